@@ -60,6 +60,7 @@ from reflexio_commons.config_schema import (
     AgentSuccessConfig,
     Config,
     FeedbackAggregatorConfig,
+    LocalStorageEngine,
     ProfileExtractorConfig,
     SkillGeneratorConfig,
     StorageConfig,
@@ -119,6 +120,7 @@ __all__ = [
     "SearchUserProfileResponse",
     "StorageConfigTest",
     "StorageConfigLocal",
+    "LocalStorageEngine",
     "StorageConfigSupabase",
     "StorageConfig",
     "ProfileExtractorConfig",
@@ -81,6 +81,8 @@ from reflexio_commons.api_schema.service_schemas import (
     ProfileChangeLogResponse,
     PublishUserInteractionRequest,
     PublishUserInteractionResponse,
+    PublishUserInteractionsBulkRequest,
+    PublishUserInteractionsBulkResponse,
     RawFeedback,
     RerunFeedbackGenerationRequest,
     RerunFeedbackGenerationResponse,
@@ -372,6 +374,75 @@ class ReflexioClient:
         self._fire_and_forget(self._publish_interaction_async, request)
         return None
 
+    def _publish_interactions_bulk_sync(
+        self,
+        request: PublishUserInteractionsBulkRequest,
+        wait_for_response: bool = False,
+    ) -> PublishUserInteractionsBulkResponse:
+        """Internal sync method to publish interactions in bulk.
+
+        Args:
+            request (PublishUserInteractionsBulkRequest): The bulk publish request
+            wait_for_response (bool): If True, server processes synchronously and returns real result
+        """
+        params = {"wait_for_response": "true"} if wait_for_response else None
+        response = self._make_request(
+            "POST",
+            "/api/publish_interactions_bulk",
+            json=request.model_dump(),
+            params=params,
+        )
+        return PublishUserInteractionsBulkResponse(**response)
+
+    async def _publish_interactions_bulk_async(
+        self,
+        request: PublishUserInteractionsBulkRequest,
+        wait_for_response: bool = False,
+    ) -> PublishUserInteractionsBulkResponse:
+        """Internal async method to publish interactions in bulk.
+
+        Args:
+            request (PublishUserInteractionsBulkRequest): The bulk publish request
+            wait_for_response (bool): If True, server processes synchronously and returns real result
+        """
+        params = {"wait_for_response": "true"} if wait_for_response else None
+        response = await self._make_async_request(
+            "POST",
+            "/api/publish_interactions_bulk",
+            json=request.model_dump(),
+            params=params,
+        )
+        return PublishUserInteractionsBulkResponse(**response)
+
+    def publish_interactions_bulk(
+        self,
+        requests: list[PublishUserInteractionRequest | dict],
+        wait_for_response: bool = False,
+    ) -> PublishUserInteractionsBulkResponse | None:
+        """Publish many interaction requests, of any number of users, in one API call.
+
+        Use this to replay historical conversations or to ingest from many agents: the server
+        stores all interactions with batched embedding calls and bulk inserts, and runs profile and
+        feedback generation once per user instead of once per request. Up to 1000 requests per call.
+
+        Args:
+            requests (List[PublishUserInteractionRequest]): The publish requests (same fields as publish_interaction)
+            wait_for_response (bool, optional): If True, wait for response. If False, send request without waiting. Defaults to False.
+        Returns:
+            Optional[PublishUserInteractionsBulkResponse]: Response containing success status, message and number of published requests if wait_for_response=True, None otherwise
+        """
+        request = PublishUserInteractionsBulkRequest(
+            requests=[
+                self._convert_to_model(publish_request, PublishUserInteractionRequest)
+                for publish_request in requests
+            ]
+        )
+
+        if wait_for_response:
+            return self._publish_interactions_bulk_sync(request, wait_for_response=True)
+        self._fire_and_forget(self._publish_interactions_bulk_async, request)
+        return None
+
     def search_interactions(
         self,
         request: SearchInteractionRequest | dict | None = None,
@@ -393,6 +393,17 @@ class PublishUserInteractionResponse(BaseModel):
     message: str = ""
 
 
+# publish many user interaction requests (any users) in one call
+class PublishUserInteractionsBulkRequest(BaseModel):
+    requests: list[PublishUserInteractionRequest] = Field(min_length=1, max_length=1000)
+
+
+class PublishUserInteractionsBulkResponse(BaseModel):
+    success: bool
+    message: str = ""
+    request_count: int = 0  # number of requests published (or queued)
+
+
 # add raw feedback request/response
 class AddRawFeedbackRequest(BaseModel):
     raw_feedbacks: list[RawFeedback] = Field(min_length=1)
@@ -2,7 +2,8 @@
 Reusable Pydantic v2 validator types for reflexio_commons.
 
 This module provides:
-1. **Data Integrity Validators** - NonEmptyStr, EmbeddingVector, numeric constraints
+1. **Data Integrity Validators** - NonEmptyStr, EmbeddingVector (with the opt-in CompactEmbedding
+   float32 storage), numeric constraints
 2. **Security Validators** - SafeHttpUrl (SSRF prevention), SanitizedStr (prompt injection mitigation)
 3. **Mixins** - TimeRangeValidatorMixin for models with start_time/end_time
 
@@ -12,13 +13,24 @@ Usage:
     )
 """
 
+import array
+import base64
+import binascii
 import ipaddress
 import os
 import re
+import sys
 from typing import Annotated, Any
 from urllib.parse import urlparse
 
-from pydantic import AfterValidator, HttpUrl
+from pydantic import (
+    AfterValidator,
+    HttpUrl,
+    PlainSerializer,
+    SerializationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+)
 
 # Embedding vector dimensions — must match config_schema.EMBEDDING_DIMENSIONS.
 # Duplicated here to avoid circular imports (config_schema imports from this module).
@@ -68,14 +80,110 @@ def _check_optional_non_empty_str(v: str | None) -> str | None:
     return stripped
 
 
-def _check_embedding_dimensions(v: list[float]) -> list[float]:
+class CompactEmbedding(array.array):
+    """Embedding vector stored as a packed float32 buffer.
+
+    A list[float] embedding costs a Python float object plus a list slot per dimension (~32 bytes);
+    this stores 4 bytes per dimension and skips per-element validation. It is a sequence of floats
+    (len, indexing, iteration) and exposes the buffer protocol, so np.asarray / np.frombuffer read
+    it without copying. It compares equal to a list of floats at float32 precision. JSON
+    serialization is base64 of its little-endian bytes, which EmbeddingVector validates back.
+
+    Usage:
+        CompactEmbedding([0.1] * 512)
+        CompactEmbedding.from_buffer(np_float32_vector)
+        CompactEmbedding.from_base64(text)
+    """
+
+    def __new__(cls, values: Any = ()) -> "CompactEmbedding":
+        return super().__new__(cls, "f", values)
+
+    @classmethod
+    def from_buffer(cls, data: Any) -> "CompactEmbedding":
+        """Build from a buffer: float32 vectors and raw bytes are copied in one memcpy.
+
+        Args:
+            data: Object supporting the buffer protocol (NumPy array, array.array, bytes)
+
+        Returns:
+            CompactEmbedding: The vector
+
+        Raises:
+            TypeError: If data does not support the buffer protocol
+            ValueError: If raw bytes are not a whole number of float32 values
+        """
+        view = memoryview(data)
+        if view.format.lstrip("<=@") not in ("f", "B"):
+            return cls(view.tolist())
+        if view.nbytes % 4:
+            raise ValueError("Embedding buffer must hold whole float32 values")
+        vector = cls()
+        vector.frombytes(view.cast("B") if view.c_contiguous else view.tobytes())
+        return vector
+
+    @classmethod
+    def from_base64(cls, data: str | bytes) -> "CompactEmbedding":
+        """Decode the base64 JSON form (little-endian float32 bytes).
+
+        Raises:
+            ValueError: If data is not valid base64 of whole float32 values
+        """
+        try:
+            raw = base64.b64decode(data, validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"Embedding is not valid base64: {e}") from e
+        vector = cls.from_buffer(raw)
+        if sys.byteorder == "big":
+            vector.byteswap()
+        return vector
+
+    def to_base64(self) -> str:
+        """Encode as base64 of little-endian float32 bytes (the JSON form)."""
+        if sys.byteorder == "big":
+            swapped = CompactEmbedding(self)
+            swapped.byteswap()
+            return base64.b64encode(swapped).decode("ascii")
+        return base64.b64encode(self).decode("ascii")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, array.array):
+            return super().__eq__(other)
+        if isinstance(other, (list, tuple)):
+            try:
+                return super().__eq__(array.array("f", other))
+            except TypeError:
+                return False
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce_ex__(self, protocol: Any) -> tuple:
+        return self.__class__, (self.tobytes(),)
+
+    def __copy__(self) -> "CompactEmbedding":
+        return CompactEmbedding.from_buffer(self)
+
+    def __deepcopy__(self, memo: dict) -> "CompactEmbedding":
+        return CompactEmbedding.from_buffer(self)
+
+    def __repr__(self) -> str:
+        return f"CompactEmbedding(<{len(self)} x float32>)"
+
+
+def _check_embedding_dimensions(
+    v: list[float] | CompactEmbedding,
+) -> list[float] | CompactEmbedding:
     """Validate that an embedding vector is either empty or has the correct dimensions.
 
     Args:
-        v (list[float]): The embedding vector
+        v (list[float] | CompactEmbedding): The embedding vector
 
     Returns:
-        list[float]: The validated embedding vector
+        list[float] | CompactEmbedding: The validated embedding vector
 
     Raises:
         ValueError: If the embedding has wrong dimensions (not empty and not EMBEDDING_DIMENSIONS)
@@ -88,6 +196,75 @@ def _check_embedding_dimensions(v: list[float]) -> list[float]:
     return v
 
 
+def _is_compact_embedding_mode() -> bool:
+    """Check if embeddings should be validated into CompactEmbedding.
+
+    Returns:
+        bool: True if REFLEXIO_COMPACT_EMBEDDINGS env var is set to true/1/yes
+    """
+    return os.environ.get("REFLEXIO_COMPACT_EMBEDDINGS", "").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+
+
+def _coerce_embedding(
+    v: Any, handler: ValidatorFunctionWrapHandler
+) -> list[float] | CompactEmbedding:
+    """Accept any embedding representation and store it as list[float] or CompactEmbedding.
+
+    CompactEmbedding values are kept as they are. Lists, base64 strings or bytes (the
+    CompactEmbedding JSON form) and buffers (NumPy arrays, array.array) become CompactEmbedding
+    when REFLEXIO_COMPACT_EMBEDDINGS is enabled, otherwise list[float].
+
+    Args:
+        v: The embedding value
+        handler: Validator of the underlying list[float] schema
+
+    Returns:
+        list[float] | CompactEmbedding: The embedding vector
+
+    Raises:
+        ValueError: If the value is not a valid embedding
+    """
+    if isinstance(v, CompactEmbedding):
+        return v
+    compact = _is_compact_embedding_mode()
+    if isinstance(v, (list, tuple)):
+        if not compact:
+            return handler(v)
+        try:
+            return CompactEmbedding(v)
+        except TypeError as e:
+            raise ValueError(f"Embedding must contain only numbers: {e}") from e
+    if isinstance(v, (str, bytes)):
+        vector = CompactEmbedding.from_base64(v)
+        return vector if compact else vector.tolist()
+    try:
+        view = memoryview(v)
+    except TypeError:
+        return handler(v)
+    return CompactEmbedding.from_buffer(view) if compact else handler(view.tolist())
+
+
+# Serialization context under which JSON dumps carry CompactEmbedding as base64 (storage writes);
+# without it, embeddings are always dumped as list[float] so API responses keep their shape
+COMPACT_EMBEDDING_JSON_CONTEXT = {"compact_embeddings": True}
+
+
+def _serialize_embedding(
+    v: list[float] | CompactEmbedding, info: SerializationInfo
+) -> list[float] | str:
+    """Serialize CompactEmbedding as base64 in JSON mode under COMPACT_EMBEDDING_JSON_CONTEXT, else as list[float]."""
+    if isinstance(v, CompactEmbedding):
+        context = info.context or {}
+        if info.mode_is_json() and context.get("compact_embeddings"):
+            return v.to_base64()
+        return v.tolist()
+    return v
+
+
 # Reusable Annotated types for data integrity
 NonEmptyStr = Annotated[str, AfterValidator(_check_non_empty_str)]
 """String that rejects empty/whitespace-only values. Strips leading/trailing whitespace."""
@@ -97,8 +274,18 @@ OptionalNonEmptyStr = Annotated[
 ]
 """Optional string that, if provided, rejects empty/whitespace-only values."""
 
-EmbeddingVector = Annotated[list[float], AfterValidator(_check_embedding_dimensions)]
-"""Embedding vector that must be either empty or exactly EMBEDDING_DIMENSIONS (512) floats."""
+EmbeddingVector = Annotated[
+    list[float],
+    WrapValidator(_coerce_embedding),
+    AfterValidator(_check_embedding_dimensions),
+    PlainSerializer(_serialize_embedding, return_type=list[float] | str),
+]
+"""Embedding vector that must be either empty or exactly EMBEDDING_DIMENSIONS (512) floats.
+
+Also accepts CompactEmbedding, NumPy arrays and base64 strings; stored as CompactEmbedding when
+REFLEXIO_COMPACT_EMBEDDINGS=true (CompactEmbedding inputs always), otherwise as list[float].
+Dumped as list[float] unless JSON-dumped with `context=COMPACT_EMBEDDING_JSON_CONTEXT`.
+"""
 
 
 # =============================================================================
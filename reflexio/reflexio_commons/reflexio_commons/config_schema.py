@@ -35,8 +35,20 @@ class StorageConfigTest(IntEnum):
     SUCCEEDED = 3
 
 
+class LocalStorageEngine(str, Enum):
+    """On-disk engine used by local (self-host) storage.
+
+    - JSON: Single JSON document per org, rewritten on every write
+    - SQLITE: Embedded SQLite database (WAL mode) with indexed per-entity tables
+    """
+
+    JSON = "json"
+    SQLITE = "sqlite"
+
+
 class StorageConfigLocal(BaseModel):
     dir_path: NonEmptyStr
+    engine: LocalStorageEngine = LocalStorageEngine.JSON
 
 
 class StorageConfigSupabase(BaseModel):
@@ -146,11 +158,13 @@ class ProfileExtractorConfig(BaseModel):
     extraction_window_stride_override: int | None = Field(
         default=None, gt=0
     )  # override global extraction_window_stride for this extractor
+    depends_on_previous_extractors: bool = False  # with parallel extraction, run after the independent extractors and see their results
 
 
 class FeedbackAggregatorConfig(BaseModel):
     min_feedback_threshold: int = Field(default=2, ge=1)
     refresh_count: int = Field(default=2, ge=1)
+    incremental_clustering: bool = False  # assign new raw feedbacks to stored cluster centroids and re-cluster only affected neighbourhoods
 
 
 class SkillGeneratorConfig(BaseModel):
@@ -177,6 +191,7 @@ class AgentFeedbackConfig(BaseModel):
     extraction_window_stride_override: int | None = Field(
         default=None, gt=0
     )  # override global extraction_window_stride for this extractor
+    depends_on_previous_extractors: bool = False  # with parallel extraction, run after the independent extractors and see their results
 
 
 class ToolUseConfig(BaseModel):
@@ -232,6 +247,8 @@ class Config(BaseModel):
     # sliding window parameters for extraction
     extraction_window_size: int | None = Field(default=None, gt=0)
     extraction_window_stride: int | None = Field(default=None, gt=0)
+    # max clusters whose LLM calls run concurrently in feedback aggregation and skill generation
+    cluster_generation_concurrency: int = Field(default=4, gt=0)
     # API key configuration for LLM providers
     api_key_config: APIKeyConfig | None = None
     # LLM model configuration overrides
@@ -10,6 +10,9 @@ Covers:
 6. Cross-field model validators
 """
 
+import array
+import json
+import pickle
 from datetime import datetime, timezone
 
 import pytest
@@ -47,12 +50,17 @@ from reflexio_commons.api_schema.service_schemas import (
     OperationStatus,
     OperationStatusInfo,
     PublishUserInteractionRequest,
+    RawFeedback,
     RerunFeedbackGenerationRequest,
     RerunProfileGenerationRequest,
     Skill,
     UpdateSkillStatusRequest,
     UserProfile,
 )
+from reflexio_commons.api_schema.validators import (
+    COMPACT_EMBEDDING_JSON_CONTEXT,
+    CompactEmbedding,
+)
 from reflexio_commons.config_schema import (
     AgentFeedbackConfig,
     AgentSuccessConfig,
@@ -373,6 +381,82 @@ class TestEmbeddingVector:
             )
 
 
+class TestCompactEmbedding:
+    """Tests for the opt-in float32 CompactEmbedding storage of EmbeddingVector fields."""
+
+    def test_compact_embedding_kept_without_copy(self):
+        """A CompactEmbedding input is stored as is and compares equal to the list."""
+        embedding = CompactEmbedding([0.5] * 512)
+        feedback = RawFeedback(agent_version="v1", request_id="r1", embedding=embedding)
+        assert feedback.embedding is embedding
+        assert feedback.embedding == [0.5] * 512
+        assert feedback.embedding.itemsize == 4
+
+    def test_storage_json_round_trip_uses_base64(self):
+        """Under the storage context, CompactEmbedding serializes to base64 and validates back."""
+        embedding = CompactEmbedding([0.25] * 512)
+        feedback = RawFeedback(agent_version="v1", request_id="r1", embedding=embedding)
+        dumped = feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+        assert isinstance(json.loads(dumped)["embedding"], str)
+        assert feedback.model_dump()["embedding"] == [0.25] * 512
+
+        restored = RawFeedback.model_validate_json(dumped)
+        assert isinstance(restored.embedding, list)
+        assert restored.embedding == [0.25] * 512
+
+    def test_api_json_keeps_lists(self):
+        """Plain JSON dumps (API responses) carry compact embeddings as lists of floats."""
+        feedback = RawFeedback(
+            agent_version="v1",
+            request_id="r1",
+            embedding=CompactEmbedding([0.25] * 512),
+        )
+        assert json.loads(feedback.model_dump_json())["embedding"] == [0.25] * 512
+        assert feedback.model_dump(mode="json")["embedding"] == [0.25] * 512
+
+    def test_compact_mode_converts_lists(self, monkeypatch):
+        """With REFLEXIO_COMPACT_EMBEDDINGS, list and base64 inputs become CompactEmbedding."""
+        monkeypatch.setenv("REFLEXIO_COMPACT_EMBEDDINGS", "true")
+        feedback = Feedback(
+            agent_version="v1", feedback_content="test", embedding=[0.1] * 512
+        )
+        assert isinstance(feedback.embedding, CompactEmbedding)
+        restored = Feedback.model_validate_json(
+            feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+        )
+        assert isinstance(restored.embedding, CompactEmbedding)
+        assert restored.embedding == feedback.embedding
+
+    def test_buffer_input_accepted(self):
+        """Buffers (array.array of doubles here) are accepted like lists."""
+        embedding = array.array("d", [0.1] * 512)
+        interaction = Interaction(user_id="u", request_id="r", embedding=embedding)
+        assert interaction.embedding == [0.1] * 512
+        assert isinstance(interaction.embedding, list)
+
+    def test_compact_mode_still_validates(self, monkeypatch):
+        """Compact vectors keep the dimension check and reject non-numbers."""
+        monkeypatch.setenv("REFLEXIO_COMPACT_EMBEDDINGS", "true")
+        with pytest.raises(ValidationError, match="512"):
+            Skill(skill_name="test", embedding=[1.0] * 256)
+        with pytest.raises(ValidationError, match="numbers"):
+            Skill(skill_name="test", embedding=["x"] * 512)
+        with pytest.raises(ValidationError, match="base64"):
+            Skill(skill_name="test", embedding="not base64!")
+
+    def test_deep_copy_and_pickle_keep_type(self):
+        """Copies used by model_copy(deep=True) and pickling stay CompactEmbedding."""
+        feedback = RawFeedback(
+            agent_version="v1",
+            request_id="r1",
+            embedding=CompactEmbedding([0.5] * 512),
+        )
+        copied = feedback.model_copy(deep=True)
+        assert isinstance(copied.embedding, CompactEmbedding)
+        assert copied.embedding is not feedback.embedding
+        assert pickle.loads(pickle.dumps(feedback.embedding)) == feedback.embedding  # noqa: S301
+
+
 # =============================================================================
 # Numeric Constraint Tests
 # =============================================================================
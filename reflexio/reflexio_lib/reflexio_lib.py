@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -77,6 +78,8 @@ from reflexio_commons.api_schema.service_schemas import (
     ProfileChangeLogResponse,
     PublishUserInteractionRequest,
     PublishUserInteractionResponse,
+    PublishUserInteractionsBulkRequest,
+    PublishUserInteractionsBulkResponse,
     RawFeedback,
     RerunFeedbackGenerationRequest,
     RerunFeedbackGenerationResponse,
@@ -89,6 +92,7 @@ from reflexio_commons.api_schema.service_schemas import (
     UpgradeProfilesResponse,
     UpgradeRawFeedbacksRequest,
     UpgradeRawFeedbacksResponse,
+    UserProfile,
 )
 from reflexio_commons.config_schema import Config
 
@@ -108,7 +112,7 @@ from reflexio.server.services.profile.profile_generation_service import (
     ProfileGenerationService,
 )
 from reflexio.server.services.storage.storage_base import BaseStorage
-from reflexio.server.site_var.site_var_manager import SiteVarManager
+from reflexio.server.site_var.site_var_manager import get_site_var_manager
 
 logger = logging.getLogger(__name__)
 
@@ -137,8 +141,30 @@ class Reflexio:
             org_id=org_id, storage_base_dir=storage_base_dir, configurator=configurator
         )
 
-        # Create single LLM client for all services
-        model_setting = SiteVarManager().get_site_var("llm_model_setting")
+        # Single LLM client for all services, created on first use (see the llm_client property)
+        self._llm_client: LiteLLMClient | None = None
+        self._llm_client_lock = threading.Lock()
+
+    @property
+    def llm_client(self) -> LiteLLMClient:
+        """LLM client of the org's generation model, created on first use.
+
+        Returns:
+            LiteLLMClient: Client shared by all services of this instance
+        """
+        if self._llm_client is None:
+            with self._llm_client_lock:
+                if self._llm_client is None:
+                    self._llm_client = self._create_llm_client()
+        return self._llm_client
+
+    @llm_client.setter
+    def llm_client(self, llm_client: LiteLLMClient) -> None:
+        self._llm_client = llm_client
+
+    def _create_llm_client(self) -> LiteLLMClient:
+        """Build the LLM client from the org's LLM config, falling back to the site var model."""
+        model_setting = get_site_var_manager().get_site_var("llm_model_setting")
 
         # Get API key config and LLM config from configuration if available
         config = self.request_context.configurator.get_config()
@@ -160,7 +186,17 @@ class Reflexio:
             model=generation_model_name,
             api_key_config=api_key_config,
         )
-        self.llm_client = LiteLLMClient(llm_config)
+        return LiteLLMClient(llm_config)
+
+    def warm_up(self) -> None:
+        """Create the lazily initialized storage and LLM client now, e.g. ahead of traffic."""
+        _ = self.request_context.storage
+        _ = self.llm_client
+
+    @property
+    def is_warmed_up(self) -> bool:
+        """Whether the lazily initialized storage and LLM client were both created."""
+        return self.request_context.storage_created and self._llm_client is not None
 
     def _is_storage_configured(self) -> bool:
         """Check if storage is configured and available.
@@ -220,11 +256,16 @@ class Reflexio:
     def publish_interaction(
         self,
         request: PublishUserInteractionRequest | dict,
+        *,
+        request_id: str | None = None,
+        replace_existing: bool = False,
     ) -> PublishUserInteractionResponse:
         """Publish user interactions.
 
         Args:
             request (Union[PublishUserInteractionRequest, dict]): The publish user interaction request
+            request_id (str, optional): ID to store the request under (a new UUID when None)
+            replace_existing (bool): Replace a request already stored under `request_id` instead of adding to it
 
         Returns:
             PublishUserInteractionResponse: Response containing success status and message
@@ -241,11 +282,57 @@ class Reflexio:
             # Convert dict to PublishUserInteractionRequest if needed
             if isinstance(request, dict):
                 request = PublishUserInteractionRequest(**request)
-            generation_service.run(request)
+            generation_service.run(
+                request, request_id=request_id, replace_existing=replace_existing
+            )
             return PublishUserInteractionResponse(success=True)
         except Exception as e:
             return PublishUserInteractionResponse(success=False, message=str(e))
 
+    def publish_interactions_bulk(
+        self,
+        request: PublishUserInteractionsBulkRequest | dict,
+        *,
+        request_ids: list[str] | None = None,
+        replace_existing: bool = False,
+    ) -> PublishUserInteractionsBulkResponse:
+        """Publish many user interaction requests, of any number of users, at once.
+
+        Requests and interactions are stored with batched embedding calls and bulk inserts, and
+        profile/feedback generation runs once per (user, agent version, source) instead of once
+        per request.
+
+        Args:
+            request (Union[PublishUserInteractionsBulkRequest, dict]): The bulk publish request
+            request_ids (list[str], optional): IDs to store the requests under, in order (new UUIDs when None)
+            replace_existing (bool): Replace requests already stored under `request_ids` instead of adding to them
+
+        Returns:
+            PublishUserInteractionsBulkResponse: Response containing success status, message and number of published requests
+        """
+        if not self._is_storage_configured():
+            return PublishUserInteractionsBulkResponse(
+                success=False, message=STORAGE_NOT_CONFIGURED_MSG
+            )
+        generation_service = GenerationService(
+            llm_client=self.llm_client,
+            request_context=self.request_context,
+        )
+        try:
+            # Convert dict to PublishUserInteractionsBulkRequest if needed
+            if isinstance(request, dict):
+                request = PublishUserInteractionsBulkRequest(**request)
+            stored_request_ids = generation_service.run_bulk(
+                request.requests,
+                request_ids=request_ids,
+                replace_existing=replace_existing,
+            )
+            return PublishUserInteractionsBulkResponse(
+                success=True, request_count=len(stored_request_ids)
+            )
+        except Exception as e:
+            return PublishUserInteractionsBulkResponse(success=False, message=str(e))
+
     def search_interactions(
         self,
         request: SearchInteractionRequest | dict,
@@ -299,6 +386,39 @@ class Reflexio:
         )
         return SearchUserProfileResponse(success=True, user_profiles=profiles)
 
+    async def asearch_profiles(
+        self,
+        request: SearchUserProfileRequest | dict,
+        status_filter: list[Status | None] | None = None,
+    ) -> SearchUserProfileResponse:
+        """Async twin of search_profiles for async API endpoints.
+
+        Args:
+            request (SearchUserProfileRequest): The search request
+            status_filter (Optional[list[Optional[Status]]]): Filter profiles by status. Defaults to [None] for current profiles only.
+
+        Returns:
+            SearchUserProfileResponse: Response containing matching profiles
+        """
+        if not self._is_storage_configured():
+            return SearchUserProfileResponse(
+                success=True, user_profiles=[], msg=STORAGE_NOT_CONFIGURED_MSG
+            )
+        if isinstance(request, dict):
+            request = SearchUserProfileRequest(**request)
+        if status_filter is None:
+            status_filter = [None]  # Default to current profiles
+        if request.query and request.query_rewrite:
+            result = await self._get_query_rewriter().arewrite(
+                request.query, enabled=True
+            )
+            if result.fts_query != request.query:
+                request = request.model_copy(update={"query": result.fts_query})
+        profiles = await self._get_storage().asearch_user_profile(
+            request, status_filter=status_filter
+        )
+        return SearchUserProfileResponse(success=True, user_profiles=profiles)
+
     def get_profile_change_logs(self) -> ProfileChangeLogResponse:
         """Get profile change logs.
 
@@ -540,16 +660,57 @@ class Reflexio:
         if isinstance(request, dict):
             request = GetUserProfilesRequest(**request)
 
-        # Priority: parameter > request.status_filter > default [None]
-        if status_filter is None:
-            if hasattr(request, "status_filter") and request.status_filter is not None:
-                status_filter = request.status_filter
-            else:
-                status_filter = [None]  # Default to current profiles
-
         profiles = self._get_storage().get_user_profile(
-            request.user_id, status_filter=status_filter
+            request.user_id,
+            status_filter=self._profiles_status_filter(request, status_filter),
+        )
+        return self._filter_profiles(request, profiles)
+
+    async def aget_profiles(
+        self,
+        request: GetUserProfilesRequest | dict,
+        status_filter: list[Status | None] | None = None,
+    ) -> GetUserProfilesResponse:
+        """Async twin of get_profiles for async API endpoints.
+
+        Args:
+            request (GetUserProfilesRequest): The get request
+            status_filter (Optional[list[Optional[Status]]]): Filter profiles by status. Defaults to [None] for current profiles only.
+                If provided, takes precedence over request.status_filter.
+
+        Returns:
+            GetUserProfilesResponse: Response containing user profiles
+        """
+        if not self._is_storage_configured():
+            return GetUserProfilesResponse(
+                success=True, user_profiles=[], msg=STORAGE_NOT_CONFIGURED_MSG
+            )
+        if isinstance(request, dict):
+            request = GetUserProfilesRequest(**request)
+
+        profiles = await self._get_storage().aget_user_profile(
+            request.user_id,
+            status_filter=self._profiles_status_filter(request, status_filter),
         )
+        return self._filter_profiles(request, profiles)
+
+    @staticmethod
+    def _profiles_status_filter(
+        request: GetUserProfilesRequest,
+        status_filter: list[Status | None] | None,
+    ) -> list[Status | None]:
+        # Priority: parameter > request.status_filter > default [None]
+        if status_filter is not None:
+            return status_filter
+        if hasattr(request, "status_filter") and request.status_filter is not None:
+            return request.status_filter
+        return [None]  # Default to current profiles
+
+    @staticmethod
+    def _filter_profiles(
+        request: GetUserProfilesRequest, profiles: list[UserProfile]
+    ) -> GetUserProfilesResponse:
+        """Sort profiles newest first and apply the request's time range and top_k."""
         profiles = sorted(
             profiles, key=lambda x: x.last_modified_timestamp, reverse=True
         )
@@ -1665,6 +1826,41 @@ class Reflexio:
             prompt_manager=self.request_context.prompt_manager,
         )
 
+    async def aunified_search(
+        self,
+        request: UnifiedSearchRequest | dict,
+        org_id: str,
+    ) -> UnifiedSearchResponse:
+        """
+        Async twin of unified_search for async API endpoints.
+
+        Args:
+            request (Union[UnifiedSearchRequest, dict]): The unified search request
+            org_id (str): Organization ID (used for feature flag checks)
+
+        Returns:
+            UnifiedSearchResponse: Combined results from all entity types
+        """
+        if not self._is_storage_configured():
+            return UnifiedSearchResponse(success=True, msg=STORAGE_NOT_CONFIGURED_MSG)
+        if isinstance(request, dict):
+            request = UnifiedSearchRequest(**request)
+
+        from reflexio.server.services.unified_search_service import (
+            arun_unified_search,
+        )
+
+        config = self.request_context.configurator.get_config()
+        api_key_config = config.api_key_config if config else None
+
+        return await arun_unified_search(
+            request=request,
+            org_id=org_id,
+            storage=self._get_storage(),
+            api_key_config=api_key_config,
+            prompt_manager=self.request_context.prompt_manager,
+        )
+
     def upgrade_all_raw_feedbacks(
         self,
         request: UpgradeRawFeedbacksRequest | dict | None = None,
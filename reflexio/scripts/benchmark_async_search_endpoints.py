@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark sync vs async unified search throughput against a storage with simulated I/O latency.
+
+Sync endpoints hold one of Starlette's threadpool slots (40 by default) for the whole request,
+so throughput caps at roughly slots / latency regardless of CPU. The async endpoints await
+storage and embeddings on the event loop instead. This script drives run_unified_search through
+a 40-thread pool (the sync endpoint) and arun_unified_search on a single event loop (the async
+endpoint) at increasing client concurrency, with each storage read and the query embedding
+sleeping for --latency-ms. Sync requests rejected by the saturated "search" executor (503s in
+the API) are counted separately and excluded from sync throughput.
+
+Usage:
+    python reflexio/scripts/benchmark_async_search_endpoints.py
+    python reflexio/scripts/benchmark_async_search_endpoints.py --concurrency 10 100 400 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from reflexio_commons.api_schema.retriever_schema import UnifiedSearchRequest
+
+from reflexio.server.services.executor_registry import (
+    ExecutorSaturatedError,
+    shutdown_executors,
+)
+from reflexio.server.services.unified_search_service import (
+    arun_unified_search,
+    run_unified_search,
+)
+
+# Starlette's default threadpool size for sync endpoints
+STARLETTE_THREADPOOL_SIZE = 40
+
+
+class SimulatedLatencyStorage:
+    """Storage exposing the reads unified search uses, each taking a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def _read(self, *_args, **_kwargs) -> list:
+        time.sleep(self.latency)
+        return []
+
+    async def _aread(self, *_args, **_kwargs) -> list:
+        await asyncio.sleep(self.latency)
+        return []
+
+    async def _aget_embedding(self, _text: str) -> list[float]:
+        await asyncio.sleep(self.latency)
+        return [0.0] * 8
+
+    search_user_profile = _read
+    search_feedbacks = _read
+    search_raw_feedbacks = _read
+    search_skills = _read
+    asearch_user_profile = _aread
+    asearch_feedbacks = _aread
+    asearch_raw_feedbacks = _aread
+    asearch_skills = _aread
+
+
+def bench_sync(
+    storage, requests: list[UnifiedSearchRequest], clients: int
+) -> tuple[float, int]:
+    """Run requests through a Starlette-sized threadpool.
+
+    Returns:
+        tuple[float, int]: Successful requests per second, and requests shed with a 503
+    """
+    pool = ThreadPoolExecutor(max_workers=min(clients, STARLETTE_THREADPOOL_SIZE))
+    start = time.perf_counter()
+    futures = [
+        pool.submit(
+            run_unified_search, request, "benchmark", storage, None, MagicMock()
+        )
+        for request in requests
+    ]
+    rejected = 0
+    for future in futures:
+        try:
+            assert future.result().success
+        except ExecutorSaturatedError:  # noqa: PERF203
+            rejected += 1
+    elapsed = time.perf_counter() - start
+    pool.shutdown()
+    return (len(requests) - rejected) / elapsed, rejected
+
+
+def bench_async(storage, requests: list[UnifiedSearchRequest], clients: int) -> float:
+    """Run requests on one event loop with at most `clients` in flight; return requests per second."""
+
+    async def run() -> float:
+        semaphore = asyncio.Semaphore(clients)
+
+        async def one(request: UnifiedSearchRequest) -> None:
+            async with semaphore:
+                response = await arun_unified_search(
+                    request, "benchmark", storage, None, MagicMock()
+                )
+                assert response.success
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(request) for request in requests))
+        return len(requests) / (time.perf_counter() - start)
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[10, 40, 100, 200],
+        help="Concurrent clients",
+    )
+    parser.add_argument(
+        "--requests-per-client", type=int, default=5, help="Requests per client"
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=50.0, help="Latency of each storage read"
+    )
+    args = parser.parse_args()
+
+    storage = SimulatedLatencyStorage(args.latency_ms / 1000)
+    print(f"latency={args.latency_ms:.0f}ms per read")
+    print(
+        f"  {'clients':>8} {'sync req/s':>12} {'sync 503s':>10} {'async req/s':>12} {'speedup':>8}"
+    )
+    with patch(
+        "reflexio.server.services.unified_search_service.is_skill_generation_enabled",
+        return_value=True,
+    ):
+        for clients in args.concurrency:
+            requests = [
+                UnifiedSearchRequest(query=f"query {i}", user_id=f"user-{i}")
+                for i in range(clients * args.requests_per_client)
+            ]
+            sync_rps, rejected = bench_sync(storage, requests, clients)
+            async_rps = bench_async(storage, requests, clients)
+            print(
+                f"  {clients:>8} {sync_rps:>12.1f} {rejected:>10} {async_rps:>12.1f}"
+                f" {async_rps / sync_rps:>7.1f}x"
+            )
+    shutdown_executors()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory and (de)serialization cost of list[float] vs CompactEmbedding embeddings.
+
+Builds --count RawFeedback objects with 512-dim embeddings three ways: from Python lists (the
+default list[float] storage), from lists with REFLEXIO_COMPACT_EMBEDDINGS=true, and from float32
+NumPy rows through CompactEmbedding.from_buffer. For each it reports the memory the objects retain
+(tracemalloc), construction time, model_dump_json size and time, and model_validate_json time.
+
+Usage:
+    python reflexio/scripts/benchmark_compact_embeddings.py
+    python reflexio/scripts/benchmark_compact_embeddings.py --count 20000
+"""
+
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+from reflexio_commons.api_schema.service_schemas import RawFeedback
+from reflexio_commons.api_schema.validators import (
+    COMPACT_EMBEDDING_JSON_CONTEXT,
+    CompactEmbedding,
+)
+from reflexio_commons.config_schema import EMBEDDING_DIMENSIONS
+
+
+def build(
+    count: int, embedding_for: Callable[[int], object]
+) -> tuple[list[RawFeedback], int, float]:
+    """Build raw feedbacks; return them with the bytes they retain and the build time."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    raw_feedbacks = [
+        RawFeedback(
+            raw_feedback_id=i,
+            agent_version="v1",
+            request_id=f"request-{i}",
+            feedback_content="Confirm the order number before issuing a refund",
+            embedding=embedding_for(i),
+        )
+        for i in range(count)
+    ]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return raw_feedbacks, retained, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--count", type=int, default=5000, help="Raw feedbacks to build"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    matrix = rng.standard_normal((args.count, EMBEDDING_DIMENSIONS)).astype(np.float32)
+
+    variants: list[tuple[str, bool, Callable[[int], object]]] = [
+        ("list[float]", False, lambda i: matrix[i].tolist()),
+        ("compact from lists", True, lambda i: matrix[i].tolist()),
+        (
+            "compact from_buffer",
+            False,
+            lambda i: CompactEmbedding.from_buffer(matrix[i]),
+        ),
+    ]
+    print(f"{args.count} raw feedbacks x {EMBEDDING_DIMENSIONS} dims")
+    print(
+        f"  {'variant':<20} {'retained MB':>12} {'build s':>8} {'json MB':>8}"
+        f" {'dump s':>7} {'load s':>7}"
+    )
+    for name, compact, embedding_for in variants:
+        os.environ["REFLEXIO_COMPACT_EMBEDDINGS"] = "true" if compact else ""
+        raw_feedbacks, retained, build_seconds = build(args.count, embedding_for)
+
+        start = time.perf_counter()
+        # Storage dumps: CompactEmbedding vectors are written as base64
+        payloads = [
+            fb.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+            for fb in raw_feedbacks
+        ]
+        dump_seconds = time.perf_counter() - start
+        json_bytes = sum(len(payload) for payload in payloads)
+
+        start = time.perf_counter()
+        for payload in payloads:
+            RawFeedback.model_validate_json(payload)
+        load_seconds = time.perf_counter() - start
+
+        print(
+            f"  {name:<20} {retained / 1e6:>12.1f} {build_seconds:>8.2f}"
+            f" {json_bytes / 1e6:>8.1f} {dump_seconds:>7.2f} {load_seconds:>7.2f}"
+        )
+        del raw_feedbacks, payloads
+    os.environ.pop("REFLEXIO_COMPACT_EMBEDDINGS", None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark FeedbackAggregator clustering memory and time on synthetic embedding sets.
+
+Below SPARSE_CLUSTERING_THRESHOLD, get_clusters builds a dense n x n cosine distance matrix
+(float64: 8 * n^2 bytes, ~20 GB at 50k feedbacks). Above it, embeddings are clustered on a
+sparse k-nearest-neighbour distance graph built in bounded-memory blocks. The dense path is
+only run for sizes up to --dense-max; larger sizes report its estimated matrix size instead.
+
+Usage:
+    python reflexio/scripts/benchmark_feedback_clustering.py
+    python reflexio/scripts/benchmark_feedback_clustering.py --sizes 10000 50000 200000 --dense-max 10000
+"""
+
+import argparse
+import time
+import tracemalloc
+from unittest.mock import MagicMock
+
+import numpy as np
+from reflexio_commons.api_schema.service_schemas import RawFeedback
+from reflexio_commons.config_schema import EMBEDDING_DIMENSIONS
+from sklearn.metrics.pairwise import cosine_distances
+
+from reflexio.server.services.feedback.feedback_aggregator import (
+    KNN_GRAPH_NEIGHBORS,
+    FeedbackAggregator,
+)
+
+
+def synthetic_raw_feedbacks(
+    n: int, dim: int, cluster_size: int, seed: int
+) -> list[RawFeedback]:
+    """Build n raw feedbacks whose embeddings form groups of ~cluster_size near-duplicates."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, n // cluster_size), dim), dtype=np.float32)
+    vectors = centers[rng.integers(0, len(centers), n)] + 0.3 * rng.standard_normal(
+        (n, dim), dtype=np.float32
+    )
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [
+        RawFeedback(
+            raw_feedback_id=i,
+            agent_version="benchmark",
+            request_id=str(i),
+            feedback_content="",
+            feedback_name="benchmark",
+            embedding=vector.tolist(),
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def float32_matrix(raw_feedbacks: list[RawFeedback]) -> np.ndarray:
+    """Build the contiguous float32 embedding matrix used by get_clusters."""
+    return np.asarray([fb.embedding for fb in raw_feedbacks], dtype=np.float32)
+
+
+def dense_distances(raw_feedbacks: list[RawFeedback]) -> np.ndarray:
+    """Build the float64 n x n cosine distance matrix of the dense path."""
+    return cosine_distances(np.array([fb.embedding for fb in raw_feedbacks]))
+
+
+def measure(label: str, func, *args) -> object:
+    """Run func, printing wall-clock time and peak traced allocations."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<28} {elapsed:>9.2f}s {peak / 2**20:>10.1f} MB peak")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 50_000, 200_000]
+    )
+    parser.add_argument("--dim", type=int, default=EMBEDDING_DIMENSIONS)
+    parser.add_argument(
+        "--cluster-size", type=int, default=100, help="Average feedbacks per cluster"
+    )
+    parser.add_argument(
+        "--dense-max",
+        type=int,
+        default=10_000,
+        help="Largest size to also run the dense distance matrix for",
+    )
+    args = parser.parse_args()
+
+    aggregator = FeedbackAggregator(MagicMock(), MagicMock(), "benchmark")
+    for n in args.sizes:
+        raw_feedbacks = synthetic_raw_feedbacks(n, args.dim, args.cluster_size, seed=n)
+        print(f"n={n} dim={args.dim}")
+
+        embeddings = measure("float32 embedding matrix", float32_matrix, raw_feedbacks)
+        if n <= args.dense_max:
+            measure("dense float64 distances", dense_distances, raw_feedbacks)
+        else:
+            print(
+                f"  {'dense float64 distances':<28} skipped (needs {8 * n * n / 2**30:.1f} GB)"
+            )
+        graph = measure(
+            f"sparse {KNN_GRAPH_NEIGHBORS}-NN graph",
+            FeedbackAggregator._build_knn_distance_graph,
+            embeddings,
+            KNN_GRAPH_NEIGHBORS,
+        )
+        print(f"  {'graph edges':<28} {graph.nnz:>10}")
+        labels = measure(
+            "graph build + clustering",
+            aggregator._cluster_with_knn_graph,
+            embeddings,
+            2,
+        )
+        print(f"  {'clusters found':<28} {len(set(labels.tolist()) - {-1}):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark request lookups in LocalJsonStorage.get_last_k_interactions_grouped.
+
+Compares the single-pass request index against the previous per-interaction
+`get_request()` lookup (which reloads the storage file for every candidate interaction)
+on synthetic stores of increasing size.
+
+Usage:
+    python reflexio/scripts/benchmark_local_json_request_index.py
+    python reflexio/scripts/benchmark_local_json_request_index.py --sizes 10000 100000 --k 200
+    python reflexio/scripts/benchmark_local_json_request_index.py --skip-baseline
+"""
+
+import argparse
+import tempfile
+import time
+
+from reflexio_commons.api_schema.service_schemas import Interaction, Request
+
+from reflexio.server.services.storage.local_json_storage import (
+    LocalJsonStorage,
+    clear_local_storage_cache,
+)
+
+INTERACTIONS_PER_REQUEST = 5
+USER_ID = "bench_user"
+
+
+def build_storage(base_dir: str, num_interactions: int) -> LocalJsonStorage:
+    """
+    Create a storage file holding `num_interactions` interactions for one user.
+
+    Every other request comes from the "chat" source so that a source filter has to skip
+    over non-matching interactions, like a busy user with mixed traffic.
+
+    Args:
+        base_dir: Directory for the storage file
+        num_interactions: Number of interactions to generate
+
+    Returns:
+        LocalJsonStorage: Storage backed by the generated file
+    """
+    storage = LocalJsonStorage(org_id="bench", base_dir=base_dir)
+    num_requests = max(1, num_interactions // INTERACTIONS_PER_REQUEST)
+    requests = [
+        Request(
+            request_id=f"req_{i}",
+            user_id=USER_ID,
+            source="chat" if i % 2 == 0 else "api",
+            agent_version="v1",
+            session_id=f"session_{i // 10}",
+            created_at=1_700_000_000 + i,
+        ).model_dump_json()
+        for i in range(num_requests)
+    ]
+    interactions = [
+        Interaction(
+            interaction_id=i + 1,
+            user_id=USER_ID,
+            request_id=f"req_{i // INTERACTIONS_PER_REQUEST}",
+            content=f"message {i}",
+            created_at=1_700_000_000 + i,
+        ).model_dump_json()
+        for i in range(num_interactions)
+    ]
+    storage._save(
+        {
+            USER_ID: {"profiles": [], "interactions": interactions},
+            "requests": requests,
+        }
+    )
+    return storage
+
+
+def legacy_last_k(
+    storage: LocalJsonStorage, k: int, sources: list[str]
+) -> list[Interaction]:
+    """Reproduce the previous N+1 filter: one `get_request()` call per candidate interaction."""
+    all_interactions = storage.get_user_interaction(USER_ID)
+    all_interactions.sort(key=lambda x: x.interaction_id or 0, reverse=True)
+    selected: list[Interaction] = []
+    for interaction in all_interactions:
+        if len(selected) >= k:
+            break
+        request = storage.get_request(interaction.request_id)
+        if request is None or request.source not in sources:
+            continue
+        selected.append(interaction)
+    return selected
+
+
+def time_call(fn, repeat: int) -> float:  # noqa: ANN001
+    """Return the best wall-clock time in seconds over `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="Numbers of interactions to benchmark",
+    )
+    parser.add_argument("--k", type=int, default=100, help="Window size (last K)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument(
+        "--skip-baseline",
+        action="store_true",
+        help="Only time the indexed implementation",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'interactions':>12} {'indexed (s)':>12} {'per-request (s)':>16} {'speedup':>8}"
+    )
+    for size in args.sizes:
+        clear_local_storage_cache()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = build_storage(temp_dir, size)
+            indexed = time_call(
+                lambda storage=storage: storage.get_last_k_interactions_grouped(
+                    USER_ID, k=args.k, sources=["chat"]
+                ),
+                args.repeat,
+            )
+            if args.skip_baseline:
+                print(f"{size:>12} {indexed:>12.4f} {'-':>16} {'-':>8}")
+                continue
+            baseline = time_call(
+                lambda storage=storage: legacy_last_k(storage, args.k, ["chat"]),
+                args.repeat,
+            )
+            print(
+                f"{size:>12} {indexed:>12.4f} {baseline:>16.4f} {baseline / indexed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark PromptManager startup and render time against the previous per-instance loading.
+
+The previous PromptManager read `metadata.json` and `.prompt` files on the first render of each
+prompt in every new instance (one per RequestContext) and re-parsed the template with
+`str.format` on every render. The shared registry loads the bundled prompt bank once per
+process and renders from pre-split template segments.
+
+Usage:
+    python reflexio/scripts/benchmark_prompt_manager.py
+    python reflexio/scripts/benchmark_prompt_manager.py --instances 200 --renders 20000
+"""
+
+import argparse
+import time
+
+from reflexio.server.prompt.prompt_manager import (
+    PromptManager,
+    PromptRegistry,
+    get_prompt_registry,
+)
+
+
+def legacy_render(
+    registry: PromptRegistry, prompt_id: str, variables: dict[str, str]
+) -> str:
+    """Reproduce the previous first render of a fresh PromptManager: load from disk, then str.format."""
+    metadata = registry._load_metadata_file(prompt_id) or {}
+    prompt_bank = registry._build_prompt_bank(prompt_id, metadata)
+    assert prompt_bank is not None
+    prompt = prompt_bank.versions[prompt_bank.active_version]
+    return prompt.content.format(**variables)
+
+
+def sample_variables(registry: PromptRegistry) -> dict[str, dict[str, str]]:
+    """Build 2KB string values for every variable of each prompt's active version."""
+    samples = {}
+    for prompt_id in registry.get_all_prompt_ids():
+        compiled_prompt = registry.get_compiled_prompt(prompt_id)
+        if compiled_prompt is None or compiled_prompt.segments is None:
+            continue
+        samples[prompt_id] = dict.fromkeys(
+            compiled_prompt.fields | compiled_prompt.variables, "x" * 2000
+        )
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--instances",
+        type=int,
+        default=100,
+        help="PromptManager instances (requests) to simulate",
+    )
+    parser.add_argument(
+        "--renders", type=int, default=10_000, help="Renders per render benchmark"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    registry = get_prompt_registry()
+    print(
+        f"shared registry load: {time.perf_counter() - start:.4f}s "
+        f"({len(registry.get_all_prompt_ids())} prompts)"
+    )
+
+    samples = sample_variables(registry)
+    prompt_ids = list(samples)
+
+    # Every request builds a PromptManager and renders each prompt once
+    start = time.perf_counter()
+    for _ in range(args.instances):
+        for prompt_id in prompt_ids:
+            legacy_render(registry, prompt_id, samples[prompt_id])
+    legacy_requests = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(args.instances):
+        manager = PromptManager()
+        for prompt_id in prompt_ids:
+            manager.render_prompt(prompt_id, samples[prompt_id])
+    shared_requests = time.perf_counter() - start
+    print(
+        f"{args.instances} requests x {len(prompt_ids)} prompts: "
+        f"per-instance load {legacy_requests:.4f}s, shared {shared_requests:.4f}s "
+        f"({legacy_requests / shared_requests:.1f}x)"
+    )
+
+    print(f"{'prompt_id':>42} {'str.format (us)':>16} {'compiled (us)':>14}")
+    manager = PromptManager()
+    for prompt_id in prompt_ids:
+        variables = samples[prompt_id]
+        prompt_bank = registry.get_prompt_bank(prompt_id)
+        assert prompt_bank is not None
+        content = prompt_bank.versions[prompt_bank.active_version].content
+        start = time.perf_counter()
+        for _ in range(args.renders):
+            content.format(**variables)
+        baseline = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args.renders):
+            manager.render_prompt(prompt_id, variables)
+        compiled = time.perf_counter() - start
+        print(
+            f"{prompt_id:>42} {baseline / args.renders * 1e6:>16.1f} "
+            f"{compiled / args.renders * 1e6:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -40,12 +40,140 @@ LOCAL_STORAGE_PATH = os.environ.get(
     "LOCAL_STORAGE_PATH", str(Path(data.__file__).parent)
 ).strip() or str(Path(data.__file__).parent)
 
+# Max number of parsed records LocalJsonStorage keeps in its in-process model cache (0 disables the cache)
+
+LOCAL_STORAGE_MODEL_CACHE_SIZE = int(
+    os.environ.get("LOCAL_STORAGE_MODEL_CACHE_SIZE", "").strip() or "100000"
+)
+
+# Embedding cache: max embeddings kept in memory (0 disables the cache) and optional on-disk tier directory
+
+EMBEDDING_CACHE_SIZE = int(
+    os.environ.get("EMBEDDING_CACHE_SIZE", "").strip() or "10000"
+)
+EMBEDDING_CACHE_DIR = os.environ.get("EMBEDDING_CACHE_DIR", "").strip()
+
 # Local SQLite database file related
 
 SQLITE_FILE_DIRECTORY = os.environ.get(
     "SQLITE_FILE_DIRECTORY", str(Path(data.__file__).parent)
 ).strip() or str(Path(data.__file__).parent)
 
+# Run a service's independent extractors concurrently on the shared "llm" executor. Off (default):
+# extractors run one at a time, each chained on the previous results; on: only extractors with
+# depends_on_previous_extractors are chained
+
+PARALLEL_EXTRACTION = os.environ.get("PARALLEL_EXTRACTION", "").strip().lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+# Shared executors: worker counts per pool as "name=workers,..." (pools: generation, llm, embedding,
+# storage, search, aggregation) and queued tasks allowed per worker before submissions are rejected
+
+EXECUTOR_POOL_SIZES = os.environ.get("EXECUTOR_POOL_SIZES", "").strip()
+EXECUTOR_MAX_QUEUE_PER_WORKER = int(
+    os.environ.get("EXECUTOR_MAX_QUEUE_PER_WORKER", "").strip() or "4"
+)
+
+# Async LLM client: max in-flight requests per provider (openai, anthropic, ...) on the shared LLM
+# event loop; further async calls wait for a slot
+
+LLM_ASYNC_CONCURRENCY_PER_PROVIDER = int(
+    os.environ.get("LLM_ASYNC_CONCURRENCY_PER_PROVIDER", "").strip() or "64"
+)
+
+# Site vars: seconds between source-file change checks of the shared site var registry
+# (0 disables polling), and Redis URL whose reload channel triggers reloads across processes
+
+SITE_VAR_RELOAD_INTERVAL_SECONDS = float(
+    os.environ.get("SITE_VAR_RELOAD_INTERVAL_SECONDS", "").strip() or "5"
+)
+SITE_VAR_REDIS_URL = os.environ.get("SITE_VAR_REDIS_URL", "").strip()
+
+# Prompts: set to true to reload the shared prompt bank when its files change (for prompt development)
+
+PROMPT_HOT_RELOAD = os.environ.get("PROMPT_HOT_RELOAD", "").strip().lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+# Durable publish queue: backend ("sqlite" or "postgres"; empty processes publishes in-process),
+# Postgres URL, worker threads, per-org concurrency, attempts before dead-lettering, and max pending jobs per org
+
+PUBLISH_QUEUE_BACKEND = os.environ.get("PUBLISH_QUEUE_BACKEND", "").strip().lower()
+PUBLISH_QUEUE_DB_URL = os.environ.get("PUBLISH_QUEUE_DB_URL", "").strip()
+PUBLISH_QUEUE_WORKERS = int(os.environ.get("PUBLISH_QUEUE_WORKERS", "").strip() or "4")
+PUBLISH_QUEUE_PER_ORG_CONCURRENCY = int(
+    os.environ.get("PUBLISH_QUEUE_PER_ORG_CONCURRENCY", "").strip() or "2"
+)
+PUBLISH_QUEUE_MAX_ATTEMPTS = int(
+    os.environ.get("PUBLISH_QUEUE_MAX_ATTEMPTS", "").strip() or "5"
+)
+PUBLISH_QUEUE_MAX_DEPTH = int(
+    os.environ.get("PUBLISH_QUEUE_MAX_DEPTH", "").strip() or "10000"
+)
+
+# Aggregation scheduler: seconds to debounce feedback aggregation and skill generation triggers per
+# (org, feedback_name, agent_version) and run them in the background (0 runs them inline during publish)
+
+AGGREGATION_DEBOUNCE_SECONDS = float(
+    os.environ.get("AGGREGATION_DEBOUNCE_SECONDS", "").strip() or "0"
+)
+
+# Raw feedbacks fetched per page when aggregation and skill generation stream all raw feedbacks
+# with embeddings (keep at or below PostgREST's max-rows, 1000 on Supabase)
+
+RAW_FEEDBACK_PAGE_SIZE = int(
+    os.environ.get("RAW_FEEDBACK_PAGE_SIZE", "").strip() or "1000"
+)
+
+# Reflexio instance cache: memory budget in MB for cached per-org Reflexio instances (least recently
+# used instances are evicted once their estimated total size exceeds it), and number of most
+# recently active orgs whose instances are pre-built at startup (0 disables the warm-up)
+
+REFLEXIO_CACHE_MAX_MB = float(
+    os.environ.get("REFLEXIO_CACHE_MAX_MB", "").strip() or "512"
+)
+REFLEXIO_CACHE_WARMUP_ORGS = int(
+    os.environ.get("REFLEXIO_CACHE_WARMUP_ORGS", "").strip() or "0"
+)
+
+# Supabase client pool: max connections of the shared HTTP/2 connection pool (all kept alive) and
+# seconds an idle connection is kept open
+
+SUPABASE_HTTP_MAX_CONNECTIONS = int(
+    os.environ.get("SUPABASE_HTTP_MAX_CONNECTIONS", "").strip() or "100"
+)
+SUPABASE_HTTP_KEEPALIVE_SECONDS = float(
+    os.environ.get("SUPABASE_HTTP_KEEPALIVE_SECONDS", "").strip() or "30"
+)
+
+# Unified search result cache: max cached responses (0 disables the cache), seconds an entry stays
+# fresh, and min cosine similarity for reusing the results of a near-duplicate query (0 disables it)
+
+UNIFIED_SEARCH_CACHE_SIZE = int(
+    os.environ.get("UNIFIED_SEARCH_CACHE_SIZE", "").strip() or "1024"
+)
+UNIFIED_SEARCH_CACHE_TTL_SECONDS = float(
+    os.environ.get("UNIFIED_SEARCH_CACHE_TTL_SECONDS", "").strip() or "60"
+)
+UNIFIED_SEARCH_CACHE_SIMILARITY = float(
+    os.environ.get("UNIFIED_SEARCH_CACHE_SIMILARITY", "").strip() or "0"
+)
+
+# Query rewrite cache: max cached (model, query, conversation history) -> rewritten query entries
+# (0 disables the cache) and seconds an entry is reused
+
+QUERY_REWRITE_CACHE_SIZE = int(
+    os.environ.get("QUERY_REWRITE_CACHE_SIZE", "").strip() or "4096"
+)
+QUERY_REWRITE_CACHE_TTL_SECONDS = float(
+    os.environ.get("QUERY_REWRITE_CACHE_TTL_SECONDS", "").strip() or "3600"
+)
+
 # Interaction cleanup configuration
 
 INTERACTION_CLEANUP_THRESHOLD = int(
@@ -1,6 +1,8 @@
 import asyncio
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated, Any
 
 from fastapi import (
@@ -105,6 +107,8 @@ from reflexio_commons.api_schema.service_schemas import (
     ProfileChangeLogResponse,
     PublishUserInteractionRequest,
     PublishUserInteractionResponse,
+    PublishUserInteractionsBulkRequest,
+    PublishUserInteractionsBulkResponse,
     RerunFeedbackGenerationRequest,
     RerunFeedbackGenerationResponse,
     RerunProfileGenerationRequest,
@@ -148,8 +152,11 @@ from reflexio.server.api_endpoints.login import (
 from reflexio.server.api_endpoints.oauth import get_configured_oauth_providers
 from reflexio.server.api_endpoints.oauth import router as oauth_router
 from reflexio.server.cache.reflexio_cache import (
+    get_cache_stats,
     get_reflexio,
     invalidate_reflexio_cache,
+    start_reflexio_cache_warmup,
+    stop_reflexio_cache_warmup,
 )
 from reflexio.server.db.db_operations import (
     claim_invitation_code,
@@ -163,12 +170,36 @@ from reflexio.server.db.db_operations import (
     release_invitation_code,
     update_organization,
 )
+from reflexio.server.prompt.prompt_manager import get_prompt_registry
 from reflexio.server.services.email.email_service import get_email_service
+from reflexio.server.services.executor_registry import (
+    ExecutorSaturatedError,
+    get_executor_stats,
+)
+from reflexio.server.services.feedback.aggregation_scheduler import (
+    get_aggregation_scheduler_stats,
+    start_aggregation_scheduler,
+    stop_aggregation_scheduler,
+)
+from reflexio.server.services.publish_queue.publish_queue_base import (
+    PublishQueueFullError,
+)
+from reflexio.server.services.publish_queue.publish_queue_worker import (
+    get_publish_queue_stats,
+    start_publish_queue_workers,
+    stop_publish_queue_workers,
+)
+from reflexio.server.services.query_rewriter import get_query_rewrite_cache_stats
+from reflexio.server.services.search_result_cache import get_search_cache_stats
+from reflexio.server.services.storage.supabase_client_pool import (
+    get_supabase_client_pool_stats,
+)
 from reflexio.server.site_var.feature_flags import (
     get_all_feature_flags,
     is_invitation_only_enabled,
     is_skill_generation_enabled,
 )
+from reflexio.server.site_var.site_var_manager import get_site_var_stats
 
 logger = logging.getLogger(__name__)
 
@@ -270,12 +301,57 @@ class TimeoutMiddleware(BaseHTTPMiddleware):
             )
 
 
-app = FastAPI(docs_url="/docs")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Load the shared prompt bank and start the publish queue workers (if a queue backend is configured),
+    the aggregation scheduler (if AGGREGATION_DEBOUNCE_SECONDS > 0) and the Reflexio cache warm-up
+    (if REFLEXIO_CACHE_WARMUP_ORGS > 0) for the app's lifetime.
+
+    Args:
+        app (FastAPI): The application
+    """
+    get_prompt_registry()
+    start_reflexio_cache_warmup()
+    start_aggregation_scheduler(publisher_api.run_scheduled_feedback_aggregation)
+    start_publish_queue_workers(publisher_api.process_publish_job)
+    yield
+    stop_publish_queue_workers()
+    stop_aggregation_scheduler()
+    stop_reflexio_cache_warmup()
+
+
+app = FastAPI(docs_url="/docs", lifespan=lifespan)
 
 # Configure rate limiter
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[reportArgumentType]
 
+
+def _executor_saturated_handler(
+    request: Request,  # noqa: ARG001
+    exc: Exception,
+) -> Response:
+    """Answer 503 when a shared executor sheds load instead of queueing more work.
+
+    Args:
+        request (Request): The incoming request
+        exc (Exception): The ExecutorSaturatedError
+
+    Returns:
+        Response: 503 JSON response with a Retry-After header
+    """
+    from starlette.responses import JSONResponse
+
+    logger.warning("Shedding request: %s", exc)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, retry later"},
+        headers={"Retry-After": "5"},
+    )
+
+
+app.add_exception_handler(ExecutorSaturatedError, _executor_saturated_handler)
+
 # Add middlewares (order matters: last added = first executed)
 # 1. CORS (outermost)
 origins = [
@@ -1089,6 +1165,17 @@ def publish_user_interaction(
     if wait_for_response:
         # Process synchronously so the caller gets the real result
         return publisher_api.add_user_interaction(org_id=org_id, request=payload)
+    # Hand off to the durable queue when configured — survives restarts and applies backpressure
+    try:
+        queued = publisher_api.enqueue_user_interaction(org_id=org_id, request=payload)
+    except PublishQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "30"},
+        ) from e
+    if queued is not None:
+        return queued
     # Run in background — caller gets immediate acknowledgement
     background_tasks.add_task(
         publisher_api.add_user_interaction, org_id=org_id, request=payload
@@ -1098,6 +1185,154 @@ def publish_user_interaction(
     )
 
 
+@app.post(
+    "/api/publish_interactions_bulk",
+    response_model=PublishUserInteractionsBulkResponse,
+    response_model_exclude_none=True,
+)
+@limiter.limit("10/minute")  # Each call carries up to 1000 publish requests
+def publish_user_interactions_bulk(
+    request: Request,
+    payload: PublishUserInteractionsBulkRequest,
+    background_tasks: BackgroundTasks,
+    org_id: str = Depends(get_org_id_for_self_host),
+    wait_for_response: bool = False,
+) -> PublishUserInteractionsBulkResponse:
+    """Publish many user interaction requests, of any number of users, in one call.
+
+    Args:
+        request (Request): The HTTP request (used by the rate limiter)
+        payload (PublishUserInteractionsBulkRequest): The publish requests
+        background_tasks (BackgroundTasks): Background tasks used when no publish queue is configured
+        org_id (str): Organization ID
+        wait_for_response (bool): If True, process synchronously and return the real result
+
+    Returns:
+        PublishUserInteractionsBulkResponse: Response containing success status, message and request count
+    """
+    if wait_for_response:
+        return publisher_api.add_user_interactions_bulk(org_id=org_id, request=payload)
+    # The whole batch is one queue job, so it counts once against the org's queue depth
+    try:
+        queued = publisher_api.enqueue_user_interactions_bulk(
+            org_id=org_id, request=payload
+        )
+    except PublishQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "30"},
+        ) from e
+    if queued is not None:
+        return queued
+    background_tasks.add_task(
+        publisher_api.add_user_interactions_bulk, org_id=org_id, request=payload
+    )
+    return PublishUserInteractionsBulkResponse(
+        success=True,
+        message="Interactions queued for processing",
+        request_count=len(payload.requests),
+    )
+
+
+@app.get("/api/publish_queue_stats")
+def publish_queue_stats(
+    org_id: str = Depends(get_org_id_for_self_host),
+) -> dict[str, Any]:
+    """Get publish queue depth, lag, dead-letter count and worker counters.
+
+    Args:
+        org_id (str): Organization ID
+
+    Returns:
+        dict[str, Any]: Queue-wide stats, stats for the caller's org, and this process's worker counters
+    """
+    return get_publish_queue_stats(org_id=org_id)
+
+
+@app.get("/api/aggregation_scheduler_stats")
+def aggregation_scheduler_stats(
+    org_id: str = Depends(get_org_id_for_self_host),
+) -> dict[str, Any]:
+    """Get pending/running scheduled aggregations, trigger counters and run durations.
+
+    Args:
+        org_id (str): Organization ID
+
+    Returns:
+        dict[str, Any]: Scheduler-wide stats plus the caller's pending and running keys
+    """
+    return get_aggregation_scheduler_stats(org_id=org_id)
+
+
+@app.get("/api/executor_stats")
+def executor_stats(
+    org_id: str = Depends(get_org_id_for_self_host),  # noqa: ARG001
+) -> dict[str, Any]:
+    """Get active-thread and queue-length gauges and counters of the shared executors.
+
+    Args:
+        org_id (str): Organization ID (authentication only)
+
+    Returns:
+        dict[str, Any]: Stats keyed by executor name
+    """
+    return get_executor_stats()
+
+
+@app.get("/api/site_var_stats")
+def site_var_stats(
+    org_id: str = Depends(get_org_id_for_self_host),  # noqa: ARG001
+) -> dict[str, Any]:
+    """Get hit, miss and reload counters of the shared site var registry.
+
+    Args:
+        org_id (str): Organization ID (authentication only)
+
+    Returns:
+        dict[str, Any]: Registry stats
+    """
+    return get_site_var_stats()
+
+
+@app.get("/api/search_cache_stats")
+def search_cache_stats(
+    org_id: str = Depends(get_org_id_for_self_host),  # noqa: ARG001
+) -> dict[str, Any]:
+    """Get hit, miss, invalidation and latency-saved counters of the unified search result cache.
+
+    Args:
+        org_id (str): Organization ID (authentication only)
+
+    Returns:
+        dict[str, Any]: Cache stats for this process, with query rewrite cache and fast-path
+            counters under "query_rewrite"
+    """
+    return {
+        **get_search_cache_stats(),
+        "query_rewrite": get_query_rewrite_cache_stats(),
+    }
+
+
+@app.get("/api/reflexio_cache_stats")
+def reflexio_cache_stats(
+    org_id: str = Depends(get_org_id_for_self_host),  # noqa: ARG001
+) -> dict[str, Any]:
+    """Get size, hit/miss and eviction counters of the Reflexio instance cache.
+
+    Args:
+        org_id (str): Organization ID (authentication only)
+
+    Returns:
+        dict[str, Any]: Cache stats for this process, with the shared Supabase client pool
+            counters under "supabase_client_pool"
+    """
+    return {
+        **get_cache_stats(),
+        "supabase_client_pool": get_supabase_client_pool_stats(),
+    }
+
+
 @app.post(
     "/api/add_raw_feedback",
     response_model=AddRawFeedbackResponse,
@@ -1152,12 +1387,12 @@ def add_feedback_endpoint(
     response_model_exclude_none=True,
 )
 @limiter.limit("120/minute")  # Rate limit for read operations
-def search_profiles(
+async def search_profiles(
     request: Request,
     payload: SearchUserProfileRequest,
     org_id: str = Depends(get_org_id_for_self_host),
 ) -> SearchUserProfileResponse:
-    return retriever_api.search_user_profiles(org_id=org_id, request=payload)
+    return await retriever_api.asearch_user_profiles(org_id=org_id, request=payload)
 
 
 @app.post(
@@ -1242,15 +1477,15 @@ def search_feedbacks_endpoint(
     response_model_exclude_none=True,
 )
 @limiter.limit("120/minute")
-def unified_search_endpoint(
+async def unified_search_endpoint(
     request: Request,
     payload: UnifiedSearchRequest,
     org_id: str = Depends(get_org_id_for_self_host),
 ) -> UnifiedSearchResponse:
     """Search across all entity types (profiles, feedbacks, raw_feedbacks, skills).
 
-    Runs query rewriting and embedding generation in parallel, then searches
-    all entity types in parallel. Query rewriting is gated behind the
+    Runs query rewriting and embedding generation concurrently, then searches
+    all entity types concurrently, all awaited on the event loop. Query rewriting is gated behind the
     query_rewrite feature flag. Skills are only searched if the
     skill_generation feature flag is enabled for the org.
 
@@ -1262,7 +1497,7 @@ def unified_search_endpoint(
     Returns:
         UnifiedSearchResponse: Combined search results
     """
-    response = retriever_api.unified_search(org_id=org_id, request=payload)
+    response = await retriever_api.aunified_search(org_id=org_id, request=payload)
     # Filter out embedding fields
     for profile in response.profiles:
         profile.embedding = []
@@ -1437,11 +1672,11 @@ def get_requests_endpoint(
     response_model=GetUserProfilesResponse,
     response_model_exclude_none=True,
 )
-def get_profiles(
+async def get_profiles(
     request: GetUserProfilesRequest,
     org_id: str = Depends(get_org_id_for_self_host),
 ) -> GetUserProfilesResponse:
-    return retriever_api.get_user_profiles(org_id=org_id, request=request)
+    return await retriever_api.aget_user_profiles(org_id=org_id, request=request)
 
 
 @app.get(
@@ -2,7 +2,9 @@
 Create, edit, delete user interaction and user profile
 """
 
+import json
 import logging
+import uuid
 
 from reflexio_commons.api_schema.retriever_schema import (
     UpdateFeedbackStatusRequest,
@@ -27,6 +29,8 @@ from reflexio_commons.api_schema.service_schemas import (
     DeleteUserProfileResponse,
     PublishUserInteractionRequest,
     PublishUserInteractionResponse,
+    PublishUserInteractionsBulkRequest,
+    PublishUserInteractionsBulkResponse,
     RunFeedbackAggregationRequest,
     RunFeedbackAggregationResponse,
     RunSkillGenerationRequest,
@@ -38,9 +42,20 @@ from reflexio.server.api_endpoints.precondition_checks import (
     validate_publish_user_interaction_request,
 )
 from reflexio.server.cache.reflexio_cache import get_reflexio
+from reflexio.server.services.feedback.feedback_generation_service import (
+    run_feedback_aggregation_for_config,
+)
+from reflexio.server.services.publish_queue.publish_queue_base import PublishJob
+from reflexio.server.services.publish_queue.publish_queue_worker import (
+    get_publish_queue,
+    notify_publish_queue_workers,
+)
 
 logger = logging.getLogger(__name__)
 
+# Namespace of the request IDs derived from publish queue jobs
+_PUBLISH_JOB_NAMESPACE = uuid.UUID("6f1d6c5e-3b7a-5c1e-9a4f-2d8e0b7c4a91")
+
 # ==============================
 # Create user interaction and profile
 # ==============================
@@ -49,12 +64,17 @@ logger = logging.getLogger(__name__)
 def add_user_interaction(
     org_id: str,
     request: PublishUserInteractionRequest,
+    *,
+    request_id: str | None = None,
+    replace_existing: bool = False,
 ) -> PublishUserInteractionResponse:
     """Add user interaction
 
     Args:
         org_id (str): Organization ID
         request (PublishUserInteractionRequest): The request containing interaction data
+        request_id (str, optional): ID to store the request under (a new UUID when None)
+        replace_existing (bool): Replace a request already stored under `request_id` instead of adding to it
 
     Returns:
         PublishUserInteractionResponse: Response containing success status and message
@@ -64,7 +84,183 @@ def add_user_interaction(
         return PublishUserInteractionResponse(success=False, message=message)
 
     reflexio = get_reflexio(org_id=org_id)
-    return reflexio.publish_interaction(request=request)
+    return reflexio.publish_interaction(
+        request=request, request_id=request_id, replace_existing=replace_existing
+    )
+
+
+def enqueue_user_interaction(
+    org_id: str,
+    request: PublishUserInteractionRequest,
+) -> PublishUserInteractionResponse | None:
+    """Validate a publish request and add it to the durable publish queue.
+
+    Args:
+        org_id (str): Organization ID
+        request (PublishUserInteractionRequest): The request containing interaction data
+
+    Returns:
+        PublishUserInteractionResponse | None: Response for the caller, or None when no queue is configured
+
+    Raises:
+        PublishQueueFullError: If the org already has too many pending jobs
+    """
+    queue = get_publish_queue()
+    if queue is None:
+        return None
+    is_valid, message = validate_publish_user_interaction_request(request)
+    if not is_valid:
+        return PublishUserInteractionResponse(success=False, message=message)
+
+    job_id = queue.enqueue(org_id, request.model_dump_json())
+    notify_publish_queue_workers()
+    logger.debug("Enqueued publish job %s for org %s", job_id, org_id)
+    return PublishUserInteractionResponse(
+        success=True, message="Interaction queued for processing"
+    )
+
+
+def _validate_publish_user_interactions_bulk_request(
+    request: PublishUserInteractionsBulkRequest,
+) -> tuple[bool, str]:
+    """Validate every request of a bulk publish request.
+
+    Args:
+        request (PublishUserInteractionsBulkRequest): The request to validate
+
+    Returns:
+        tuple[bool, str]: Whether all requests are valid, and the message of the first invalid one
+    """
+    for i, publish_request in enumerate(request.requests):
+        is_valid, message = validate_publish_user_interaction_request(publish_request)
+        if not is_valid:
+            return False, f"requests[{i}]: {message}"
+    return True, ""
+
+
+def add_user_interactions_bulk(
+    org_id: str,
+    request: PublishUserInteractionsBulkRequest,
+    *,
+    request_ids: list[str] | None = None,
+    replace_existing: bool = False,
+) -> PublishUserInteractionsBulkResponse:
+    """Add many user interaction requests at once
+
+    Args:
+        org_id (str): Organization ID
+        request (PublishUserInteractionsBulkRequest): The request containing the publish requests
+        request_ids (list[str], optional): IDs to store the requests under, in order (new UUIDs when None)
+        replace_existing (bool): Replace requests already stored under `request_ids` instead of adding to them
+
+    Returns:
+        PublishUserInteractionsBulkResponse: Response containing success status, message and published count
+    """
+    is_valid, message = _validate_publish_user_interactions_bulk_request(request)
+    if not is_valid:
+        return PublishUserInteractionsBulkResponse(success=False, message=message)
+
+    reflexio = get_reflexio(org_id=org_id)
+    return reflexio.publish_interactions_bulk(
+        request=request, request_ids=request_ids, replace_existing=replace_existing
+    )
+
+
+def enqueue_user_interactions_bulk(
+    org_id: str,
+    request: PublishUserInteractionsBulkRequest,
+) -> PublishUserInteractionsBulkResponse | None:
+    """Validate a bulk publish request and add it to the durable publish queue as one job.
+
+    Args:
+        org_id (str): Organization ID
+        request (PublishUserInteractionsBulkRequest): The request containing the publish requests
+
+    Returns:
+        PublishUserInteractionsBulkResponse | None: Response for the caller, or None when no queue is configured
+
+    Raises:
+        PublishQueueFullError: If the org already has too many pending jobs
+    """
+    queue = get_publish_queue()
+    if queue is None:
+        return None
+    is_valid, message = _validate_publish_user_interactions_bulk_request(request)
+    if not is_valid:
+        return PublishUserInteractionsBulkResponse(success=False, message=message)
+
+    job_id = queue.enqueue(org_id, request.model_dump_json())
+    notify_publish_queue_workers()
+    logger.debug(
+        "Enqueued bulk publish job %s (%d requests) for org %s",
+        job_id,
+        len(request.requests),
+        org_id,
+    )
+    return PublishUserInteractionsBulkResponse(
+        success=True,
+        message="Interactions queued for processing",
+        request_count=len(request.requests),
+    )
+
+
+def publish_job_request_id(job: PublishJob, index: int) -> str:
+    """Get the stable request ID of one publish request of a queue job.
+
+    The enqueue time is part of the name, so job IDs reused by a recreated queue database do not
+    map to requests stored by earlier jobs.
+
+    Args:
+        job (PublishJob): The queue job
+        index (int): Position of the publish request in the job payload (0 for single publishes)
+
+    Returns:
+        str: UUID derived from the job and the index, the same on every attempt of the job
+    """
+    return str(
+        uuid.uuid5(
+            _PUBLISH_JOB_NAMESPACE,
+            f"{job.org_id}:{job.job_id}:{job.enqueued_at!r}:{index}",
+        )
+    )
+
+
+def process_publish_job(job: PublishJob) -> None:
+    """Process one publish queue job.
+
+    Requests are stored under IDs derived from the job, and later attempts (retries and reclaimed
+    leases) replace whatever an interrupted earlier attempt stored instead of duplicating it.
+
+    Args:
+        job (PublishJob): Claimed job whose payload is a serialized PublishUserInteractionRequest,
+            or a PublishUserInteractionsBulkRequest for bulk publishes
+
+    Raises:
+        RuntimeError: If publishing failed, so the queue retries or dead-letters the job
+    """
+    payload = json.loads(job.payload)
+    replace_existing = job.attempts > 1
+    if "requests" in payload:
+        bulk_request = PublishUserInteractionsBulkRequest.model_validate(payload)
+        response = add_user_interactions_bulk(
+            org_id=job.org_id,
+            request=bulk_request,
+            request_ids=[
+                publish_job_request_id(job, i)
+                for i in range(len(bulk_request.requests))
+            ],
+            replace_existing=replace_existing,
+        )
+    else:
+        request = PublishUserInteractionRequest.model_validate(payload)
+        response = add_user_interaction(
+            org_id=job.org_id,
+            request=request,
+            request_id=publish_job_request_id(job, 0),
+            replace_existing=replace_existing,
+        )
+    if not response.success:
+        raise RuntimeError(response.message or "publish_interaction failed")
 
 
 def add_raw_feedback(
@@ -247,6 +443,39 @@ def run_feedback_aggregation(
     return RunFeedbackAggregationResponse(success=True)
 
 
+def run_scheduled_feedback_aggregation(
+    org_id: str, feedback_name: str, agent_version: str
+) -> None:
+    """Run aggregation (and auto skill generation) for a trigger of the aggregation scheduler.
+
+    Args:
+        org_id (str): Organization ID
+        feedback_name (str): Feedback name to aggregate
+        agent_version (str): Agent version to aggregate
+    """
+    reflexio = get_reflexio(org_id=org_id)
+    feedback_configs = (
+        reflexio.request_context.configurator.get_config().agent_feedback_configs or []
+    )
+    for feedback_config in feedback_configs:
+        if (
+            feedback_config.feedback_name == feedback_name
+            and feedback_config.feedback_aggregator_config
+        ):
+            run_feedback_aggregation_for_config(
+                llm_client=reflexio.llm_client,
+                request_context=reflexio.request_context,
+                agent_version=agent_version,
+                feedback_config=feedback_config,
+            )
+            return
+    logger.info(
+        "Skipping scheduled aggregation for org %s: feedback_name %s has no aggregator config",
+        org_id,
+        feedback_name,
+    )
+
+
 # ==============================
 # Run skill generation
 # ==============================
@@ -1,5 +1,8 @@
+import threading
+
 from reflexio.server.prompt.prompt_manager import PromptManager
 from reflexio.server.services.configurator.configurator import SimpleConfigurator
+from reflexio.server.services.storage.storage_base import BaseStorage
 
 
 class RequestContext:
@@ -15,9 +18,40 @@ class RequestContext:
             org_id, base_dir=storage_base_dir
         )
         self.prompt_manager = PromptManager()
-        self.storage = self.configurator.create_storage(
-            storage_config=self.configurator.get_current_storage_configuration(),
-        )
+        # Storage is created on first use (see the storage property)
+        self._storage: BaseStorage | None = None
+        self._storage_created = False
+        self._storage_lock = threading.Lock()
+
+    @property
+    def storage(self) -> BaseStorage | None:
+        """Storage of the org's configured storage config, created on first use.
+
+        Creating storage can open clients and build the embedding LLM client, so instances that
+        never touch storage (config reads) skip it; concurrent first uses create it once.
+
+        Returns:
+            BaseStorage | None: The storage, or None if no storage is configured
+        """
+        if not self._storage_created:
+            with self._storage_lock:
+                if not self._storage_created:
+                    self._storage = self.configurator.create_storage(
+                        storage_config=self.configurator.get_current_storage_configuration(),
+                    )
+                    self._storage_created = True
+        return self._storage
+
+    @property
+    def storage_created(self) -> bool:
+        """Whether storage was already created (or set), so reading `storage` no longer builds it."""
+        return self._storage_created
+
+    @storage.setter
+    def storage(self, storage: BaseStorage | None) -> None:
+        with self._storage_lock:
+            self._storage = storage
+            self._storage_created = True
 
     def is_storage_configured(self) -> bool:
         """Check if storage is configured and available.
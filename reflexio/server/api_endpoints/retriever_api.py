@@ -25,7 +25,7 @@ from reflexio_commons.api_schema.service_schemas import (
     ProfileChangeLogResponse,
 )
 
-from reflexio.server.cache.reflexio_cache import get_reflexio
+from reflexio.server.cache.reflexio_cache import aget_reflexio, get_reflexio
 
 # ==============================
 # Search profiles and interactions
@@ -55,6 +55,23 @@ def search_user_profiles(
     return reflexio.search_profiles(request)
 
 
+async def asearch_user_profiles(
+    org_id: str,
+    request: SearchUserProfileRequest,
+) -> SearchUserProfileResponse:
+    """Async twin of search_user_profiles for async endpoints.
+
+    Args:
+        org_id (str): Organization ID
+        request (SearchUserProfileRequest): The search request
+
+    Returns:
+        SearchUserProfileResponse: Response containing matching user profiles
+    """
+    reflexio = await aget_reflexio(org_id=org_id)
+    return await reflexio.asearch_profiles(request)
+
+
 def search_interactions(
     org_id: str,
     request: SearchInteractionRequest,
@@ -105,6 +122,23 @@ def get_user_profiles(
     return reflexio.get_profiles(request, status_filter=request.status_filter)
 
 
+async def aget_user_profiles(
+    org_id: str,
+    request: GetUserProfilesRequest,
+) -> GetUserProfilesResponse:
+    """Async twin of get_user_profiles for async endpoints.
+
+    Args:
+        org_id (str): Organization ID
+        request (GetUserProfilesRequest): The get request
+
+    Returns:
+        GetUserProfilesResponse: Response containing user profiles
+    """
+    reflexio = await aget_reflexio(org_id=org_id)
+    return await reflexio.aget_profiles(request, status_filter=request.status_filter)
+
+
 def get_user_interactions(
     org_id: str,
     request: GetInteractionsRequest,
@@ -267,3 +301,20 @@ def unified_search(
     """
     reflexio = get_reflexio(org_id=org_id)
     return reflexio.unified_search(request, org_id=org_id)
+
+
+async def aunified_search(
+    org_id: str,
+    request: UnifiedSearchRequest,
+) -> UnifiedSearchResponse:
+    """Async twin of unified_search for async endpoints.
+
+    Args:
+        org_id (str): Organization ID
+        request (UnifiedSearchRequest): The unified search request
+
+    Returns:
+        UnifiedSearchResponse: Combined search results from all entity types
+    """
+    reflexio = await aget_reflexio(org_id=org_id)
+    return await reflexio.aunified_search(request, org_id=org_id)
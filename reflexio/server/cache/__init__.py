@@ -4,12 +4,24 @@ from reflexio.server.cache.reflexio_cache import (
     clear_reflexio_cache,
     get_cache_stats,
     get_reflexio,
+    get_storage_cache_stats,
     invalidate_reflexio_cache,
 )
+from reflexio.server.llm.embedding_cache import get_embedding_cache_stats
+from reflexio.server.services.query_rewriter import get_query_rewrite_cache_stats
+from reflexio.server.services.search_result_cache import get_search_cache_stats
+from reflexio.server.services.storage.supabase_client_pool import (
+    get_supabase_client_pool_stats,
+)
 
 __all__ = [
     "get_reflexio",
     "invalidate_reflexio_cache",
     "clear_reflexio_cache",
     "get_cache_stats",
+    "get_storage_cache_stats",
+    "get_embedding_cache_stats",
+    "get_search_cache_stats",
+    "get_query_rewrite_cache_stats",
+    "get_supabase_client_pool_stats",
 ]
@@ -0,0 +1,90 @@
+"""
+Persisted record of the orgs whose Reflexio instances were most recently used.
+
+The instance cache writes a row when it builds an instance and, on shutdown, for every instance
+still cached; the startup warm-up reads the most recent rows to pre-build those instances before
+their first request. Rows live in a SQLite file so they survive restarts.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# (org_id, storage_base_dir), as in reflexio_cache.CacheKey
+OrgKey = tuple[str, str | None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recent_orgs (
+    org_id TEXT NOT NULL,
+    storage_base_dir TEXT NOT NULL,
+    last_active_at REAL NOT NULL,
+    PRIMARY KEY (org_id, storage_base_dir)
+);
+CREATE INDEX IF NOT EXISTS idx_recent_orgs_last_active ON recent_orgs (last_active_at);
+"""
+
+
+class RecentOrgs:
+    """Last-active timestamps of (org_id, storage_base_dir) keys in a SQLite file."""
+
+    def __init__(self, db_path: str, max_rows: int = 10000) -> None:
+        """
+        Args:
+            db_path (str): SQLite file holding the timestamps
+            max_rows (int): Rows kept; the least recently active are pruned beyond it
+        """
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            db_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.executescript(_SCHEMA)
+
+    def record(self, keys: list[OrgKey], now: float | None = None) -> None:
+        """
+        Mark keys as active now.
+
+        Args:
+            keys (list[OrgKey]): Keys to mark
+            now (float, optional): Unix time to record (defaults to the current time)
+        """
+        if not keys:
+            return
+        now = time.time() if now is None else now
+        with self._lock:
+            # storage_base_dir None is stored as "" so it takes part in the primary key
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO recent_orgs (org_id, storage_base_dir, last_active_at) "
+                "VALUES (?, ?, ?)",
+                [(org_id, base_dir or "", now) for org_id, base_dir in keys],
+            )
+            self._conn.execute(
+                "DELETE FROM recent_orgs WHERE rowid NOT IN (SELECT rowid FROM recent_orgs "
+                "ORDER BY last_active_at DESC LIMIT ?)",
+                (self.max_rows,),
+            )
+
+    def most_recent(self, limit: int) -> list[OrgKey]:
+        """
+        Get the most recently active keys.
+
+        Args:
+            limit (int): Max keys to return
+
+        Returns:
+            list[OrgKey]: Keys, most recently active first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT org_id, storage_base_dir FROM recent_orgs "
+                "ORDER BY last_active_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [(org_id, base_dir or None) for org_id, base_dir in rows]
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
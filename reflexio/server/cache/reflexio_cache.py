@@ -1,28 +1,147 @@
-"""Reflexio instance cache with explicit invalidation."""
+"""Reflexio instance cache with explicit invalidation.
 
+Instances are kept in an LRU cache bounded by their estimated memory rather than by org count, so a
+process serving many small orgs is not forced to evict and rebuild them under churn, while a few
+orgs holding large in-memory storage cannot grow it without bound.
+"""
+
+import asyncio
+import logging
+import sys
 import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, NamedTuple
 
 from cachetools import TTLCache
 
 from reflexio.reflexio_lib.reflexio_lib import Reflexio
+from reflexio.server import (
+    REFLEXIO_CACHE_MAX_MB,
+    REFLEXIO_CACHE_WARMUP_ORGS,
+    SQLITE_FILE_DIRECTORY,
+)
+from reflexio.server.cache.recent_orgs import RecentOrgs
+from reflexio.server.services.executor_registry import run_in_executor_async
+from reflexio.server.services.storage.local_json_storage import (
+    get_local_storage_cache_stats,
+)
+
+logger = logging.getLogger(__name__)
 
 # Cache configuration
-REFLEXIO_CACHE_MAX_SIZE = 100
+REFLEXIO_CACHE_MAX_BYTES = int(REFLEXIO_CACHE_MAX_MB * 1024 * 1024)
 REFLEXIO_CACHE_TTL_SECONDS = 3600  # 1 hour safety net
 
 # Type alias for cache key: (org_id, storage_base_dir)
 CacheKey = tuple[str, str | None]
 
+# Packages whose objects the size estimate descends into; objects of other packages (HTTP, S3 and
+# LLM SDK clients, mostly shared process-wide) are counted shallowly
+_OWNED_PACKAGES = ("reflexio", "reflexio_commons")
+
+
+class _CacheEntry(NamedTuple):
+    """A cached Reflexio instance with its memory estimate.
+
+    Storage is created on an instance's first use, so an instance sized before that is sized again
+    once its storage exists (see _resize_initialized_entry).
+    """
+
+    reflexio: Reflexio
+    size_bytes: int
+    includes_storage: bool
+
+
+def estimate_size(obj: Any) -> int:
+    """Estimate the bytes an object graph retains, counting each object once.
+
+    Descends into containers and into the attributes of objects defined by Reflexio; homogeneous
+    sequences of numbers (embeddings) are sized from their first element.
+
+    Args:
+        obj (Any): Root object
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+        if isinstance(current, str | bytes | bytearray | int | float | bool | type):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, list | tuple | set | frozenset):
+            first = next(iter(current), None)
+            if isinstance(first, int | float):
+                total += len(current) * sys.getsizeof(first)
+            else:
+                stack.extend(current)
+        elif type(current).__module__.split(".")[0] in _OWNED_PACKAGES:
+            attributes = getattr(current, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+    return total
+
+
+class _ReflexioCache(TTLCache):
+    """TTLCache of _CacheEntry values weighted by size_bytes, counting evictions and expirations."""
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        super().__init__(
+            maxsize=max_bytes,
+            ttl=ttl,
+            # An instance larger than the whole budget still gets cached, alone
+            getsizeof=lambda entry: min(entry.size_bytes, max_bytes),
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.coalesced = 0
+        self.warmed_up = 0
+
+    def popitem(self) -> tuple[CacheKey, _CacheEntry]:
+        key, entry = super().popitem()
+        self.evictions += 1
+        return key, entry
+
+    def expire(self, time: float | None = None) -> list[tuple[CacheKey, _CacheEntry]]:
+        expired = super().expire(time)
+        self.expirations += len(expired)
+        return expired
+
+
 # Module-level cache and lock
-_reflexio_cache: TTLCache = TTLCache(
-    maxsize=REFLEXIO_CACHE_MAX_SIZE, ttl=REFLEXIO_CACHE_TTL_SECONDS
+_reflexio_cache = _ReflexioCache(
+    max_bytes=REFLEXIO_CACHE_MAX_BYTES, ttl=REFLEXIO_CACHE_TTL_SECONDS
 )
 _reflexio_cache_lock = threading.Lock()
+# Instances being built, so concurrent misses of a key wait for one construction (single-flight)
+_inflight: dict[CacheKey, Future] = {}
+
+# Recently active orgs and the warm-up thread, set up by start_reflexio_cache_warmup()
+_recent_orgs: RecentOrgs | None = None
+_warmup_thread: threading.Thread | None = None
+_warmup_stop = threading.Event()
 
 
 def get_reflexio(org_id: str, storage_base_dir: str | None = None) -> Reflexio:
     """Get or create cached Reflexio instance.
 
+    Concurrent misses of the same key build one instance: the first caller builds it and the
+    others wait for it. Storage and the LLM client are created on the instance's first use, and
+    the entry is re-sized on the first hit after its storage exists.
+
     Args:
         org_id (str): Organization ID
         storage_base_dir (Optional[str]): Base directory for storage (self-host mode)
@@ -33,17 +152,146 @@ def get_reflexio(org_id: str, storage_base_dir: str | None = None) -> Reflexio:
     cache_key: CacheKey = (org_id, storage_base_dir)
 
     with _reflexio_cache_lock:
-        if cache_key in _reflexio_cache:
-            return _reflexio_cache[cache_key]
+        entry = _reflexio_cache.get(cache_key)
+        if entry is not None:
+            _reflexio_cache.hits += 1
+        else:
+            future = _inflight.get(cache_key)
+            if future is None:
+                _reflexio_cache.misses += 1
+                future = _inflight[cache_key] = Future()
+                is_builder = True
+            else:
+                _reflexio_cache.coalesced += 1
+                is_builder = False
+
+    if entry is not None:
+        if _needs_resize(entry):
+            _resize_initialized_entry(cache_key)
+        return entry.reflexio
+    if not is_builder:
+        return future.result()
+    return _build_reflexio(cache_key, future)
+
+
+def _build_reflexio(cache_key: CacheKey, future: Future) -> Reflexio:
+    """Build, size and cache the instance of a key, resolving its in-flight future.
+
+    Args:
+        cache_key (CacheKey): Key to build
+        future (Future): In-flight future other callers of the key are waiting on
+
+    Returns:
+        Reflexio: The new instance
+    """
+    try:
+        # Built outside the lock to avoid blocking other keys
+        reflexio = Reflexio(org_id=cache_key[0], storage_base_dir=cache_key[1])
+        entry = _CacheEntry(
+            reflexio,
+            estimate_size(reflexio),
+            bool(reflexio.request_context.storage_created),
+        )
+    except BaseException as e:
+        with _reflexio_cache_lock:
+            if _inflight.get(cache_key) is future:
+                del _inflight[cache_key]
+        future.set_exception(e)
+        raise
+
+    with _reflexio_cache_lock:
+        # Not cached if the key was invalidated meanwhile: its config may have changed
+        if _inflight.get(cache_key) is future:
+            del _inflight[cache_key]
+            _reflexio_cache[cache_key] = entry
+    future.set_result(reflexio)
+    _record_recent_orgs([cache_key])
+    return reflexio
+
+
+def _needs_resize(entry: _CacheEntry) -> bool:
+    """Check if an entry was sized before its instance created storage that now exists."""
+    return not entry.includes_storage and entry.reflexio.request_context.storage_created
+
+
+def _resize_initialized_entry(cache_key: CacheKey) -> None:
+    """Re-estimate the size of a key's entry once its instance has created storage.
+
+    Sizing runs outside the lock; the new size is only stored if the entry was not replaced or
+    invalidated meanwhile, and may evict other entries.
+
+    Args:
+        cache_key (CacheKey): Key of the entry
+    """
+    with _reflexio_cache_lock:
+        entry = _reflexio_cache.get(cache_key)
+    if entry is None or not _needs_resize(entry):
+        return
+    resized = _CacheEntry(entry.reflexio, estimate_size(entry.reflexio), True)
+    with _reflexio_cache_lock:
+        if _reflexio_cache.get(cache_key) is entry:
+            _reflexio_cache[cache_key] = resized
+
+
+def _warm_up_entry(cache_key: CacheKey, reflexio: Reflexio) -> Reflexio:
+    """Create an instance's storage and LLM client, then re-size its cache entry.
+
+    Args:
+        cache_key (CacheKey): Key of the instance
+        reflexio (Reflexio): The instance
+
+    Returns:
+        Reflexio: The same instance
+    """
+    reflexio.warm_up()
+    _resize_initialized_entry(cache_key)
+    return reflexio
+
+
+def _get_warm_reflexio(org_id: str, storage_base_dir: str | None = None) -> Reflexio:
+    """get_reflexio, with storage and the LLM client created (for executor threads)."""
+    return _warm_up_entry(
+        (org_id, storage_base_dir), get_reflexio(org_id, storage_base_dir)
+    )
+
 
-    # Cache miss - create new instance (outside lock to avoid blocking)
-    reflexio = Reflexio(org_id=org_id, storage_base_dir=storage_base_dir)
+async def aget_reflexio(org_id: str, storage_base_dir: str | None = None) -> Reflexio:
+    """Async twin of get_reflexio for async API endpoints.
 
+    Cache hits of warmed-up instances return without leaving the event loop, and a key already
+    being built is awaited. Otherwise the instance is built and warmed up on the shared "storage"
+    executor, so the async endpoints never create storage or the LLM client on the event loop.
+
+    Args:
+        org_id (str): Organization ID
+        storage_base_dir (Optional[str]): Base directory for storage (self-host mode)
+
+    Returns:
+        Reflexio: Cached or newly created instance, with storage and LLM client created
+    """
+    cache_key: CacheKey = (org_id, storage_base_dir)
     with _reflexio_cache_lock:
-        # Double-check in case another thread created it
-        if cache_key not in _reflexio_cache:
-            _reflexio_cache[cache_key] = reflexio
-        return _reflexio_cache[cache_key]
+        entry = _reflexio_cache.get(cache_key)
+        if entry is not None:
+            _reflexio_cache.hits += 1
+            future = None
+        else:
+            future = _inflight.get(cache_key)
+            if future is not None:
+                _reflexio_cache.coalesced += 1
+    if entry is not None:
+        reflexio = entry.reflexio
+        if reflexio.is_warmed_up and not _needs_resize(entry):
+            return reflexio
+    elif future is not None:
+        reflexio = await asyncio.wrap_future(future)
+        if reflexio.is_warmed_up:
+            return reflexio
+    else:
+        return await run_in_executor_async(
+            "storage", _get_warm_reflexio, org_id, storage_base_dir
+        )
+    return await run_in_executor_async("storage", _warm_up_entry, cache_key, reflexio)
 
 
 def invalidate_reflexio_cache(org_id: str, storage_base_dir: str | None = None) -> bool:
@@ -60,27 +308,137 @@ def invalidate_reflexio_cache(org_id: str, storage_base_dir: str | None = None)
     """
     cache_key: CacheKey = (org_id, storage_base_dir)
     with _reflexio_cache_lock:
+        # An instance still being built must not be cached either
+        _inflight.pop(cache_key, None)
         if cache_key in _reflexio_cache:
             del _reflexio_cache[cache_key]
+            _reflexio_cache.invalidations += 1
             return True
         return False
 
 
 def clear_reflexio_cache() -> None:
-    """Clear entire cache (for testing/admin)."""
+    """Clear entire cache and reset its counters (for testing/admin)."""
+    global _reflexio_cache
     with _reflexio_cache_lock:
-        _reflexio_cache.clear()
+        _inflight.clear()
+        _reflexio_cache = _ReflexioCache(
+            max_bytes=REFLEXIO_CACHE_MAX_BYTES, ttl=REFLEXIO_CACHE_TTL_SECONDS
+        )
 
 
-def get_cache_stats() -> dict:
+def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics for monitoring.
 
     Returns:
-        dict: Cache statistics including current size, max size, and TTL
+        dict[str, Any]: Entry count, estimated and max bytes, TTL, instances being built, and
+            hit, miss, coalesced miss, LRU eviction, TTL expiration, invalidation and warm-up counters
     """
     with _reflexio_cache_lock:
         return {
             "current_size": len(_reflexio_cache),
-            "max_size": REFLEXIO_CACHE_MAX_SIZE,
+            "current_bytes": _reflexio_cache.currsize,
+            "max_bytes": REFLEXIO_CACHE_MAX_BYTES,
             "ttl_seconds": REFLEXIO_CACHE_TTL_SECONDS,
+            "hits": _reflexio_cache.hits,
+            "misses": _reflexio_cache.misses,
+            "evictions": _reflexio_cache.evictions,
+            "expirations": _reflexio_cache.expirations,
+            "invalidations": _reflexio_cache.invalidations,
+            "coalesced": _reflexio_cache.coalesced,
+            "building": len(_inflight),
+            "warmed_up": _reflexio_cache.warmed_up,
         }
+
+
+def get_storage_cache_stats() -> dict:
+    """Get hit/miss counters of the local storage parsed-model cache for monitoring.
+
+    Returns:
+        dict: Document and model cache hits, misses, invalidations and size
+    """
+    return get_local_storage_cache_stats()
+
+
+def _record_recent_orgs(keys: list[CacheKey]) -> None:
+    """Mark keys as recently active for the next startup's warm-up (no-op when warm-up is off)."""
+    recent_orgs = _recent_orgs
+    if recent_orgs is None:
+        return
+    try:
+        recent_orgs.record(keys)
+    except Exception as e:
+        # Tracking must never fail a request
+        logger.warning("Failed to record recently active orgs: %s", e)
+
+
+def warm_up_reflexio_cache(keys: list[CacheKey]) -> int:
+    """Build and fully initialize (storage and LLM client) the cached instances of keys.
+
+    Stops early when stop_reflexio_cache_warmup() is called. A request for a key being warmed up
+    waits for that construction instead of starting its own.
+
+    Args:
+        keys (list[CacheKey]): Keys to warm up, in order
+
+    Returns:
+        int: Number of instances warmed up
+    """
+    warmed = 0
+    for org_id, storage_base_dir in keys:
+        if _warmup_stop.is_set():
+            break
+        try:
+            _get_warm_reflexio(org_id, storage_base_dir)
+        except Exception as e:
+            # One broken org must not stop the warm-up
+            logger.warning("Failed to warm up Reflexio for org %s: %s", org_id, e)
+            continue
+        warmed += 1
+        with _reflexio_cache_lock:
+            _reflexio_cache.warmed_up += 1
+    return warmed
+
+
+def start_reflexio_cache_warmup() -> None:
+    """Start tracking recently active orgs and warm up the most recent ones in the background.
+
+    No-op unless REFLEXIO_CACHE_WARMUP_ORGS is above 0. Orgs are recorded in
+    SQLITE_FILE_DIRECTORY/recent_orgs.sqlite3 when their instance is built and at shutdown.
+    """
+    global _recent_orgs, _warmup_thread
+    if REFLEXIO_CACHE_WARMUP_ORGS <= 0 or _recent_orgs is not None:
+        return
+    _recent_orgs = RecentOrgs(str(Path(SQLITE_FILE_DIRECTORY) / "recent_orgs.sqlite3"))
+    keys = _recent_orgs.most_recent(REFLEXIO_CACHE_WARMUP_ORGS)
+    if not keys:
+        return
+    logger.info("Warming up Reflexio instances of %d recently active orgs", len(keys))
+    _warmup_stop.clear()
+    _warmup_thread = threading.Thread(
+        target=warm_up_reflexio_cache,
+        args=(keys,),
+        daemon=True,
+        name="reflexio-cache-warmup",
+    )
+    _warmup_thread.start()
+
+
+def stop_reflexio_cache_warmup(timeout: float = 5.0) -> None:
+    """Stop a running warm-up and record the still cached orgs as recently active.
+
+    Args:
+        timeout (float): Seconds to wait for the warm-up thread to finish its current org
+    """
+    global _recent_orgs, _warmup_thread
+    _warmup_stop.set()
+    if _warmup_thread is not None:
+        _warmup_thread.join(timeout)
+        _warmup_thread = None
+    if _recent_orgs is None:
+        return
+    with _reflexio_cache_lock:
+        cached_keys = list(_reflexio_cache.keys())
+    _record_recent_orgs(cached_keys)
+    _recent_orgs.close()
+    _recent_orgs = None
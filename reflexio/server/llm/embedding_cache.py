@@ -0,0 +1,276 @@
+"""
+Content-addressed embedding cache shared by every LiteLLMClient in the process.
+
+Embeddings are keyed by (model, dimensions, sha256(text)). Lookups hit an in-memory LRU
+first and then, when EMBEDDING_CACHE_DIR is set, an on-disk tier: one append-only float32
+file per (model, dimensions) that is memory-mapped for reads, plus a key file mapping each
+text hash to the byte offset of its vector.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking for the disk tier
+    fcntl = None  # type: ignore[assignment]
+
+import numpy as np
+from cachetools import LRUCache
+
+from reflexio.server import EMBEDDING_CACHE_DIR, EMBEDDING_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, int, str]
+
+
+def embedding_cache_key(text: str, model: str, dimensions: int | None) -> CacheKey:
+    """
+    Build the cache key for an embedding.
+
+    Args:
+        text (str): Embedded text
+        model (str): Embedding model name
+        dimensions (int, optional): Requested dimensions (None for the model default)
+
+    Returns:
+        CacheKey: (model, dimensions or 0, sha256 hex digest of the text)
+    """
+    return model, dimensions or 0, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class _DiskStore:
+    """Row index and memory map of one (model, dimensions) vector file."""
+
+    def __init__(self, vectors_path: Path, keys_path: Path, dimensions: int) -> None:
+        self.vectors_path = vectors_path
+        self.keys_path = keys_path
+        self.dimensions = dimensions
+        self.row_bytes = dimensions * 4
+        # Byte offset of each text hash's vector in the vector file
+        self.offsets: dict[str, int] = {}
+        self.keys_offset = 0
+        self.vectors: np.memmap | None = None
+
+    def sync(self) -> None:
+        """Index key lines appended since the last sync (by this or another process).
+
+        Lines that are malformed (an interrupted write) or point past the end of the vector file
+        are skipped, so they read as misses rather than as another text's vector.
+        """
+        if not self.keys_path.exists():
+            return
+        if self.keys_path.stat().st_size <= self.keys_offset:
+            return
+        with self.keys_path.open("rb") as file:
+            file.seek(self.keys_offset)
+            chunk = file.read()
+        # Ignore a trailing partial line that another writer has not finished yet
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        self.keys_offset += len(complete)
+        # Vectors are written before their key lines, so every valid line fits this size
+        vectors_size = (
+            self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+        )
+        for line in complete.decode("ascii", errors="replace").splitlines():
+            parts = line.split()
+            if len(parts) != 2 or len(parts[0]) != 64 or not parts[1].isdigit():
+                continue
+            offset = int(parts[1])
+            if offset + self.row_bytes <= vectors_size:
+                self.offsets.setdefault(parts[0], offset)
+
+    def read(self, offset: int) -> list[float] | None:
+        end = offset + self.row_bytes
+        if self.vectors is None or end > len(self.vectors):
+            if not self.vectors_path.exists():
+                return None
+            self.vectors = np.memmap(self.vectors_path, dtype=np.uint8, mode="r")
+            if end > len(self.vectors):
+                return None
+        return np.frombuffer(self.vectors[offset:end], dtype="<f4").tolist()
+
+
+class _DiskTier:
+    """
+    Append-only float32 vector files, one per (model, dimensions).
+
+    `<slug>.f32` holds the vectors back to back and `<slug>.keys` holds one
+    "<text hash> <byte offset>" line per vector. Each vector is appended with one O_APPEND write
+    and its offset taken from where that write ended, so a vector whose key line was never written
+    only wastes space, and concurrent writers without file locks cannot shift other rows. Rows
+    appended by other processes are picked up incrementally.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._stores: dict[tuple[str, int], _DiskStore] = {}
+
+    def _store(self, model: str, dimensions: int) -> _DiskStore:
+        store = self._stores.get((model, dimensions))
+        if store is None:
+            slug = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{model}_{dimensions}")
+            store = _DiskStore(
+                self.directory / f"{slug}.f32",
+                self.directory / f"{slug}.keys",
+                dimensions,
+            )
+            self._stores[(model, dimensions)] = store
+        return store
+
+    def get(self, key: CacheKey) -> list[float] | None:
+        model, dimensions, digest = key
+        if not dimensions:
+            return None
+        store = self._store(model, dimensions)
+        if digest not in store.offsets:
+            store.sync()
+        offset = store.offsets.get(digest)
+        return store.read(offset) if offset is not None else None
+
+    def put(self, key: CacheKey, embedding: list[float]) -> None:
+        model, dimensions, digest = key
+        # Only fixed-size vectors fit the row layout
+        if not dimensions or len(embedding) != dimensions:
+            return
+        store = self._store(model, dimensions)
+        # The key file lock only avoids storing a text twice; offsets stay valid without it
+        with store.keys_path.open("a", encoding="ascii") as keys_file:
+            if fcntl is not None:
+                fcntl.flock(keys_file, fcntl.LOCK_EX)
+            store.sync()
+            if digest in store.offsets:
+                return
+            with store.vectors_path.open("ab", buffering=0) as vectors_file:
+                vectors_file.write(np.asarray(embedding, dtype="<f4").tobytes())
+                offset = vectors_file.tell() - store.row_bytes
+            keys_file.write(f"{digest} {offset}\n")
+
+
+class EmbeddingCache:
+    """
+    In-memory LRU of embeddings with an optional on-disk tier and hit/miss counters.
+
+    Entries are kept as float32 arrays (about 2 KB per 512-dimension vector, a quarter of a
+    list of Python floats), so hits carry float32 precision just like the disk tier.
+    """
+
+    def __init__(self, max_size: int, disk_dir: str | None = None) -> None:
+        """
+        Args:
+            max_size (int): Max embeddings kept in memory (0 disables the cache entirely)
+            disk_dir (str, optional): Directory for the on-disk tier. Disabled when empty.
+        """
+        self.max_size = max_size
+        self._memory: LRUCache | None = LRUCache(maxsize=max_size) if max_size else None
+        self._disk: _DiskTier | None = None
+        if max_size and disk_dir:
+            try:
+                self._disk = _DiskTier(disk_dir)
+            except OSError as e:
+                logger.warning("Embedding disk cache disabled (%s): %s", disk_dir, e)
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups can hit at all."""
+        return self._memory is not None
+
+    def get(self, key: CacheKey) -> list[float] | None:
+        """
+        Look up an embedding, promoting disk hits into memory.
+
+        Args:
+            key (CacheKey): Key from `embedding_cache_key`
+
+        Returns:
+            list[float] | None: Cached embedding (a copy), or None on a miss
+        """
+        if self._memory is None:
+            return None
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._counters["memory_hits"] += 1
+                return embedding.tolist()
+            if self._disk is not None:
+                try:
+                    embedding = self._disk.get(key)
+                except OSError as e:
+                    logger.warning("Embedding disk cache read failed: %s", e)
+                    embedding = None
+                if embedding is not None:
+                    self._counters["disk_hits"] += 1
+                    self._memory[key] = np.asarray(embedding, dtype=np.float32)
+                    return embedding
+            self._counters["misses"] += 1
+            return None
+
+    def put(self, key: CacheKey, embedding: list[float]) -> None:
+        """
+        Store an embedding in memory and, if enabled, on disk.
+
+        Args:
+            key (CacheKey): Key from `embedding_cache_key`
+            embedding (list[float]): Embedding returned by the provider
+        """
+        if self._memory is None or not embedding:
+            return
+        with self._lock:
+            self._memory[key] = np.asarray(embedding, dtype=np.float32)
+            self._counters["stores"] += 1
+            if self._disk is not None:
+                try:
+                    self._disk.put(key, embedding)
+                except OSError as e:
+                    logger.warning("Embedding disk cache write failed: %s", e)
+
+    def stats(self) -> dict:
+        """
+        Get hit/miss counters.
+
+        Returns:
+            dict: memory/disk hits, misses, stores, hit rate, current and max in-memory size
+        """
+        with self._lock:
+            hits = self._counters["memory_hits"] + self._counters["disk_hits"]
+            lookups = hits + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_size": len(self._memory) if self._memory is not None else 0,
+                "max_memory_size": self.max_size,
+                "disk_enabled": self._disk is not None,
+            }
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters (the disk tier is kept)."""
+        with self._lock:
+            if self._memory is not None:
+                self._memory.clear()
+            for name in self._counters:
+                self._counters[name] = 0
+
+
+_embedding_cache = EmbeddingCache(EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_DIR)
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache."""
+    return _embedding_cache
+
+
+def get_embedding_cache_stats() -> dict:
+    """Get hit/miss counters of the process-wide embedding cache."""
+    return _embedding_cache.stats()
+
+
+def clear_embedding_cache() -> None:
+    """Clear the in-memory embedding cache and reset counters (for testing/admin)."""
+    _embedding_cache.clear()
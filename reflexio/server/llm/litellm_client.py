@@ -5,12 +5,15 @@ This module provides a unified interface to multiple LLM providers (OpenAI, Clau
 using LiteLLM. It maintains the same interface as the existing LLMClient for easy replacement.
 """
 
+import asyncio
 import base64
 import json
 import logging
 import os
 import re
+import threading
 import time
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -20,7 +23,13 @@ from dotenv import load_dotenv
 from pydantic import BaseModel
 from reflexio_commons.config_schema import APIKeyConfig
 
+from reflexio.server import LLM_ASYNC_CONCURRENCY_PER_PROVIDER
+from reflexio.server.llm.embedding_cache import (
+    embedding_cache_key,
+    get_embedding_cache,
+)
 from reflexio.server.llm.llm_utils import is_pydantic_model
+from reflexio.server.services.executor_registry import raise_if_cancelled
 
 # Load environment variables from .env file
 load_dotenv()
@@ -62,6 +71,65 @@ class LiteLLMClientError(Exception):
     """Custom exception for LiteLLM client errors."""
 
 
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Check whether an LLM call failed because the provider rate-limited it.
+
+    Args:
+        error (BaseException): Error raised by the call, possibly a LiteLLMClientError wrapping it
+
+    Returns:
+        bool: True if the error or its cause is a rate limit (HTTP 429) error
+    """
+    cause = error.__cause__ or error
+    if isinstance(cause, litellm.RateLimitError):
+        return True
+    error_str = str(error).lower()
+    return "rate_limit" in error_str or "ratelimiterror" in error_str
+
+
+# Per event loop: provider name -> semaphore bounding its in-flight async requests
+_provider_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+_provider_semaphores_lock = threading.Lock()
+_model_providers: dict[str, str] = {}
+
+
+def _provider_name(model: str) -> str:
+    provider = _model_providers.get(model)
+    if provider is None:
+        try:
+            provider = litellm.get_llm_provider(model)[1]
+        except Exception:
+            provider = model.split("/", 1)[0] if "/" in model else "openai"
+        _model_providers[model] = provider
+    return provider
+
+
+def _provider_semaphore(model: str) -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding async requests to the provider serving a model.
+
+    Semaphores are bound to the running event loop, so each loop gets its own set.
+
+    Args:
+        model (str): Model name as passed to LiteLLM
+
+    Returns:
+        asyncio.Semaphore: Semaphore admitting LLM_ASYNC_CONCURRENCY_PER_PROVIDER requests
+    """
+    loop = asyncio.get_running_loop()
+    provider = _provider_name(model)
+    with _provider_semaphores_lock:
+        semaphores = _provider_semaphores.setdefault(loop, {})
+        semaphore = semaphores.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(LLM_ASYNC_CONCURRENCY_PER_PROVIDER, 1))
+            semaphores[provider] = semaphore
+    return semaphore
+
+
 class LiteLLMClient:
     """
     Unified LLM client using LiteLLM for multi-provider support.
@@ -207,13 +275,50 @@ class LiteLLMClient:
             LiteLLMClientError: If the API call fails after all retries,
                 or if response_format is not a Pydantic BaseModel class.
         """
-        # Validate response_format if provided
-        response_format = kwargs.get("response_format")
-        if response_format is not None and not is_pydantic_model(response_format):
-            raise LiteLLMClientError(
-                "response_format must be a Pydantic BaseModel class, "
-                f"got {type(response_format).__name__}"
-            )
+        messages = self._build_prompt_messages(
+            prompt, system_message, images, image_media_type, kwargs
+        )
+        return self._make_request(messages, **kwargs)
+
+    async def agenerate_response(
+        self,
+        prompt: str,
+        system_message: str | None = None,
+        images: list[str | bytes | dict] | None = None,
+        image_media_type: str | None = None,
+        **kwargs,
+    ) -> str | BaseModel:
+        """
+        Async twin of generate_response; must be awaited on a running event loop.
+
+        Args:
+            prompt: The user prompt/message.
+            system_message: Optional system message to set context.
+            images: Optional list of images (file paths, bytes, or pre-formatted content blocks).
+            image_media_type: Media type for images if passing bytes (e.g., 'image/png').
+            **kwargs: Same parameters as generate_response.
+
+        Returns:
+            Generated response content (string or BaseModel instance).
+
+        Raises:
+            LiteLLMClientError: If the API call fails after all retries,
+                or if response_format is not a Pydantic BaseModel class.
+        """
+        messages = self._build_prompt_messages(
+            prompt, system_message, images, image_media_type, kwargs
+        )
+        return await self._amake_request(messages, **kwargs)
+
+    def _build_prompt_messages(
+        self,
+        prompt: str,
+        system_message: str | None,
+        images: list[str | bytes | dict] | None,
+        image_media_type: str | None,
+        kwargs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        self._validate_response_format(kwargs)
 
         # Build user message content
         user_content = self._build_user_content(prompt, images, image_media_type)
@@ -223,8 +328,7 @@ class LiteLLMClient:
         if system_message:
             messages.append({"role": "system", "content": system_message})
         messages.append({"role": "user", "content": user_content})
-
-        return self._make_request(messages, **kwargs)
+        return messages
 
     def generate_chat_response(
         self,
@@ -252,7 +356,37 @@ class LiteLLMClient:
             LiteLLMClientError: If the API call fails after all retries,
                 or if response_format is not a Pydantic BaseModel class.
         """
-        # Validate response_format if provided
+        self._validate_response_format(kwargs)
+        final_messages = self._prepend_system_message(messages, system_message)
+        return self._make_request(final_messages, **kwargs)
+
+    async def agenerate_chat_response(
+        self,
+        messages: list[dict[str, Any]],
+        system_message: str | None = None,
+        **kwargs,
+    ) -> str | BaseModel:
+        """
+        Async twin of generate_chat_response; must be awaited on a running event loop.
+
+        Args:
+            messages: List of messages in chat format [{"role": "...", "content": "..."}].
+            system_message: Optional system message to prepend.
+            **kwargs: Same parameters as generate_chat_response.
+
+        Returns:
+            Generated response content (string or BaseModel instance).
+
+        Raises:
+            LiteLLMClientError: If the API call fails after all retries,
+                or if response_format is not a Pydantic BaseModel class.
+        """
+        self._validate_response_format(kwargs)
+        final_messages = self._prepend_system_message(messages, system_message)
+        return await self._amake_request(final_messages, **kwargs)
+
+    @staticmethod
+    def _validate_response_format(kwargs: dict[str, Any]) -> None:
         response_format = kwargs.get("response_format")
         if response_format is not None and not is_pydantic_model(response_format):
             raise LiteLLMClientError(
@@ -260,7 +394,10 @@ class LiteLLMClient:
                 f"got {type(response_format).__name__}"
             )
 
-        # Prepend system message if provided
+    @staticmethod
+    def _prepend_system_message(
+        messages: list[dict[str, Any]], system_message: str | None
+    ) -> list[dict[str, Any]]:
         final_messages = list(messages)
         if system_message:
             # Check if first message is already a system message
@@ -271,8 +408,7 @@ class LiteLLMClient:
                 )
             else:
                 final_messages.insert(0, {"role": "system", "content": system_message})
-
-        return self._make_request(final_messages, **kwargs)
+        return final_messages
 
     def get_embedding(
         self, text: str, model: str | None = None, dimensions: int | None = None
@@ -280,6 +416,9 @@ class LiteLLMClient:
         """
         Get embedding vector for the given text.
 
+        Served from the process-wide embedding cache when the same text was embedded before
+        with the same model and dimensions.
+
         Args:
             text: The text to get embedding for.
             model: Optional embedding model (defaults to 'text-embedding-3-small').
@@ -292,27 +431,49 @@ class LiteLLMClient:
             LiteLLMClientError: If embedding generation fails.
         """
         embedding_model = model or "text-embedding-3-small"
+        cache = get_embedding_cache()
+        key = embedding_cache_key(text, embedding_model, dimensions)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
 
         try:
-            params = {"model": embedding_model, "input": [text]}
-            if dimensions:
-                params["dimensions"] = dimensions
+            embedding = self._embed([text], embedding_model, dimensions)[0]
+        except Exception as e:
+            raise LiteLLMClientError(f"Embedding generation failed: {str(e)}") from e
+        cache.put(key, embedding)
+        return embedding
 
-            # Resolve and add API key configuration if provided (overrides env vars)
-            api_key, api_base, api_version = self._resolve_api_key(
-                embedding_model, for_embedding=True
-            )
-            if api_key:
-                params["api_key"] = api_key
-            if api_base:
-                params["api_base"] = api_base
-            if api_version:
-                params["api_version"] = api_version
-
-            response = litellm.embedding(**params, timeout=self.config.timeout)
-            return response.data[0]["embedding"]
+    async def aget_embedding(
+        self, text: str, model: str | None = None, dimensions: int | None = None
+    ) -> list[float]:
+        """
+        Async twin of get_embedding (shares the process-wide embedding cache).
+
+        Args:
+            text: The text to get embedding for.
+            model: Optional embedding model (defaults to 'text-embedding-3-small').
+            dimensions: Optional number of dimensions for the embedding vector.
+
+        Returns:
+            List of floats representing the embedding vector.
+
+        Raises:
+            LiteLLMClientError: If embedding generation fails.
+        """
+        embedding_model = model or "text-embedding-3-small"
+        cache = get_embedding_cache()
+        key = embedding_cache_key(text, embedding_model, dimensions)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            embedding = (await self._aembed([text], embedding_model, dimensions))[0]
         except Exception as e:
             raise LiteLLMClientError(f"Embedding generation failed: {str(e)}") from e
+        cache.put(key, embedding)
+        return embedding
 
     def get_embeddings(
         self,
@@ -323,6 +484,9 @@ class LiteLLMClient:
         """
         Get embedding vectors for multiple texts in a single API call.
 
+        Texts found in the process-wide embedding cache are not sent; repeated texts within
+        the batch are sent once.
+
         Args:
             texts: List of texts to get embeddings for.
             model: Optional embedding model (defaults to 'text-embedding-3-small').
@@ -338,31 +502,164 @@ class LiteLLMClient:
             return []
 
         embedding_model = model or "text-embedding-3-small"
+        keys, embeddings, missing = self._lookup_cached_embeddings(
+            texts, embedding_model, dimensions
+        )
+        if missing:
+            try:
+                fetched = self._embed(
+                    list(missing.values()), embedding_model, dimensions
+                )
+            except Exception as e:
+                raise LiteLLMClientError(
+                    f"Batch embedding generation failed: {str(e)}"
+                ) from e
+            embeddings = self._merge_fetched_embeddings(
+                keys, embeddings, missing, fetched
+            )
 
-        try:
-            params = {"model": embedding_model, "input": texts}
-            if dimensions:
-                params["dimensions"] = dimensions
+        return embeddings  # type: ignore[return-value]
+
+    async def aget_embeddings(
+        self,
+        texts: list[str],
+        model: str | None = None,
+        dimensions: int | None = None,
+    ) -> list[list[float]]:
+        """
+        Async twin of get_embeddings (shares the process-wide embedding cache).
+
+        Args:
+            texts: List of texts to get embeddings for.
+            model: Optional embedding model (defaults to 'text-embedding-3-small').
+            dimensions: Optional number of dimensions for the embedding vectors.
 
-            # Resolve and add API key configuration if provided (overrides env vars)
-            api_key, api_base, api_version = self._resolve_api_key(
-                embedding_model, for_embedding=True
+        Returns:
+            List of embedding vectors, one per input text, in the same order as input.
+
+        Raises:
+            LiteLLMClientError: If embedding generation fails.
+        """
+        if not texts:
+            return []
+
+        embedding_model = model or "text-embedding-3-small"
+        keys, embeddings, missing = self._lookup_cached_embeddings(
+            texts, embedding_model, dimensions
+        )
+        if missing:
+            try:
+                fetched = await self._aembed(
+                    list(missing.values()), embedding_model, dimensions
+                )
+            except Exception as e:
+                raise LiteLLMClientError(
+                    f"Batch embedding generation failed: {str(e)}"
+                ) from e
+            embeddings = self._merge_fetched_embeddings(
+                keys, embeddings, missing, fetched
             )
-            if api_key:
-                params["api_key"] = api_key
-            if api_base:
-                params["api_base"] = api_base
-            if api_version:
-                params["api_version"] = api_version
-
-            response = litellm.embedding(**params, timeout=self.config.timeout)
-            # Response data may not be in order, sort by index to ensure correct ordering
-            sorted_data = sorted(response.data, key=lambda x: x["index"])
-            return [item["embedding"] for item in sorted_data]
-        except Exception as e:
-            raise LiteLLMClientError(
-                f"Batch embedding generation failed: {str(e)}"
-            ) from e
+
+        return embeddings  # type: ignore[return-value]
+
+    @staticmethod
+    def _lookup_cached_embeddings(
+        texts: list[str], embedding_model: str, dimensions: int | None
+    ) -> tuple[list[tuple], list[list[float] | None], dict[tuple, str]]:
+        """
+        Look texts up in the embedding cache.
+
+        Returns:
+            tuple: (cache keys, cached embedding or None per text, unique misses by key in
+                first-seen order)
+        """
+        cache = get_embedding_cache()
+        keys = [
+            embedding_cache_key(text, embedding_model, dimensions) for text in texts
+        ]
+        embeddings: list[list[float] | None] = [cache.get(key) for key in keys]
+
+        # Unique cache misses, in first-seen order
+        missing: dict[tuple, str] = {}
+        for key, text, embedding in zip(keys, texts, embeddings, strict=True):
+            if embedding is None and key not in missing:
+                missing[key] = text
+        return keys, embeddings, missing
+
+    @staticmethod
+    def _merge_fetched_embeddings(
+        keys: list[tuple],
+        embeddings: list[list[float] | None],
+        missing: dict[tuple, str],
+        fetched: list[list[float]],
+    ) -> list[list[float] | None]:
+        cache = get_embedding_cache()
+        fetched_by_key = dict(zip(missing, fetched, strict=True))
+        for key, embedding in fetched_by_key.items():
+            cache.put(key, embedding)
+        return [
+            embedding if embedding is not None else fetched_by_key[key]
+            for key, embedding in zip(keys, embeddings, strict=True)
+        ]
+
+    def _embed(
+        self, texts: list[str], embedding_model: str, dimensions: int | None
+    ) -> list[list[float]]:
+        """
+        Call the embedding provider for a batch of texts.
+
+        Args:
+            texts: Texts to embed.
+            embedding_model: Embedding model name.
+            dimensions: Optional number of dimensions for the embedding vectors.
+
+        Returns:
+            Embedding vectors in the same order as `texts`.
+        """
+        params = self._build_embedding_params(texts, embedding_model, dimensions)
+        response = litellm.embedding(**params, timeout=self.config.timeout)
+        # Response data may not be in order, sort by index to ensure correct ordering
+        sorted_data = sorted(response.data, key=lambda x: x["index"])
+        return [item["embedding"] for item in sorted_data]
+
+    def _build_embedding_params(
+        self, texts: list[str], embedding_model: str, dimensions: int | None
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {"model": embedding_model, "input": texts}
+        if dimensions:
+            params["dimensions"] = dimensions
+
+        # Resolve and add API key configuration if provided (overrides env vars)
+        api_key, api_base, api_version = self._resolve_api_key(
+            embedding_model, for_embedding=True
+        )
+        if api_key:
+            params["api_key"] = api_key
+        if api_base:
+            params["api_base"] = api_base
+        if api_version:
+            params["api_version"] = api_version
+        return params
+
+    async def _aembed(
+        self, texts: list[str], embedding_model: str, dimensions: int | None
+    ) -> list[list[float]]:
+        """
+        Async twin of _embed using litellm.aembedding.
+
+        Args:
+            texts: Texts to embed.
+            embedding_model: Embedding model name.
+            dimensions: Optional number of dimensions for the embedding vectors.
+
+        Returns:
+            Embedding vectors in the same order as `texts`.
+        """
+        params = self._build_embedding_params(texts, embedding_model, dimensions)
+        async with _provider_semaphore(embedding_model):
+            response = await litellm.aembedding(**params, timeout=self.config.timeout)
+        sorted_data = sorted(response.data, key=lambda x: x["index"])
+        return [item["embedding"] for item in sorted_data]
 
     def _build_completion_params(
         self, messages: list[dict[str, Any]], **kwargs: Any
@@ -475,8 +772,8 @@ class LiteLLMClient:
         max_retries: int,
         response_format: Any,
         elapsed_seconds: float,
-    ) -> None:
-        """Handle retry logic or raise on non-retryable/final errors.
+    ) -> float | None:
+        """Log a failed attempt and decide whether to retry it.
 
         Args:
             error: The exception that occurred
@@ -486,8 +783,11 @@ class LiteLLMClient:
             response_format: Response format (for logging)
             elapsed_seconds: Time elapsed for this attempt
 
+        Returns:
+            float | None: Seconds to back off before the next attempt, or None after the last one
+
         Raises:
-            LiteLLMClientError: If the error is non-retryable or this was the last attempt
+            LiteLLMClientError: If the error is non-retryable
         """
         error_str = str(error).lower()
 
@@ -517,14 +817,14 @@ class LiteLLMClient:
                 error,
                 delay,
             )
-            time.sleep(delay)
-        else:
-            self.logger.error(
-                "LLM request failed (model=%s, has_response_format=%s): %s",
-                params.get("model"),
-                response_format is not None,
-                error,
-            )
+            return delay
+        self.logger.error(
+            "LLM request failed (model=%s, has_response_format=%s): %s",
+            params.get("model"),
+            response_format is not None,
+            error,
+        )
+        return None
 
     def _make_request(
         self, messages: list[dict[str, Any]], **kwargs: Any
@@ -548,6 +848,8 @@ class LiteLLMClient:
 
         last_error: Exception | None = None
         for attempt in range(max_retries):
+            # Stop retrying once the caller gave up on this task (e.g. extractor timeout)
+            raise_if_cancelled()
             request_start = time.perf_counter()
             self.logger.info(
                 "event=llm_request_start model=%s timeout=%s has_response_format=%s attempt=%d/%d",
@@ -584,9 +886,87 @@ class LiteLLMClient:
             except Exception as e:
                 last_error = e
                 elapsed_seconds = time.perf_counter() - request_start
-                self._handle_retry_or_raise(
+                delay = self._handle_retry_or_raise(
                     e, params, attempt, max_retries, response_format, elapsed_seconds
                 )
+                if delay is not None:
+                    time.sleep(delay)
+
+        raise LiteLLMClientError(
+            f"API call failed after {max_retries} retries: {str(last_error)}"
+        )
+
+    async def _amake_request(
+        self, messages: list[dict[str, Any]], **kwargs: Any
+    ) -> str | BaseModel:
+        """
+        Async twin of _make_request: awaits litellm.acompletion and backs off with asyncio.sleep.
+
+        Args:
+            messages: List of messages to send.
+            **kwargs: Additional parameters.
+
+        Returns:
+            Response content as string or BaseModel instance.
+
+        Raises:
+            LiteLLMClientError: If the request fails after all retries.
+        """
+        params, response_format, parse_structured_output, max_retries = (
+            self._build_completion_params(messages, **kwargs)
+        )
+
+        last_error: Exception | None = None
+        for attempt in range(max_retries):
+            delay: float | None = None
+            async with _provider_semaphore(params["model"]):
+                request_start = time.perf_counter()
+                self.logger.info(
+                    "event=llm_request_start model=%s timeout=%s has_response_format=%s attempt=%d/%d async=True",
+                    params.get("model"),
+                    params.get("timeout"),
+                    response_format is not None,
+                    attempt + 1,
+                    max_retries,
+                )
+                try:
+                    response = await litellm.acompletion(**params)
+                    content = response.choices[0].message.content  # type: ignore[reportAttributeAccessIssue]
+                    elapsed_seconds = time.perf_counter() - request_start
+
+                    self._log_token_usage(params, response)
+
+                    self.logger.info(
+                        "event=llm_request_end model=%s timeout=%s has_response_format=%s attempt=%d/%d elapsed_seconds=%.3f success=%s async=True",
+                        params.get("model"),
+                        params.get("timeout"),
+                        response_format is not None,
+                        attempt + 1,
+                        max_retries,
+                        elapsed_seconds,
+                        True,
+                    )
+
+                    return self._maybe_parse_structured_output(
+                        content,  # type: ignore[reportArgumentType]
+                        response_format,
+                        parse_structured_output,  # type: ignore[reportArgumentType]
+                    )
+
+                except Exception as e:
+                    last_error = e
+                    elapsed_seconds = time.perf_counter() - request_start
+                    delay = self._handle_retry_or_raise(
+                        e,
+                        params,
+                        attempt,
+                        max_retries,
+                        response_format,
+                        elapsed_seconds,
+                    )
+            # Back off outside the semaphore so the slot serves other requests meanwhile
+            if delay is not None:
+                await asyncio.sleep(delay)
 
         raise LiteLLMClientError(
             f"API call failed after {max_retries} retries: {str(last_error)}"
@@ -0,0 +1,109 @@
+"""
+Process-wide asyncio event loop for async LLM calls.
+
+Sync LLM calls pin a worker thread for the whole request (up to the client timeout, plus retry
+sleeps). Async calls awaited on this loop only hold a coroutine, so hundreds of in-flight requests
+share one thread. Sync code (executor tasks, services) hands coroutines to the loop with
+`run_on_llm_event_loop`, which blocks the calling thread only until the coroutine finishes.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from reflexio.server.services.executor_registry import (
+    TaskCancelledError,
+    is_cancelled,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds between checks of the calling executor task's cancellation flag while waiting
+_CANCEL_POLL_SECONDS = 0.5
+
+_loop_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+
+
+def get_llm_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared LLM event loop, starting its daemon thread on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running loop
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, daemon=True, name="llm-event-loop"
+            )
+            thread.start()
+            _loop, _loop_thread = loop, thread
+            logger.info("event=llm_event_loop_started")
+        return _loop
+
+
+def run_on_llm_event_loop(
+    coro: Coroutine[Any, Any, T], timeout: float | None = None
+) -> T:
+    """
+    Run a coroutine on the shared LLM event loop and wait for its result.
+
+    When called from a task of a shared executor, cancelling that task cancels the coroutine.
+
+    Args:
+        coro (Coroutine): Coroutine to run
+        timeout (float, optional): Seconds to wait before cancelling the coroutine
+
+    Returns:
+        T: The coroutine's result
+
+    Raises:
+        RuntimeError: If called from the LLM event loop thread itself (await the coroutine instead)
+        TimeoutError: If the coroutine did not finish within timeout
+        TaskCancelledError: If the calling executor task was cancelled meanwhile
+    """
+    loop = get_llm_event_loop()
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError(
+            "run_on_llm_event_loop called from the LLM event loop; await instead"
+        )
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    waited = 0.0
+    while True:
+        wait = _CANCEL_POLL_SECONDS
+        if timeout is not None:
+            wait = min(wait, max(timeout - waited, 0.0))
+        done, _ = concurrent.futures.wait([future], timeout=wait)
+        if done:
+            return future.result()
+        waited += wait
+        if is_cancelled():
+            future.cancel()
+            raise TaskCancelledError("Task cancelled by caller")
+        if timeout is not None and waited >= timeout:
+            future.cancel()
+            raise TimeoutError(f"LLM coroutine did not finish within {timeout}s")
+
+
+def stop_llm_event_loop() -> None:
+    """Stop and forget the shared LLM event loop (for testing/admin)."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop, _loop_thread = None, None
+    if loop is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=5)
+    loop.close()
@@ -4,139 +4,258 @@ Prompt management using file system prompt bank
 
 import json
 import logging
+import string
+import threading
+import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from reflexio.server import PROMPT_HOT_RELOAD
 
 from .prompt_schema import Prompt, PromptBank
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PROMPT_BANK_PATH = Path(__file__).parent / "prompt_bank"
 
-class PromptManager:
-    """Prompt management using file system prompt bank"""
+# Min seconds between prompt bank file change checks when hot reload is enabled
+_HOT_RELOAD_CHECK_SECONDS = 1.0
 
-    def __init__(
-        self,
-        prompt_bank_path: str | None = None,
-        version_override: dict[str, str] | None = None,
-    ):
-        """
-        Initialize the PromptManager.
-
-        Args:
-            prompt_bank_path (str, optional): Path to the prompt bank directory.
-            version_override (Dict[str, str], optional): key is prompt_id, value is version. If not provided, the active version is used.
-        """
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
 
-        if prompt_bank_path is None:
-            # Default to prompt_bank directory relative to this file
-            current_dir = Path(__file__).parent
-            self.prompt_bank_path = current_dir / "prompt_bank"
-        else:
-            self.prompt_bank_path = Path(prompt_bank_path)
 
-        self.version_override: dict[str, str] | None = version_override
+class CompiledPrompt:
+    """
+    Prompt template split once into static text and replacement fields.
 
-        if not self.prompt_bank_path.exists():
-            logger.warning("Prompt bank path does not exist: %s", self.prompt_bank_path)
+    Rendering joins the pre-split segments instead of re-parsing the template on every
+    `str.format` call. Templates with attribute/index fields (e.g. `{a.b}`) fall back to
+    `str.format`.
+    """
 
-        self.prompt_bank_cache = {}
+    __slots__ = ("content", "error", "fields", "segments", "variables")
 
-    # ==============================
-    # Public methods
-    # ==============================
-    def render_prompt(self, prompt_id: str, variables: dict[str, Any]) -> str:
+    def __init__(self, prompt: Prompt):
         """
-        Render prompt template with variables
+        Args:
+            prompt (Prompt): Prompt version to compile
+        """
+        self.content = prompt.content
+        self.variables = frozenset(prompt.variables)
+        self.error: str | None = None
+        segments: list[tuple[str, str | None, str | None, str]] | None = []
+        fields: set[str] = set()
+        try:
+            for literal, field, format_spec, conversion in string.Formatter().parse(
+                prompt.content
+            ):
+                if field is not None:
+                    fields.add(field)
+                    if not field.isidentifier() or "{" in (format_spec or ""):
+                        segments = None
+                if segments is not None:
+                    segments.append((literal, field, conversion, format_spec or ""))
+        except ValueError as e:
+            self.error = str(e)
+            segments = None
+        self.segments = tuple(segments) if segments is not None else None
+        self.fields = frozenset(fields)
+
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """
+        Render the template.
 
         Args:
-            prompt_id (str): ID of the prompt
-            variables (dict[str, Any]): Variables to substitute in template
+            variables (Mapping[str, Any]): Variables to substitute in template
 
         Returns:
             str: Rendered prompt content
 
         Raises:
-            ValueError: If prompt not found or template rendering fails
+            KeyError: If a template variable is missing
+            ValueError: If the template or a format spec is invalid
         """
-        version = (
-            self.version_override.get(prompt_id) if self.version_override else None
-        )
-        prompt = self._get_prompt(prompt_id, version)
-        if not prompt:
-            raise ValueError(f"Prompt {prompt_id} not found")
-
-        # Check that all required prompt variables are provided (allow extra variables)
-        missing_vars = set(prompt.variables) - set(variables.keys())
-        if missing_vars:
-            raise ValueError(
-                f"Missing required variables {missing_vars} for prompt {prompt_id}"
-            )
-
-        try:
-            return prompt.content.format(**variables)
-        except KeyError as e:
-            raise ValueError(
-                f"Missing required variable {e} for prompt {prompt_id}"
-            ) from e
-        except Exception as e:
-            raise ValueError(f"Error rendering prompt {prompt_id}: {e}") from e
-
-    def list_versions(self, prompt_id: str) -> list[str]:
+        if self.segments is None:
+            return self.content.format(**variables)
+        parts = []
+        for literal, field, conversion, format_spec in self.segments:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                value = variables[field]
+                if conversion:
+                    value = _CONVERSIONS[conversion](value)
+                parts.append(format(value, format_spec))
+        return "".join(parts)
+
+
+class _PromptSnapshot(NamedTuple):
+    banks: Mapping[str, PromptBank]
+    compiled: Mapping[tuple[str, str], CompiledPrompt]
+
+
+class PromptRegistry:
+    """
+    Immutable, process-wide snapshot of every prompt bank in a directory.
+
+    All banks are loaded, validated and compiled once. With hot reload enabled, lookups check
+    file modification times (at most once a second) and swap in a freshly loaded snapshot when
+    a prompt file changes.
+    """
+
+    def __init__(self, prompt_bank_path: Path, hot_reload: bool = False):
         """
-        List all versions of a prompt
+        Args:
+            prompt_bank_path (Path): Path to the prompt bank directory
+            hot_reload (bool): Whether to reload the snapshot when prompt files change
+        """
+        self.prompt_bank_path = prompt_bank_path
+        self.hot_reload = hot_reload
+        self._reload_lock = threading.Lock()
+        self._fingerprint: dict[str, tuple[int, int]] = {}
+        self._next_check = 0.0
+        self.load_seconds = 0.0
+        self.reloads = 0
+        self._snapshot = _PromptSnapshot(MappingProxyType({}), MappingProxyType({}))
+        self.reload()
+
+    def get_prompt_bank(self, prompt_id: str) -> PromptBank | None:
+        """
+        Get a prompt bank from the snapshot.
 
         Args:
             prompt_id (str): ID of the prompt
 
         Returns:
-            list[str]: List of version strings
+            Optional[PromptBank]: Prompt bank or None if not found
         """
-        prompt_bank = self._get_prompt_bank(prompt_id)
-        if prompt_bank:
-            return list(prompt_bank.versions.keys())
-        return []
+        self._maybe_reload()
+        return self._snapshot.banks.get(prompt_id)
 
-    def get_active_version(self, prompt_id: str) -> str | None:
+    def get_compiled_prompt(
+        self, prompt_id: str, version: str | None = None
+    ) -> CompiledPrompt | None:
         """
-        Get the active version for a prompt (considering overrides).
+        Get the compiled template of a prompt version.
 
         Args:
             prompt_id (str): ID of the prompt
+            version (str, optional): Version of the prompt. If not provided, the active version is used.
 
         Returns:
-            Optional[str]: The active version string, or None if prompt not found
+            Optional[CompiledPrompt]: Compiled template or None if not found
         """
-        if self.version_override and prompt_id in self.version_override:
-            return self.version_override[prompt_id]
-        prompt_bank = self._get_prompt_bank(prompt_id)
-        return prompt_bank.active_version if prompt_bank else None
+        self._maybe_reload()
+        snapshot = self._snapshot
+        prompt_bank = snapshot.banks.get(prompt_id)
+        if prompt_bank is None:
+            return None
+        return snapshot.compiled.get((prompt_id, version or prompt_bank.active_version))
 
     def get_all_prompt_ids(self) -> list[str]:
         """
-        Get list of all available prompt IDs
+        Get list of all loaded prompt IDs
 
         Returns:
             list[str]: List of prompt IDs
         """
+        self._maybe_reload()
+        return list(self._snapshot.banks)
+
+    def reload(self) -> bool:
+        """
+        Load every prompt bank and swap in the new snapshot if any file changed.
+
+        Returns:
+            bool: True if a new snapshot was installed
+        """
+        with self._reload_lock:
+            fingerprint = self._scan_fingerprint()
+            if fingerprint == self._fingerprint and self.reloads:
+                return False
+            start = time.perf_counter()
+            banks: dict[str, PromptBank] = {}
+            compiled: dict[tuple[str, str], CompiledPrompt] = {}
+            for prompt_id in self._list_prompt_dirs():
+                metadata_data = self._load_metadata_file(prompt_id)
+                if not metadata_data:
+                    continue
+                prompt_bank = self._build_prompt_bank(prompt_id, metadata_data)
+                if prompt_bank is None:
+                    continue
+                banks[prompt_id] = prompt_bank
+                for version, prompt in prompt_bank.versions.items():
+                    compiled[(prompt_id, version)] = self._compile(
+                        prompt_id, version, prompt
+                    )
+            self._snapshot = _PromptSnapshot(
+                MappingProxyType(banks), MappingProxyType(compiled)
+            )
+            self._fingerprint = fingerprint
+            self.load_seconds = time.perf_counter() - start
+            self.reloads += 1
+            logger.info(
+                "event=prompt_bank_loaded prompts=%d versions=%d seconds=%.4f path=%s",
+                len(banks),
+                len(compiled),
+                self.load_seconds,
+                self.prompt_bank_path,
+            )
+            return True
+
+    def _maybe_reload(self) -> None:
+        if not self.hot_reload or time.monotonic() < self._next_check:
+            return
+        self._next_check = time.monotonic() + _HOT_RELOAD_CHECK_SECONDS
+        self.reload()
+
+    def _compile(self, prompt_id: str, version: str, prompt: Prompt) -> CompiledPrompt:
+        """Compile a prompt version and log template problems found at load time."""
+        compiled_prompt = CompiledPrompt(prompt)
+        if compiled_prompt.error:
+            logger.error(
+                "Invalid template for prompt %s version %s: %s",
+                prompt_id,
+                version,
+                compiled_prompt.error,
+            )
+        undeclared = compiled_prompt.fields - compiled_prompt.variables
+        if undeclared:
+            logger.warning(
+                "Prompt %s version %s uses variables %s missing from metadata.json",
+                prompt_id,
+                version,
+                sorted(undeclared),
+            )
+        return compiled_prompt
+
+    def _list_prompt_dirs(self) -> list[str]:
         if not self.prompt_bank_path.exists():
+            logger.warning("Prompt bank path does not exist: %s", self.prompt_bank_path)
             return []
-
-        prompt_ids = []
         try:
-            prompt_ids.extend(
+            return sorted(
                 item.name
                 for item in self.prompt_bank_path.iterdir()
                 if item.is_dir() and (item / "metadata.json").exists()
             )
         except Exception as e:
             logger.error("Error listing prompt directories: %s", e)
+            return []
 
-        return prompt_ids
-
-    # ==============================
-    # Private methods
-    # ==============================
+    def _scan_fingerprint(self) -> dict[str, tuple[int, int]]:
+        """Get (mtime_ns, size) of every metadata and prompt file in the bank."""
+        fingerprint = {}
+        try:
+            for path in self.prompt_bank_path.glob("*/*"):
+                if path.suffix in (".json", ".prompt"):
+                    stat = path.stat()
+                    fingerprint[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        except OSError as e:
+            logger.error("Error scanning prompt bank %s: %s", self.prompt_bank_path, e)
+        return fingerprint
 
     def _load_metadata_file(self, prompt_id: str) -> dict | None:
         """Load metadata.json for a prompt"""
@@ -226,6 +345,151 @@ class PromptManager:
             logger.error("Failed to build prompt bank for %s: %s", prompt_id, e)
             return None
 
+
+_registry_lock = threading.Lock()
+_registries: dict[Path, PromptRegistry] = {}
+
+
+def get_prompt_registry(prompt_bank_path: str | Path | None = None) -> PromptRegistry:
+    """
+    Get the process-wide registry of a prompt bank directory, loading it on first use.
+
+    Args:
+        prompt_bank_path (str | Path, optional): Prompt bank directory (defaults to the bundled prompt_bank)
+
+    Returns:
+        PromptRegistry: The shared registry
+    """
+    path = Path(prompt_bank_path or DEFAULT_PROMPT_BANK_PATH).resolve()
+    registry = _registries.get(path)
+    if registry is None:
+        with _registry_lock:
+            registry = _registries.get(path)
+            if registry is None:
+                registry = PromptRegistry(path, hot_reload=PROMPT_HOT_RELOAD)
+                _registries[path] = registry
+    return registry
+
+
+def reload_prompt_registries() -> None:
+    """Reload every shared prompt registry whose files changed (for prompt development)."""
+    with _registry_lock:
+        registries = list(_registries.values())
+    for registry in registries:
+        registry.reload()
+
+
+class PromptManager:
+    """Prompt management using file system prompt bank"""
+
+    def __init__(
+        self,
+        prompt_bank_path: str | None = None,
+        version_override: dict[str, str] | None = None,
+    ):
+        """
+        Initialize the PromptManager.
+
+        Prompt banks are loaded once per process and shared by every PromptManager of the same path.
+
+        Args:
+            prompt_bank_path (str, optional): Path to the prompt bank directory.
+            version_override (Dict[str, str], optional): key is prompt_id, value is version. If not provided, the active version is used.
+        """
+        self.prompt_bank_path = Path(prompt_bank_path or DEFAULT_PROMPT_BANK_PATH)
+        self.version_override: dict[str, str] | None = version_override
+        self._registry: PromptRegistry | None = None
+
+    @property
+    def registry(self) -> PromptRegistry:
+        """Shared registry of this manager's prompt bank, loaded on first use."""
+        if self._registry is None:
+            self._registry = get_prompt_registry(self.prompt_bank_path)
+        return self._registry
+
+    # ==============================
+    # Public methods
+    # ==============================
+    def render_prompt(self, prompt_id: str, variables: dict[str, Any]) -> str:
+        """
+        Render prompt template with variables
+
+        Args:
+            prompt_id (str): ID of the prompt
+            variables (dict[str, Any]): Variables to substitute in template
+
+        Returns:
+            str: Rendered prompt content
+
+        Raises:
+            ValueError: If prompt not found or template rendering fails
+        """
+        version = (
+            self.version_override.get(prompt_id) if self.version_override else None
+        )
+        compiled_prompt = self.registry.get_compiled_prompt(prompt_id, version)
+        if not compiled_prompt:
+            raise ValueError(f"Prompt {prompt_id} not found")
+
+        # Check that all required prompt variables are provided (allow extra variables)
+        missing_vars = compiled_prompt.variables.difference(variables)
+        if missing_vars:
+            raise ValueError(
+                f"Missing required variables {missing_vars} for prompt {prompt_id}"
+            )
+
+        try:
+            return compiled_prompt.render(variables)
+        except KeyError as e:
+            raise ValueError(
+                f"Missing required variable {e} for prompt {prompt_id}"
+            ) from e
+        except Exception as e:
+            raise ValueError(f"Error rendering prompt {prompt_id}: {e}") from e
+
+    def list_versions(self, prompt_id: str) -> list[str]:
+        """
+        List all versions of a prompt
+
+        Args:
+            prompt_id (str): ID of the prompt
+
+        Returns:
+            list[str]: List of version strings
+        """
+        prompt_bank = self._get_prompt_bank(prompt_id)
+        if prompt_bank:
+            return list(prompt_bank.versions.keys())
+        return []
+
+    def get_active_version(self, prompt_id: str) -> str | None:
+        """
+        Get the active version for a prompt (considering overrides).
+
+        Args:
+            prompt_id (str): ID of the prompt
+
+        Returns:
+            Optional[str]: The active version string, or None if prompt not found
+        """
+        if self.version_override and prompt_id in self.version_override:
+            return self.version_override[prompt_id]
+        prompt_bank = self._get_prompt_bank(prompt_id)
+        return prompt_bank.active_version if prompt_bank else None
+
+    def get_all_prompt_ids(self) -> list[str]:
+        """
+        Get list of all available prompt IDs
+
+        Returns:
+            list[str]: List of prompt IDs
+        """
+        return self.registry.get_all_prompt_ids()
+
+    # ==============================
+    # Private methods
+    # ==============================
+
     def _get_prompt(self, prompt_id: str, version: str | None = None) -> Prompt | None:
         """
         Get active prompt with validation
@@ -262,13 +526,4 @@ class PromptManager:
         Returns:
             Optional[PromptBank]: Validated prompt bank or None if not found
         """
-        if prompt_id in self.prompt_bank_cache:
-            return self.prompt_bank_cache[prompt_id]
-
-        metadata_data = self._load_metadata_file(prompt_id)
-        if not metadata_data:
-            return None
-
-        prompt_bank = self._build_prompt_bank(prompt_id, metadata_data)
-        self.prompt_bank_cache[prompt_id] = prompt_bank
-        return prompt_bank
+        return self.registry.get_prompt_bank(prompt_id)
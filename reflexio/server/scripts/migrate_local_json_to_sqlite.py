@@ -0,0 +1,77 @@
+"""
+CLI script to import a LocalJsonStorage file into the SQLite local storage engine.
+
+The legacy `user_profiles_{org_id}.json` file is left untouched, so the import can be
+re-run against a fresh database if needed.
+
+Usage:
+    python -m reflexio.server.scripts.migrate_local_json_to_sqlite --org-id 0 --dir /path/to/storage
+    python -m reflexio.server.scripts.migrate_local_json_to_sqlite --org-id 0 --dir /path/to/storage --json-file /path/to/user_profiles_0.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from reflexio.server.services.storage.sqlite_storage import SqliteStorage
+
+
+def migrate(org_id: str, base_dir: str, json_file: str | None = None) -> dict[str, int]:
+    """
+    Import a legacy JSON storage file into the SQLite database for an org.
+
+    Args:
+        org_id: Organization ID whose storage should be migrated
+        base_dir: Directory holding the SQLite database (and, by default, the JSON file)
+        json_file: Optional explicit path to the legacy JSON file
+
+    Returns:
+        Number of imported records per table
+
+    Raises:
+        FileNotFoundError: If the JSON file does not exist
+        ValueError: If the SQLite database already contains data
+    """
+    storage = SqliteStorage(org_id=org_id, base_dir=base_dir)
+    json_path = json_file or storage.legacy_json_path
+    if not Path(json_path).exists():
+        raise FileNotFoundError(f"Legacy JSON storage file not found: {json_path}")
+    if not storage._is_empty():
+        raise ValueError(
+            f"SQLite database {storage.db_path} already contains data; refusing to import"
+        )
+    return storage.import_local_json(json_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Import LocalJsonStorage data into the SQLite local storage engine"
+    )
+    parser.add_argument("--org-id", required=True, help="Organization ID to migrate")
+    parser.add_argument(
+        "--dir",
+        required=True,
+        help="Local storage directory (StorageConfigLocal.dir_path)",
+    )
+    parser.add_argument(
+        "--json-file",
+        default=None,
+        help="Path to the legacy JSON file (defaults to <dir>/user_profiles_<org-id>.json)",
+    )
+    args = parser.parse_args()
+
+    try:
+        counts = migrate(
+            org_id=args.org_id, base_dir=args.dir, json_file=args.json_file
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Migration failed: {e}")
+        sys.exit(1)
+
+    print(f"Imported local JSON storage for org {args.org_id}:")
+    for table, count in counts.items():
+        print(f"  {table:<35} {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,7 +33,7 @@ from reflexio.server.services.service_utils import (
     format_messages_for_logging,
     log_model_response,
 )
-from reflexio.server.site_var.site_var_manager import SiteVarManager
+from reflexio.server.site_var.site_var_manager import get_site_var_manager
 
 if TYPE_CHECKING:
     from reflexio.server.services.agent_success_evaluation.agent_success_evaluation_service import (
@@ -85,7 +85,7 @@ class AgentSuccessEvaluator:
         llm_config = config.llm_config if config else None
 
         # Get site var as fallback
-        self.model_setting = SiteVarManager().get_site_var("llm_model_setting")
+        self.model_setting = get_site_var_manager().get_site_var("llm_model_setting")
         if not isinstance(self.model_setting, dict):
             raise ValueError("llm_model_setting must be a dict")
 
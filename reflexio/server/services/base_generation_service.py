@@ -8,15 +8,20 @@ import os
 import time
 import uuid
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Any, Generic, TypeVar
 
 from reflexio_commons.api_schema.internal_schema import RequestInteractionDataModel
 from reflexio_commons.api_schema.service_schemas import Status
 
+from reflexio.server import PARALLEL_EXTRACTION
 from reflexio.server.api_endpoints.request_context import RequestContext
 from reflexio.server.llm.litellm_client import LiteLLMClient
+from reflexio.server.services.executor_registry import (
+    ExecutorSaturatedError,
+    get_executor,
+)
 from reflexio.server.services.extractor_config_utils import (
     filter_extractor_configs,
     get_extractor_name,
@@ -46,6 +51,14 @@ logger = logging.getLogger(__name__)
 # Timeout for individual extractor execution (safety net if LLM provider ignores its own timeout)
 EXTRACTOR_TIMEOUT_SECONDS = 300
 
+
+def _timed_run(extractor: Any) -> tuple[Any, float]:
+    """Run an extractor and return its result with the elapsed seconds."""
+    start = time.perf_counter()
+    result = extractor.run()
+    return result, time.perf_counter() - start
+
+
 # Type variables for generic base service
 TExtractorConfig = TypeVar(
     "TExtractorConfig"
@@ -67,7 +80,8 @@ class BaseGenerationService(
     ABC, Generic[TExtractorConfig, TExtractor, TGenerationServiceConfig, TRequest]
 ):
     """
-    Base class for generation services that run multiple extractors sequentially.
+    Base class for generation services that run multiple extractors, sequentially by default
+    or concurrently when PARALLEL_EXTRACTION is on. Extractors run on the shared "llm" executor.
 
     This unified class supports two types of services:
     1. Evaluation services (feedback, agent success) - process interactions and save RawFeedback
@@ -104,10 +118,12 @@ class BaseGenerationService(
         self.request_context = request_context
         self.service_config: TGenerationServiceConfig | None = None
         self._is_batch_mode: bool = False
-        self._last_extractor_run_stats: dict[str, int] = {
+        self._last_extractor_run_stats: dict[str, Any] = {
             "total": 0,
             "failed": 0,
             "timed_out": 0,
+            "parallel": False,
+            "extractors": [],
         }
 
     @abstractmethod
@@ -420,7 +436,7 @@ class BaseGenerationService(
         This method contains the core generation logic extracted from the original run() method.
         It handles:
         1. Validating and extracting parameters from the request
-        2. Running extractors sequentially
+        2. Running extractors (independent ones in parallel when enabled, chained ones sequentially)
         3. Processing results
 
         Args:
@@ -481,52 +497,74 @@ class BaseGenerationService(
                 )
                 return
 
-            # Run extractors sequentially: each extractor runs independently,
-            # then existing_data is refreshed so the next extractor sees updated state.
-            # Results are collected and processed once after all extractors complete.
-            all_results = []
-            previously_extracted = []
-            run_stats = {"total": len(extractor_configs), "failed": 0, "timed_out": 0}
+            all_results: list = []
+            previously_extracted: list = []
+            run_stats: dict[str, Any] = {
+                "total": len(extractor_configs),
+                "failed": 0,
+                "timed_out": 0,
+                "parallel": PARALLEL_EXTRACTION,
+                "extractors": [],
+            }
+
+            chained_configs = extractor_configs
+            if PARALLEL_EXTRACTION:
+                # Independent extractors run concurrently on the shared executor against the same
+                # service config; extractors that declare a dependency are chained afterwards.
+                independent_configs = [
+                    config
+                    for config in extractor_configs
+                    if not getattr(config, "depends_on_previous_extractors", False)
+                ]
+                chained_configs = [
+                    config
+                    for config in extractor_configs
+                    if getattr(config, "depends_on_previous_extractors", False)
+                ]
+                futures = [
+                    (
+                        config,
+                        self._submit_extractor(
+                            self._create_extractor(config, self.service_config)
+                        ),
+                    )
+                    for config in independent_configs
+                ]
+                deadline = time.monotonic() + EXTRACTOR_TIMEOUT_SECONDS
+                for config, future in futures:
+                    result = self._await_extractor(
+                        future,
+                        config,
+                        max(deadline - time.monotonic(), 0),
+                        run_stats,
+                        identifier,
+                    )
+                    if result:
+                        all_results.append(result)
+                        previously_extracted.append(result)
 
-            for i, config in enumerate(extractor_configs):
-                if i > 0 and previously_extracted:
+            # Chained extractors run one at a time: after the first result, existing_data is
+            # refreshed and previous results are passed in so the next extractor sees updated state.
+            # Results are collected and processed once after all extractors complete.
+            for config in chained_configs:
+                if previously_extracted:
                     # Re-load service config for next extractor
                     self.service_config = self._load_generation_service_config(request)
                     # Let subclass update config for incremental mode
                     self._update_config_for_incremental(previously_extracted)
 
                 extractor = self._create_extractor(config, self.service_config)
-                executor: ThreadPoolExecutor | None = None
-                try:
-                    executor = ThreadPoolExecutor(max_workers=1)
-                    future = executor.submit(extractor.run)  # type: ignore[reportAttributeAccessIssue]
-                    result = future.result(timeout=EXTRACTOR_TIMEOUT_SECONDS)
-                    if result:
-                        all_results.append(result)
-                        previously_extracted.append(result)
-                except FuturesTimeoutError:
-                    run_stats["failed"] += 1
-                    run_stats["timed_out"] += 1
-                    logger.error(
-                        "Extractor timed out after %d seconds for %s identifier=%s",
-                        EXTRACTOR_TIMEOUT_SECONDS,
-                        self._get_service_name(),
-                        identifier,
-                    )
-                    continue
-                except Exception as e:
-                    run_stats["failed"] += 1
-                    logger.error(
-                        "Extractor failed for %s identifier=%s: %s (type=%s)",
-                        self._get_service_name(),
-                        identifier,
-                        str(e),
-                        type(e).__name__,
-                    )
-                    continue
-                finally:
-                    if executor is not None:
-                        executor.shutdown(wait=False, cancel_futures=True)
+                # Run on the shared executor only to enforce the timeout
+                result = self._await_extractor(
+                    self._submit_extractor(extractor),
+                    config,
+                    EXTRACTOR_TIMEOUT_SECONDS,
+                    run_stats,
+                    identifier,
+                )
+                if result:
+                    all_results.append(result)
+                    previously_extracted.append(result)
 
             self._last_extractor_run_stats = run_stats
 
@@ -562,6 +600,101 @@ class BaseGenerationService(
             if isinstance(e, ExtractorExecutionError):
                 raise
 
+    @staticmethod
+    def _submit_extractor(extractor: TExtractor) -> Future:
+        """
+        Submit an extractor run to the shared "llm" executor, running it on the calling thread if
+        the executor is shedding load.
+
+        Args:
+            extractor: The extractor to run
+
+        Returns:
+            Future of `_timed_run(extractor)`; already completed for inline runs
+        """
+        try:
+            return get_executor("llm").submit(_timed_run, extractor)
+        except ExecutorSaturatedError as e:
+            logger.warning("%s; running %s inline", e, type(extractor).__name__)
+        future: Future = Future()
+        try:
+            future.set_result(_timed_run(extractor))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _await_extractor(
+        self,
+        future: Future,
+        config: TExtractorConfig,
+        timeout: float,
+        run_stats: dict[str, Any],
+        identifier: str,
+    ) -> Any:
+        """
+        Wait for an extractor run, recording its outcome and timing in run_stats.
+
+        Args:
+            future: Future of `_timed_run(extractor)`
+            config: The extractor's config (for its name)
+            timeout: Seconds to wait before giving up on the extractor
+            run_stats: Run stats to update (failed/timed_out counters and per-extractor entries)
+            identifier: User or request ID for log context
+
+        Returns:
+            The extractor result, or None if it failed or timed out
+        """
+        name = get_extractor_name(config)
+        wait_start = time.perf_counter()
+        try:
+            result, seconds = future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            # Drop it if still queued, otherwise ask it to stop at its next cancellation check
+            get_executor("llm").cancel(future)
+            run_stats["failed"] += 1
+            run_stats["timed_out"] += 1
+            run_stats["extractors"].append(
+                {
+                    "name": name,
+                    "status": "timed_out",
+                    "seconds": time.perf_counter() - wait_start,
+                }
+            )
+            logger.error(
+                "Extractor timed out after %d seconds for %s identifier=%s",
+                EXTRACTOR_TIMEOUT_SECONDS,
+                self._get_service_name(),
+                identifier,
+            )
+            return None
+        except Exception as e:
+            run_stats["failed"] += 1
+            run_stats["extractors"].append(
+                {
+                    "name": name,
+                    "status": "failed",
+                    "seconds": time.perf_counter() - wait_start,
+                }
+            )
+            logger.error(
+                "Extractor failed for %s identifier=%s: %s (type=%s)",
+                self._get_service_name(),
+                identifier,
+                str(e),
+                type(e).__name__,
+            )
+            return None
+        run_stats["extractors"].append(
+            {"name": name, "status": "ok" if result else "empty", "seconds": seconds}
+        )
+        logger.info(
+            "event=extractor_run service=%s extractor=%s elapsed_seconds=%.3f",
+            self._get_service_name(),
+            name,
+            seconds,
+        )
+        return result
+
     def _should_run_before_extraction(
         self, extractor_configs: list[TExtractorConfig]
     ) -> bool:
@@ -707,7 +840,10 @@ class BaseGenerationService(
                 continue
 
             window_size, _ = get_extractor_window_params(
-                config, global_window_size, global_stride
+                config,
+                global_window_size,
+                global_stride,
+                getattr(self.service_config, "min_extraction_window_size", None),
             )
             fetch_k = window_size
             session_data_models, _ = self.storage.get_last_k_interactions_grouped(  # type: ignore[reportOptionalMemberAccess]
@@ -757,9 +893,9 @@ class BaseGenerationService(
         """
         root_config = self.request_context.configurator.get_config()
         llm_config = root_config.llm_config if root_config else None
-        from reflexio.server.site_var.site_var_manager import SiteVarManager
+        from reflexio.server.site_var.site_var_manager import get_site_var_manager
 
-        model_setting = SiteVarManager().get_site_var("llm_model_setting")
+        model_setting = get_site_var_manager().get_site_var("llm_model_setting")
         return (
             llm_config.should_run_model_name
             if llm_config and llm_config.should_run_model_name
@@ -5,6 +5,7 @@ import os
 from pydantic import BaseModel
 from reflexio_commons.config_schema import (
     Config,
+    LocalStorageEngine,
     StorageConfig,
     StorageConfigLocal,
     StorageConfigSupabase,
@@ -24,6 +25,7 @@ from reflexio.server.services.configurator.rds_config_storage import RdsConfigSt
 from reflexio.server.services.configurator.s3_config_storage import S3ConfigStorage
 from reflexio.server.services.storage.error import StorageError
 from reflexio.server.services.storage.local_json_storage import LocalJsonStorage
+from reflexio.server.services.storage.sqlite_storage import SqliteStorage
 from reflexio.server.services.storage.storage_base import BaseStorage
 from reflexio.server.services.storage.supabase_storage import SupabaseStorage
 
@@ -157,12 +159,20 @@ class SimpleConfigurator:
         """
         storage: BaseStorage
         if isinstance(storage_config, StorageConfigLocal):
-            logger.info("Using local storage for org %s", self.org_id)
-            storage = LocalJsonStorage(
-                org_id=self.org_id,
-                base_dir=self.base_dir,
-                config=storage_config,
-            )
+            if storage_config.engine == LocalStorageEngine.SQLITE:
+                logger.info("Using local SQLite storage for org %s", self.org_id)
+                storage = SqliteStorage(
+                    org_id=self.org_id,
+                    base_dir=self.base_dir,
+                    config=storage_config,
+                )
+            else:
+                logger.info("Using local storage for org %s", self.org_id)
+                storage = LocalJsonStorage(
+                    org_id=self.org_id,
+                    base_dir=self.base_dir,
+                    config=storage_config,
+                )
         elif isinstance(storage_config, StorageConfigSupabase):
             logger.info("Using Supabase storage for org %s", self.org_id)
             # Get API key config and LLM config from current config
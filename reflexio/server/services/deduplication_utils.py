@@ -8,9 +8,12 @@ ProfileDeduplicator and FeedbackDeduplicator.
 import logging
 from abc import ABC
 
+from pydantic import BaseModel
+from reflexio_commons.config_schema import EMBEDDING_DIMENSIONS
+
 from reflexio.server.api_endpoints.request_context import RequestContext
 from reflexio.server.llm.litellm_client import LiteLLMClient
-from reflexio.server.site_var.site_var_manager import SiteVarManager
+from reflexio.server.site_var.site_var_manager import get_site_var_manager
 
 logger = logging.getLogger(__name__)
 
@@ -72,9 +75,53 @@ class BaseDeduplicator(ABC):  # noqa: B024
         self.client = llm_client
 
         # Get model name from site var
-        model_setting = SiteVarManager().get_site_var("llm_model_setting")
+        model_setting = get_site_var_manager().get_site_var("llm_model_setting")
         if not isinstance(model_setting, dict):
             raise ValueError("llm_model_setting must be a dict")
         self.model_name = model_setting.get(
             "default_generation_model_name", "gpt-5-mini"
         )
+
+    def _embed_queries_and_stored_texts(
+        self,
+        items: list[BaseModel],
+        query_texts: list[str],
+        stored_texts: list[str],
+    ) -> list[list[float]]:
+        """
+        Embed the dedup search queries, and attach the embeddings of the stored texts to the items.
+
+        Searches keep using vectors of their query texts, so similarity thresholds are unchanged;
+        the stored-text vectors are only carried forward so storage can skip re-embedding the
+        items when saving them. Both are embedded with the storage's embedding model in one call,
+        and texts that coincide are embedded once.
+
+        Args:
+            items (list[BaseModel]): Items with an `embedding` field, aligned with the texts
+            query_texts (list[str]): Text each item is searched with
+            stored_texts (list[str]): Text storage embeds for each item
+
+        Returns:
+            list[list[float]]: Embeddings of the query texts
+
+        Raises:
+            Exception: If the embedding call fails (items are then left without embeddings)
+        """
+        texts = list(dict.fromkeys([*query_texts, *stored_texts]))
+        embeddings = dict(
+            zip(
+                texts,
+                self.client.get_embeddings(
+                    texts,
+                    model=getattr(
+                        self.request_context.storage, "embedding_model_name", None
+                    ),
+                    dimensions=EMBEDDING_DIMENSIONS,
+                ),
+                strict=True,
+            )
+        )
+        for item, text in zip(items, stored_texts, strict=True):
+            if len(embeddings[text]) == EMBEDDING_DIMENSIONS:
+                item.embedding = embeddings[text]  # type: ignore[attr-defined]
+        return [embeddings[text] for text in query_texts]
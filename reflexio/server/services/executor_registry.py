@@ -0,0 +1,295 @@
+"""
+Process-wide registry of named, bounded thread pools.
+
+Work that used to create a ThreadPoolExecutor per call runs on a shared pool instead, so hung
+LLM or storage calls can only tie up a fixed number of threads. Each pool admits at most
+`max_workers + max_queue` tasks; beyond that `submit` raises ExecutorSaturatedError so callers
+shed load instead of queueing without bound.
+
+Cancellation is cooperative: `BoundedExecutor.cancel` drops a task that has not started and
+flags a running one, which long-running code observes through `is_cancelled()` /
+`raise_if_cancelled()`.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from reflexio.server import EXECUTOR_MAX_QUEUE_PER_WORKER, EXECUTOR_POOL_SIZES
+
+logger = logging.getLogger(__name__)
+
+# Pool names and their default worker counts (override with EXECUTOR_POOL_SIZES)
+DEFAULT_POOL_SIZES = {
+    "generation": 8,  # profile/feedback generation services per publish
+    "llm": 16,  # extractor runs and query rewrites
+    "embedding": 8,  # query embeddings
+    "storage": 8,  # blocking storage calls
+    "search": 16,  # per-entity searches of unified search
+    "aggregation": 2,  # scheduled feedback aggregation and skill generation runs
+}
+
+_task_state = threading.local()
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a pool already holds its maximum number of running and queued tasks."""
+
+
+class TaskCancelledError(RuntimeError):
+    """Raised by `raise_if_cancelled` inside a task whose caller gave up on it."""
+
+
+def is_cancelled() -> bool:
+    """
+    Check whether the task running on the current thread was cancelled.
+
+    Returns:
+        bool: True if the caller cancelled the task (always False outside a pool task)
+    """
+    event = getattr(_task_state, "cancel_event", None)
+    return event is not None and event.is_set()
+
+
+def raise_if_cancelled() -> None:
+    """
+    Stop the current task if its caller cancelled it.
+
+    Raises:
+        TaskCancelledError: If the task running on the current thread was cancelled
+    """
+    if is_cancelled():
+        raise TaskCancelledError("Task cancelled by caller")
+
+
+class BoundedExecutor:
+    """ThreadPoolExecutor with an admission limit, cooperative cancellation and gauges."""
+
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        """
+        Args:
+            name (str): Pool name (used for thread names and metrics)
+            max_workers (int): Max threads
+            max_queue (int): Max tasks waiting for a thread before submit sheds load
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-pool"
+        )
+        self._lock = threading.Lock()
+        self._cancel_events: dict[Future, threading.Event] = {}
+        self._in_flight = 0
+        self._active = 0
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "rejected": 0,
+            "cancelled": 0,
+            "peak_in_flight": 0,
+        }
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule a task on the pool.
+
+        Args:
+            fn (Callable): Function to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future: Future of the task
+
+        Raises:
+            ExecutorSaturatedError: If the pool already holds max_workers + max_queue tasks
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._counters["rejected"] += 1
+                raise ExecutorSaturatedError(
+                    f"Executor '{self.name}' is saturated ({self._in_flight} tasks in flight)"
+                )
+            self._in_flight += 1
+            self._counters["submitted"] += 1
+            self._counters["peak_in_flight"] = max(
+                self._counters["peak_in_flight"], self._in_flight
+            )
+        cancel_event = threading.Event()
+        try:
+            future = self._pool.submit(self._run, cancel_event, fn, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        with self._lock:
+            self._cancel_events[future] = cancel_event
+        future.add_done_callback(self._on_done)
+        return future
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Cancel a task: drop it if it has not started, otherwise flag it for cooperative cancellation.
+
+        Args:
+            future (Future): Future returned by submit
+
+        Returns:
+            bool: True if the task will not run to completion unobserved (dropped or flagged)
+        """
+        if future.cancel():
+            return True
+        with self._lock:
+            cancel_event = self._cancel_events.get(future)
+        if cancel_event is None:
+            return False
+        cancel_event.set()
+        return True
+
+    def _run(
+        self,
+        cancel_event: threading.Event,
+        fn: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+    ) -> Any:
+        if cancel_event.is_set():
+            raise TaskCancelledError("Task cancelled before it started")
+        with self._lock:
+            self._active += 1
+        _task_state.cancel_event = cancel_event
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _task_state.cancel_event = None
+            with self._lock:
+                self._active -= 1
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            cancel_event = self._cancel_events.pop(future, None)
+            if future.cancelled() or (
+                cancel_event is not None and cancel_event.is_set()
+            ):
+                self._counters["cancelled"] += 1
+            else:
+                self._counters["completed"] += 1
+
+    def stats(self) -> dict:
+        """
+        Get pool gauges and counters.
+
+        Returns:
+            dict: max_workers, max_queue, active and queued gauges, and submitted/completed/
+                rejected/cancelled/peak_in_flight counters
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queued": self._in_flight - self._active,
+                **self._counters,
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting tasks and cancel queued ones without waiting for running tasks."""
+        with self._lock:
+            cancel_events = list(self._cancel_events.values())
+        for cancel_event in cancel_events:
+            cancel_event.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_registry_lock = threading.Lock()
+_executors: dict[str, BoundedExecutor] = {}
+
+
+def _pool_size(name: str) -> int:
+    for entry in EXECUTOR_POOL_SIZES.split(","):
+        key, _, value = entry.partition("=")
+        if key.strip() == name and value.strip():
+            return max(int(value), 1)
+    return DEFAULT_POOL_SIZES.get(name, 4)
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """
+    Get a named process-wide pool, creating it on first use.
+
+    Args:
+        name (str): Pool name, normally one of DEFAULT_POOL_SIZES
+
+    Returns:
+        BoundedExecutor: The shared pool
+    """
+    with _registry_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            max_workers = _pool_size(name)
+            executor = BoundedExecutor(
+                name, max_workers, max_workers * EXECUTOR_MAX_QUEUE_PER_WORKER
+            )
+            _executors[name] = executor
+            logger.info(
+                "event=executor_created name=%s max_workers=%d max_queue=%d",
+                name,
+                executor.max_workers,
+                executor.max_queue,
+            )
+        return executor
+
+
+async def run_in_executor_async(
+    name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """
+    Await a blocking call on a named pool, keeping the event loop free meanwhile.
+
+    Cancelling the awaiting coroutine drops the task if it has not started and flags it otherwise.
+
+    Args:
+        name (str): Pool name, normally one of DEFAULT_POOL_SIZES
+        fn (Callable): Blocking function to run
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Any: fn's result
+
+    Raises:
+        ExecutorSaturatedError: If the pool already holds max_workers + max_queue tasks
+    """
+    executor = get_executor(name)
+    future = executor.submit(fn, *args, **kwargs)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        executor.cancel(future)
+        raise
+
+
+def get_executor_stats() -> dict[str, dict]:
+    """
+    Get gauges and counters of every pool created so far.
+
+    Returns:
+        dict[str, dict]: Stats keyed by pool name
+    """
+    with _registry_lock:
+        executors = list(_executors.values())
+    return {executor.name: executor.stats() for executor in executors}
+
+
+def shutdown_executors() -> None:
+    """Shut down and forget every pool (for testing/admin)."""
+    with _registry_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown()
@@ -25,17 +25,20 @@ def get_extractor_window_params(
     extractor_config: TExtractorConfig,
     global_window_size: int | None,
     global_stride: int | None,
+    min_window_size: int | None = None,
 ) -> tuple[int, int]:
     """
     Get effective window size and stride for a specific extractor.
 
     Uses extractor's override values if set, otherwise falls back to global values,
-    then to defaults (window=10, stride=5).
+    then to defaults (window=10, stride=5). The window is widened to `min_window_size`
+    when a run must cover more interactions than the configured window.
 
     Args:
         extractor_config: Extractor configuration object
         global_window_size: Global extraction_window_size from config
         global_stride: Global extraction_window_stride from config
+        min_window_size: Minimum window size requested by the run (e.g. a coalesced bulk publish)
 
     Returns:
         Tuple of (window_size, stride_size) for this extractor
@@ -60,6 +63,8 @@ def get_extractor_window_params(
         if stride_override is not None
         else (global_stride if global_stride is not None else DEFAULT_STRIDE_SIZE)
     )
+    if min_window_size is not None:
+        window_size = max(window_size, min_window_size)
 
     return window_size, stride_size
 
@@ -0,0 +1,474 @@
+"""
+Debounced background scheduler for feedback aggregation and skill generation.
+
+Publishing an interaction used to run FeedbackAggregator (clustering plus one LLM call per changed
+cluster) and SkillGenerator inline for every feedback config. With AGGREGATION_DEBOUNCE_SECONDS > 0
+the publish pipeline only records a trigger for (org_id, feedback_name, agent_version); triggers for
+the same key coalesce, and the key runs once on the shared "aggregation" executor when its window
+expires. A key never runs concurrently with itself, so it runs at most once per window.
+
+Pending triggers are kept in a SQLite file so they survive restarts; a trigger is only removed
+once the run it caused finishes without being re-triggered meanwhile. A failed run keeps its trigger
+and is retried with exponential backoff, up to `max_attempts` runs before the trigger is dropped.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from reflexio.server import AGGREGATION_DEBOUNCE_SECONDS, SQLITE_FILE_DIRECTORY
+from reflexio.server.services.executor_registry import (
+    ExecutorSaturatedError,
+    get_executor,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before retrying keys the aggregation executor had no room for
+_SATURATED_RETRY_SECONDS = 5.0
+
+# Upper bound of the backoff between retries of a failed run
+_MAX_RETRY_SECONDS = 3600.0
+
+# (org_id, feedback_name, agent_version)
+AggregationKey = tuple[str, str, str]
+
+# Runs aggregation (and skill generation) for one key; raising counts the run as failed
+AggregationHandler = Callable[[str, str, str], None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending_aggregations (
+    org_id TEXT NOT NULL,
+    feedback_name TEXT NOT NULL,
+    agent_version TEXT NOT NULL,
+    first_triggered_at REAL NOT NULL,
+    due_at REAL NOT NULL,
+    trigger_count INTEGER NOT NULL,
+    failed_attempts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (org_id, feedback_name, agent_version)
+);
+"""
+
+
+@dataclass
+class PendingAggregation:
+    """A coalesced trigger waiting for its window to expire.
+
+    Attributes:
+        first_triggered_at: Unix time of the first trigger since the last run
+        due_at: Unix time at which the key may run
+        trigger_count: Triggers coalesced into this run
+        failed_attempts: Consecutive failed runs of these triggers
+    """
+
+    first_triggered_at: float
+    due_at: float
+    trigger_count: int = 1
+    failed_attempts: int = 0
+
+
+class AggregationScheduler:
+    """Coalesces aggregation triggers per key and runs each key at most once per debounce window."""
+
+    def __init__(
+        self,
+        handler: AggregationHandler,
+        debounce_seconds: float,
+        db_path: str | None = None,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            handler (AggregationHandler): Runs aggregation for (org_id, feedback_name, agent_version)
+            debounce_seconds (float): Seconds between a key's first trigger and its run
+            db_path (str, optional): SQLite file persisting pending triggers (in memory only if None)
+            max_attempts (int): Runs of the same triggers before a failing key is dropped
+            retry_base_seconds (float): Backoff before the first retry, doubled on each further failure
+        """
+        self.handler = handler
+        self.debounce_seconds = debounce_seconds
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self._lock = threading.Condition()
+        self._pending: dict[AggregationKey, PendingAggregation] = {}
+        self._running: set[AggregationKey] = set()
+        self._stop = False
+        self._thread: threading.Thread | None = None
+        self._conn: sqlite3.Connection | None = None
+        self._counters = {
+            "triggered": 0,
+            "coalesced": 0,
+            "runs": 0,
+            "failed_runs": 0,
+            "dropped_triggers": 0,
+            "total_run_seconds": 0.0,
+            "max_run_seconds": 0.0,
+            "last_run_seconds": 0.0,
+        }
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                db_path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            self._conn.executescript(_SCHEMA)
+            columns = {
+                row[1]
+                for row in self._conn.execute("PRAGMA table_info(pending_aggregations)")
+            }
+            if "failed_attempts" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE pending_aggregations "
+                    "ADD COLUMN failed_attempts INTEGER NOT NULL DEFAULT 0"
+                )
+            for row in self._conn.execute(
+                "SELECT org_id, feedback_name, agent_version, first_triggered_at, due_at, "
+                "trigger_count, failed_attempts FROM pending_aggregations"
+            ):
+                self._pending[(row[0], row[1], row[2])] = PendingAggregation(
+                    first_triggered_at=row[3],
+                    due_at=row[4],
+                    trigger_count=row[5],
+                    failed_attempts=row[6],
+                )
+            if self._pending:
+                logger.info(
+                    "Restored %d pending aggregation triggers from %s",
+                    len(self._pending),
+                    db_path,
+                )
+
+    def start(self) -> None:
+        """Start the dispatcher thread (no-op if already running)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop = False
+            self._thread = threading.Thread(
+                target=self._dispatch_loop, daemon=True, name="aggregation-scheduler"
+            )
+            self._thread.start()
+        logger.info(
+            "Aggregation scheduler started debounce_seconds=%s", self.debounce_seconds
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the dispatcher thread. Pending triggers stay persisted for the next start.
+
+        Args:
+            timeout (float): Seconds to wait for the dispatcher thread
+        """
+        with self._lock:
+            self._stop = True
+            thread, self._thread = self._thread, None
+            self._lock.notify_all()
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def trigger(self, org_id: str, feedback_name: str, agent_version: str) -> None:
+        """
+        Request aggregation for a key, coalescing with a pending trigger of the same key.
+
+        Args:
+            org_id (str): Organization ID
+            feedback_name (str): Feedback name to aggregate
+            agent_version (str): Agent version to aggregate
+        """
+        key = (org_id, feedback_name, agent_version)
+        now = time.time()
+        with self._lock:
+            self._counters["triggered"] += 1
+            pending = self._pending.get(key)
+            if pending is not None:
+                pending.trigger_count += 1
+                self._counters["coalesced"] += 1
+            else:
+                pending = PendingAggregation(
+                    first_triggered_at=now, due_at=now + self.debounce_seconds
+                )
+                self._pending[key] = pending
+                self._lock.notify_all()
+            self._persist(key, pending)
+
+    def run_due(self, now: float | None = None) -> int:
+        """
+        Submit every due key that is not already running to the aggregation executor.
+
+        Args:
+            now (float, optional): Current Unix time (defaults to time.time())
+
+        Returns:
+            int: Number of keys submitted
+        """
+        now = time.time() if now is None else now
+        submitted = 0
+        with self._lock:
+            due_keys = [
+                key
+                for key, pending in self._pending.items()
+                if pending.due_at <= now and key not in self._running
+            ]
+            for key in due_keys:
+                pending = self._pending[key]
+                try:
+                    get_executor("aggregation").submit(
+                        self._run, key, pending.trigger_count
+                    )
+                except ExecutorSaturatedError:
+                    pending.due_at = now + _SATURATED_RETRY_SECONDS
+                    logger.warning(
+                        "Aggregation executor saturated, delaying org=%s feedback_name=%s",
+                        key[0],
+                        key[1],
+                    )
+                    continue
+                self._running.add(key)
+                submitted += 1
+        return submitted
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._lock:
+                if self._stop:
+                    return
+                waiting = [
+                    pending.due_at
+                    for key, pending in self._pending.items()
+                    if key not in self._running
+                ]
+                timeout = max(min(waiting) - time.time(), 0.0) if waiting else None
+                if timeout is None or timeout > 0:
+                    self._lock.wait(timeout=timeout)
+                    continue
+            self.run_due()
+
+    def _run(self, key: AggregationKey, trigger_count: int) -> None:
+        org_id, feedback_name, agent_version = key
+        start = time.perf_counter()
+        failed = False
+        try:
+            self.handler(org_id, feedback_name, agent_version)
+        except Exception:
+            failed = True
+            logger.exception(
+                "Scheduled aggregation failed org=%s feedback_name=%s agent_version=%s",
+                org_id,
+                feedback_name,
+                agent_version,
+            )
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._running.discard(key)
+            pending = self._pending.get(key)
+            if pending is not None and failed:
+                pending.failed_attempts += 1
+            if (
+                pending is not None
+                and failed
+                and pending.failed_attempts < self.max_attempts
+            ):
+                # Keep every trigger and retry after a backoff
+                pending.due_at = max(
+                    pending.due_at,
+                    time.time() + self.retry_delay(pending.failed_attempts),
+                )
+                self._persist(key, pending)
+            elif pending is not None and pending.trigger_count == trigger_count:
+                # Not re-triggered during the run
+                del self._pending[key]
+                self._delete(key)
+                if failed:
+                    self._counters["dropped_triggers"] += trigger_count
+                    logger.error(
+                        "Dropping aggregation trigger after %d failed runs org=%s "
+                        "feedback_name=%s agent_version=%s",
+                        pending.failed_attempts,
+                        org_id,
+                        feedback_name,
+                        agent_version,
+                    )
+            elif pending is not None:
+                # Re-triggered during the run: run again one window after the latest run started
+                if failed:
+                    self._counters["dropped_triggers"] += trigger_count
+                pending.trigger_count -= trigger_count
+                pending.failed_attempts = 0
+                pending.due_at = max(
+                    pending.due_at, time.time() - elapsed + self.debounce_seconds
+                )
+                self._persist(key, pending)
+            self._counters["runs"] += 1
+            self._counters["failed_runs"] += int(failed)
+            self._counters["total_run_seconds"] += elapsed
+            self._counters["max_run_seconds"] = max(
+                self._counters["max_run_seconds"], elapsed
+            )
+            self._counters["last_run_seconds"] = elapsed
+            self._lock.notify_all()
+        logger.info(
+            "event=scheduled_aggregation_done org_id=%s feedback_name=%s agent_version=%s "
+            "coalesced_triggers=%d run_seconds=%.3f failed=%s",
+            org_id,
+            feedback_name,
+            agent_version,
+            trigger_count,
+            elapsed,
+            failed,
+        )
+
+    def retry_delay(self, failed_attempts: int) -> float:
+        """
+        Get the backoff before retrying a key after its latest failed run.
+
+        Args:
+            failed_attempts (int): Consecutive failed runs so far (1 for the first failure)
+
+        Returns:
+            float: Seconds to wait, capped at one hour
+        """
+        return min(
+            self.retry_base_seconds * 2 ** (failed_attempts - 1), _MAX_RETRY_SECONDS
+        )
+
+    def _persist(self, key: AggregationKey, pending: PendingAggregation) -> None:
+        if self._conn is None:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pending_aggregations (org_id, feedback_name, agent_version, "
+            "first_triggered_at, due_at, trigger_count, failed_attempts) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                *key,
+                pending.first_triggered_at,
+                pending.due_at,
+                pending.trigger_count,
+                pending.failed_attempts,
+            ),
+        )
+
+    def _delete(self, key: AggregationKey) -> None:
+        if self._conn is None:
+            return
+        self._conn.execute(
+            "DELETE FROM pending_aggregations WHERE org_id = ? AND feedback_name = ? "
+            "AND agent_version = ?",
+            key,
+        )
+
+    def stats(self, org_id: str | None = None) -> dict:
+        """
+        Get queue state and run counters.
+
+        Args:
+            org_id (str, optional): Also list this org's pending and running keys
+
+        Returns:
+            dict: pending/running gauges, oldest pending trigger age, run counters and timings,
+                and the org's keys when org_id is given
+        """
+        now = time.time()
+        with self._lock:
+            stats = {
+                "debounce_seconds": self.debounce_seconds,
+                "pending": len(self._pending),
+                "running": len(self._running),
+                "oldest_pending_seconds": max(
+                    (now - p.first_triggered_at for p in self._pending.values()),
+                    default=0.0,
+                ),
+                **self._counters,
+            }
+            if org_id is not None:
+                stats["org"] = {
+                    "pending": [
+                        {
+                            "feedback_name": key[1],
+                            "agent_version": key[2],
+                            "trigger_count": pending.trigger_count,
+                            "failed_attempts": pending.failed_attempts,
+                            "due_in_seconds": max(pending.due_at - now, 0.0),
+                        }
+                        for key, pending in self._pending.items()
+                        if key[0] == org_id
+                    ],
+                    "running": [
+                        {"feedback_name": key[1], "agent_version": key[2]}
+                        for key in self._running
+                        if key[0] == org_id
+                    ],
+                }
+        return stats
+
+
+_scheduler_lock = threading.Lock()
+_scheduler: AggregationScheduler | None = None
+
+
+def get_aggregation_scheduler() -> AggregationScheduler | None:
+    """
+    Get the process-wide aggregation scheduler.
+
+    Returns:
+        AggregationScheduler | None: The running scheduler, or None when aggregation runs inline
+            (AGGREGATION_DEBOUNCE_SECONDS is 0 or the scheduler was not started)
+    """
+    return _scheduler
+
+
+def start_aggregation_scheduler(
+    handler: AggregationHandler,
+) -> AggregationScheduler | None:
+    """
+    Start the process-wide scheduler if AGGREGATION_DEBOUNCE_SECONDS is above 0.
+
+    Args:
+        handler (AggregationHandler): Runs aggregation for (org_id, feedback_name, agent_version)
+
+    Returns:
+        AggregationScheduler | None: The running scheduler, or None when disabled
+    """
+    global _scheduler
+    if AGGREGATION_DEBOUNCE_SECONDS <= 0:
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = AggregationScheduler(
+                handler,
+                AGGREGATION_DEBOUNCE_SECONDS,
+                db_path=str(
+                    Path(SQLITE_FILE_DIRECTORY) / "aggregation_triggers.sqlite3"
+                ),
+            )
+        _scheduler.start()
+        return _scheduler
+
+
+def stop_aggregation_scheduler() -> None:
+    """Stop and forget the process-wide scheduler; pending triggers stay persisted."""
+    global _scheduler
+    with _scheduler_lock:
+        scheduler, _scheduler = _scheduler, None
+    if scheduler is not None:
+        scheduler.stop()
+
+
+def get_aggregation_scheduler_stats(org_id: str | None = None) -> dict:
+    """
+    Get scheduler queue state and run timings.
+
+    Args:
+        org_id (str, optional): Also list this org's pending and running keys
+
+    Returns:
+        dict: {"enabled": False} when aggregation runs inline, otherwise scheduler stats
+    """
+    scheduler = _scheduler
+    if scheduler is None:
+        return {"enabled": False}
+    return {"enabled": True, **scheduler.stats(org_id)}
@@ -4,6 +4,8 @@ import os
 
 import hdbscan
 import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from sklearn.cluster import AgglomerativeClustering
 from sklearn.metrics.pairwise import cosine_distances
 
@@ -12,6 +14,20 @@ from sklearn.metrics.pairwise import cosine_distances
 # Above this, use HDBSCAN (scales better, handles noise)
 CLUSTERING_ALGORITHM_THRESHOLD = 50
 
+# At or above this many feedbacks, cluster on a sparse k-nearest-neighbour distance graph
+# instead of a dense n x n distance matrix (4 * n^2 bytes even at float32)
+SPARSE_CLUSTERING_THRESHOLD = 5000
+# Nearest neighbours kept per feedback in the sparse distance graph
+KNN_GRAPH_NEIGHBORS = 30
+# Max similarity entries computed per block while building the graph (64 MB of float32)
+KNN_BLOCK_ELEMENTS = 16 * 1024 * 1024
+# Sparse matrices drop explicit zeros, so identical embeddings keep this distance instead
+MIN_GRAPH_DISTANCE = 1e-8
+
+# Incremental clustering: max cosine distance between a new raw feedback and a stored
+# cluster centroid for the feedback to join that cluster (matches the clustering thresholds)
+INCREMENTAL_ASSIGNMENT_DISTANCE = 0.3
+
 from reflexio_commons.api_schema.service_schemas import (
     Feedback,
     FeedbackAggregationChangeLog,
@@ -26,7 +42,7 @@ from reflexio_commons.config_schema import (
 )
 
 from reflexio.server.api_endpoints.request_context import RequestContext
-from reflexio.server.llm.litellm_client import LiteLLMClient
+from reflexio.server.llm.litellm_client import LiteLLMClient, is_rate_limit_error
 from reflexio.server.services.feedback.feedback_service_constants import (
     FeedbackServiceConstants,
 )
@@ -37,11 +53,60 @@ from reflexio.server.services.feedback.feedback_service_utils import (
     format_structured_feedback_content,
 )
 from reflexio.server.services.operation_state_utils import OperationStateManager
-from reflexio.server.services.service_utils import log_model_response
+from reflexio.server.services.service_utils import (
+    log_model_response,
+    run_llm_tasks_concurrently,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_rows(
+    vectors: list[list[float]] | list[np.ndarray] | np.ndarray,
+) -> np.ndarray:
+    """
+    Stack vectors into a float32 matrix with unit-length rows, so dot products are cosine similarities.
+
+    Args:
+        vectors: Embedding vectors of equal dimension, or a matrix with one vector per row
+
+    Returns:
+        np.ndarray: Row-normalized float32 matrix
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _embeddings_by_id(
+    raw_feedbacks: list[RawFeedback], embeddings: np.ndarray | None
+) -> dict[int, np.ndarray]:
+    """
+    Map raw_feedback_id to embedding vector, skipping raw feedbacks without an embedding.
+
+    Args:
+        raw_feedbacks: Raw feedbacks
+        embeddings: Float32 matrix whose row i is the embedding of raw_feedbacks[i] (zero rows for
+            missing embeddings), as returned by get_raw_feedbacks_with_embeddings. If None, the
+            embedding field of each raw feedback is used.
+
+    Returns:
+        dict[int, np.ndarray]: raw_feedback_id -> embedding vector
+    """
+    if embeddings is None:
+        return {
+            fb.raw_feedback_id: np.asarray(fb.embedding, dtype=np.float32)
+            for fb in raw_feedbacks
+            if fb.embedding
+        }
+    return {
+        fb.raw_feedback_id: vector
+        for fb, vector in zip(raw_feedbacks, embeddings, strict=True)
+        if vector.any()
+    }
+
+
 class FeedbackAggregator:
     def __init__(
         self,
@@ -439,13 +504,30 @@ class FeedbackAggregator:
             len(existing_feedbacks),
         )
 
-        # get all raw feedbacks and generate clusters
-        raw_feedbacks = self.storage.get_raw_feedbacks(  # type: ignore[reportOptionalMemberAccess]
+        # Stream all raw feedbacks (not just the latest page) with embeddings as one float32 matrix
+        raw_feedbacks, embeddings = self.storage.get_raw_feedbacks_with_embeddings(  # type: ignore[reportOptionalMemberAccess]
             feedback_name=feedback_aggregator_request.feedback_name,
             agent_version=self.agent_version,
-            include_embedding=True,
         )
-        clusters = self.get_clusters(raw_feedbacks, feedback_aggregator_config)
+        mgr = self._create_state_manager()
+        feedback_name = feedback_aggregator_request.feedback_name
+        new_cluster_state: dict | None = None  # Populated for incremental clustering
+        if feedback_aggregator_config.incremental_clustering:
+            # Rerun ignores stored centroids and clusters everything from scratch
+            cluster_state = (
+                {}
+                if feedback_aggregator_request.rerun
+                else mgr.get_cluster_centroids(
+                    name=feedback_name, version=self.agent_version
+                )
+            )
+            clusters, new_cluster_state = self._get_clusters_incremental(
+                raw_feedbacks, feedback_aggregator_config, cluster_state, embeddings
+            )
+        else:
+            clusters = self.get_clusters(
+                raw_feedbacks, feedback_aggregator_config, embeddings
+            )
 
         # Capture all current feedbacks before archiving (for change log)
         before_feedbacks_by_id: dict[int, Feedback] = {
@@ -453,8 +535,6 @@ class FeedbackAggregator:
         }
 
         # Determine which clusters changed (skip for rerun)
-        mgr = self._create_state_manager()
-        feedback_name = feedback_aggregator_request.feedback_name
         archived_feedback_ids = []
         full_archive = False  # True when archive_feedbacks_by_feedback_name was used
         prev_fingerprints: dict = {}  # Populated for incremental mode
@@ -494,7 +574,13 @@ class FeedbackAggregator:
                         "No cluster changes detected for '%s', skipping LLM calls",
                         feedback_name,
                     )
-                    # Still update bookmark
+                    # Still update bookmark (and noise membership for incremental clustering)
+                    if new_cluster_state is not None:
+                        mgr.update_cluster_centroids(
+                            name=feedback_name,
+                            version=self.agent_version,
+                            cluster_state=new_cluster_state,
+                        )
                     self._update_operation_state(feedback_name, raw_feedbacks)
                     return
 
@@ -510,9 +596,17 @@ class FeedbackAggregator:
 
         try:
             # Generate new feedbacks only for changed clusters
-            feedbacks = self._generate_feedback_from_clusters(
+            feedbacks_by_cluster = self._generate_feedbacks_by_cluster(
                 changed_clusters, existing_feedbacks
             )
+            generated_cluster_ids = [
+                cluster_id
+                for cluster_id, feedback in feedbacks_by_cluster.items()
+                if feedback is not None
+            ]
+            feedbacks = [
+                feedbacks_by_cluster[cluster_id] for cluster_id in generated_cluster_ids
+            ]
 
             # Save feedbacks (returns feedbacks with feedback_id populated)
             saved_feedbacks = self.storage.save_feedbacks(feedbacks)  # type: ignore[reportOptionalMemberAccess]
@@ -545,53 +639,38 @@ class FeedbackAggregator:
                     }
                 )
 
-            # Map saved feedbacks back to changed clusters by order
-            # _generate_feedback_from_clusters iterates clusters in order and
-            # filters out None results, so we need to track which feedbacks
-            # correspond to which clusters
-            for cluster_feedbacks in changed_clusters.values():
+            # Map saved feedbacks back to the changed clusters they were generated from.
+            # save_feedbacks keeps input order, and the LLM may return None for some
+            # clusters (duplicates), so those clusters keep feedback_id None.
+            saved_feedback_list = list(saved_feedbacks)
+            feedback_id_by_cluster = {
+                cluster_id: saved_fb.feedback_id
+                for cluster_id, saved_fb in zip(
+                    generated_cluster_ids, saved_feedback_list, strict=False
+                )
+                if saved_fb and saved_fb.feedback_id
+            }
+            for cluster_id, cluster_feedbacks in changed_clusters.items():
                 fp = self._compute_cluster_fingerprint(cluster_feedbacks)
-                raw_ids = sorted(fb.raw_feedback_id for fb in cluster_feedbacks)
-
-                # Try to match saved feedback - the LLM may return None for some
-                # clusters (duplicates), so not every cluster has a saved feedback
-                feedback_id = None
-                # We can't perfectly map without changing _generate_feedback_from_clusters,
-                # so store the fingerprint with whatever feedback_id we have
                 new_fingerprints[fp] = {
-                    "feedback_id": feedback_id,
-                    "raw_feedback_ids": raw_ids,
+                    "feedback_id": feedback_id_by_cluster.get(cluster_id),
+                    "raw_feedback_ids": sorted(
+                        fb.raw_feedback_id for fb in cluster_feedbacks
+                    ),
                 }
 
-            # Now assign feedback_ids from saved feedbacks to fingerprints
-            # Since both iterate in cluster order, match by position
-            saved_feedback_list = list(saved_feedbacks)
-            fp_keys_from_changed = [
-                self._compute_cluster_fingerprint(cluster_feedbacks)
-                for cluster_feedbacks in changed_clusters.values()
-            ]
-
-            # saved_feedbacks only contains non-None results, so we just
-            # assign feedback_ids to fingerprints that got valid feedbacks
-            for saved_fb in saved_feedback_list:
-                if saved_fb and saved_fb.feedback_id:
-                    # Find matching fingerprint by when_condition/content matching
-                    for fp_key in fp_keys_from_changed:
-                        if (
-                            fp_key in new_fingerprints
-                            and new_fingerprints[fp_key]["feedback_id"] is None
-                        ):
-                            new_fingerprints[fp_key]["feedback_id"] = (
-                                saved_fb.feedback_id
-                            )
-                            break
-
             # Store fingerprints in operation state
             mgr.update_cluster_fingerprints(
                 name=feedback_name,
                 version=self.agent_version,
                 fingerprints=new_fingerprints,
             )
+            if new_cluster_state is not None:
+                mgr.update_cluster_centroids(
+                    name=feedback_name,
+                    version=self.agent_version,
+                    cluster_state=new_cluster_state,
+                )
 
             # Update operation state with the highest raw_feedback_id processed
             self._update_operation_state(feedback_name, raw_feedbacks)
@@ -647,6 +726,7 @@ class FeedbackAggregator:
         self,
         raw_feedbacks: list[RawFeedback],
         feedback_aggregator_config: FeedbackAggregatorConfig,
+        embeddings: np.ndarray | None = None,
     ) -> dict[int, list[RawFeedback]]:
         """
         Cluster raw feedbacks based on their embeddings (when_condition indexed).
@@ -654,6 +734,8 @@ class FeedbackAggregator:
         Args:
             raw_feedbacks: Contains raw feedbacks to cluster
             feedback_aggregator_config: Feedback aggregator config
+            embeddings: Float32 matrix whose row i is the embedding of raw_feedbacks[i]. If None,
+                the embedding field of each raw feedback is used.
 
         Returns:
             dict[int, list[RawFeedback]]: Dictionary mapping cluster IDs to lists of raw feedbacks
@@ -675,29 +757,65 @@ class FeedbackAggregator:
             logger.info("Mock mode: clustering by when_condition")
             return self._cluster_by_when_condition_mock(raw_feedbacks, min_cluster_size)
 
-        # Extract embeddings from raw feedbacks
-        embeddings = np.array([feedback.embedding for feedback in raw_feedbacks])
-
-        if len(embeddings) < min_cluster_size:
+        if len(raw_feedbacks) < min_cluster_size:
             logger.info(
                 "Not enough feedbacks to cluster (got %d, need %d)",
-                len(embeddings),
+                len(raw_feedbacks),
                 min_cluster_size,
             )
             return {}
 
-        # Compute cosine distance matrix for better text embedding clustering
-        distance_matrix = cosine_distances(embeddings)
+        clusters = self._cluster_raw_feedbacks(
+            raw_feedbacks, min_cluster_size, embeddings
+        )
+
+        logger.info(
+            "Found %d clusters from %d feedbacks", len(clusters), len(raw_feedbacks)
+        )
+        for cluster_id, cluster_feedbacks in clusters.items():
+            logger.info("Cluster %d: %d feedbacks", cluster_id, len(cluster_feedbacks))
+
+        return clusters
+
+    def _cluster_raw_feedbacks(
+        self,
+        raw_feedbacks: list[RawFeedback],
+        min_cluster_size: int,
+        embeddings: np.ndarray | None = None,
+    ) -> dict[int, list[RawFeedback]]:
+        """
+        Run the embedding clustering algorithm over raw feedbacks.
+
+        Args:
+            raw_feedbacks: Raw feedbacks with embeddings (at least min_cluster_size of them)
+            min_cluster_size: Minimum number of feedbacks per cluster
+            embeddings: Float32 matrix whose row i is the embedding of raw_feedbacks[i]. If None,
+                the embedding field of each raw feedback is used.
+
+        Returns:
+            dict[int, list[RawFeedback]]: Clusters with at least min_cluster_size feedbacks
+        """
+        # One contiguous float32 matrix of unit-length embeddings
+        embeddings = _normalize_rows(
+            [feedback.embedding for feedback in raw_feedbacks]
+            if embeddings is None
+            else embeddings
+        )
 
         # Choose algorithm based on dataset size
-        if len(embeddings) < CLUSTERING_ALGORITHM_THRESHOLD:
-            cluster_labels = self._cluster_with_agglomerative(
-                distance_matrix, min_cluster_size
-            )
+        if len(embeddings) >= SPARSE_CLUSTERING_THRESHOLD:
+            cluster_labels = self._cluster_with_knn_graph(embeddings, min_cluster_size)
         else:
-            cluster_labels = self._cluster_with_hdbscan(
-                distance_matrix, min_cluster_size
-            )
+            # Compute cosine distance matrix for better text embedding clustering
+            distance_matrix = cosine_distances(embeddings)
+            if len(embeddings) < CLUSTERING_ALGORITHM_THRESHOLD:
+                cluster_labels = self._cluster_with_agglomerative(
+                    distance_matrix, min_cluster_size
+                )
+            else:
+                cluster_labels = self._cluster_with_hdbscan(
+                    distance_matrix, min_cluster_size
+                )
 
         # Group feedbacks by cluster
         clusters: dict[int, list[RawFeedback]] = {}
@@ -709,19 +827,241 @@ class FeedbackAggregator:
             clusters[label].append(raw_feedbacks[idx])
 
         # Filter out clusters smaller than min_cluster_size
-        clusters = {
+        return {
             label: feedbacks
             for label, feedbacks in clusters.items()
             if len(feedbacks) >= min_cluster_size
         }
 
+    def _get_clusters_incremental(  # noqa: C901
+        self,
+        raw_feedbacks: list[RawFeedback],
+        feedback_aggregator_config: FeedbackAggregatorConfig,
+        cluster_state: dict,
+        embeddings: np.ndarray | None = None,
+    ) -> tuple[dict[int, list[RawFeedback]], dict]:
+        """
+        Update the clusters of the previous run with newly arrived raw feedbacks.
+
+        Each new raw feedback joins the stored cluster with the nearest centroid if it is
+        within INCREMENTAL_ASSIGNMENT_DISTANCE. Only the affected neighbourhood is re-clustered:
+        clusters that gained or lost members, new feedbacks no centroid claimed, and previous
+        noise points close to either. Other clusters keep their exact membership, so their
+        fingerprints stay unchanged. Falls back to full clustering when there is no usable
+        stored state or in mock mode.
+
+        Args:
+            raw_feedbacks: Current raw feedbacks with embeddings
+            feedback_aggregator_config: Feedback aggregator config
+            cluster_state: State from OperationStateManager.get_cluster_centroids
+            embeddings: Float32 matrix whose row i is the embedding of raw_feedbacks[i]. If None,
+                the embedding field of each raw feedback is used.
+
+        Returns:
+            tuple of:
+                - clusters: Cluster ID -> list of RawFeedback, like get_clusters
+                - cluster state to store after a successful run
+        """
+        min_cluster_size = feedback_aggregator_config.min_feedback_threshold
+        stored_clusters = cluster_state.get("clusters", [])
+        vectors = _embeddings_by_id(raw_feedbacks, embeddings)
+        by_id = {
+            fb.raw_feedback_id: fb
+            for fb in raw_feedbacks
+            if fb.raw_feedback_id in vectors
+        }
+
+        if not stored_clusters or os.getenv("MOCK_LLM_RESPONSE", "").lower() == "true":
+            clusters = self.get_clusters(
+                raw_feedbacks, feedback_aggregator_config, embeddings
+            )
+            return clusters, self._build_cluster_state(clusters, by_id, vectors)
+
+        # Drop members that no longer exist; a cluster that lost members is affected
+        stored_noise_ids = cluster_state.get("noise_raw_feedback_ids", [])
+        known_ids = set(stored_noise_ids)
+        members: list[list[int]] = []
+        affected: set[int] = set()
+        for idx, entry in enumerate(stored_clusters):
+            ids = entry.get("raw_feedback_ids", [])
+            known_ids.update(ids)
+            present = [raw_id for raw_id in ids if raw_id in by_id]
+            if len(present) != len(ids) or len(present) < min_cluster_size:
+                affected.add(idx)
+            members.append(present)
+        noise_feedbacks = [
+            by_id[raw_id] for raw_id in stored_noise_ids if raw_id in by_id
+        ]
+        new_feedbacks = [
+            fb for fb in by_id.values() if fb.raw_feedback_id not in known_ids
+        ]
+
+        centroid_matrix = _normalize_rows(
+            [entry["centroid"] for entry in stored_clusters]
+        )
+        if new_feedbacks and centroid_matrix.shape[1] != len(
+            vectors[new_feedbacks[0].raw_feedback_id]
+        ):
+            logger.info(
+                "Stored centroids do not match the embedding dimension, re-clustering all feedbacks"
+            )
+            clusters = self.get_clusters(
+                raw_feedbacks, feedback_aggregator_config, embeddings
+            )
+            return clusters, self._build_cluster_state(clusters, by_id, vectors)
+
+        # Assign new feedbacks to the nearest stored centroid
+        unassigned: list[RawFeedback] = []
+        if new_feedbacks:
+            similarities = (
+                _normalize_rows([vectors[fb.raw_feedback_id] for fb in new_feedbacks])
+                @ centroid_matrix.T
+            )
+            nearest = similarities.argmax(axis=1)
+            for row, fb in enumerate(new_feedbacks):
+                idx = int(nearest[row])
+                if 1.0 - similarities[row, idx] <= INCREMENTAL_ASSIGNMENT_DISTANCE:
+                    members[idx].append(fb.raw_feedback_id)
+                    affected.add(idx)
+                else:
+                    unassigned.append(fb)
+
+        # Pull in previous noise points close to an unassigned feedback or an affected centroid
+        nearby_noise: list[RawFeedback] = []
+        anchors = [vectors[fb.raw_feedback_id] for fb in unassigned] + [
+            np.asarray(stored_clusters[idx]["centroid"], dtype=np.float32)
+            for idx in affected
+        ]
+        if noise_feedbacks and anchors:
+            close = (
+                (
+                    _normalize_rows(
+                        [vectors[fb.raw_feedback_id] for fb in noise_feedbacks]
+                    )
+                    @ _normalize_rows(anchors).T
+                )
+                >= 1.0 - INCREMENTAL_ASSIGNMENT_DISTANCE
+            ).any(axis=1)
+            nearby_noise = [
+                fb
+                for fb, is_close in zip(noise_feedbacks, close, strict=True)
+                if is_close
+            ]
+
+        pool = (
+            [by_id[raw_id] for idx in sorted(affected) for raw_id in members[idx]]
+            + unassigned
+            + nearby_noise
+        )
+        reclustered = (
+            self._cluster_raw_feedbacks(
+                pool,
+                min_cluster_size,
+                np.stack([vectors[fb.raw_feedback_id] for fb in pool]),
+            )
+            if len(pool) >= min_cluster_size
+            else {}
+        )
+
+        clusters: dict[int, list[RawFeedback]] = {}
+        state_clusters: list[dict] = []
+        for idx, entry in enumerate(stored_clusters):
+            if idx in affected:
+                continue
+            clusters[len(clusters)] = [by_id[raw_id] for raw_id in members[idx]]
+            state_clusters.append(entry)
+        for cluster_feedbacks in reclustered.values():
+            clusters[len(clusters)] = cluster_feedbacks
+            state_clusters.append(
+                self._build_cluster_state_entry(cluster_feedbacks, vectors)
+            )
+
+        # Noise: previous noise left out of the pool plus pooled feedbacks left unclustered
+        pooled_ids = {fb.raw_feedback_id for fb in pool}
+        clustered_ids = {
+            fb.raw_feedback_id
+            for cluster_feedbacks in reclustered.values()
+            for fb in cluster_feedbacks
+        }
+        noise_ids = [
+            fb.raw_feedback_id
+            for fb in noise_feedbacks
+            if fb.raw_feedback_id not in pooled_ids
+        ] + sorted(pooled_ids - clustered_ids)
+
         logger.info(
-            "Found %d clusters from %d feedbacks", len(clusters), len(raw_feedbacks)
+            "Incremental clustering: %d new feedbacks (%d assigned to existing clusters), "
+            "re-clustered %d affected clusters from %d feedbacks into %d clusters, "
+            "%d clusters unchanged",
+            len(new_feedbacks),
+            len(new_feedbacks) - len(unassigned),
+            len(affected),
+            len(pool),
+            len(reclustered),
+            len(stored_clusters) - len(affected),
         )
-        for cluster_id, cluster_feedbacks in clusters.items():
-            logger.info("Cluster %d: %d feedbacks", cluster_id, len(cluster_feedbacks))
+        return clusters, {
+            "clusters": state_clusters,
+            "noise_raw_feedback_ids": sorted(noise_ids),
+        }
 
-        return clusters
+    def _build_cluster_state(
+        self,
+        clusters: dict[int, list[RawFeedback]],
+        feedbacks_by_id: dict[int, RawFeedback],
+        vectors: dict[int, np.ndarray],
+    ) -> dict:
+        """
+        Build the stored incremental clustering state from a full clustering.
+
+        Args:
+            clusters: Clusters returned by get_clusters
+            feedbacks_by_id: All clustered raw feedbacks keyed by raw_feedback_id
+            vectors: Embedding vectors keyed by raw_feedback_id
+
+        Returns:
+            dict: {"clusters": [...], "noise_raw_feedback_ids": [...]}
+        """
+        clustered_ids = {
+            fb.raw_feedback_id
+            for cluster_feedbacks in clusters.values()
+            for fb in cluster_feedbacks
+        }
+        return {
+            "clusters": [
+                self._build_cluster_state_entry(cluster_feedbacks, vectors)
+                for cluster_feedbacks in clusters.values()
+            ],
+            "noise_raw_feedback_ids": sorted(set(feedbacks_by_id) - clustered_ids),
+        }
+
+    @staticmethod
+    def _build_cluster_state_entry(
+        cluster_feedbacks: list[RawFeedback], vectors: dict[int, np.ndarray]
+    ) -> dict:
+        """
+        Build the stored centroid and members of one cluster.
+
+        Args:
+            cluster_feedbacks: Raw feedbacks in the cluster
+            vectors: Embedding vectors keyed by raw_feedback_id (members without one are left out
+                of the centroid)
+
+        Returns:
+            dict: {"centroid": list[float], "raw_feedback_ids": list[int]}
+        """
+        centroid = _normalize_rows(
+            [
+                vectors[fb.raw_feedback_id]
+                for fb in cluster_feedbacks
+                if fb.raw_feedback_id in vectors
+            ]
+        ).mean(axis=0)
+        centroid /= np.linalg.norm(centroid) or 1.0
+        return {
+            "centroid": np.round(centroid, 6).tolist(),
+            "raw_feedback_ids": sorted(fb.raw_feedback_id for fb in cluster_feedbacks),
+        }
 
     def _cluster_by_when_condition_mock(
         self, raw_feedbacks: list[RawFeedback], min_cluster_size: int
@@ -791,13 +1131,14 @@ class FeedbackAggregator:
         return clusterer.fit_predict(distance_matrix)
 
     def _cluster_with_hdbscan(
-        self, distance_matrix: np.ndarray, min_cluster_size: int
+        self, distance_matrix: np.ndarray | csr_matrix, min_cluster_size: int
     ) -> np.ndarray:
         """
         Cluster using HDBSCAN - best for large datasets with potential noise.
 
         Args:
-            distance_matrix: Precomputed cosine distance matrix
+            distance_matrix: Precomputed cosine distance matrix, dense or a sparse
+                             connected k-nearest-neighbour distance graph
             min_cluster_size: Minimum number of points to form a cluster
 
         Returns:
@@ -805,7 +1146,7 @@ class FeedbackAggregator:
         """
         logger.info(
             "Using HDBSCAN for %d feedbacks (>= %d threshold)",
-            len(distance_matrix),
+            distance_matrix.shape[0],
             CLUSTERING_ALGORITHM_THRESHOLD,
         )
 
@@ -818,6 +1159,105 @@ class FeedbackAggregator:
 
         return clusterer.fit_predict(distance_matrix)
 
+    def _cluster_with_knn_graph(
+        self, embeddings: np.ndarray, min_cluster_size: int
+    ) -> np.ndarray:
+        """
+        Cluster large datasets on a sparse k-nearest-neighbour distance graph.
+
+        HDBSCAN needs a connected graph, so each connected component is clustered on
+        its own: small components with Agglomerative on their dense distances, the rest
+        with HDBSCAN on the sparse subgraph. Components smaller than min_cluster_size
+        are noise.
+
+        Args:
+            embeddings: Row-normalized float32 embedding matrix
+            min_cluster_size: Minimum number of points to form a cluster
+
+        Returns:
+            np.ndarray: Cluster labels for each point (-1 indicates noise)
+        """
+        graph = self._build_knn_distance_graph(
+            embeddings, max(KNN_GRAPH_NEIGHBORS, min_cluster_size)
+        )
+        n_components, component_labels = connected_components(graph, directed=False)
+        logger.info(
+            "Using sparse %d-NN graph for %d feedbacks (>= %d threshold): %d components",
+            max(KNN_GRAPH_NEIGHBORS, min_cluster_size),
+            len(embeddings),
+            SPARSE_CLUSTERING_THRESHOLD,
+            n_components,
+        )
+
+        labels = np.full(len(embeddings), -1, dtype=np.int64)
+        next_label = 0
+        order = np.argsort(component_labels, kind="stable")
+        boundaries = np.cumsum(np.bincount(component_labels, minlength=n_components))
+        for start, stop in zip(
+            np.concatenate(([0], boundaries[:-1])), boundaries, strict=True
+        ):
+            members = order[start:stop]
+            if len(members) < min_cluster_size:
+                continue
+            if len(members) < CLUSTERING_ALGORITHM_THRESHOLD:
+                sub_labels = self._cluster_with_agglomerative(
+                    cosine_distances(embeddings[members]), min_cluster_size
+                )
+            else:
+                sub_labels = self._cluster_with_hdbscan(
+                    graph[members][:, members], min_cluster_size
+                )
+            clustered = sub_labels >= 0
+            if clustered.any():
+                labels[members[clustered]] = sub_labels[clustered] + next_label
+                next_label += int(sub_labels.max()) + 1
+        return labels
+
+    @staticmethod
+    def _build_knn_distance_graph(
+        embeddings: np.ndarray, n_neighbors: int
+    ) -> csr_matrix:
+        """
+        Build a symmetric sparse cosine distance graph to each point's nearest neighbours.
+
+        Similarities are computed block by block with a matrix multiply, so peak memory is
+        bounded by KNN_BLOCK_ELEMENTS instead of growing with n^2.
+
+        Args:
+            embeddings: Row-normalized float32 embedding matrix
+            n_neighbors: Nearest neighbours kept per point (excluding itself)
+
+        Returns:
+            csr_matrix: n x n cosine distances, non-zero only between neighbours
+        """
+        n = len(embeddings)
+        k = min(n_neighbors, n - 1)
+        if k < 1:
+            return csr_matrix((n, n), dtype=np.float32)
+        block_size = max(1, KNN_BLOCK_ELEMENTS // n)
+
+        rows, cols, distances = [], [], []
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            similarities = embeddings[start:stop] @ embeddings.T
+            # Exclude each point from its own neighbours
+            similarities[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+            neighbors = np.argpartition(similarities, -k, axis=1)[:, -k:]
+            neighbor_similarities = np.take_along_axis(similarities, neighbors, axis=1)
+            rows.append(np.repeat(np.arange(start, stop), k))
+            cols.append(neighbors.ravel())
+            distances.append(
+                np.maximum(1.0 - neighbor_similarities, MIN_GRAPH_DISTANCE).ravel()
+            )
+
+        graph = csr_matrix(
+            (np.concatenate(distances), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n, n),
+            dtype=np.float32,
+        )
+        # Keep an edge if either endpoint lists the other as a neighbour
+        return graph.maximum(graph.T).tocsr()
+
     def _generate_feedback_from_clusters(
         self,
         clusters: dict[int, list[RawFeedback]],
@@ -833,6 +1273,31 @@ class FeedbackAggregator:
         Returns:
             list[Feedback]: List of newly generated feedbacks (excludes duplicates)
         """
+        return [
+            feedback
+            for feedback in self._generate_feedbacks_by_cluster(
+                clusters, existing_approved_feedbacks
+            ).values()
+            if feedback is not None
+        ]
+
+    def _generate_feedbacks_by_cluster(
+        self,
+        clusters: dict[int, list[RawFeedback]],
+        existing_approved_feedbacks: list[Feedback],
+    ) -> dict[int, Feedback | None]:
+        """
+        Generate one feedback per cluster, running up to the org's cluster_generation_concurrency
+        async LLM calls at once on the shared LLM event loop.
+
+        Args:
+            clusters: Dictionary mapping cluster IDs to lists of raw feedbacks
+            existing_approved_feedbacks: List of existing approved feedbacks to avoid duplication
+
+        Returns:
+            dict[int, Feedback | None]: Generated feedback per cluster ID, in cluster order
+                (None where no new feedback was needed or generation failed)
+        """
         # Format existing approved feedbacks for the prompt
         approved_feedbacks_str = (
             "\n".join(
@@ -842,16 +1307,20 @@ class FeedbackAggregator:
             else "None"
         )
 
-        feedbacks = []
-        for cluster_feedbacks in clusters.values():
-            feedback = self._generate_feedback_from_cluster(
-                cluster_feedbacks, approved_feedbacks_str
+        async def generate(cluster_id: int) -> Feedback | None:
+            return await self._generate_feedback_from_cluster(
+                clusters[cluster_id], approved_feedbacks_str
             )
-            if feedback is not None:
-                feedbacks.append(feedback)
-        return feedbacks
 
-    def _generate_feedback_from_cluster(
+        cluster_ids = list(clusters)
+        feedbacks = run_llm_tasks_concurrently(
+            generate,
+            cluster_ids,
+            self.request_context.configurator.get_config().cluster_generation_concurrency,
+        )
+        return dict(zip(cluster_ids, feedbacks, strict=True))
+
+    async def _generate_feedback_from_cluster(
         self,
         cluster_feedbacks: list[RawFeedback],
         existing_approved_feedbacks_str: str,
@@ -929,7 +1398,7 @@ class FeedbackAggregator:
         ]
 
         try:
-            response = self.client.generate_chat_response(
+            response = await self.client.agenerate_chat_response(
                 messages=messages,
                 model=self.client.config.model,
                 response_format=FeedbackAggregationOutput,
@@ -946,6 +1415,9 @@ class FeedbackAggregator:
 
             return self._process_aggregation_response(response, cluster_feedbacks)
         except Exception as exc:
+            if is_rate_limit_error(exc):
+                # Let run_llm_tasks_concurrently back off and retry the cluster
+                raise
             logger.error(
                 "Feedback aggregation failed due to %s, returning None.",
                 str(exc),
@@ -9,7 +9,6 @@ from datetime import datetime, timezone
 
 from pydantic import BaseModel, ConfigDict, Field
 from reflexio_commons.api_schema.service_schemas import RawFeedback
-from reflexio_commons.config_schema import EMBEDDING_DIMENSIONS
 
 from reflexio.server.api_endpoints.request_context import RequestContext
 from reflexio.server.llm.litellm_client import LiteLLMClient
@@ -21,6 +20,9 @@ from reflexio.server.services.feedback.feedback_service_utils import (
     StructuredFeedbackContent,
     format_structured_feedback_content,
 )
+from reflexio.server.services.storage.supabase_storage_utils import (
+    raw_feedback_embedding_text,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -147,7 +149,9 @@ class FeedbackDeduplicator(BaseDeduplicator):
         Retrieve existing feedbacks from the database using hybrid search.
 
         For each new feedback, uses its when_condition as the query with
-        pre-computed embeddings for vector search.
+        pre-computed embeddings for vector search. Embeddings of the text storage
+        embeds are computed in the same call and attached to the new feedbacks, so
+        saving them does not embed the same text again.
 
         Args:
             new_feedbacks: List of new feedbacks to search against
@@ -159,20 +163,26 @@ class FeedbackDeduplicator(BaseDeduplicator):
         """
         storage = self.request_context.storage
 
-        # Collect when_condition strings for embedding
-        query_texts = []
-        for feedback in new_feedbacks:
-            when_condition = feedback.when_condition or feedback.feedback_content
-            if when_condition and when_condition.strip():
-                query_texts.append(when_condition.strip())
+        # Collect when_condition strings to search with
+        searchable_feedbacks = [
+            feedback
+            for feedback in new_feedbacks
+            if (feedback.when_condition or feedback.feedback_content or "").strip()
+        ]
+        query_texts = [
+            (feedback.when_condition or feedback.feedback_content).strip()
+            for feedback in searchable_feedbacks
+        ]
 
         if not query_texts:
             return []
 
-        # Batch-generate embeddings
+        # Batch-generate query embeddings, plus stored-text embeddings carried forward for saving
         try:
-            embeddings = self.client.get_embeddings(
-                query_texts, dimensions=EMBEDDING_DIMENSIONS
+            embeddings = self._embed_queries_and_stored_texts(
+                searchable_feedbacks,  # type: ignore[arg-type]
+                query_texts,
+                [raw_feedback_embedding_text(f) for f in searchable_feedbacks],
             )
         except Exception as e:
             logger.warning("Failed to generate embeddings for dedup search: %s", e)
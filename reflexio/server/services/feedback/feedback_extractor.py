@@ -23,7 +23,7 @@ from reflexio.server.services.service_utils import (
     format_messages_for_logging,
     log_model_response,
 )
-from reflexio.server.site_var.site_var_manager import SiteVarManager
+from reflexio.server.site_var.site_var_manager import get_site_var_manager
 
 if TYPE_CHECKING:
     from reflexio.server.services.feedback.feedback_generation_service import (
@@ -75,7 +75,7 @@ class FeedbackExtractor:
         llm_config = config.llm_config if config else None
 
         # Get site var as fallback
-        self.model_setting = SiteVarManager().get_site_var("llm_model_setting")
+        self.model_setting = get_site_var_manager().get_site_var("llm_model_setting")
         if not isinstance(self.model_setting, dict):
             raise ValueError("llm_model_setting must be a dict")
 
@@ -133,6 +133,7 @@ class FeedbackExtractor:
             self.config,
             global_window_size,
             global_stride,
+            self.service_config.min_extraction_window_size,
         )
 
         # Get effective source filter (None = get ALL sources)
@@ -26,6 +26,9 @@ from reflexio.server.services.base_generation_service import (
     BaseGenerationService,
     StatusChangeOperation,
 )
+from reflexio.server.services.feedback.aggregation_scheduler import (
+    get_aggregation_scheduler,
+)
 from reflexio.server.services.feedback.feedback_aggregator import FeedbackAggregator
 from reflexio.server.services.feedback.feedback_extractor import FeedbackExtractor
 from reflexio.server.services.feedback.feedback_service_constants import (
@@ -56,6 +59,7 @@ class FeedbackGenerationServiceConfig:
         rerun_end_time: Optional end time filter for rerun flows (Unix timestamp)
         auto_run: True for regular flow (checks stride), False for rerun/manual (skips stride)
         extractor_names: Optional list of extractor names to run (derived from feedback_name)
+        min_extraction_window_size: Optional minimum extraction window (coalesced bulk publishes)
     """
 
     request_id: str
@@ -67,6 +71,7 @@ class FeedbackGenerationServiceConfig:
     rerun_end_time: int | None = None
     auto_run: bool = True
     extractor_names: list[str] | None = None
+    min_extraction_window_size: int | None = None
     is_incremental: bool = False
     previously_extracted: list[list[RawFeedback]] = field(default_factory=list)
 
@@ -126,6 +131,7 @@ class FeedbackGenerationService(
             rerun_end_time=request.rerun_end_time,
             auto_run=request.auto_run,
             extractor_names=[request.feedback_name] if request.feedback_name else None,
+            min_extraction_window_size=request.min_extraction_window_size,
         )
 
     def _load_extractor_configs(self) -> list[AgentFeedbackConfig]:
@@ -375,57 +381,33 @@ class FeedbackGenerationService(
         if not agent_feedback_configs:
             return
 
-        # Iterate through configs and trigger aggregation for those with aggregator config
+        # Iterate through configs and trigger aggregation for those with aggregator config.
+        # With the aggregation scheduler running, only record a debounced trigger so the
+        # publish pipeline does not block on clustering and LLM calls.
+        scheduler = get_aggregation_scheduler()
+        agent_version = self.service_config.agent_version  # type: ignore[reportOptionalMemberAccess]
         for feedback_config in agent_feedback_configs:
             if not feedback_config.feedback_aggregator_config:
                 continue
 
-            feedback_name = feedback_config.feedback_name
-            logger.info("Triggering aggregation for feedback_name: %s", feedback_name)
-
-            # Create aggregator request
-            aggregator_request = FeedbackAggregatorRequest(
-                agent_version=self.service_config.agent_version,  # type: ignore[reportOptionalMemberAccess]
-                feedback_name=feedback_name,
-            )
+            if scheduler is not None:
+                logger.info(
+                    "Scheduling aggregation for feedback_name: %s",
+                    feedback_config.feedback_name,
+                )
+                scheduler.trigger(
+                    self.request_context.org_id,
+                    feedback_config.feedback_name,
+                    agent_version,
+                )
+                continue
 
-            # Initialize and run aggregator (synchronous)
-            aggregator = FeedbackAggregator(
+            run_feedback_aggregation_for_config(
                 llm_client=self.client,
                 request_context=self.request_context,
-                agent_version=self.service_config.agent_version,  # type: ignore[reportOptionalMemberAccess]
+                agent_version=agent_version,
+                feedback_config=feedback_config,
             )
-            aggregator.run(aggregator_request)
-
-            # After aggregation, optionally trigger skill generation
-            try:
-                skill_config = feedback_config.skill_generator_config
-                if (
-                    skill_config
-                    and skill_config.enabled
-                    and skill_config.auto_generate_on_aggregation
-                ):
-                    from reflexio.server.services.feedback.feedback_service_utils import (
-                        SkillGeneratorRequest,
-                    )
-                    from reflexio.server.services.feedback.skill_generator import (
-                        SkillGenerator,
-                    )
-
-                    logger.info("Triggering skill generation")
-                    skill_gen = SkillGenerator(
-                        llm_client=self.client,
-                        request_context=self.request_context,
-                        agent_version=self.service_config.agent_version,  # type: ignore[reportOptionalMemberAccess]
-                    )
-                    skill_gen.run(
-                        SkillGeneratorRequest(
-                            agent_version=self.service_config.agent_version,  # type: ignore[reportOptionalMemberAccess]
-                            feedback_name=feedback_name,
-                        )
-                    )
-            except Exception as e:
-                logger.error("Skill generation failed: %s", e)
 
     # ===============================
     # Rerun hook implementations (override base class methods)
@@ -777,3 +759,66 @@ class FeedbackGenerationService(
             raw_feedbacks_restored=counts.get("restored", 0),
             message=msg,
         )
+
+
+def run_feedback_aggregation_for_config(
+    llm_client: LiteLLMClient,
+    request_context: RequestContext,
+    agent_version: str,
+    feedback_config: AgentFeedbackConfig,
+) -> None:
+    """
+    Run feedback aggregation for one feedback config, then skill generation if it is enabled
+    with auto_generate_on_aggregation.
+
+    Args:
+        llm_client (LiteLLMClient): LLM client for aggregation and skill generation
+        request_context (RequestContext): Request context of the org
+        agent_version (str): Agent version to aggregate
+        feedback_config (AgentFeedbackConfig): Feedback config with a feedback_aggregator_config
+    """
+    feedback_name = feedback_config.feedback_name
+    logger.info("Triggering aggregation for feedback_name: %s", feedback_name)
+
+    # Initialize and run aggregator (synchronous)
+    aggregator = FeedbackAggregator(
+        llm_client=llm_client,
+        request_context=request_context,
+        agent_version=agent_version,
+    )
+    aggregator.run(
+        FeedbackAggregatorRequest(
+            agent_version=agent_version,
+            feedback_name=feedback_name,
+        )
+    )
+
+    # After aggregation, optionally trigger skill generation
+    try:
+        skill_config = feedback_config.skill_generator_config
+        if (
+            skill_config
+            and skill_config.enabled
+            and skill_config.auto_generate_on_aggregation
+        ):
+            from reflexio.server.services.feedback.feedback_service_utils import (
+                SkillGeneratorRequest,
+            )
+            from reflexio.server.services.feedback.skill_generator import (
+                SkillGenerator,
+            )
+
+            logger.info("Triggering skill generation")
+            skill_gen = SkillGenerator(
+                llm_client=llm_client,
+                request_context=request_context,
+                agent_version=agent_version,
+            )
+            skill_gen.run(
+                SkillGeneratorRequest(
+                    agent_version=agent_version,
+                    feedback_name=feedback_name,
+                )
+            )
+    except Exception as e:
+        logger.error("Skill generation failed: %s", e)
@@ -203,6 +203,8 @@ class FeedbackGenerationRequest(BaseModel):
     auto_run: bool = (
         True  # True for regular flow (checks stride), False for rerun/manual
     )
+    # Minimum extraction window, so a run coalescing many new interactions covers all of them
+    min_extraction_window_size: int | None = None
 
 
 class FeedbackAggregatorRequest(BaseModel):
@@ -12,7 +12,7 @@ from reflexio_commons.config_schema import (
 )
 
 from reflexio.server.api_endpoints.request_context import RequestContext
-from reflexio.server.llm.litellm_client import LiteLLMClient
+from reflexio.server.llm.litellm_client import LiteLLMClient, is_rate_limit_error
 from reflexio.server.services.feedback.feedback_aggregator import FeedbackAggregator
 from reflexio.server.services.feedback.feedback_service_constants import (
     FeedbackServiceConstants,
@@ -26,6 +26,7 @@ from reflexio.server.services.service_utils import (
     format_interactions_to_history_string,
     format_messages_for_logging,
     log_model_response,
+    run_llm_tasks_concurrently,
 )
 
 logger = logging.getLogger(__name__)
@@ -225,7 +226,7 @@ class SkillGenerator:
         ]
         return "\n".join(lines)
 
-    def _generate_new_skill(
+    async def _generate_new_skill(
         self,
         cluster_feedbacks: list[RawFeedback],
         interaction_context: str,
@@ -267,7 +268,7 @@ class SkillGenerator:
         )
 
         try:
-            response = self.client.generate_chat_response(
+            response = await self.client.agenerate_chat_response(
                 messages=messages,
                 model=self.client.config.model,
                 response_format=SkillGenerationOutput,
@@ -291,10 +292,13 @@ class SkillGenerator:
                 skill_status=SkillStatus.DRAFT,
             )
         except Exception as exc:
+            if is_rate_limit_error(exc):
+                # Let run_llm_tasks_concurrently back off and retry the cluster
+                raise
             logger.error("Skill generation failed: %s", str(exc))
             return None
 
-    def _update_existing_skill(
+    async def _update_existing_skill(
         self,
         existing_skill: Skill,
         cluster_feedbacks: list[RawFeedback],
@@ -344,7 +348,7 @@ class SkillGenerator:
         )
 
         try:
-            response = self.client.generate_chat_response(
+            response = await self.client.agenerate_chat_response(
                 messages=messages,
                 model=self.client.config.model,
                 response_format=SkillGenerationOutput,
@@ -380,6 +384,9 @@ class SkillGenerator:
                 skill_status=existing_skill.skill_status,
             )
         except Exception as exc:
+            if is_rate_limit_error(exc):
+                # Let run_llm_tasks_concurrently back off and retry the cluster
+                raise
             logger.error("Skill update failed: %s", str(exc))
             return None
 
@@ -416,12 +423,11 @@ class SkillGenerator:
                 min_feedback_threshold=skill_config.min_feedback_per_cluster
             )
 
-        # Fetch raw feedbacks
-        raw_feedbacks = self.storage.get_raw_feedbacks(  # type: ignore[reportOptionalMemberAccess]
+        # Fetch all raw feedbacks with embeddings as one float32 matrix
+        raw_feedbacks, embeddings = self.storage.get_raw_feedbacks_with_embeddings(  # type: ignore[reportOptionalMemberAccess]
             feedback_name=request.feedback_name,
             agent_version=self.agent_version,
             status_filter=[None],  # Current feedbacks only
-            include_embedding=True,
         )
 
         if not raw_feedbacks:
@@ -434,7 +440,7 @@ class SkillGenerator:
             request_context=self.request_context,
             agent_version=self.agent_version,
         )
-        clusters = aggregator.get_clusters(raw_feedbacks, aggregator_config)
+        clusters = aggregator.get_clusters(raw_feedbacks, aggregator_config, embeddings)
 
         # Filter clusters by min_feedback_per_cluster
         min_size = skill_config.min_feedback_per_cluster
@@ -459,9 +465,9 @@ class SkillGenerator:
         tool_can_use_str = self._get_tool_can_use_str()
         max_interactions = skill_config.max_interactions_per_skill
 
-        new_skills = []
-        updated_skills = []
-
+        # Storage lookups run here one cluster at a time; only the LLM calls below are
+        # spread across the shared "llm" executor.
+        cluster_inputs = []
         for cluster_id, cluster_feedbacks in clusters.items():
             logger.info(
                 "Processing cluster %d with %d feedbacks",
@@ -496,30 +502,49 @@ class SkillGenerator:
                 except Exception as exc:
                     logger.warning("Skill search failed: %s", str(exc))
 
+            cluster_inputs.append(
+                (cluster_feedbacks, interaction_context, matched_skill)
+            )
+
+        async def generate_skill(
+            cluster_input: tuple[list[RawFeedback], str, Skill | None],
+        ) -> Skill | None:
+            cluster_feedbacks, interaction_context, matched_skill = cluster_input
             if matched_skill:
                 # Update existing skill
-                updated = self._update_existing_skill(
+                return await self._update_existing_skill(
                     matched_skill,
                     cluster_feedbacks,
                     interaction_context,
                     tool_can_use_str,
                 )
-                if updated:
-                    updated_skills.append(updated)
-                    logger.info(
-                        "Updated skill '%s' -> v%s", updated.skill_name, updated.version
-                    )
-            else:
-                # Generate new skill
-                skill = self._generate_new_skill(
-                    cluster_feedbacks,
-                    interaction_context,
-                    tool_can_use_str,
-                    existing_skills_str,
+            # Generate new skill
+            return await self._generate_new_skill(
+                cluster_feedbacks,
+                interaction_context,
+                tool_can_use_str,
+                existing_skills_str,
+            )
+
+        skills = run_llm_tasks_concurrently(
+            generate_skill,
+            cluster_inputs,
+            self.configurator.get_config().cluster_generation_concurrency,
+        )
+
+        new_skills = []
+        updated_skills = []
+        for (_, _, matched_skill), skill in zip(cluster_inputs, skills, strict=True):
+            if skill is None:
+                continue
+            if matched_skill:
+                updated_skills.append(skill)
+                logger.info(
+                    "Updated skill '%s' -> v%s", skill.skill_name, skill.version
                 )
-                if skill:
-                    new_skills.append(skill)
-                    logger.info("Generated new skill '%s'", skill.skill_name)
+            else:
+                new_skills.append(skill)
+                logger.info("Generated new skill '%s'", skill.skill_name)
 
         # Save all skills
         all_skills = new_skills + updated_skills
@@ -1,9 +1,10 @@
 import logging
 import uuid
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime, timezone
+from typing import Any
 
 from reflexio_commons.api_schema.service_schemas import (
     Interaction,
@@ -19,6 +20,11 @@ from reflexio.server.services.agent_success_evaluation.delayed_group_evaluator i
 from reflexio.server.services.agent_success_evaluation.group_evaluation_runner import (
     run_group_evaluation,
 )
+from reflexio.server.services.executor_registry import (
+    BoundedExecutor,
+    ExecutorSaturatedError,
+    get_executor,
+)
 from reflexio.server.services.feedback.feedback_generation_service import (
     FeedbackGenerationService,
 )
@@ -71,7 +77,11 @@ class GenerationService:
     # ===============================
 
     def run(
-        self, publish_user_interaction_request: PublishUserInteractionRequest
+        self,
+        publish_user_interaction_request: PublishUserInteractionRequest,
+        *,
+        request_id: str | None = None,
+        replace_existing: bool = False,
     ) -> None:
         """
         Process a user interaction request by storing interactions and triggering generation services.
@@ -87,6 +97,10 @@ class GenerationService:
 
         Args:
             publish_user_interaction_request: The incoming user interaction request
+            request_id: ID to store the request under (a new UUID when None). Queue workers pass an
+                ID derived from the job so that a retried job writes the same request again.
+            replace_existing: Delete a request already stored under `request_id` (and its
+                interactions) before storing it, so a retry does not duplicate interactions
         """
         if not publish_user_interaction_request:
             logger.error("Received None publish_user_interaction_request")
@@ -101,31 +115,22 @@ class GenerationService:
         self._cleanup_old_interactions_if_needed()
 
         try:
-            # Always generate a new UUID for request_id
-            request_id = str(uuid.uuid4())
-
-            new_interactions: list[Interaction] = (
-                GenerationService.get_interaction_from_publish_user_interaction_request(
-                    publish_user_interaction_request, request_id
-                )
+            new_request, new_interactions = self._build_request(
+                publish_user_interaction_request, request_id
             )
 
             if not new_interactions:
                 logger.info(
                     "No interactions from the publish user interaction request: %s, get all interactions for the user: %s",
-                    request_id,
+                    new_request.request_id,
                     user_id,
                 )
                 return
 
+            if replace_existing:
+                self._delete_stored_requests([new_request.request_id])
+
             # Store Request
-            new_request = Request(
-                request_id=request_id,
-                user_id=user_id,
-                source=publish_user_interaction_request.source,
-                agent_version=publish_user_interaction_request.agent_version,
-                session_id=publish_user_interaction_request.session_id or None,
-            )
             self.storage.add_request(new_request)  # type: ignore[reportOptionalMemberAccess]
 
             # Add interactions to storage (bulk insert with batched embedding generation)
@@ -133,107 +138,10 @@ class GenerationService:
                 user_id=user_id, interactions=new_interactions
             )
 
-            # Extract source (empty string treated as None)
-            source = publish_user_interaction_request.source or None
-
-            # Create generation services and requests
-            # Each service writes to separate storage tables and has no dependencies on others
-            profile_generation_service = ProfileGenerationService(
-                llm_client=self.client, request_context=self.request_context
-            )
-            profile_generation_request = ProfileGenerationRequest(
-                user_id=user_id,
-                request_id=request_id,
-                source=source,
-            )
-
-            feedback_generation_service = FeedbackGenerationService(
-                llm_client=self.client, request_context=self.request_context
-            )
-            feedback_generation_request = FeedbackGenerationRequest(
-                request_id=request_id,
-                agent_version=publish_user_interaction_request.agent_version,
-                user_id=user_id,
-                source=source,
-            )
-
-            # Run profile and feedback generation services in parallel
-            # Each service creates its own internal ThreadPoolExecutor for extractors
-            # This is safe because we create separate, independent pool instances
-            # Uses manual executor management to avoid blocking on shutdown(wait=True)
-            # when threads are hung on LLM calls
-            executor = ThreadPoolExecutor(max_workers=2)
-            try:
-                futures = [
-                    executor.submit(
-                        profile_generation_service.run, profile_generation_request
-                    ),
-                    executor.submit(
-                        feedback_generation_service.run, feedback_generation_request
-                    ),
-                ]
-
-                # Collect results and handle any exceptions
-                # Each service failure is logged but doesn't block others
-                for future in futures:
-                    try:
-                        future.result(timeout=GENERATION_SERVICE_TIMEOUT_SECONDS)
-                    except FuturesTimeoutError:  # noqa: PERF203
-                        logger.error(
-                            "Generation service timed out after %d seconds for request %s",
-                            GENERATION_SERVICE_TIMEOUT_SECONDS,
-                            request_id,
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "Generation service failed for request %s: %s, exception type: %s",
-                            request_id,
-                            str(e),
-                            type(e).__name__,
-                        )
-            finally:
-                executor.shutdown(wait=False, cancel_futures=True)
+            self._wait_for_generation(self._submit_generation(new_request))
 
             # Schedule delayed group evaluation if session_id is present
-            session_id = new_request.session_id
-            if session_id:
-                scheduler = GroupEvaluationScheduler.get_instance()
-                key = (self.org_id, user_id, session_id)
-
-                def make_callback(
-                    _org_id: str,
-                    _user_id: str,
-                    _sid: str,
-                    _av: str,
-                    _src: str | None,
-                    _rc: RequestContext,
-                    _llm: LiteLLMClient,
-                ) -> Callable[[], None]:
-                    def callback() -> None:
-                        run_group_evaluation(
-                            org_id=_org_id,
-                            user_id=_user_id,
-                            session_id=_sid,
-                            agent_version=_av,
-                            source=_src,
-                            request_context=_rc,
-                            llm_client=_llm,
-                        )
-
-                    return callback
-
-                scheduler.schedule(
-                    key,
-                    make_callback(
-                        self.org_id,
-                        user_id,
-                        session_id,
-                        publish_user_interaction_request.agent_version,
-                        source,
-                        self.request_context,
-                        self.client,
-                    ),
-                )
+            self._schedule_group_evaluation(new_request)
 
         except Exception as e:
             # log exception
@@ -245,10 +153,303 @@ class GenerationService:
             )
             raise e
 
+    def run_bulk(
+        self,
+        publish_user_interaction_requests: list[PublishUserInteractionRequest],
+        *,
+        request_ids: list[str] | None = None,
+        replace_existing: bool = False,
+    ) -> list[str]:
+        """
+        Process many user interaction requests, of any number of users, in one pass.
+
+        All requests and interactions are stored with one storage.add_requests_bulk call (batched
+        embeddings, bulk inserts). Generation is then coalesced: profile and feedback generation run
+        once per (user_id, agent_version, source) for the last request of that group, so a user with
+        50 requests in the batch triggers extraction once instead of 50 times. Each coalesced run
+        widens its extraction window to the user's number of new interactions in the batch, so no
+        interaction is left out of extraction. The runs of all groups are submitted to the
+        shared "generation" executor together and awaited from this thread. Group evaluation is
+        scheduled once per session.
+
+        Args:
+            publish_user_interaction_requests: The incoming user interaction requests
+            request_ids: IDs to store the requests under, in input order (new UUIDs when None)
+            replace_existing: Delete requests already stored under `request_ids` (and their
+                interactions) before storing them, so a retry does not duplicate interactions
+
+        Returns:
+            list[str]: IDs of the stored requests, in input order (requests without interactions are skipped)
+        """
+        self._cleanup_old_interactions_if_needed()
+
+        new_requests: list[Request] = []
+        all_interactions: list[Interaction] = []
+        for i, publish_user_interaction_request in enumerate(
+            publish_user_interaction_requests
+        ):
+            new_request, new_interactions = self._build_request(
+                publish_user_interaction_request,
+                request_ids[i] if request_ids is not None else None,
+            )
+            if not new_interactions:
+                continue
+            new_requests.append(new_request)
+            all_interactions.extend(new_interactions)
+        if not new_requests:
+            return []
+
+        if replace_existing:
+            self._delete_stored_requests(
+                [new_request.request_id for new_request in new_requests]
+            )
+
+        self.storage.add_requests_bulk(new_requests, all_interactions)  # type: ignore[reportOptionalMemberAccess]
+
+        interaction_count_by_user: dict[str, int] = {}
+        for interaction in all_interactions:
+            interaction_count_by_user[interaction.user_id] = (
+                interaction_count_by_user.get(interaction.user_id, 0) + 1
+            )
+
+        # Last request of each (user, agent_version, source) group and of each session
+        last_request_by_group: dict[tuple[str, str, str], Request] = {}
+        last_request_by_session: dict[tuple[str, str], Request] = {}
+        for new_request in new_requests:
+            last_request_by_group[
+                (new_request.user_id, new_request.agent_version, new_request.source)
+            ] = new_request
+            if new_request.session_id:
+                last_request_by_session[
+                    (new_request.user_id, new_request.session_id)
+                ] = new_request
+        logger.info(
+            "Published %d requests in bulk for org %s; running generation for %d (user, agent_version, source) groups",
+            len(new_requests),
+            self.org_id,
+            len(last_request_by_group),
+        )
+
+        futures: list[tuple[Future, str]] = []
+        for new_request in last_request_by_group.values():
+            futures.extend(
+                self._submit_generation(
+                    new_request,
+                    min_extraction_window_size=interaction_count_by_user[
+                        new_request.user_id
+                    ],
+                )
+            )
+        self._wait_for_generation(futures)
+
+        for new_request in last_request_by_session.values():
+            self._schedule_group_evaluation(new_request)
+        return [new_request.request_id for new_request in new_requests]
+
     # ===============================
     # private methods
     # ===============================
 
+    def _build_request(
+        self,
+        publish_user_interaction_request: PublishUserInteractionRequest,
+        request_id: str | None = None,
+    ) -> tuple[Request, list[Interaction]]:
+        """
+        Build the request to store for a publish request, and its interactions.
+
+        Args:
+            publish_user_interaction_request: The incoming user interaction request
+            request_id: ID to store the request under (a new UUID when None)
+
+        Returns:
+            tuple[Request, list[Interaction]]: The request and its interactions
+        """
+        request_id = request_id or str(uuid.uuid4())
+        new_request = Request(
+            request_id=request_id,
+            user_id=publish_user_interaction_request.user_id,
+            source=publish_user_interaction_request.source,
+            agent_version=publish_user_interaction_request.agent_version,
+            session_id=publish_user_interaction_request.session_id or None,
+        )
+        new_interactions = (
+            GenerationService.get_interaction_from_publish_user_interaction_request(
+                publish_user_interaction_request, request_id
+            )
+        )
+        return new_request, new_interactions
+
+    def _delete_stored_requests(self, request_ids: list[str]) -> None:
+        """
+        Delete the requests of an earlier, interrupted attempt, with their interactions.
+
+        Args:
+            request_ids: IDs of the requests about to be stored
+        """
+        for request_id in request_ids:
+            if self.storage.get_request(request_id) is not None:  # type: ignore[reportOptionalMemberAccess]
+                logger.info(
+                    "Replacing request %s stored by an earlier attempt", request_id
+                )
+                self.storage.delete_request(request_id)  # type: ignore[reportOptionalMemberAccess]
+
+    def _submit_generation(
+        self, new_request: Request, min_extraction_window_size: int | None = None
+    ) -> list[tuple[Future, str]]:
+        """
+        Submit profile and feedback generation for a stored request.
+
+        Each service writes to separate storage tables and has no dependencies on others, so they
+        run in parallel on the shared "generation" executor (extractors run on the separate "llm"
+        executor, so services waiting on their extractors cannot starve each other of threads).
+        If the executor is shedding load, the service runs inline on this thread.
+
+        Args:
+            new_request: The stored request
+            min_extraction_window_size: Minimum extraction window, for runs that cover many new
+                interactions at once (None keeps the configured windows)
+
+        Returns:
+            list[tuple[Future, str]]: Future of each service run, with the request ID for logging
+        """
+        # Extract source (empty string treated as None)
+        source = new_request.source or None
+
+        profile_generation_service = ProfileGenerationService(
+            llm_client=self.client, request_context=self.request_context
+        )
+        profile_generation_request = ProfileGenerationRequest(
+            user_id=new_request.user_id,
+            request_id=new_request.request_id,
+            source=source,
+            min_extraction_window_size=min_extraction_window_size,
+        )
+
+        feedback_generation_service = FeedbackGenerationService(
+            llm_client=self.client, request_context=self.request_context
+        )
+        feedback_generation_request = FeedbackGenerationRequest(
+            request_id=new_request.request_id,
+            agent_version=new_request.agent_version,
+            user_id=new_request.user_id,
+            source=source,
+            min_extraction_window_size=min_extraction_window_size,
+        )
+
+        executor = get_executor("generation")
+        return [
+            (
+                self._submit_or_run_inline(executor, service.run, service_request),
+                new_request.request_id,
+            )
+            for service, service_request in (
+                (profile_generation_service, profile_generation_request),
+                (feedback_generation_service, feedback_generation_request),
+            )
+        ]
+
+    @staticmethod
+    def _wait_for_generation(futures: list[tuple[Future, str]]) -> None:
+        """
+        Wait for generation service runs. Each service failure is logged but doesn't block others.
+
+        Args:
+            futures: Future of each service run, with the request ID for logging
+        """
+        executor = get_executor("generation")
+        for future, request_id in futures:
+            try:
+                future.result(timeout=GENERATION_SERVICE_TIMEOUT_SECONDS)
+            except FuturesTimeoutError:  # noqa: PERF203
+                executor.cancel(future)
+                logger.error(
+                    "Generation service timed out after %d seconds for request %s",
+                    GENERATION_SERVICE_TIMEOUT_SECONDS,
+                    request_id,
+                )
+            except Exception as e:
+                logger.error(
+                    "Generation service failed for request %s: %s, exception type: %s",
+                    request_id,
+                    str(e),
+                    type(e).__name__,
+                )
+
+    def _schedule_group_evaluation(self, new_request: Request) -> None:
+        """
+        Schedule delayed agent success evaluation of the request's session, if it has one.
+
+        Args:
+            new_request: The stored request
+        """
+        session_id = new_request.session_id
+        if not session_id:
+            return
+        scheduler = GroupEvaluationScheduler.get_instance()
+        key = (self.org_id, new_request.user_id, session_id)
+
+        def make_callback(
+            _org_id: str,
+            _user_id: str,
+            _sid: str,
+            _av: str,
+            _src: str | None,
+            _rc: RequestContext,
+            _llm: LiteLLMClient,
+        ) -> Callable[[], None]:
+            def callback() -> None:
+                run_group_evaluation(
+                    org_id=_org_id,
+                    user_id=_user_id,
+                    session_id=_sid,
+                    agent_version=_av,
+                    source=_src,
+                    request_context=_rc,
+                    llm_client=_llm,
+                )
+
+            return callback
+
+        scheduler.schedule(
+            key,
+            make_callback(
+                self.org_id,
+                new_request.user_id,
+                session_id,
+                new_request.agent_version,
+                new_request.source or None,
+                self.request_context,
+                self.client,
+            ),
+        )
+
+    @staticmethod
+    def _submit_or_run_inline(
+        executor: BoundedExecutor, fn: Callable[[Any], None], arg: Any
+    ) -> Future:
+        """
+        Submit work to a shared executor, running it on the calling thread if the executor is shedding load.
+
+        Args:
+            executor (BoundedExecutor): Executor to submit to
+            fn (Callable): Function to run
+            arg (Any): Its single argument
+
+        Returns:
+            Future: Future of the submitted task, or an already-completed future for inline runs
+        """
+        try:
+            return executor.submit(fn, arg)
+        except ExecutorSaturatedError as e:
+            logger.warning("%s; running %s inline", e, getattr(fn, "__qualname__", fn))
+        future: Future = Future()
+        try:
+            future.set_result(fn(arg))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
     def _cleanup_old_interactions_if_needed(self) -> None:
         """
         Check total interaction count and cleanup oldest interactions if threshold exceeded.
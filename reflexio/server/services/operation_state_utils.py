@@ -667,6 +667,50 @@ class OperationStateManager:
             len(fingerprints),
         )
 
+    # ── Use Case 4c: Aggregator Cluster Centroids ──
+    # (Persist cluster centroids and members for incremental clustering)
+
+    def get_cluster_centroids(self, name: str, version: str) -> dict:
+        """
+        Get stored cluster centroids for an aggregator.
+
+        Args:
+            name: Aggregator/feedback name
+            version: Agent version
+
+        Returns:
+            dict: {"clusters": [{"centroid": list[float], "raw_feedback_ids": list[int]}],
+                   "noise_raw_feedback_ids": list[int]}. Returns empty dict if no state exists.
+        """
+        state_key = self._bookmark_key(name, version=version) + "::centroids"
+        record = self.storage.get_operation_state(state_key)
+        if record:
+            state = record.get("operation_state", {})
+            if isinstance(state, dict):
+                return state
+        return {}
+
+    def update_cluster_centroids(
+        self, name: str, version: str, cluster_state: dict
+    ) -> None:
+        """
+        Store cluster centroids and members for an aggregator.
+
+        Args:
+            name: Aggregator/feedback name
+            version: Agent version
+            cluster_state: {"clusters": [{"centroid": list[float], "raw_feedback_ids": list[int]}],
+                            "noise_raw_feedback_ids": list[int]}
+        """
+        state_key = self._bookmark_key(name, version=version) + "::centroids"
+        self.storage.upsert_operation_state(state_key, cluster_state)
+        logger.info(
+            "Updated cluster centroids for '%s' v%s with %d clusters",
+            name,
+            version,
+            len(cluster_state.get("clusters", [])),
+        )
+
     # ── Use Case 5: Simple Lock ──
     # (Non-queuing lock for cleanup operations)
 
@@ -11,7 +11,6 @@ from datetime import datetime, timezone
 from pydantic import BaseModel, ConfigDict, Field
 from reflexio_commons.api_schema.retriever_schema import SearchUserProfileRequest
 from reflexio_commons.api_schema.service_schemas import UserProfile
-from reflexio_commons.config_schema import EMBEDDING_DIMENSIONS
 
 from reflexio.server.api_endpoints.request_context import RequestContext
 from reflexio.server.llm.litellm_client import LiteLLMClient
@@ -23,6 +22,9 @@ from reflexio.server.services.profile.profile_generation_service_utils import (
     ProfileTimeToLive,
     calculate_expiration_timestamp,
 )
+from reflexio.server.services.storage.supabase_storage_utils import (
+    user_profile_embedding_text,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -190,8 +192,11 @@ class ProfileDeduplicator(BaseDeduplicator):
         """
         Retrieve existing profiles from the database using hybrid search.
 
-        For each new profile, uses its profile_content as the query with
-        pre-computed embeddings for vector search.
+        For each new profile, uses its profile_content as the full-text query and the
+        embedding of the text storage embeds for profiles (content plus custom features)
+        as the vector query, so the vector compares like with like against stored profile
+        embeddings. That embedding is attached to the new profile, so each new profile is
+        embedded once for both the search and its save.
 
         Args:
             new_profiles: List of new profiles to search against
@@ -202,20 +207,26 @@ class ProfileDeduplicator(BaseDeduplicator):
         """
         storage = self.request_context.storage
 
-        # Collect profile content strings for embedding
-        query_texts = []
-        for profile in new_profiles:
-            text = profile.profile_content
-            if text and text.strip():
-                query_texts.append(text.strip())
+        # Collect profile content strings to search with
+        searchable_profiles = [
+            profile
+            for profile in new_profiles
+            if profile.profile_content and profile.profile_content.strip()
+        ]
+        query_texts = [
+            profile.profile_content.strip() for profile in searchable_profiles
+        ]
 
         if not query_texts:
             return []
 
-        # Batch-generate embeddings
+        # One embedding per profile, used for the vector search and carried forward for saving
+        stored_texts = [user_profile_embedding_text(p) for p in searchable_profiles]
         try:
-            embeddings = self.client.get_embeddings(
-                query_texts, dimensions=EMBEDDING_DIMENSIONS
+            embeddings = self._embed_queries_and_stored_texts(
+                searchable_profiles,  # type: ignore[arg-type]
+                stored_texts,
+                stored_texts,
             )
         except Exception as e:
             logger.warning("Failed to generate embeddings for dedup search: %s", e)
@@ -35,7 +35,7 @@ from reflexio.server.services.service_utils import (
     format_sessions_to_history_string,
     log_model_response,
 )
-from reflexio.server.site_var.site_var_manager import SiteVarManager
+from reflexio.server.site_var.site_var_manager import get_site_var_manager
 
 logger = logging.getLogger(__name__)
 PROFILE_EXTRACTION_TIMEOUT_SECONDS = 300
@@ -83,7 +83,7 @@ class ProfileExtractor:
         llm_config = config.llm_config if config else None
 
         # Get site var as fallback
-        self.model_setting = SiteVarManager().get_site_var("llm_model_setting")
+        self.model_setting = get_site_var_manager().get_site_var("llm_model_setting")
         if not isinstance(self.model_setting, dict):
             raise ValueError("llm_model_setting must be a dict")
 
@@ -141,6 +141,7 @@ class ProfileExtractor:
             self.config,
             global_window_size,
             global_stride,
+            self.service_config.min_extraction_window_size,
         )
 
         # Get effective source filter (None = get ALL sources)
@@ -58,6 +58,7 @@ class ProfileGenerationServiceConfig:
         rerun_start_time: Optional start time filter for rerun flows (Unix timestamp)
         rerun_end_time: Optional end time filter for rerun flows (Unix timestamp)
         auto_run: True for regular flow (checks stride), False for rerun/manual (skips stride)
+        min_extraction_window_size: Optional minimum extraction window (coalesced bulk publishes)
     """
 
     user_id: str
@@ -70,6 +71,7 @@ class ProfileGenerationServiceConfig:
     rerun_start_time: int | None = None
     rerun_end_time: int | None = None
     auto_run: bool = True
+    min_extraction_window_size: int | None = None
     is_incremental: bool = False
     previously_extracted: list[list[UserProfile]] = field(default_factory=list)
 
@@ -137,6 +139,7 @@ class ProfileGenerationService(
             rerun_start_time=request.rerun_start_time,
             rerun_end_time=request.rerun_end_time,
             auto_run=request.auto_run,
+            min_extraction_window_size=request.min_extraction_window_size,
         )
 
     def _process_results(self, results: list[list[UserProfile]]) -> None:
@@ -44,6 +44,8 @@ class ProfileGenerationRequest(BaseModel):
     auto_run: bool = (
         True  # True for regular flow (checks stride), False for rerun/manual
     )
+    # Minimum extraction window, so a run coalescing many new interactions covers all of them
+    min_extraction_window_size: int | None = None
 
 
 @dataclass(frozen=True)
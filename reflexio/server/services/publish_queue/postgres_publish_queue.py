@@ -0,0 +1,221 @@
+"""Postgres-backed publish queue for Supabase deployments; workers claim rows with FOR UPDATE SKIP LOCKED."""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import psycopg2
+import psycopg2.extensions
+
+from reflexio.server.services.publish_queue.publish_queue_base import (
+    DEAD,
+    PENDING,
+    RUNNING,
+    PublishJob,
+    PublishQueue,
+    PublishQueueFullError,
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publish_queue (
+    job_id BIGSERIAL PRIMARY KEY,
+    org_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at DOUBLE PRECISION NOT NULL,
+    available_at DOUBLE PRECISION NOT NULL,
+    lease_expires_at DOUBLE PRECISION,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_publish_queue_ready
+    ON publish_queue(status, available_at, job_id);
+CREATE INDEX IF NOT EXISTS idx_publish_queue_org ON publish_queue(org_id, status);
+"""
+
+
+def _fetch_row(cursor: psycopg2.extensions.cursor) -> tuple:
+    """Fetch the single row of an aggregate or RETURNING query, which always produces one."""
+    row = cursor.fetchone()
+    if row is None:
+        raise RuntimeError(f"Publish queue query returned no row: {cursor.query!r}")
+    return row
+
+
+class PostgresPublishQueue(PublishQueue):
+    """Publish queue in a Postgres table shared by every API instance."""
+
+    backend = "postgres"
+
+    def __init__(self, db_url: str, **kwargs) -> None:  # noqa: ANN003
+        """
+        Args:
+            db_url (str): PostgreSQL connection string
+            **kwargs: Retry and limit settings passed to PublishQueue
+        """
+        super().__init__(**kwargs)
+        self.db_url = db_url
+        self._local = threading.local()
+        with self._transaction() as cursor:
+            cursor.execute(_SCHEMA)
+        logger.info("Postgres publish queue initialized")
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn.closed:
+            conn = psycopg2.connect(self.db_url, connect_timeout=10)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[psycopg2.extensions.cursor]:
+        conn = self._connect()
+        try:
+            with conn.cursor() as cursor:
+                yield cursor
+            conn.commit()
+        except psycopg2.InterfaceError:
+            # Connection dropped; reconnect on next use
+            self._local.conn = None
+            raise
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def enqueue(self, org_id: str, payload: str) -> int:
+        now = time.time()
+        with self._transaction() as cursor:
+            if self.max_depth:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM publish_queue WHERE org_id = %s AND status = %s",
+                    (org_id, PENDING),
+                )
+                (depth,) = _fetch_row(cursor)
+                if depth >= self.max_depth:
+                    raise PublishQueueFullError(org_id, depth)
+            cursor.execute(
+                "INSERT INTO publish_queue (org_id, payload, enqueued_at, available_at) "
+                "VALUES (%s, %s, %s, %s) RETURNING job_id",
+                (org_id, payload, now, now),
+            )
+            return int(_fetch_row(cursor)[0])
+
+    def claim(self, limit: int, per_org_limit: int) -> list[PublishJob]:
+        now = time.time()
+        with self._transaction() as cursor:
+            # Reclaim jobs whose worker died; a job that keeps killing workers ends up dead
+            cursor.execute(
+                "UPDATE publish_queue SET status = CASE WHEN attempts >= %s THEN %s ELSE %s END, "
+                "last_error = 'lease expired', lease_expires_at = NULL "
+                "WHERE job_id IN (SELECT job_id FROM publish_queue "
+                "WHERE status = %s AND lease_expires_at < %s FOR UPDATE SKIP LOCKED)",
+                (self.max_attempts, DEAD, PENDING, RUNNING, now),
+            )
+            cursor.execute(
+                "SELECT org_id, COUNT(*) FROM publish_queue WHERE status = %s GROUP BY org_id",
+                (RUNNING,),
+            )
+            running_per_org = dict(cursor.fetchall())
+            saturated_orgs = [
+                org_id
+                for org_id, running in running_per_org.items()
+                if per_org_limit and running >= per_org_limit
+            ]
+            # Rows locked by other workers are skipped; unselected rows unlock at commit
+            cursor.execute(
+                "SELECT job_id, org_id, payload, attempts, enqueued_at FROM publish_queue "
+                "WHERE status = %s AND available_at <= %s AND NOT (org_id = ANY(%s)) "
+                "ORDER BY job_id LIMIT %s FOR UPDATE SKIP LOCKED",
+                (PENDING, now, saturated_orgs, self._claim_scan_size(limit)),
+            )
+            candidates = [PublishJob(*row) for row in cursor.fetchall()]
+            jobs = self._select_within_org_limits(
+                candidates, running_per_org, limit, per_org_limit
+            )
+            if jobs:
+                cursor.execute(
+                    "UPDATE publish_queue SET status = %s, attempts = attempts + 1, "
+                    "lease_expires_at = %s WHERE job_id = ANY(%s)",
+                    (RUNNING, now + self.lease_seconds, [job.job_id for job in jobs]),
+                )
+        for job in jobs:
+            job.attempts += 1
+        return jobs
+
+    def complete(self, job: PublishJob) -> bool:
+        with self._transaction() as cursor:
+            cursor.execute(
+                "DELETE FROM publish_queue WHERE job_id = %s AND attempts = %s",
+                (job.job_id, job.attempts),
+            )
+            held = bool(cursor.rowcount)
+        if not held:
+            self._log_lost_lease(job, "complete")
+        return held
+
+    def fail(self, job: PublishJob, error: str) -> bool:
+        dead = job.attempts >= self.max_attempts
+        with self._transaction() as cursor:
+            cursor.execute(
+                "UPDATE publish_queue SET status = %s, available_at = %s, "
+                "lease_expires_at = NULL, last_error = %s WHERE job_id = %s AND attempts = %s",
+                (
+                    DEAD if dead else PENDING,
+                    time.time() + self.retry_delay(job.attempts),
+                    error[:2000],
+                    job.job_id,
+                    job.attempts,
+                ),
+            )
+            held = bool(cursor.rowcount)
+        if not held:
+            self._log_lost_lease(job, "fail")
+            return False
+        return dead
+
+    def extend_lease(self, job: PublishJob) -> bool:
+        with self._transaction() as cursor:
+            cursor.execute(
+                "UPDATE publish_queue SET lease_expires_at = %s "
+                "WHERE job_id = %s AND attempts = %s AND status = %s",
+                (time.time() + self.lease_seconds, job.job_id, job.attempts, RUNNING),
+            )
+            held = bool(cursor.rowcount)
+        if not held:
+            self._log_lost_lease(job, "extend_lease")
+        return held
+
+    def stats(self, org_id: str | None = None) -> dict:
+        now = time.time()
+        org_filter, params = ("AND org_id = %s", (org_id,)) if org_id else ("", ())
+        with self._transaction() as cursor:
+            cursor.execute(
+                f"SELECT status, COUNT(*) FROM publish_queue WHERE TRUE {org_filter} "  # noqa: S608
+                "GROUP BY status",
+                params,
+            )
+            counts = dict(cursor.fetchall())
+            cursor.execute(
+                f"SELECT COUNT(*) FILTER (WHERE available_at <= %s), MIN(enqueued_at) FROM publish_queue "  # noqa: S608
+                f"WHERE status = %s {org_filter}",
+                (now, PENDING, *params),
+            )
+            ready, oldest = _fetch_row(cursor)
+        return {
+            "backend": self.backend,
+            "pending": counts.get(PENDING, 0),
+            "ready": int(ready),
+            "running": counts.get(RUNNING, 0),
+            "dead": counts.get(DEAD, 0),
+            "oldest_pending_age_seconds": now - oldest if oldest else 0.0,
+        }
@@ -0,0 +1,226 @@
+"""
+Durable work queue for publish_interaction background processing.
+
+Jobs are rows in a `publish_queue` table. A job is `pending` until a worker claims it, `running`
+while a worker holds its lease, and is deleted once processed. Failed jobs go back to `pending`
+with exponential backoff until they run out of attempts, then stay behind as `dead` rows
+(the dead-letter set). A running job whose lease expires (its worker died) is reclaimed.
+
+Every claim increments a job's `attempts`, which therefore identifies the lease: completing or
+failing a job only takes effect while its `attempts` still matches the claimed job's, so a worker
+whose lease expired and was claimed by another worker cannot delete or reschedule it. Workers
+extend the leases of the jobs they are still running, so only jobs of dead workers expire.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Job statuses
+PENDING = "pending"
+RUNNING = "running"
+DEAD = "dead"
+
+# Ready rows of orgs below their concurrency limit scanned per claimed job (the limit is also
+# applied within one claim)
+_CLAIM_SCAN_FACTOR = 20
+
+
+@dataclass
+class PublishJob:
+    """A claimed queue job."""
+
+    job_id: int
+    org_id: str
+    payload: str
+    attempts: int
+    enqueued_at: float
+
+
+class PublishQueueFullError(Exception):
+    """
+    Exception raised when an org already has too many pending jobs
+    """
+
+    def __init__(self, org_id: str, depth: int):
+        super().__init__(f"Publish queue for org {org_id} is full ({depth} pending)")
+        self.org_id = org_id
+        self.depth = depth
+
+
+class PublishQueue(ABC):
+    """Base class of the durable publish queue backends."""
+
+    backend = ""
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        max_depth: int = 10000,
+        lease_seconds: float = 900.0,
+        retry_base_seconds: float = 5.0,
+        retry_max_seconds: float = 600.0,
+    ) -> None:
+        """
+        Args:
+            max_attempts (int): Attempts before a job is dead-lettered
+            max_depth (int): Max pending jobs per org before enqueue is rejected (0 for no limit)
+            lease_seconds (float): How long a claimed job may go without a lease extension before it is reclaimed
+            retry_base_seconds (float): Backoff after the first failure, doubled per attempt
+            retry_max_seconds (float): Upper bound of the backoff
+        """
+        self.max_attempts = max_attempts
+        self.max_depth = max_depth
+        self.lease_seconds = lease_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+
+    def retry_delay(self, attempts: int) -> float:
+        """
+        Get the backoff before the next attempt of a job.
+
+        Args:
+            attempts (int): Attempts made so far (>= 1)
+
+        Returns:
+            float: Delay in seconds
+        """
+        return min(
+            self.retry_base_seconds * 2 ** max(attempts - 1, 0), self.retry_max_seconds
+        )
+
+    @staticmethod
+    def _select_within_org_limits(
+        candidates: list[PublishJob],
+        running_per_org: dict[str, int],
+        limit: int,
+        per_org_limit: int,
+    ) -> list[PublishJob]:
+        """
+        Pick up to `limit` candidates in queue order without exceeding per-org concurrency.
+
+        Args:
+            candidates (list[PublishJob]): Ready jobs, oldest first
+            running_per_org (dict[str, int]): Jobs currently running per org
+            limit (int): Max jobs to pick
+            per_org_limit (int): Max running jobs per org (0 for no limit)
+
+        Returns:
+            list[PublishJob]: Jobs to claim
+        """
+        running = dict(running_per_org)
+        selected: list[PublishJob] = []
+        for job in candidates:
+            if len(selected) >= limit:
+                break
+            if per_org_limit and running.get(job.org_id, 0) >= per_org_limit:
+                continue
+            running[job.org_id] = running.get(job.org_id, 0) + 1
+            selected.append(job)
+        return selected
+
+    @staticmethod
+    def _claim_scan_size(limit: int) -> int:
+        return limit * _CLAIM_SCAN_FACTOR
+
+    @staticmethod
+    def _log_lost_lease(job: PublishJob, action: str) -> None:
+        logger.warning(
+            "event=publish_job_lease_lost job_id=%s org_id=%s attempts=%d action=%s",
+            job.job_id,
+            job.org_id,
+            job.attempts,
+            action,
+        )
+
+    @abstractmethod
+    def enqueue(self, org_id: str, payload: str) -> int:
+        """
+        Add a job.
+
+        Args:
+            org_id (str): Organization ID
+            payload (str): Serialized request
+
+        Returns:
+            int: Job ID
+
+        Raises:
+            PublishQueueFullError: If the org already has `max_depth` pending jobs
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim(self, limit: int, per_org_limit: int) -> list[PublishJob]:
+        """
+        Lease ready jobs, oldest first, respecting per-org concurrency across all workers.
+
+        Orgs already at `per_org_limit` are excluded when selecting rows, so an org with a
+        backlog at the head of the queue does not hold back other orgs' jobs.
+
+        Args:
+            limit (int): Max jobs to claim
+            per_org_limit (int): Max running jobs per org (0 for no limit)
+
+        Returns:
+            list[PublishJob]: Claimed jobs (their `attempts` already include this attempt)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, job: PublishJob) -> bool:
+        """
+        Remove a successfully processed job.
+
+        Args:
+            job (PublishJob): The claimed job
+
+        Returns:
+            bool: False if the job was no longer held by this lease (left untouched)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fail(self, job: PublishJob, error: str) -> bool:
+        """
+        Record a failed attempt, scheduling a retry or dead-lettering the job.
+
+        Args:
+            job (PublishJob): The claimed job
+            error (str): Error message
+
+        Returns:
+            bool: True if the job was dead-lettered (False if it was no longer held by this lease)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def extend_lease(self, job: PublishJob) -> bool:
+        """
+        Push back the lease expiry of a job that is still running.
+
+        Args:
+            job (PublishJob): The claimed job
+
+        Returns:
+            bool: False if the job was no longer held by this lease (left untouched)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self, org_id: str | None = None) -> dict:
+        """
+        Get queue depth and lag.
+
+        Args:
+            org_id (str, optional): Only count this org's jobs
+
+        Returns:
+            dict: pending, ready, running and dead counts, and oldest_pending_age_seconds (lag)
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:  # noqa: B027
+        """Release connections held by the current thread."""
@@ -0,0 +1,326 @@
+"""
+Worker pool that drains the durable publish queue.
+
+The process-wide queue is selected by PUBLISH_QUEUE_BACKEND ("sqlite" or "postgres"); when it is
+empty the queue is disabled and callers keep processing publishes in-process.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from reflexio.server import (
+    PUBLISH_QUEUE_BACKEND,
+    PUBLISH_QUEUE_DB_URL,
+    PUBLISH_QUEUE_MAX_ATTEMPTS,
+    PUBLISH_QUEUE_MAX_DEPTH,
+    PUBLISH_QUEUE_PER_ORG_CONCURRENCY,
+    PUBLISH_QUEUE_WORKERS,
+    SQLITE_FILE_DIRECTORY,
+)
+from reflexio.server.services.publish_queue.publish_queue_base import (
+    PublishJob,
+    PublishQueue,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds an idle worker waits before polling the queue again (jobs enqueued by this process wake it immediately)
+_IDLE_POLL_SECONDS = 1.0
+
+# Lease extensions per lease period while a job runs, so one missed extension does not lose the lease
+_LEASE_EXTENSIONS_PER_LEASE = 3
+
+# Processes one job; raising marks the attempt as failed
+JobHandler = Callable[[PublishJob], None]
+
+
+class PublishQueueWorkerPool:
+    """
+    Daemon threads that claim jobs from a PublishQueue, run them and record the outcome.
+
+    A separate heartbeat thread extends the leases of running jobs, so jobs that run longer than
+    the queue's lease (large bulk publishes) are not reclaimed and run twice.
+    """
+
+    def __init__(
+        self,
+        queue: PublishQueue,
+        handler: JobHandler,
+        num_workers: int = 4,
+        per_org_limit: int = 2,
+    ) -> None:
+        """
+        Args:
+            queue (PublishQueue): Queue to drain
+            handler (JobHandler): Callable that processes one job and raises on failure
+            num_workers (int): Number of worker threads
+            per_org_limit (int): Max jobs of one org running at once across all workers (0 for no limit)
+        """
+        self.queue = queue
+        self.handler = handler
+        self.num_workers = num_workers
+        self.per_org_limit = per_org_limit
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._heartbeat_thread: threading.Thread | None = None
+        self._mutex = threading.Lock()
+        self._in_flight = 0
+        self._running_jobs: dict[int, PublishJob] = {}
+        self._counters = {
+            "processed": 0,
+            "failed_attempts": 0,
+            "dead_lettered": 0,
+            "processing_seconds": 0.0,
+        }
+
+    def start(self) -> None:
+        """Start the worker threads (no-op if already running)."""
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for i in range(self.num_workers):
+            thread = threading.Thread(
+                target=self._worker_loop, daemon=True, name=f"publish-queue-{i}"
+            )
+            thread.start()
+            self._threads.append(thread)
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, daemon=True, name="publish-queue-heartbeat"
+        )
+        self._heartbeat_thread.start()
+        logger.info(
+            "Publish queue workers started backend=%s workers=%d per_org_limit=%d",
+            self.queue.backend,
+            self.num_workers,
+            self.per_org_limit,
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker threads. Jobs still running are reclaimed after their lease expires.
+
+        Args:
+            timeout (float): Seconds to wait for each thread
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=timeout)
+        self._threads = []
+        self._heartbeat_thread = None
+
+    def notify(self) -> None:
+        """Wake idle workers after a job was enqueued."""
+        self._wake_event.set()
+
+    def run_once(self) -> bool:
+        """
+        Claim and process a single job on the calling thread.
+
+        Returns:
+            bool: True if a job was processed (successfully or not)
+        """
+        jobs = self.queue.claim(limit=1, per_org_limit=self.per_org_limit)
+        if not jobs:
+            return False
+        self._process(jobs[0])
+        return True
+
+    def _worker_loop(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    processed = self.run_once()
+                except Exception:
+                    logger.exception("Publish queue worker failed to claim a job")
+                    processed = False
+                if not processed:
+                    self._wake_event.wait(timeout=_IDLE_POLL_SECONDS)
+                    self._wake_event.clear()
+        finally:
+            self.queue.close()
+
+    def _heartbeat_loop(self) -> None:
+        interval = self.queue.lease_seconds / _LEASE_EXTENSIONS_PER_LEASE
+        try:
+            while not self._stop_event.wait(timeout=interval):
+                with self._mutex:
+                    running_jobs = list(self._running_jobs.values())
+                for job in running_jobs:
+                    try:
+                        self.queue.extend_lease(job)
+                    except Exception:  # noqa: PERF203
+                        logger.exception(
+                            "Failed to extend the lease of publish job %s", job.job_id
+                        )
+        finally:
+            self.queue.close()
+
+    def _process(self, job: PublishJob) -> None:
+        with self._mutex:
+            self._in_flight += 1
+            self._running_jobs[job.job_id] = job
+        start = time.perf_counter()
+        try:
+            self.handler(job)
+        except Exception as e:
+            dead = self.queue.fail(job, str(e) or type(e).__name__)
+            with self._mutex:
+                self._counters["failed_attempts"] += 1
+                self._counters["dead_lettered"] += int(dead)
+            logger.warning(
+                "event=publish_job_failed job_id=%s org_id=%s attempts=%d dead=%s error=%s",
+                job.job_id,
+                job.org_id,
+                job.attempts,
+                dead,
+                e,
+            )
+        else:
+            self.queue.complete(job)
+            with self._mutex:
+                self._counters["processed"] += 1
+            logger.info(
+                "event=publish_job_done job_id=%s org_id=%s attempts=%d queue_lag_seconds=%.3f",
+                job.job_id,
+                job.org_id,
+                job.attempts,
+                time.time() - job.enqueued_at,
+            )
+        finally:
+            with self._mutex:
+                self._in_flight -= 1
+                self._running_jobs.pop(job.job_id, None)
+                self._counters["processing_seconds"] += time.perf_counter() - start
+
+    def stats(self) -> dict:
+        """
+        Get worker counters.
+
+        Returns:
+            dict: workers, in_flight, processed, failed_attempts, dead_lettered and processing_seconds
+        """
+        with self._mutex:
+            return {
+                "workers": len(self._threads),
+                "per_org_limit": self.per_org_limit,
+                "in_flight": self._in_flight,
+                **self._counters,
+            }
+
+
+_pool_lock = threading.Lock()
+_queue: PublishQueue | None = None
+_pool: PublishQueueWorkerPool | None = None
+
+
+def get_publish_queue() -> PublishQueue | None:
+    """
+    Get the process-wide publish queue, creating it on first use.
+
+    Returns:
+        PublishQueue | None: The configured queue, or None when PUBLISH_QUEUE_BACKEND is unset
+    """
+    global _queue
+    if not PUBLISH_QUEUE_BACKEND:
+        return None
+    with _pool_lock:
+        if _queue is None:
+            settings = {
+                "max_attempts": PUBLISH_QUEUE_MAX_ATTEMPTS,
+                "max_depth": PUBLISH_QUEUE_MAX_DEPTH,
+            }
+            if PUBLISH_QUEUE_BACKEND == "sqlite":
+                from reflexio.server.services.publish_queue.sqlite_publish_queue import (
+                    SqlitePublishQueue,
+                )
+
+                _queue = SqlitePublishQueue(
+                    str(Path(SQLITE_FILE_DIRECTORY) / "publish_queue.sqlite3"),
+                    **settings,
+                )
+            elif PUBLISH_QUEUE_BACKEND == "postgres":
+                from reflexio.server.services.publish_queue.postgres_publish_queue import (
+                    PostgresPublishQueue,
+                )
+
+                if not PUBLISH_QUEUE_DB_URL:
+                    raise ValueError(
+                        "PUBLISH_QUEUE_DB_URL is required for the postgres publish queue"
+                    )
+                _queue = PostgresPublishQueue(PUBLISH_QUEUE_DB_URL, **settings)
+            else:
+                raise ValueError(
+                    f"Invalid PUBLISH_QUEUE_BACKEND: {PUBLISH_QUEUE_BACKEND}"
+                )
+        return _queue
+
+
+def start_publish_queue_workers(handler: JobHandler) -> PublishQueueWorkerPool | None:
+    """
+    Start the process-wide worker pool if a queue backend is configured.
+
+    Args:
+        handler (JobHandler): Callable that processes one job and raises on failure
+
+    Returns:
+        PublishQueueWorkerPool | None: The running pool, or None when the queue is disabled
+    """
+    global _pool
+    queue = get_publish_queue()
+    if queue is None:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = PublishQueueWorkerPool(
+                queue,
+                handler,
+                num_workers=PUBLISH_QUEUE_WORKERS,
+                per_org_limit=PUBLISH_QUEUE_PER_ORG_CONCURRENCY,
+            )
+        _pool.start()
+        return _pool
+
+
+def stop_publish_queue_workers() -> None:
+    """Stop the process-wide worker pool."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.stop()
+
+
+def notify_publish_queue_workers() -> None:
+    """Wake idle workers of this process after an enqueue."""
+    pool = _pool
+    if pool is not None:
+        pool.notify()
+
+
+def get_publish_queue_stats(org_id: str | None = None) -> dict:
+    """
+    Get queue depth/lag and worker counters.
+
+    Args:
+        org_id (str, optional): Also report depth and lag for this org
+
+    Returns:
+        dict: {"enabled": False} when the queue is disabled, otherwise queue, org and worker stats
+    """
+    queue = get_publish_queue()
+    if queue is None:
+        return {"enabled": False}
+    pool = _pool
+    return {
+        "enabled": True,
+        "queue": queue.stats(),
+        "org": queue.stats(org_id) if org_id else None,
+        "workers": pool.stats() if pool is not None else None,
+    }
@@ -0,0 +1,220 @@
+"""SQLite-backed publish queue for local and self-hosted deployments."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from reflexio.server.services.publish_queue.publish_queue_base import (
+    DEAD,
+    PENDING,
+    RUNNING,
+    PublishJob,
+    PublishQueue,
+    PublishQueueFullError,
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publish_queue (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    org_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    lease_expires_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_publish_queue_ready
+    ON publish_queue(status, available_at, job_id);
+CREATE INDEX IF NOT EXISTS idx_publish_queue_org ON publish_queue(org_id, status);
+"""
+
+
+class SqlitePublishQueue(PublishQueue):
+    """Publish queue in a SQLite file; claims run under BEGIN IMMEDIATE so workers in several processes can share it."""
+
+    backend = "sqlite"
+
+    def __init__(self, db_path: str, **kwargs) -> None:  # noqa: ANN003
+        """
+        Args:
+            db_path (str): Path of the SQLite database file
+            **kwargs: Retry and limit settings passed to PublishQueue
+        """
+        super().__init__(**kwargs)
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connect().executescript(_SCHEMA)
+        logger.info("SQLite publish queue uses %s", db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def enqueue(self, org_id: str, payload: str) -> int:
+        now = time.time()
+        with self._transaction() as conn:
+            if self.max_depth:
+                (depth,) = conn.execute(
+                    "SELECT COUNT(*) FROM publish_queue WHERE org_id = ? AND status = ?",
+                    (org_id, PENDING),
+                ).fetchone()
+                if depth >= self.max_depth:
+                    raise PublishQueueFullError(org_id, depth)
+            cursor = conn.execute(
+                "INSERT INTO publish_queue (org_id, payload, enqueued_at, available_at) "
+                "VALUES (?, ?, ?, ?)",
+                (org_id, payload, now, now),
+            )
+            return int(cursor.lastrowid or 0)
+
+    def claim(self, limit: int, per_org_limit: int) -> list[PublishJob]:
+        now = time.time()
+        with self._transaction() as conn:
+            # Reclaim jobs whose worker died; a job that keeps killing workers ends up dead
+            conn.execute(
+                "UPDATE publish_queue SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "last_error = 'lease expired', lease_expires_at = NULL "
+                "WHERE status = ? AND lease_expires_at < ?",
+                (self.max_attempts, DEAD, PENDING, RUNNING, now),
+            )
+            running_per_org = dict(
+                conn.execute(
+                    "SELECT org_id, COUNT(*) FROM publish_queue WHERE status = ? GROUP BY org_id",
+                    (RUNNING,),
+                ).fetchall()
+            )
+            saturated_orgs = [
+                org_id
+                for org_id, running in running_per_org.items()
+                if per_org_limit and running >= per_org_limit
+            ]
+            candidates = [
+                PublishJob(*row)
+                for row in conn.execute(
+                    "SELECT job_id, org_id, payload, attempts, enqueued_at FROM publish_queue "
+                    "WHERE status = ? AND available_at <= ? "
+                    "AND org_id NOT IN (SELECT value FROM json_each(?)) "
+                    "ORDER BY job_id LIMIT ?",
+                    (
+                        PENDING,
+                        now,
+                        json.dumps(saturated_orgs),
+                        self._claim_scan_size(limit),
+                    ),
+                ).fetchall()
+            ]
+            jobs = self._select_within_org_limits(
+                candidates, running_per_org, limit, per_org_limit
+            )
+            conn.executemany(
+                "UPDATE publish_queue SET status = ?, attempts = attempts + 1, "
+                "lease_expires_at = ? WHERE job_id = ?",
+                [(RUNNING, now + self.lease_seconds, job.job_id) for job in jobs],
+            )
+        for job in jobs:
+            job.attempts += 1
+        return jobs
+
+    def complete(self, job: PublishJob) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM publish_queue WHERE job_id = ? AND attempts = ?",
+                (job.job_id, job.attempts),
+            )
+        if not cursor.rowcount:
+            self._log_lost_lease(job, "complete")
+            return False
+        return True
+
+    def fail(self, job: PublishJob, error: str) -> bool:
+        dead = job.attempts >= self.max_attempts
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE publish_queue SET status = ?, available_at = ?, "
+                "lease_expires_at = NULL, last_error = ? WHERE job_id = ? AND attempts = ?",
+                (
+                    DEAD if dead else PENDING,
+                    time.time() + self.retry_delay(job.attempts),
+                    error[:2000],
+                    job.job_id,
+                    job.attempts,
+                ),
+            )
+        if not cursor.rowcount:
+            self._log_lost_lease(job, "fail")
+            return False
+        return dead
+
+    def extend_lease(self, job: PublishJob) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE publish_queue SET lease_expires_at = ? "
+                "WHERE job_id = ? AND attempts = ? AND status = ?",
+                (time.time() + self.lease_seconds, job.job_id, job.attempts, RUNNING),
+            )
+        if not cursor.rowcount:
+            self._log_lost_lease(job, "extend_lease")
+            return False
+        return True
+
+    def stats(self, org_id: str | None = None) -> dict:
+        now = time.time()
+        org_filter, params = ("AND org_id = ?", (org_id,)) if org_id else ("", ())
+        conn = self._connect()
+        counts = dict(
+            conn.execute(
+                f"SELECT status, COUNT(*) FROM publish_queue WHERE 1 = 1 {org_filter} "  # noqa: S608
+                "GROUP BY status",
+                params,
+            ).fetchall()
+        )
+        ready, oldest = conn.execute(
+            f"SELECT COALESCE(SUM(available_at <= ?), 0), MIN(enqueued_at) FROM publish_queue "  # noqa: S608
+            f"WHERE status = ? {org_filter}",
+            (now, PENDING, *params),
+        ).fetchone()
+        return {
+            "backend": self.backend,
+            "pending": counts.get(PENDING, 0),
+            "ready": int(ready),
+            "running": counts.get(RUNNING, 0),
+            "dead": counts.get(DEAD, 0),
+            "oldest_pending_age_seconds": now - oldest if oldest else 0.0,
+        }
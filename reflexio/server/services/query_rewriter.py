@@ -1,31 +1,132 @@
 """
 Query rewriter service that expands user search queries with synonyms
 for improved full-text search recall using websearch_to_tsquery syntax.
+
+Successful rewrites are cached process-wide by (model, query, conversation history), and queries that are
+already keyword-like (websearch syntax or identifiers) skip the LLM entirely.
 """
 
+import hashlib
 import json
 import logging
 import re
+import threading
 
+from cachetools import TTLCache
 from reflexio_commons.api_schema.retriever_schema import (
     ConversationTurn,
     RewrittenQuery,
 )
 from reflexio_commons.config_schema import APIKeyConfig
 
+from reflexio.server import QUERY_REWRITE_CACHE_SIZE, QUERY_REWRITE_CACHE_TTL_SECONDS
 from reflexio.server.llm.litellm_client import LiteLLMClient, LiteLLMConfig
 from reflexio.server.prompt.prompt_manager import PromptManager
-from reflexio.server.site_var.site_var_manager import SiteVarManager
+from reflexio.server.site_var.site_var_manager import get_site_var_manager
 
 logger = logging.getLogger(__name__)
 
+RewriteCacheKey = tuple[str, str, str]
+
+
+class RewriteCache:
+    """TTL cache of LLM query rewrites with hit/miss/fast-path counters."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """
+        Args:
+            max_size (int): Max cached rewrites (0 disables the cache)
+            ttl_seconds (float): Seconds an entry is reused
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: TTLCache | None = (
+            TTLCache(maxsize=max_size, ttl=ttl_seconds) if max_size else None
+        )
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "fast_path": 0}
+
+    def get(self, key: RewriteCacheKey) -> RewrittenQuery | None:
+        """
+        Look up a cached rewrite.
+
+        Args:
+            key (RewriteCacheKey): (model, query, conversation history hash)
+
+        Returns:
+            RewrittenQuery | None: A copy of the cached rewrite, or None on a miss
+        """
+        if self._entries is None:
+            return None
+        with self._lock:
+            rewritten = self._entries.get(key)
+            self._counters["hits" if rewritten is not None else "misses"] += 1
+            return rewritten.model_copy() if rewritten is not None else None
+
+    def put(self, key: RewriteCacheKey, rewritten: RewrittenQuery) -> None:
+        """
+        Cache a rewrite.
+
+        Args:
+            key (RewriteCacheKey): (model, query, conversation history hash)
+            rewritten (RewrittenQuery): Rewrite produced by the LLM
+        """
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries[key] = rewritten.model_copy()
+            self._counters["stores"] += 1
+
+    def record_fast_path(self) -> None:
+        """Count a query that skipped the LLM as already keyword-like."""
+        with self._lock:
+            self._counters["fast_path"] += 1
+
+    def stats(self) -> dict:
+        """
+        Get hit/miss counters.
+
+        Returns:
+            dict: hits, misses, stores, fast-path skips, hit rate and current/max size
+        """
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+                "size": len(self._entries) if self._entries is not None else 0,
+                "max_size": self.max_size,
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            if self._entries is not None:
+                self._entries.clear()
+            for name in self._counters:
+                self._counters[name] = 0
+
+
+_rewrite_cache = RewriteCache(QUERY_REWRITE_CACHE_SIZE, QUERY_REWRITE_CACHE_TTL_SECONDS)
+
+
+def get_query_rewrite_cache_stats() -> dict:
+    """Get hit/miss/fast-path counters of the process-wide query rewrite cache."""
+    return _rewrite_cache.stats()
+
+
+def clear_query_rewrite_cache() -> None:
+    """Clear the query rewrite cache and reset counters (for testing/admin)."""
+    _rewrite_cache.clear()
+
 
 class QueryRewriter:
     """Rewrites search queries by expanding them with synonyms via LLM.
 
     Uses a fast, cheap model (query_rewrite_model_name from llm_model_setting.json)
     to produce expanded FTS queries in websearch_to_tsquery format.
-    Falls back to the original query on any failure.
+    Falls back to the original query on any failure. Rewrites are served from the
+    process-wide rewrite cache when possible, and keyword-like queries skip the LLM.
     """
 
     MAX_REWRITE_LENGTH = 512
@@ -44,6 +145,10 @@ class QueryRewriter:
         "i cannot",
         "i can't",
     )
+    # Queries already written in websearch_to_tsquery syntax: OR, quoted phrases, -exclusions
+    _WEBSEARCH_SYNTAX_PATTERN = re.compile(r'\sOR\s|"[^"]+"|(?:^|\s)-\w')
+    # Identifier-like terms synonyms cannot expand: ids, versions, paths, snake_case, camelCase
+    _IDENTIFIER_TERM_PATTERN = re.compile(r"^\S*(?:\d|_|\.\w|/|::|[a-z][A-Z])\S*$")
 
     def __init__(
         self,
@@ -63,7 +168,7 @@ class QueryRewriter:
         """
         self.prompt_manager = prompt_manager
         if model is None:
-            model_setting = SiteVarManager().get_site_var("llm_model_setting")
+            model_setting = get_site_var_manager().get_site_var("llm_model_setting")
             model = (
                 model_setting.get("query_rewrite_model_name", "gpt-5-nano")
                 if isinstance(model_setting, dict)
@@ -102,18 +207,124 @@ class QueryRewriter:
         """
         if not enabled:
             return self._fallback_rewrite(query)
+        if self._is_keyword_query(query, conversation_history):
+            _rewrite_cache.record_fast_path()
+            return self._fallback_rewrite(query)
+
+        cache_key = self._cache_key(query, conversation_history)
+        cached = _rewrite_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            return self._llm_rewrite(query, conversation_history=conversation_history)
+            rewritten = self._llm_rewrite(
+                query, conversation_history=conversation_history
+            )
         except Exception as e:
             logger.warning("Query rewrite failed, using fallback: %s", e)
             return self._fallback_rewrite(query)
+        if rewritten is None:
+            # Unusable output is not cached, so the next search retries the LLM
+            return self._fallback_rewrite(query)
+        _rewrite_cache.put(cache_key, rewritten)
+        return rewritten
 
-    def _llm_rewrite(
+    async def arewrite(
         self,
         query: str,
+        enabled: bool = True,
         conversation_history: list[ConversationTurn] | None = None,
     ) -> RewrittenQuery:
+        """
+        Async twin of rewrite, awaiting the LLM call instead of blocking a thread on it.
+
+        Args:
+            query (str): The original user search query
+            enabled (bool): Whether query rewriting is enabled
+            conversation_history (list, optional): Prior conversation turns for context-aware rewriting
+
+        Returns:
+            RewrittenQuery: The rewritten query with expanded FTS terms
+        """
+        if not enabled:
+            return self._fallback_rewrite(query)
+        if self._is_keyword_query(query, conversation_history):
+            _rewrite_cache.record_fast_path()
+            return self._fallback_rewrite(query)
+
+        cache_key = self._cache_key(query, conversation_history)
+        cached = _rewrite_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            prompt = self._render_rewrite_prompt(query, conversation_history)
+            result = await self.llm_client.agenerate_response(prompt)
+            rewritten = self._parse_rewrite_result(query, result)
+        except Exception as e:
+            logger.warning("Query rewrite failed, using fallback: %s", e)
+            return self._fallback_rewrite(query)
+        if rewritten is None:
+            # Unusable output is not cached, so the next search retries the LLM
+            return self._fallback_rewrite(query)
+        _rewrite_cache.put(cache_key, rewritten)
+        return rewritten
+
+    @classmethod
+    def _is_keyword_query(
+        cls,
+        query: str,
+        conversation_history: list[ConversationTurn] | None = None,
+    ) -> bool:
+        """
+        Check whether a query is already keyword-like, so an LLM rewrite cannot improve it.
+
+        Queries already in websearch_to_tsquery syntax and queries made only of identifier-like
+        terms qualify. Conversation history always goes through the LLM, which may resolve
+        references in the query.
+
+        Args:
+            query (str): The original search query
+            conversation_history (list, optional): Prior conversation turns
+
+        Returns:
+            bool: True when the query should be used as-is
+        """
+        if conversation_history:
+            return False
+        if cls._WEBSEARCH_SYNTAX_PATTERN.search(query):
+            return True
+        terms = query.split()
+        return bool(terms) and all(
+            cls._IDENTIFIER_TERM_PATTERN.match(term) for term in terms
+        )
+
+    def _cache_key(
+        self,
+        query: str,
+        conversation_history: list[ConversationTurn] | None = None,
+    ) -> RewriteCacheKey:
+        """
+        Build the rewrite cache key from the model, query and formatted conversation context.
+
+        Args:
+            query (str): The original search query
+            conversation_history (list, optional): Prior conversation turns
+
+        Returns:
+            RewriteCacheKey: (model, query, sha256 of the conversation context)
+        """
+        context = self._format_conversation_context(conversation_history)
+        context_hash = (
+            hashlib.sha256(context.encode("utf-8")).hexdigest() if context else ""
+        )
+        return self.llm_client.config.model, query.strip(), context_hash
+
+    def _llm_rewrite(
+        self,
+        query: str,
+        conversation_history: list[ConversationTurn] | None = None,
+    ) -> RewrittenQuery | None:
         """
         Use LLM to expand the query with synonyms, optionally incorporating conversation context.
 
@@ -122,33 +333,67 @@ class QueryRewriter:
             conversation_history (list, optional): Prior conversation turns
 
         Returns:
-            RewrittenQuery: LLM-generated expanded query
+            RewrittenQuery | None: LLM-generated expanded query, or None if the output was unusable
 
         Raises:
             Exception: If LLM call or parsing fails
         """
+        prompt = self._render_rewrite_prompt(query, conversation_history)
+        result = self.llm_client.generate_response(prompt)
+        return self._parse_rewrite_result(query, result)
+
+    def _render_rewrite_prompt(
+        self,
+        query: str,
+        conversation_history: list[ConversationTurn] | None = None,
+    ) -> str:
+        """
+        Render the query rewrite prompt.
+
+        Args:
+            query (str): The original search query
+            conversation_history (list, optional): Prior conversation turns
+
+        Returns:
+            str: Rendered prompt
+        """
         conversation_context = self._format_conversation_context(conversation_history)
         conversation_context_block = (
             f"\nConversation context: {conversation_context}\n"
             if conversation_context
             else ""
         )
-        prompt = self.prompt_manager.render_prompt(
+        return self.prompt_manager.render_prompt(
             "query_rewrite",
             {"query": query, "conversation_context_block": conversation_context_block},
         )
-        result = self.llm_client.generate_response(prompt)
+
+    def _parse_rewrite_result(
+        self, query: str, result: object
+    ) -> RewrittenQuery | None:
+        """
+        Turn the LLM output into a RewrittenQuery.
+
+        Args:
+            query (str): The original search query
+            result (object): LLM response
+
+        Returns:
+            RewrittenQuery | None: Validated rewrite, or None if the output is empty or invalid
+        """
         logger.debug("Query rewrite response: %s", result)
 
         if isinstance(result, str):
             extracted = self._extract_candidate_query(result)
             if extracted and self._is_valid_rewrite(extracted):
                 return RewrittenQuery(fts_query=extracted)
-            logger.warning("LLM returned invalid query rewrite text, %s", extracted)
-            return self._fallback_rewrite(query)
+            logger.warning(
+                "LLM returned invalid query rewrite text for %r, %s", query, extracted
+            )
+            return None
 
         logger.warning("LLM returned empty response for query rewrite")
-        return self._fallback_rewrite(query)
+        return None
 
     @classmethod
     def _extract_candidate_query(cls, output: str) -> str | None:
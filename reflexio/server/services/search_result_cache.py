@@ -0,0 +1,355 @@
+"""
+Process-wide cache of unified search responses.
+
+Agents often ask nearly the same question for the same user seconds apart. Responses are keyed by
+(org, user_id, agent_version, feedback_name, normalized query, top_k, threshold, query_rewrite,
+conversation history hash); with UNIFIED_SEARCH_CACHE_SIMILARITY set, a query whose embedding is
+close enough to a cached query of the same scope reuses its response as well.
+
+Entries are invalidated through write epochs: every storage write that can change search results
+bumps the epoch of its org (or only of one user, for per-user profile writes), and entries computed
+under an older epoch are dropped on lookup. Writes made by other processes are only picked up when
+entries expire after UNIFIED_SEARCH_CACHE_TTL_SECONDS.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
+from reflexio_commons.api_schema.retriever_schema import (
+    UnifiedSearchRequest,
+    UnifiedSearchResponse,
+)
+
+from reflexio.server import (
+    UNIFIED_SEARCH_CACHE_SIMILARITY,
+    UNIFIED_SEARCH_CACHE_SIZE,
+    UNIFIED_SEARCH_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cached query embeddings compared per scope on a similarity lookup (most recent first)
+_MAX_SIMILAR_CANDIDATES = 32
+
+# (org_id, user_id, agent_version, feedback_name, top_k, threshold, query_rewrite, history hash)
+ScopeKey = tuple
+# (scope, normalized query)
+CacheKey = tuple[ScopeKey, str]
+# (org epoch, user epoch) at the time the search started
+Epoch = tuple[int, int]
+
+
+@dataclass
+class _Entry:
+    response: UnifiedSearchResponse
+    epoch: Epoch
+    compute_seconds: float
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query for exact-match lookups (case and whitespace insensitive).
+
+    Args:
+        query (str): Raw query text
+
+    Returns:
+        str: Lower-cased query with collapsed whitespace
+    """
+    return " ".join(query.lower().split())
+
+
+def _history_hash(request: UnifiedSearchRequest) -> str:
+    if not request.conversation_history:
+        return ""
+    turns = [[turn.role, turn.content] for turn in request.conversation_history]
+    return hashlib.sha256(json.dumps(turns).encode("utf-8")).hexdigest()
+
+
+def _strip_embeddings(response: UnifiedSearchResponse) -> UnifiedSearchResponse:
+    """Copy a response without entity embeddings, which dominate its size."""
+    stripped = response.model_copy(deep=True)
+    for entities in (
+        stripped.profiles,
+        stripped.feedbacks,
+        stripped.raw_feedbacks,
+        stripped.skills,
+    ):
+        for entity in entities:
+            entity.embedding = []
+    return stripped
+
+
+class SearchResultCache:
+    """TTL cache of unified search responses with write-epoch invalidation and hit/miss counters."""
+
+    def __init__(
+        self, max_size: int, ttl_seconds: float, similarity_threshold: float = 0.0
+    ) -> None:
+        """
+        Args:
+            max_size (int): Max cached responses (0 disables the cache)
+            ttl_seconds (float): Seconds an entry stays fresh
+            similarity_threshold (float): Min cosine similarity for near-duplicate hits (0 disables them)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self._entries: TTLCache | None = (
+            TTLCache(maxsize=max_size, ttl=ttl_seconds) if max_size else None
+        )
+        # Per scope: (unit query embedding, normalized query) of recently cached searches
+        self._embeddings: LRUCache = LRUCache(maxsize=max(max_size, 1))
+        self._org_epochs: dict[str, int] = {}
+        self._user_epochs: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            "lookups": 0,
+            "exact_hits": 0,
+            "similar_hits": 0,
+            "stores": 0,
+            "invalidations": 0,
+            "stale_drops": 0,
+        }
+        self._latency_saved_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups can hit at all."""
+        return self._entries is not None
+
+    @staticmethod
+    def key(org_id: str, request: UnifiedSearchRequest) -> CacheKey:
+        """
+        Build the cache key of a search request.
+
+        Args:
+            org_id (str): Organization ID
+            request (UnifiedSearchRequest): The search request
+
+        Returns:
+            CacheKey: (scope, normalized query)
+        """
+        scope = (
+            org_id,
+            request.user_id,
+            request.agent_version,
+            request.feedback_name,
+            request.top_k,
+            request.threshold,
+            bool(request.query_rewrite),
+            _history_hash(request),
+        )
+        return scope, normalize_query(request.query)
+
+    def epoch(self, org_id: str, user_id: str | None) -> Epoch:
+        """
+        Get the current write epoch of a search scope; take it before searching.
+
+        Args:
+            org_id (str): Organization ID
+            user_id (str, optional): User the search is filtered to
+
+        Returns:
+            Epoch: (org epoch, user epoch)
+        """
+        with self._lock:
+            return self._current_epoch(org_id, user_id)
+
+    def _current_epoch(self, org_id: str, user_id: str | None) -> Epoch:
+        user_epoch = self._user_epochs.get((org_id, user_id), 0) if user_id else 0
+        return self._org_epochs.get(org_id, 0), user_epoch
+
+    def get(self, key: CacheKey) -> UnifiedSearchResponse | None:
+        """
+        Look up a response by exact key.
+
+        Args:
+            key (CacheKey): Key from `key`
+
+        Returns:
+            UnifiedSearchResponse | None: A copy of the cached response (without embeddings), or None
+        """
+        if self._entries is None:
+            return None
+        with self._lock:
+            self._counters["lookups"] += 1
+            entry = self._valid_entry(key)
+            if entry is None:
+                return None
+            self._counters["exact_hits"] += 1
+            self._latency_saved_seconds += entry.compute_seconds
+            return entry.response.model_copy(deep=True)
+
+    def get_similar(
+        self, key: CacheKey, embedding: list[float], elapsed_seconds: float
+    ) -> UnifiedSearchResponse | None:
+        """
+        Look up the response of the most similar cached query in the same scope.
+
+        Args:
+            key (CacheKey): Key from `key` (an exact miss)
+            embedding (list[float]): Embedding of the new query
+            elapsed_seconds (float): Time already spent on the new search, for latency-saved metrics
+
+        Returns:
+            UnifiedSearchResponse | None: A copy of the cached response (without embeddings), or None
+        """
+        if self._entries is None or self.similarity_threshold <= 0 or not embedding:
+            return None
+        query_vector = self._unit(embedding)
+        if query_vector is None:
+            return None
+        scope = key[0]
+        with self._lock:
+            candidates = self._embeddings.get(scope)
+            if not candidates:
+                return None
+            best_query, best_similarity = None, self.similarity_threshold
+            for vector, query in candidates:
+                if vector.shape != query_vector.shape:
+                    continue
+                similarity = float(vector @ query_vector)
+                if similarity >= best_similarity:
+                    best_query, best_similarity = query, similarity
+            if best_query is None:
+                return None
+            entry = self._valid_entry((scope, best_query))
+            if entry is None:
+                return None
+            self._counters["similar_hits"] += 1
+            self._latency_saved_seconds += max(
+                entry.compute_seconds - elapsed_seconds, 0.0
+            )
+            return entry.response.model_copy(deep=True)
+
+    def put(
+        self,
+        key: CacheKey,
+        response: UnifiedSearchResponse,
+        epoch: Epoch,
+        compute_seconds: float,
+        embedding: list[float] | None = None,
+    ) -> None:
+        """
+        Cache a successful response unless a write happened while it was computed.
+
+        Args:
+            key (CacheKey): Key from `key`
+            response (UnifiedSearchResponse): The response to cache (copied without embeddings)
+            epoch (Epoch): Epoch taken with `epoch` before the search started
+            compute_seconds (float): How long the search took
+            embedding (list[float], optional): Query embedding, for similarity lookups
+        """
+        if self._entries is None or not response.success:
+            return
+        stripped = _strip_embeddings(response)
+        query_vector = self._unit(embedding) if embedding else None
+        scope, query = key
+        with self._lock:
+            if self._current_epoch(scope[0], scope[1]) != epoch:
+                return
+            self._entries[key] = _Entry(stripped, epoch, compute_seconds)
+            self._counters["stores"] += 1
+            if query_vector is not None and self.similarity_threshold > 0:
+                candidates = self._embeddings.get(scope)
+                if candidates is None:
+                    candidates = deque(maxlen=_MAX_SIMILAR_CANDIDATES)
+                    self._embeddings[scope] = candidates
+                candidates.appendleft((query_vector, query))
+
+    def invalidate(self, org_id: str, user_id: str | None = None) -> None:
+        """
+        Invalidate cached searches of an org, or only those filtered to one user.
+
+        Args:
+            org_id (str): Organization whose data was written
+            user_id (str, optional): Only invalidate searches for this user (per-user profile writes)
+        """
+        if self._entries is None:
+            return
+        with self._lock:
+            if user_id:
+                key = (org_id, user_id)
+                self._user_epochs[key] = self._user_epochs.get(key, 0) + 1
+            else:
+                self._org_epochs[org_id] = self._org_epochs.get(org_id, 0) + 1
+            self._counters["invalidations"] += 1
+
+    def _valid_entry(self, key: CacheKey) -> _Entry | None:
+        """Get a cached entry, dropping it if a write happened since it was computed."""
+        entry = self._entries.get(key) if self._entries is not None else None
+        if entry is None:
+            return None
+        scope = key[0]
+        if entry.epoch != self._current_epoch(scope[0], scope[1]):
+            del self._entries[key]
+            self._counters["stale_drops"] += 1
+            return None
+        return entry
+
+    @staticmethod
+    def _unit(embedding: list[float]) -> np.ndarray | None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else None
+
+    def stats(self) -> dict:
+        """
+        Get hit/miss counters.
+
+        Returns:
+            dict: lookups, exact/similar hits, misses, stores, invalidations, stale drops, hit rate,
+                latency saved and current/max size
+        """
+        with self._lock:
+            hits = self._counters["exact_hits"] + self._counters["similar_hits"]
+            lookups = self._counters["lookups"]
+            return {
+                **self._counters,
+                "misses": lookups - hits,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "latency_saved_seconds": self._latency_saved_seconds,
+                "size": len(self._entries) if self._entries is not None else 0,
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "similarity_threshold": self.similarity_threshold,
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            if self._entries is not None:
+                self._entries.clear()
+            self._embeddings.clear()
+            for name in self._counters:
+                self._counters[name] = 0
+            self._latency_saved_seconds = 0.0
+
+
+_search_result_cache = SearchResultCache(
+    UNIFIED_SEARCH_CACHE_SIZE,
+    UNIFIED_SEARCH_CACHE_TTL_SECONDS,
+    UNIFIED_SEARCH_CACHE_SIMILARITY,
+)
+
+
+def get_search_result_cache() -> SearchResultCache:
+    """Get the process-wide unified search result cache."""
+    return _search_result_cache
+
+
+def get_search_cache_stats() -> dict:
+    """Get hit/miss counters of the process-wide unified search result cache."""
+    return _search_result_cache.stats()
+
+
+def clear_search_result_cache() -> None:
+    """Clear the unified search result cache and reset counters (for testing/admin)."""
+    _search_result_cache.clear()
@@ -3,11 +3,14 @@ Utils for service layer
 """
 
 import ast
+import asyncio
 import json
 import logging
 import re
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
 from reflexio_commons.api_schema.internal_schema import RequestInteractionDataModel
 from reflexio_commons.api_schema.service_schemas import (
@@ -15,10 +18,20 @@ from reflexio_commons.api_schema.service_schemas import (
     UserActionType,
 )
 
+from reflexio.server.llm.litellm_client import is_rate_limit_error
+from reflexio.server.llm.llm_event_loop import run_on_llm_event_loop
 from reflexio.server.prompt.prompt_manager import PromptManager
 
 logger = logging.getLogger(__name__)
 
+TItem = TypeVar("TItem")
+TTaskResult = TypeVar("TTaskResult")
+
+# A rate-limited LLM task is retried up to this many times; each rate limit halves the number of
+# tasks kept in flight and waits RATE_LIMIT_BACKOFF_SECONDS * 2^(retry - 1) before retrying
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF_SECONDS = 2.0
+
 # Custom log level for model responses (between INFO=20 and WARNING=30)
 MODEL_RESPONSE_LEVEL = 25
 logging.addLevelName(MODEL_RESPONSE_LEVEL, "MODEL_RESPONSE")
@@ -480,6 +493,82 @@ def format_messages_for_logging(messages: list[dict[str, Any]]) -> str:
     return "\n".join(formatted_parts)
 
 
+def run_llm_tasks_concurrently(
+    task: Callable[[TItem], Awaitable[TTaskResult]],
+    items: list[TItem],
+    max_concurrency: int,
+) -> list[TTaskResult | None]:
+    """
+    Await task(item) for every item on the shared LLM event loop with at most max_concurrency
+    tasks in flight, returning results in input order.
+
+    When a task raises a rate limit error the in-flight window is halved (growing back by one per
+    success) and the item is retried after a backoff. Items whose task fails otherwise, or is
+    still rate-limited after RATE_LIMIT_RETRIES, yield None. Blocks the calling thread until all
+    items are done; cancelling the calling executor task cancels the remaining ones.
+
+    Args:
+        task (Callable): Coroutine function making the async LLM call(s) for one item
+        items (list): Items to process
+        max_concurrency (int): Max tasks in flight at once
+
+    Returns:
+        list: task(item) per item (None where it failed), in the order of items
+    """
+    return run_on_llm_event_loop(_run_llm_tasks(task, items, max(1, max_concurrency)))
+
+
+async def _run_llm_tasks(
+    task: Callable[[TItem], Awaitable[TTaskResult]],
+    items: list[TItem],
+    max_concurrency: int,
+) -> list[TTaskResult | None]:
+    results: list[TTaskResult | None] = [None] * len(items)
+    retries = [0] * len(items)
+    delays = [0.0] * len(items)
+    pending = deque(range(len(items)))
+    in_flight: dict[asyncio.Task, int] = {}
+    window = max_concurrency
+
+    async def run(index: int, delay: float) -> TTaskResult:
+        if delay:
+            await asyncio.sleep(delay)
+        return await task(items[index])
+
+    try:
+        while pending or in_flight:
+            while pending and len(in_flight) < window:
+                index = pending.popleft()
+                in_flight[asyncio.ensure_future(run(index, delays[index]))] = index
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                error = future.exception()
+                if error is None:
+                    results[index] = future.result()
+                    window = min(window + 1, max_concurrency)
+                elif is_rate_limit_error(error) and retries[index] < RATE_LIMIT_RETRIES:
+                    retries[index] += 1
+                    window = max(1, window // 2)
+                    delays[index] = RATE_LIMIT_BACKOFF_SECONDS * 2 ** (
+                        retries[index] - 1
+                    )
+                    logger.warning(
+                        "LLM task rate limited (retry %d/%d), lowering concurrency to %d and retrying in %.1fs",
+                        retries[index],
+                        RATE_LIMIT_RETRIES,
+                        window,
+                        delays[index],
+                    )
+                    pending.appendleft(index)
+                else:
+                    logger.error("LLM task failed: %s", error)
+    finally:
+        for future in in_flight:
+            future.cancel()
+    return results
+
+
 # Example usage
 if __name__ == "__main__":
     test_string = """'Based on the existing profiles (which are currently empty) and the new interaction indicating a preference for sushi, the update would involve adding a new profile that reflects this preference. Here's the JSON format for the updates:\n\n```json\n{\n    "add_profile": ["I like sushi"],\n    "delete_profile": []\n}\n```'"""
@@ -4,7 +4,10 @@ import threading
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import TypeVar
 
+from cachetools import LRUCache
+from pydantic import BaseModel
 from reflexio_commons.api_schema.internal_schema import RequestInteractionDataModel
 from reflexio_commons.api_schema.retriever_schema import (
     SearchInteractionRequest,
@@ -26,15 +29,92 @@ from reflexio_commons.api_schema.service_schemas import (
     Status,
     UserProfile,
 )
+from reflexio_commons.api_schema.validators import COMPACT_EMBEDDING_JSON_CONTEXT
 from reflexio_commons.config_schema import StorageConfigLocal
 
 from reflexio import data
-from reflexio.server import LOCAL_STORAGE_PATH
+from reflexio.server import LOCAL_STORAGE_MODEL_CACHE_SIZE, LOCAL_STORAGE_PATH
 from reflexio.server.services.storage.error import StorageError
+from reflexio.server.services.storage.local_search_index import (
+    LocalVectorIndex,
+    bm25_rank,
+    reciprocal_rank_fusion,
+)
 from reflexio.server.services.storage.storage_base import BaseStorage
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# ==============================
+# In-process cache
+# ==============================
+# Shared by every LocalJsonStorage instance in the process, keyed by file path:
+# - the decoded JSON document, reused while the file's (mtime_ns, size) signature is unchanged
+# - parsed pydantic models, keyed by (model name, raw record JSON) so an updated record is
+#   simply a new key; the whole model cache is dropped when another writer changes the file
+_cache_lock = threading.Lock()
+_document_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+_generations: dict[str, int] = {}
+_model_caches: dict[str, LRUCache] = {}
+_cache_counters = {
+    "document_hits": 0,
+    "document_misses": 0,
+    "model_hits": 0,
+    "model_misses": 0,
+    "invalidations": 0,
+}
+# Vector indexes persisted next to the JSON file, keyed by index path
+_vector_index_lock = threading.Lock()
+_vector_indexes: dict[str, LocalVectorIndex] = {}
+
+
+def _copy_document(value: dict | list) -> dict | list:
+    """Copy the dict/list structure of a decoded storage document.
+
+    Records are stored as immutable JSON strings, so only containers need copying; this keeps
+    the cached document safe from callers that mutate what `_load()` returns.
+    """
+    if isinstance(value, dict):
+        return {
+            k: _copy_document(v) if isinstance(v, dict | list) else v
+            for k, v in value.items()
+        }
+    if value and isinstance(value[0], dict | list):
+        return [_copy_document(v) for v in value]
+    return list(value)
+
+
+def _file_signature(file_path: str) -> tuple[int, int]:
+    stat = Path(file_path).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_local_storage_cache_stats() -> dict:
+    """Get hit/miss counters for the LocalJsonStorage in-process cache.
+
+    Returns:
+        dict: Document and parsed-model hit/miss counts, invalidations, and cached model count
+    """
+    with _cache_lock:
+        return {
+            **_cache_counters,
+            "cached_models": sum(len(cache) for cache in _model_caches.values()),
+            "max_models_per_file": LOCAL_STORAGE_MODEL_CACHE_SIZE,
+        }
+
+
+def clear_local_storage_cache() -> None:
+    """Drop all cached documents, models and loaded vector indexes, and reset counters (for testing/admin)."""
+    with _cache_lock:
+        _document_cache.clear()
+        _generations.clear()
+        _model_caches.clear()
+        for key in _cache_counters:
+            _cache_counters[key] = 0
+    with _vector_index_lock:
+        _vector_indexes.clear()
+
 
 def _matches_status_filter(
     item_status: Status | None,
@@ -78,8 +158,15 @@ class LocalJsonStorage(BaseStorage):
         org_id: str,
         base_dir: str | None = None,
         config: StorageConfigLocal | None = None,
+        enable_model_cache: bool | None = None,
     ) -> None:
         self.config: StorageConfigLocal | None = config
+        # Serve repeated reads from the in-process document/model cache (see LOCAL_STORAGE_MODEL_CACHE_SIZE)
+        self.enable_model_cache: bool = (
+            LOCAL_STORAGE_MODEL_CACHE_SIZE > 0
+            if enable_model_cache is None
+            else enable_model_cache
+        )
         if self.config:
             base_dir = self.config.dir_path
             if not Path(base_dir).is_absolute():
@@ -118,12 +205,81 @@ class LocalJsonStorage(BaseStorage):
             self._save({})
 
     def _load(self) -> dict:
+        if not self.enable_model_cache:
+            with Path(self.file_path).open(encoding="utf-8") as file:
+                return json.load(file)
+
+        signature = _file_signature(self.file_path)
+        with _cache_lock:
+            cached = _document_cache.get(self.file_path)
+            if cached is not None and cached[0] == signature:
+                _cache_counters["document_hits"] += 1
+                return _copy_document(cached[1])  # type: ignore[reportReturnType]
+            _cache_counters["document_misses"] += 1
+
         with Path(self.file_path).open(encoding="utf-8") as file:
-            return json.load(file)
+            all_memories = json.load(file)
+        with _cache_lock:
+            if cached is not None:
+                # Another writer changed the file behind our back
+                self._invalidate_cache_locked()
+            _document_cache[self.file_path] = (signature, all_memories)
+        return _copy_document(all_memories)  # type: ignore[reportReturnType]
 
     def _save(self, all_memories: dict) -> None:
         with Path(self.file_path).open("w", encoding="utf-8") as file:
             json.dump(all_memories, file)
+        if self.enable_model_cache:
+            # Write-through: the saved document becomes the cached one
+            snapshot = _copy_document(all_memories)
+            signature = _file_signature(self.file_path)
+            with _cache_lock:
+                _document_cache[self.file_path] = (signature, snapshot)  # type: ignore[reportArgumentType]
+                _generations[self.file_path] = _generations.get(self.file_path, 0) + 1
+
+    def _invalidate_cache_locked(self) -> None:
+        """Drop parsed models for this file and bump its generation. Caller holds `_cache_lock`."""
+        _model_caches.pop(self.file_path, None)
+        _generations[self.file_path] = _generations.get(self.file_path, 0) + 1
+        _cache_counters["invalidations"] += 1
+
+    @property
+    def cache_generation(self) -> int:
+        """Number of times this org's storage file has changed since the process started."""
+        with _cache_lock:
+            return _generations.get(self.file_path, 0)
+
+    def _parse(self, model_cls: type[ModelT], record_json: str) -> ModelT:
+        """
+        Parse a stored record, reusing a previously parsed model for the same JSON when cached.
+
+        A deep copy is returned so callers can freely modify the result, including in-place changes
+        to its lists and dicts (embedding, custom_features), without touching the cached model.
+
+        Args:
+            model_cls (type[ModelT]): Pydantic model class of the record
+            record_json (str): Raw JSON string as stored in the file
+
+        Returns:
+            ModelT: Parsed model
+        """
+        if not self.enable_model_cache:
+            return model_cls.model_validate_json(record_json)
+        key = (model_cls.__name__, record_json)
+        with _cache_lock:
+            model_cache = _model_caches.get(self.file_path)
+            if model_cache is None:
+                model_cache = LRUCache(maxsize=LOCAL_STORAGE_MODEL_CACHE_SIZE)
+                _model_caches[self.file_path] = model_cache
+            model = model_cache.get(key)
+            if model is not None:
+                _cache_counters["model_hits"] += 1
+                return model.model_copy(deep=True)
+            _cache_counters["model_misses"] += 1
+        model = model_cls.model_validate_json(record_json)
+        with _cache_lock:
+            model_cache[key] = model
+        return model.model_copy(deep=True)
 
     def _load_operation_states(self) -> tuple[dict, dict]:
         """
@@ -143,6 +299,131 @@ class LocalJsonStorage(BaseStorage):
         """Return a timezone-aware ISO timestamp for updated_at."""
         return datetime.now(timezone.utc).isoformat()
 
+    # ==============================
+    # Vector index / hybrid search helpers
+    # ==============================
+
+    # Collection name -> (model class, id field) for records that carry embeddings
+    _VECTOR_COLLECTIONS: dict[str, tuple[type[BaseModel], str]] = {
+        "profiles": (UserProfile, "profile_id"),
+        "raw_feedbacks": (RawFeedback, "raw_feedback_id"),
+        "feedbacks": (Feedback, "feedback_id"),
+        "skills": (Skill, "skill_id"),
+    }
+
+    def _vector_index(self, collection: str) -> LocalVectorIndex:
+        """
+        Get the vector index for a collection, backfilling it from stored embeddings on first use.
+
+        Args:
+            collection (str): One of the keys of `_VECTOR_COLLECTIONS`
+
+        Returns:
+            LocalVectorIndex: Index persisted at `<base_dir>/vector_index_<org_id>/<collection>.npz`
+        """
+        path = str(
+            Path(self.base_dir) / f"vector_index_{self.org_id}" / f"{collection}.npz"
+        )
+        with _vector_index_lock:
+            index = _vector_indexes.get(path)
+            if index is None:
+                index = LocalVectorIndex(path)
+                if not index.exists_on_disk:
+                    index.upsert(self._stored_embeddings(collection))
+                _vector_indexes[path] = index
+        return index
+
+    def _stored_embeddings(self, collection: str) -> dict[str, list[float]]:
+        """Collect the embeddings saved in the JSON file for a collection, keyed by record id."""
+        model_cls, id_field = self._VECTOR_COLLECTIONS[collection]
+        all_memories = self._load()
+        if collection == "profiles":
+            records = [
+                profile_json
+                for user_id in self._get_user_ids(all_memories)
+                if isinstance(all_memories[user_id], dict)
+                for profile_json in all_memories[user_id].get("profiles", [])
+            ]
+        else:
+            records = all_memories.get(collection, [])
+        embeddings = {}
+        for record_json in records:
+            record = self._parse(model_cls, record_json)
+            if getattr(record, "embedding", None):
+                embeddings[str(getattr(record, id_field))] = record.embedding  # type: ignore[attr-defined]
+        return embeddings
+
+    def _index_embeddings(self, collection: str, records: list[BaseModel]) -> None:
+        """
+        Sync saved records into the collection's vector index.
+
+        Records saved without an embedding are removed from the index so a reused id never
+        matches on a previous record's vector.
+
+        Args:
+            collection (str): One of the keys of `_VECTOR_COLLECTIONS`
+            records (list[BaseModel]): Saved records (with ids assigned)
+        """
+        _, id_field = self._VECTOR_COLLECTIONS[collection]
+        index = self._vector_index(collection)
+        embeddings = {
+            str(getattr(record, id_field)): getattr(record, "embedding", None) or []
+            for record in records
+        }
+        index.remove([doc_id for doc_id, vec in embeddings.items() if not vec])
+        index.upsert({doc_id: vec for doc_id, vec in embeddings.items() if vec})
+
+    def _hybrid_rank(
+        self,
+        collection: str,
+        documents: dict[str, str],
+        query: str | None,
+        query_embedding: list[float] | None,
+        match_threshold: float,
+        match_count: int,
+    ) -> list[str]:
+        """
+        Rank already-filtered records the way the Supabase `hybrid_match_*` RPCs do.
+
+        The keyword ranking is BM25, followed by any remaining substring matches so partial-word
+        queries still match. The vector ranking comes from the collection's vector index. Both
+        lists are merged with reciprocal rank fusion.
+
+        Args:
+            collection (str): One of the keys of `_VECTOR_COLLECTIONS`
+            documents (dict[str, str]): Searchable text of the candidate records, keyed by record id
+            query (str, optional): Text query
+            query_embedding (list[float], optional): Query embedding for vector search
+            match_threshold (float): Minimum cosine similarity for vector matches
+            match_count (int): Maximum number of ids to return
+
+        Returns:
+            list[str]: Ids of the best matching records, best first
+        """
+        rankings: list[list[str]] = []
+        if query:
+            lexical = [
+                doc_id
+                for doc_id, _ in bm25_rank(query, documents, limit=match_count * 3)
+            ]
+            seen = set(lexical)
+            needle = query.lower()
+            lexical.extend(
+                doc_id
+                for doc_id, text in documents.items()
+                if doc_id not in seen and needle in text.lower()
+            )
+            rankings.append(lexical)
+        if query_embedding:
+            vector_matches = self._vector_index(collection).search(
+                query_embedding,
+                top_k=match_count * 3,
+                candidate_ids=list(documents),
+                min_similarity=match_threshold,
+            )
+            rankings.append([doc_id for doc_id, _ in vector_matches])
+        return [doc_id for doc_id, _ in reciprocal_rank_fusion(rankings)][:match_count]
+
     # ==============================
     # CRUD methods
     # ==============================
@@ -161,7 +442,7 @@ class LocalJsonStorage(BaseStorage):
         for user_data in all_memories.values():
             if "profiles" in user_data:
                 for profile in user_data["profiles"]:
-                    profile_obj = UserProfile.model_validate_json(profile)
+                    profile_obj = self._parse(UserProfile, profile)
                     # Apply status filter - compare Status enum values
                     profile_matches_filter = False
                     for status in status_filter:
@@ -202,7 +483,7 @@ class LocalJsonStorage(BaseStorage):
         for user_data in all_memories.values():
             if "interactions" in user_data:
                 interactions.extend(
-                    Interaction.model_validate_json(interaction)
+                    self._parse(Interaction, interaction)
                     for interaction in user_data["interactions"]
                 )
 
@@ -228,7 +509,7 @@ class LocalJsonStorage(BaseStorage):
 
         profiles = []
         for profile in all_memories[user_id]["profiles"]:
-            profile_obj = UserProfile.model_validate_json(profile)
+            profile_obj = self._parse(UserProfile, profile)
             # Apply status filter - compare Status enum values
             profile_matches_filter = False
             for status in status_filter:
@@ -270,7 +551,7 @@ class LocalJsonStorage(BaseStorage):
 
         interactions = all_memories[user_id]["interactions"]
         return [
-            Interaction.model_validate_json(interaction_dict)
+            self._parse(Interaction, interaction_dict)
             for interaction_dict in interactions
         ]
 
@@ -284,9 +565,13 @@ class LocalJsonStorage(BaseStorage):
                 all_memories[user_id]["profiles"] = []
 
             all_memories[user_id]["profiles"].extend(
-                [profile.model_dump_json() for profile in user_profiles]
+                [
+                    profile.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+                    for profile in user_profiles
+                ]
             )
             self._save(all_memories)
+        self._index_embeddings("profiles", user_profiles)  # type: ignore[arg-type]
 
     def _get_next_interaction_id(self, all_memories: dict) -> int:
         """
@@ -309,7 +594,7 @@ class LocalJsonStorage(BaseStorage):
             interactions = user_data.get("interactions", [])
             for interaction_json in interactions:
                 try:
-                    interaction = Interaction.model_validate_json(interaction_json)
+                    interaction = self._parse(Interaction, interaction_json)
                     if interaction.interaction_id > max_id:
                         max_id = interaction.interaction_id
                 except Exception:  # noqa: PERF203, S112
@@ -328,7 +613,9 @@ class LocalJsonStorage(BaseStorage):
             if interaction.interaction_id == 0:
                 interaction.interaction_id = self._get_next_interaction_id(all_memories)
 
-            all_memories[user_id]["interactions"].append(interaction.model_dump_json())
+            all_memories[user_id]["interactions"].append(
+                interaction.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+            )
             self._save(all_memories)
 
     def add_user_interactions_bulk(
@@ -361,7 +648,7 @@ class LocalJsonStorage(BaseStorage):
                         all_memories
                     )
                 all_memories[user_id]["interactions"].append(
-                    interaction.model_dump_json()
+                    interaction.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
                 )
 
             self._save(all_memories)
@@ -381,7 +668,7 @@ class LocalJsonStorage(BaseStorage):
             all_memories[request.user_id]["interactions"] = [
                 interaction
                 for interaction in all_memories[request.user_id]["interactions"]
-                if Interaction.model_validate_json(interaction).interaction_id
+                if self._parse(Interaction, interaction).interaction_id
                 != request.interaction_id
             ]
             self._save(all_memories)
@@ -402,8 +689,7 @@ class LocalJsonStorage(BaseStorage):
             all_memories[request.user_id]["profiles"] = [
                 profile
                 for profile in all_memories[request.user_id]["profiles"]
-                if UserProfile.model_validate_json(profile).profile_id
-                != request.profile_id
+                if self._parse(UserProfile, profile).profile_id != request.profile_id
             ]
             self._save(all_memories)
 
@@ -420,11 +706,14 @@ class LocalJsonStorage(BaseStorage):
                 return
 
             for i, profile in enumerate(all_memories[user_id]["profiles"]):
-                profile_obj = UserProfile.model_validate_json(profile)
+                profile_obj = self._parse(UserProfile, profile)
                 if profile_obj.profile_id == profile_id:
-                    all_memories[user_id]["profiles"][i] = new_profile.model_dump_json()
+                    all_memories[user_id]["profiles"][i] = new_profile.model_dump_json(
+                        context=COMPACT_EMBEDDING_JSON_CONTEXT
+                    )
                     break
             self._save(all_memories)
+        self._index_embeddings("profiles", [new_profile])
 
     def delete_all_interactions_for_user(self, user_id: str) -> None:
         with self._lock:
@@ -461,6 +750,7 @@ class LocalJsonStorage(BaseStorage):
                 if "profiles" in all_memories[user_id]:
                     all_memories[user_id]["profiles"] = []
             self._save(all_memories)
+        self._vector_index("profiles").clear()
 
     def delete_all_interactions(self) -> None:
         """Delete all interactions across all users."""
@@ -506,7 +796,7 @@ class LocalJsonStorage(BaseStorage):
             for user_id, user_data in all_memories.items():
                 if isinstance(user_data, dict) and "interactions" in user_data:
                     for interaction_json in user_data["interactions"]:
-                        interaction = Interaction.model_validate_json(interaction_json)
+                        interaction = self._parse(Interaction, interaction_json)
                         all_interactions.append((user_id, interaction))
 
             if not all_interactions:
@@ -527,7 +817,7 @@ class LocalJsonStorage(BaseStorage):
                         for ij in user_data["interactions"]
                         if (
                             user_id,
-                            Interaction.model_validate_json(ij).interaction_id,
+                            self._parse(Interaction, ij).interaction_id,
                         )
                         not in ids_to_delete
                     ]
@@ -565,7 +855,7 @@ class LocalJsonStorage(BaseStorage):
                     continue
 
                 for i, profile_json in enumerate(all_memories[user_id]["profiles"]):
-                    profile_obj = UserProfile.model_validate_json(profile_json)
+                    profile_obj = self._parse(UserProfile, profile_json)
 
                     # Check if profile matches old_status
                     status_matches = False
@@ -589,7 +879,9 @@ class LocalJsonStorage(BaseStorage):
                             datetime.now(timezone.utc).timestamp()
                         )
                         all_memories[user_id]["profiles"][i] = (
-                            profile_obj.model_dump_json()
+                            profile_obj.model_dump_json(
+                                context=COMPACT_EMBEDDING_JSON_CONTEXT
+                            )
                         )
                         updated_count += 1
 
@@ -624,7 +916,7 @@ class LocalJsonStorage(BaseStorage):
                 # Filter out profiles that match the status
                 new_profiles = []
                 for profile_json in all_memories[user_id]["profiles"]:
-                    profile_obj = UserProfile.model_validate_json(profile_json)
+                    profile_obj = self._parse(UserProfile, profile_json)
 
                     # Check if profile matches the status to delete
                     should_delete = False
@@ -661,7 +953,7 @@ class LocalJsonStorage(BaseStorage):
                 continue
 
             for profile_json in all_memories[user_id]["profiles"]:
-                profile_obj = UserProfile.model_validate_json(profile_json)
+                profile_obj = self._parse(UserProfile, profile_json)
 
                 # Check if profile matches the status
                 status_matches = False
@@ -700,14 +992,18 @@ class LocalJsonStorage(BaseStorage):
             # Check if request already exists and update it, otherwise append
             request_exists = False
             for i, existing_request_json in enumerate(all_memories["requests"]):
-                existing_request = Request.model_validate_json(existing_request_json)
+                existing_request = self._parse(Request, existing_request_json)
                 if existing_request.request_id == request.request_id:
-                    all_memories["requests"][i] = request.model_dump_json()
+                    all_memories["requests"][i] = request.model_dump_json(
+                        context=COMPACT_EMBEDDING_JSON_CONTEXT
+                    )
                     request_exists = True
                     break
 
             if not request_exists:
-                all_memories["requests"].append(request.model_dump_json())
+                all_memories["requests"].append(
+                    request.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+                )
 
             self._save(all_memories)
 
@@ -727,7 +1023,7 @@ class LocalJsonStorage(BaseStorage):
             return None
 
         for request_json in all_memories["requests"]:
-            request = Request.model_validate_json(request_json)
+            request = self._parse(Request, request_json)
             if request.request_id == request_id:
                 return request
 
@@ -749,7 +1045,7 @@ class LocalJsonStorage(BaseStorage):
                     all_memories[user_id]["interactions"] = [
                         interaction_json
                         for interaction_json in all_memories[user_id]["interactions"]
-                        if Interaction.model_validate_json(interaction_json).request_id
+                        if self._parse(Interaction, interaction_json).request_id
                         != request_id
                     ]
 
@@ -760,7 +1056,7 @@ class LocalJsonStorage(BaseStorage):
             all_memories["requests"] = [
                 request_json
                 for request_json in all_memories["requests"]
-                if Request.model_validate_json(request_json).request_id != request_id
+                if self._parse(Request, request_json).request_id != request_id
             ]
             self._save(all_memories)
 
@@ -783,7 +1079,7 @@ class LocalJsonStorage(BaseStorage):
 
             request_ids = []
             for request_json in all_memories["requests"]:
-                request = Request.model_validate_json(request_json)
+                request = self._parse(Request, request_json)
                 if request.session_id == session_id:
                     request_ids.append(request.request_id)
 
@@ -796,7 +1092,7 @@ class LocalJsonStorage(BaseStorage):
                     all_memories[user_id]["interactions"] = [
                         interaction_json
                         for interaction_json in all_memories[user_id]["interactions"]
-                        if Interaction.model_validate_json(interaction_json).request_id
+                        if self._parse(Interaction, interaction_json).request_id
                         not in request_ids
                     ]
 
@@ -804,7 +1100,7 @@ class LocalJsonStorage(BaseStorage):
             all_memories["requests"] = [
                 request_json
                 for request_json in all_memories["requests"]
-                if Request.model_validate_json(request_json).session_id != session_id
+                if self._parse(Request, request_json).session_id != session_id
             ]
 
             self._save(all_memories)
@@ -843,7 +1139,7 @@ class LocalJsonStorage(BaseStorage):
 
         requests = []
         for request_json in all_memories["requests"]:
-            request = Request.model_validate_json(request_json)
+            request = self._parse(Request, request_json)
             if request.user_id == user_id and request.session_id == session_id:
                 requests.append(request)
 
@@ -882,7 +1178,7 @@ class LocalJsonStorage(BaseStorage):
 
         requests = []
         for request_json in all_memories["requests"]:
-            req = Request.model_validate_json(request_json)
+            req = self._parse(Request, request_json)
 
             # Filter by user_id if specified
             if user_id and req.user_id != user_id:
@@ -921,23 +1217,16 @@ class LocalJsonStorage(BaseStorage):
                 groups_dict[group_name] = []
             groups_dict[group_name].append(req)
 
-        # Get all interactions - if user_id is specified, filter by user, otherwise get all
-        if user_id:
-            user_interactions = self.get_user_interaction(user_id)
-        else:
-            # Get interactions for all requests we're returning
-            all_interactions_list = []
-            if "interactions" in all_memories:
-                for interaction_json in all_memories["interactions"]:
-                    interaction = Interaction.model_validate_json(interaction_json)
-                    # Only include interactions for requests we're returning
-                    if any(
-                        interaction.request_id == req.request_id
-                        for group_requests in groups_dict.values()
-                        for req in group_requests
-                    ):
-                        all_interactions_list.append(interaction)
-            user_interactions = all_interactions_list
+        # Get interactions for the requests we're returning from the user's bucket,
+        # or from every user bucket when no user_id is given
+        returned_request_ids = {req.request_id for req in requests}
+        user_ids = [user_id] if user_id else self._get_user_ids(all_memories)
+        user_interactions = []
+        for uid in user_ids:
+            for interaction_json in all_memories.get(uid, {}).get("interactions", []):
+                interaction = self._parse(Interaction, interaction_json)
+                if interaction.request_id in returned_request_ids:
+                    user_interactions.append(interaction)
 
         # Group interactions by request_id
         interactions_by_request_id = {}
@@ -997,7 +1286,7 @@ class LocalJsonStorage(BaseStorage):
 
         user_ids: set[str] = set()
         for request_json in all_memories["requests"]:
-            req = Request.model_validate_json(request_json)
+            req = self._parse(Request, request_json)
 
             if user_id and req.user_id != user_id:
                 continue
@@ -1024,7 +1313,9 @@ class LocalJsonStorage(BaseStorage):
             if "profile_change_logs" not in all_memories:
                 all_memories["profile_change_logs"] = []
             all_memories["profile_change_logs"].append(
-                profile_change_log.model_dump_json()
+                profile_change_log.model_dump_json(
+                    context=COMPACT_EMBEDDING_JSON_CONTEXT
+                )
             )
             self._save(all_memories)
 
@@ -1034,7 +1325,7 @@ class LocalJsonStorage(BaseStorage):
         if "profile_change_logs" not in all_memories:
             return []
         return [
-            ProfileChangeLog.model_validate_json(log_json)
+            self._parse(ProfileChangeLog, log_json)
             for log_json in all_memories["profile_change_logs"][:limit]
         ]
 
@@ -1046,7 +1337,7 @@ class LocalJsonStorage(BaseStorage):
             all_memories["profile_change_logs"] = [
                 log_json
                 for log_json in all_memories["profile_change_logs"]
-                if ProfileChangeLog.model_validate_json(log_json).user_id != user_id
+                if self._parse(ProfileChangeLog, log_json).user_id != user_id
             ]
             self._save(all_memories)
 
@@ -1069,7 +1360,7 @@ class LocalJsonStorage(BaseStorage):
             if "feedback_aggregation_change_logs" not in all_memories:
                 all_memories["feedback_aggregation_change_logs"] = []
             all_memories["feedback_aggregation_change_logs"].append(
-                change_log.model_dump_json()
+                change_log.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
             )
             self._save(all_memories)
 
@@ -1085,7 +1376,7 @@ class LocalJsonStorage(BaseStorage):
             return []
         logs = []
         for log_json in all_memories["feedback_aggregation_change_logs"]:
-            log = FeedbackAggregationChangeLog.model_validate_json(log_json)
+            log = self._parse(FeedbackAggregationChangeLog, log_json)
             if (
                 log.feedback_name == feedback_name
                 and log.agent_version == agent_version
@@ -1151,13 +1442,17 @@ class LocalJsonStorage(BaseStorage):
         self,
         search_user_profile_request: SearchUserProfileRequest,
         status_filter: list[Status | None] | None = None,
-        query_embedding: list[float] | None = None,  # noqa: ARG002
+        query_embedding: list[float] | None = None,
     ) -> list[UserProfile]:
         """Search user profile from storage
 
+        Profiles are filtered first, then ranked by BM25 keyword relevance and, when a query
+        embedding is given, vector similarity, fused with RRF like the Supabase hybrid search.
+
         Args:
             search_user_profile_request (SearchUserProfileRequest): _description_
             status_filter (Optional[list[Optional[Status]]]): Filter profiles by status
+            query_embedding (list[float], optional): Query embedding for vector search
 
         Returns:
             list[UserProfile]: _description_
@@ -1175,12 +1470,6 @@ class LocalJsonStorage(BaseStorage):
                 if profile.generated_from_request_id
                 == search_user_profile_request.generated_from_request_id
             ]
-        if search_user_profile_request.query:
-            user_profiles = [
-                profile
-                for profile in user_profiles
-                if search_user_profile_request.query in profile.profile_content
-            ]
         if search_user_profile_request.start_time:
             user_profiles = [
                 profile
@@ -1195,6 +1484,24 @@ class LocalJsonStorage(BaseStorage):
                 if profile.last_modified_timestamp
                 <= search_user_profile_request.end_time.timestamp()
             ]
+        if search_user_profile_request.query or query_embedding:
+            profiles_by_id = {profile.profile_id: profile for profile in user_profiles}
+            ranked_ids = self._hybrid_rank(
+                "profiles",
+                {
+                    profile_id: profile.profile_content
+                    for profile_id, profile in profiles_by_id.items()
+                },
+                search_user_profile_request.query,
+                query_embedding,
+                match_threshold=(
+                    0.7
+                    if search_user_profile_request.threshold is None
+                    else search_user_profile_request.threshold
+                ),
+                match_count=search_user_profile_request.top_k or len(profiles_by_id),
+            )
+            user_profiles = [profiles_by_id[profile_id] for profile_id in ranked_ids]
         if search_user_profile_request.top_k:
             user_profiles = user_profiles[: search_user_profile_request.top_k]
 
@@ -1212,7 +1519,7 @@ class LocalJsonStorage(BaseStorage):
         # Find the highest existing raw_feedback_id to auto-increment from
         max_id = 0
         for feedback_json in all_memories["raw_feedbacks"]:
-            feedback = RawFeedback.model_validate_json(feedback_json)
+            feedback = self._parse(RawFeedback, feedback_json)
             if feedback.raw_feedback_id > max_id:
                 max_id = feedback.raw_feedback_id
 
@@ -1222,9 +1529,13 @@ class LocalJsonStorage(BaseStorage):
                 feedback.raw_feedback_id = max_id + i + 1
 
         all_memories["raw_feedbacks"].extend(
-            [feedback.model_dump_json() for feedback in raw_feedbacks]
+            [
+                feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+                for feedback in raw_feedbacks
+            ]
         )
         self._save(all_memories)
+        self._index_embeddings("raw_feedbacks", raw_feedbacks)  # type: ignore[arg-type]
 
     def get_raw_feedbacks(
         self,
@@ -1261,7 +1572,7 @@ class LocalJsonStorage(BaseStorage):
 
         feedbacks = []
         for feedback_json in all_memories["raw_feedbacks"]:
-            feedback = RawFeedback.model_validate_json(feedback_json)
+            feedback = self._parse(RawFeedback, feedback_json)
             # If user_id is specified, filter by it
             if user_id is not None and feedback.user_id != user_id:
                 continue
@@ -1314,7 +1625,7 @@ class LocalJsonStorage(BaseStorage):
 
         count = 0
         for feedback_json in all_memories["raw_feedbacks"]:
-            feedback = RawFeedback.model_validate_json(feedback_json)
+            feedback = self._parse(RawFeedback, feedback_json)
 
             # Apply user_id filter if specified
             if user_id is not None and feedback.user_id != user_id:
@@ -1358,7 +1669,7 @@ class LocalJsonStorage(BaseStorage):
         # Get all request_ids for this session
         request_ids = set()
         for request_json in all_memories.get("requests", []):
-            request = Request.model_validate_json(request_json)
+            request = self._parse(Request, request_json)
             if request.session_id == session_id:
                 request_ids.add(request.request_id)
 
@@ -1368,7 +1679,7 @@ class LocalJsonStorage(BaseStorage):
         # Count raw feedbacks with those request_ids
         count = 0
         for feedback_json in all_memories.get("raw_feedbacks", []):
-            feedback = RawFeedback.model_validate_json(feedback_json)
+            feedback = self._parse(RawFeedback, feedback_json)
             if feedback.request_id in request_ids:
                 count += 1
 
@@ -1379,6 +1690,7 @@ class LocalJsonStorage(BaseStorage):
         if "raw_feedbacks" in all_memories:
             all_memories["raw_feedbacks"] = []
             self._save(all_memories)
+        self._vector_index("raw_feedbacks").clear()
 
     def delete_all_raw_feedbacks_by_feedback_name(
         self, feedback_name: str, agent_version: str | None = None
@@ -1396,7 +1708,7 @@ class LocalJsonStorage(BaseStorage):
                 feedback_json
                 for feedback_json in all_memories["raw_feedbacks"]
                 if not self._should_delete_feedback(
-                    RawFeedback.model_validate_json(feedback_json),
+                    self._parse(RawFeedback, feedback_json),
                     feedback_name,
                     agent_version,
                 )
@@ -1421,6 +1733,7 @@ class LocalJsonStorage(BaseStorage):
         if "feedbacks" in all_memories:
             all_memories["feedbacks"] = []
             self._save(all_memories)
+        self._vector_index("feedbacks").clear()
 
     def delete_feedback(self, feedback_id: int) -> None:
         """Delete a feedback by ID.
@@ -1435,8 +1748,7 @@ class LocalJsonStorage(BaseStorage):
             all_memories["feedbacks"] = [
                 feedback_json
                 for feedback_json in all_memories["feedbacks"]
-                if Feedback.model_validate_json(feedback_json).feedback_id
-                != feedback_id
+                if self._parse(Feedback, feedback_json).feedback_id != feedback_id
             ]
             self._save(all_memories)
 
@@ -1453,7 +1765,7 @@ class LocalJsonStorage(BaseStorage):
             all_memories["raw_feedbacks"] = [
                 feedback_json
                 for feedback_json in all_memories["raw_feedbacks"]
-                if RawFeedback.model_validate_json(feedback_json).raw_feedback_id
+                if self._parse(RawFeedback, feedback_json).raw_feedback_id
                 != raw_feedback_id
             ]
             self._save(all_memories)
@@ -1474,7 +1786,7 @@ class LocalJsonStorage(BaseStorage):
                 feedback_json
                 for feedback_json in all_memories["feedbacks"]
                 if not self._should_delete_feedback(
-                    Feedback.model_validate_json(feedback_json),
+                    self._parse(Feedback, feedback_json),
                     feedback_name,
                     agent_version,
                 )
@@ -1498,7 +1810,7 @@ class LocalJsonStorage(BaseStorage):
         # Assign incremental feedback_ids for local storage
         existing_max_id = 0
         for fb_json in all_memories["feedbacks"]:
-            fb = Feedback.model_validate_json(fb_json)
+            fb = self._parse(Feedback, fb_json)
             if fb.feedback_id and fb.feedback_id > existing_max_id:
                 existing_max_id = fb.feedback_id
 
@@ -1507,9 +1819,13 @@ class LocalJsonStorage(BaseStorage):
                 feedback.feedback_id = existing_max_id + i + 1
 
         all_memories["feedbacks"].extend(
-            [feedback.model_dump_json() for feedback in feedbacks]
+            [
+                feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+                for feedback in feedbacks
+            ]
         )
         self._save(all_memories)
+        self._index_embeddings("feedbacks", feedbacks)  # type: ignore[arg-type]
         return feedbacks
 
     def get_feedbacks(
@@ -1538,7 +1854,7 @@ class LocalJsonStorage(BaseStorage):
 
         feedbacks = []
         for feedback_json in all_memories["feedbacks"]:
-            feedback = Feedback.model_validate_json(feedback_json)
+            feedback = self._parse(Feedback, feedback_json)
 
             # Apply status filter (for Status: CURRENT, ARCHIVED, PENDING, etc.)
             if status_filter is not None:
@@ -1588,11 +1904,13 @@ class LocalJsonStorage(BaseStorage):
         updated_feedbacks = []
 
         for feedback_json in feedbacks:
-            feedback = Feedback.model_validate_json(feedback_json)
+            feedback = self._parse(Feedback, feedback_json)
             if feedback.feedback_id == feedback_id:
                 feedback.feedback_status = feedback_status
                 feedback_found = True
-            updated_feedbacks.append(feedback.model_dump_json())
+            updated_feedbacks.append(
+                feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+            )
 
         if not feedback_found:
             raise ValueError(f"Feedback with ID {feedback_id} not found")
@@ -1617,14 +1935,16 @@ class LocalJsonStorage(BaseStorage):
 
         updated_feedbacks = []
         for feedback_json in all_memories["feedbacks"]:
-            feedback = Feedback.model_validate_json(feedback_json)
+            feedback = self._parse(Feedback, feedback_json)
             # Only archive non-APPROVED feedbacks
             if (
                 self._should_delete_feedback(feedback, feedback_name, agent_version)
                 and feedback.feedback_status != FeedbackStatus.APPROVED
             ):
                 feedback.status = "archived"  # type: ignore[reportAttributeAccessIssue]
-            updated_feedbacks.append(feedback.model_dump_json())
+            updated_feedbacks.append(
+                feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+            )
 
         all_memories["feedbacks"] = updated_feedbacks
         self._save(all_memories)
@@ -1645,13 +1965,15 @@ class LocalJsonStorage(BaseStorage):
 
         updated_feedbacks = []
         for feedback_json in all_memories["feedbacks"]:
-            feedback = Feedback.model_validate_json(feedback_json)
+            feedback = self._parse(Feedback, feedback_json)
             if (
                 self._should_delete_feedback(feedback, feedback_name, agent_version)
                 and feedback.status == "archived"
             ):
                 feedback.status = None
-            updated_feedbacks.append(feedback.model_dump_json())
+            updated_feedbacks.append(
+                feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+            )
 
         all_memories["feedbacks"] = updated_feedbacks
         self._save(all_memories)
@@ -1675,11 +1997,11 @@ class LocalJsonStorage(BaseStorage):
             for feedback_json in all_memories["feedbacks"]
             if not (
                 self._should_delete_feedback(
-                    Feedback.model_validate_json(feedback_json),
+                    self._parse(Feedback, feedback_json),
                     feedback_name,
                     agent_version,
                 )
-                and Feedback.model_validate_json(feedback_json).status == "archived"
+                and self._parse(Feedback, feedback_json).status == "archived"
             )
         ]
         self._save(all_memories)
@@ -1701,13 +2023,15 @@ class LocalJsonStorage(BaseStorage):
 
         updated_feedbacks = []
         for feedback_json in all_memories["feedbacks"]:
-            feedback = Feedback.model_validate_json(feedback_json)
+            feedback = self._parse(Feedback, feedback_json)
             if (
                 feedback.feedback_id in feedback_id_set
                 and feedback.feedback_status != FeedbackStatus.APPROVED
             ):
                 feedback.status = "archived"  # type: ignore[reportAttributeAccessIssue]
-            updated_feedbacks.append(feedback.model_dump_json())
+            updated_feedbacks.append(
+                feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+            )
 
         all_memories["feedbacks"] = updated_feedbacks
         self._save(all_memories)
@@ -1729,13 +2053,15 @@ class LocalJsonStorage(BaseStorage):
 
         updated_feedbacks = []
         for feedback_json in all_memories["feedbacks"]:
-            feedback = Feedback.model_validate_json(feedback_json)
+            feedback = self._parse(Feedback, feedback_json)
             if (
                 feedback.feedback_id in feedback_id_set
                 and feedback.status == "archived"
             ):
                 feedback.status = None
-            updated_feedbacks.append(feedback.model_dump_json())
+            updated_feedbacks.append(
+                feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+            )
 
         all_memories["feedbacks"] = updated_feedbacks
         self._save(all_memories)
@@ -1758,8 +2084,7 @@ class LocalJsonStorage(BaseStorage):
         all_memories["feedbacks"] = [
             feedback_json
             for feedback_json in all_memories["feedbacks"]
-            if Feedback.model_validate_json(feedback_json).feedback_id
-            not in feedback_id_set
+            if self._parse(Feedback, feedback_json).feedback_id not in feedback_id_set
         ]
         self._save(all_memories)
 
@@ -1790,7 +2115,7 @@ class LocalJsonStorage(BaseStorage):
         updated_feedbacks = []
 
         for feedback_json in all_memories["raw_feedbacks"]:
-            feedback_obj = RawFeedback.model_validate_json(feedback_json)
+            feedback_obj = self._parse(RawFeedback, feedback_json)
 
             # Apply optional filters
             if (
@@ -1821,7 +2146,9 @@ class LocalJsonStorage(BaseStorage):
             if status_matches:
                 # Update the raw feedback status
                 feedback_obj.status = new_status
-                updated_feedbacks.append(feedback_obj.model_dump_json())
+                updated_feedbacks.append(
+                    feedback_obj.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+                )
                 updated_count += 1
             else:
                 updated_feedbacks.append(feedback_json)
@@ -1861,7 +2188,7 @@ class LocalJsonStorage(BaseStorage):
         new_feedbacks = []
 
         for feedback_json in all_memories["raw_feedbacks"]:
-            feedback_obj = RawFeedback.model_validate_json(feedback_json)
+            feedback_obj = self._parse(RawFeedback, feedback_json)
 
             # Check if feedback matches the status to delete
             should_delete = False
@@ -1917,7 +2244,7 @@ class LocalJsonStorage(BaseStorage):
             return False
 
         for feedback_json in all_memories["raw_feedbacks"]:
-            feedback_obj = RawFeedback.model_validate_json(feedback_json)
+            feedback_obj = self._parse(RawFeedback, feedback_json)
 
             # Apply optional filters
             if (
@@ -1955,12 +2282,12 @@ class LocalJsonStorage(BaseStorage):
         start_time: int | None = None,
         end_time: int | None = None,
         status_filter: list[Status | None] | None = None,
-        match_threshold: float = 0.5,  # noqa: ARG002
+        match_threshold: float = 0.5,
         match_count: int = 10,
-        query_embedding: list[float] | None = None,  # noqa: ARG002
+        query_embedding: list[float] | None = None,
     ) -> list[RawFeedback]:
         """
-        Search raw feedbacks with advanced filtering (local storage uses text matching, not vector search).
+        Search raw feedbacks with advanced filtering and local hybrid (BM25 + vector, RRF-fused) ranking.
 
         Args:
             query (str, optional): Text query for text search
@@ -1970,8 +2297,9 @@ class LocalJsonStorage(BaseStorage):
             start_time (int, optional): Start timestamp (Unix) for created_at filter
             end_time (int, optional): End timestamp (Unix) for created_at filter
             status_filter (list[Optional[Status]], optional): List of status values to filter by
-            match_threshold (float): Not used in local storage
+            match_threshold (float): Minimum cosine similarity for vector matches
             match_count (int): Maximum number of results to return
+            query_embedding (list[float], optional): Query embedding for vector search
 
         Returns:
             list[RawFeedback]: List of matching raw feedback objects
@@ -1980,28 +2308,19 @@ class LocalJsonStorage(BaseStorage):
         if "raw_feedbacks" not in all_memories:
             return []
 
-        # Build request_id -> user_id map if user_id filter is provided
-        request_user_map: dict[str, str] = {}
-        if user_id:
-            requests_data = all_memories.get("requests", {})
-            for request_json in requests_data.values():
-                req = Request.model_validate_json(request_json)
-                request_user_map[req.request_id] = req.user_id
+        # Build request_id -> Request index if user_id filter is provided
+        request_index = self._build_request_index(all_memories) if user_id else {}
 
         results = []
         for feedback_json in all_memories["raw_feedbacks"]:
-            rf = RawFeedback.model_validate_json(feedback_json)
+            rf = self._parse(RawFeedback, feedback_json)
 
             # Filter by user_id (via request_id)
             if user_id:
-                req_user = request_user_map.get(rf.request_id)
-                if req_user != user_id:
+                req = request_index.get(rf.request_id)
+                if req is None or req.user_id != user_id:
                     continue
 
-            # Filter by query text
-            if query and query.lower() not in rf.feedback_content.lower():
-                continue
-
             # Filter by agent_version
             if agent_version and rf.agent_version != agent_version:
                 continue
@@ -2025,10 +2344,21 @@ class LocalJsonStorage(BaseStorage):
                 continue
 
             results.append(rf)
-            if len(results) >= match_count:
+            if not (query or query_embedding) and len(results) >= match_count:
                 break
 
-        return results
+        if not (query or query_embedding):
+            return results
+        by_id = {str(rf.raw_feedback_id): rf for rf in results}
+        ranked_ids = self._hybrid_rank(
+            "raw_feedbacks",
+            {doc_id: rf.feedback_content for doc_id, rf in by_id.items()},
+            query,
+            query_embedding,
+            match_threshold,
+            match_count,
+        )
+        return [by_id[doc_id] for doc_id in ranked_ids]
 
     def search_feedbacks(
         self,
@@ -2039,12 +2369,12 @@ class LocalJsonStorage(BaseStorage):
         end_time: int | None = None,
         status_filter: list[Status | None] | None = None,
         feedback_status_filter: FeedbackStatus | None = None,
-        match_threshold: float = 0.5,  # noqa: ARG002
+        match_threshold: float = 0.5,
         match_count: int = 10,
-        query_embedding: list[float] | None = None,  # noqa: ARG002
+        query_embedding: list[float] | None = None,
     ) -> list[Feedback]:
         """
-        Search feedbacks with advanced filtering (local storage uses text matching, not vector search).
+        Search feedbacks with advanced filtering and local hybrid (BM25 + vector, RRF-fused) ranking.
 
         Args:
             query (str, optional): Text query for text search
@@ -2054,8 +2384,9 @@ class LocalJsonStorage(BaseStorage):
             end_time (int, optional): End timestamp (Unix) for created_at filter
             status_filter (list[Optional[Status]], optional): List of Status values to filter by
             feedback_status_filter (FeedbackStatus, optional): Filter by FeedbackStatus
-            match_threshold (float): Not used in local storage
+            match_threshold (float): Minimum cosine similarity for vector matches
             match_count (int): Maximum number of results to return
+            query_embedding (list[float], optional): Query embedding for vector search
 
         Returns:
             list[Feedback]: List of matching feedback objects
@@ -2066,11 +2397,7 @@ class LocalJsonStorage(BaseStorage):
 
         results = []
         for feedback_json in all_memories["feedbacks"]:
-            f = Feedback.model_validate_json(feedback_json)
-
-            # Filter by query text
-            if query and query.lower() not in f.feedback_content.lower():
-                continue
+            f = self._parse(Feedback, feedback_json)
 
             # Filter by agent_version
             if agent_version and f.agent_version != agent_version:
@@ -2105,10 +2432,21 @@ class LocalJsonStorage(BaseStorage):
                 continue
 
             results.append(f)
-            if len(results) >= match_count:
+            if not (query or query_embedding) and len(results) >= match_count:
                 break
 
-        return results
+        if not (query or query_embedding):
+            return results
+        by_id = {str(f.feedback_id): f for f in results}
+        ranked_ids = self._hybrid_rank(
+            "feedbacks",
+            {doc_id: f.feedback_content for doc_id, f in by_id.items()},
+            query,
+            query_embedding,
+            match_threshold,
+            match_count,
+        )
+        return [by_id[doc_id] for doc_id in ranked_ids]
 
     # ==============================
     # Agent Success Evaluation methods
@@ -2127,7 +2465,10 @@ class LocalJsonStorage(BaseStorage):
         if "agent_success_evaluation_results" not in all_memories:
             all_memories["agent_success_evaluation_results"] = []
         all_memories["agent_success_evaluation_results"].extend(
-            [result.model_dump_json() for result in results]
+            [
+                result.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+                for result in results
+            ]
         )
         self._save(all_memories)
 
@@ -2150,7 +2491,7 @@ class LocalJsonStorage(BaseStorage):
 
         results = []
         for result_json in all_memories["agent_success_evaluation_results"]:
-            result = AgentSuccessEvaluationResult.model_validate_json(result_json)
+            result = self._parse(AgentSuccessEvaluationResult, result_json)
             # If agent_version is specified, filter by it
             if agent_version is not None and result.agent_version != agent_version:
                 continue
@@ -2213,7 +2554,7 @@ class LocalJsonStorage(BaseStorage):
         for user_data in all_memories.values():
             if isinstance(user_data, dict) and "interactions" in user_data:
                 for interaction_json in user_data["interactions"]:
-                    interaction = Interaction.model_validate_json(interaction_json)
+                    interaction = self._parse(Interaction, interaction_json)
                     timestamp = interaction.created_at
 
                     # Count for periods
@@ -2228,7 +2569,7 @@ class LocalJsonStorage(BaseStorage):
         for user_data in all_memories.values():
             if isinstance(user_data, dict) and "profiles" in user_data:
                 for profile_json in user_data["profiles"]:
-                    profile = UserProfile.model_validate_json(profile_json)
+                    profile = self._parse(UserProfile, profile_json)
                     timestamp = profile.last_modified_timestamp
 
                     # Count for periods
@@ -2244,7 +2585,7 @@ class LocalJsonStorage(BaseStorage):
         raw_feedback_count_previous = 0
         if "raw_feedbacks" in all_memories:
             for feedback_json in all_memories["raw_feedbacks"]:
-                feedback = RawFeedback.model_validate_json(feedback_json)
+                feedback = self._parse(RawFeedback, feedback_json)
                 timestamp = feedback.created_at
 
                 if timestamp >= current_period_start:
@@ -2258,7 +2599,7 @@ class LocalJsonStorage(BaseStorage):
         aggregated_feedback_count_previous = 0
         if "feedbacks" in all_memories:
             for feedback_json in all_memories["feedbacks"]:
-                feedback = Feedback.model_validate_json(feedback_json)
+                feedback = self._parse(Feedback, feedback_json)
                 timestamp = feedback.created_at
 
                 if timestamp >= current_period_start:
@@ -2281,7 +2622,7 @@ class LocalJsonStorage(BaseStorage):
 
         if "agent_success_evaluation_results" in all_memories:
             for result_json in all_memories["agent_success_evaluation_results"]:
-                result = AgentSuccessEvaluationResult.model_validate_json(result_json)
+                result = self._parse(AgentSuccessEvaluationResult, result_json)
                 timestamp = result.created_at
 
                 if timestamp >= current_period_start:
@@ -2447,6 +2788,26 @@ class LocalJsonStorage(BaseStorage):
         """
         return [key for key in all_memories if key not in self._SYSTEM_KEYS]
 
+    def _build_request_index(self, all_memories: dict) -> dict[str, Request]:
+        """
+        Build a request_id -> Request index in a single pass over the stored requests.
+
+        Used instead of calling `get_request()` per interaction, which reloads the whole
+        file on every call.
+
+        Args:
+            all_memories: The loaded memories dict
+
+        Returns:
+            dict[str, Request]: Requests keyed by request_id (first occurrence wins, like `get_request`)
+        """
+        request_index: dict[str, Request] = {}
+        for request_json in all_memories.get("requests", []):
+            request = self._parse(Request, request_json)
+            if request.request_id not in request_index:
+                request_index[request.request_id] = request
+        return request_index
+
     def get_operation_state_with_new_request_interaction(
         self,
         service_name: str,
@@ -2471,12 +2832,16 @@ class LocalJsonStorage(BaseStorage):
             all_memories = self._load()
         operation_states = all_memories.get("operation_states", {})
         state_entry = operation_states.get(service_name)
-        operation_state: dict = state_entry if isinstance(state_entry, dict) else {}
+        operation_state: dict = {}
+        if isinstance(state_entry, dict) and isinstance(
+            state_entry.get("operation_state"), dict
+        ):
+            operation_state = state_entry["operation_state"]
 
         last_processed_ids = operation_state.get("last_processed_interaction_ids") or []
         if not isinstance(last_processed_ids, list):
             last_processed_ids = []
-        processed_set = {str(item) for item in last_processed_ids}
+        processed_set = {int(item) for item in last_processed_ids}
 
         last_processed_timestamp = operation_state.get("last_processed_timestamp")
         if not isinstance(last_processed_timestamp, int):
@@ -2504,7 +2869,7 @@ class LocalJsonStorage(BaseStorage):
         # Collect new interactions
         new_interactions: list[Interaction] = []
         for _, interaction_json in all_interaction_payloads:
-            interaction = Interaction.model_validate_json(interaction_json)
+            interaction = self._parse(Interaction, interaction_json)
             created_at = interaction.created_at
             if last_processed_timestamp is not None and created_at is not None:
                 if created_at > last_processed_timestamp:
@@ -2530,10 +2895,10 @@ class LocalJsonStorage(BaseStorage):
             interactions_by_request[request_id].append(interaction)
 
         # Build RequestInteractionDataModel objects
+        request_index = self._build_request_index(all_memories)
         sessions: list[RequestInteractionDataModel] = []
         for request_id, interactions in interactions_by_request.items():
-            # Fetch the Request object
-            request = self.get_request(request_id)
+            request = request_index.get(request_id)
             if request is None:
                 # Create a minimal Request if not found
                 # Use interaction's user_id since we may be aggregating across users
@@ -2614,10 +2979,11 @@ class LocalJsonStorage(BaseStorage):
         # Parse all interactions and sort by interaction_id DESC (preserves insertion order)
         all_interactions: list[Interaction] = []
         for interaction_json in interaction_payloads:
-            interaction = Interaction.model_validate_json(interaction_json)
+            interaction = self._parse(Interaction, interaction_json)
             all_interactions.append(interaction)
 
         all_interactions.sort(key=lambda x: x.interaction_id or 0, reverse=True)
+        request_index = self._build_request_index(all_memories)
 
         # Filter by source and time range if specified, and take first K interactions
         flat_interactions: list[Interaction] = []
@@ -2635,7 +3001,7 @@ class LocalJsonStorage(BaseStorage):
                 continue
             # Check source or agent_version filter if specified
             if sources is not None or agent_version is not None:
-                request = self.get_request(interaction.request_id)
+                request = request_index.get(interaction.request_id)
                 if sources is not None and (
                     request is None or request.source not in sources
                 ):
@@ -2657,8 +3023,7 @@ class LocalJsonStorage(BaseStorage):
         # Build RequestInteractionDataModel objects
         sessions: list[RequestInteractionDataModel] = []
         for request_id, interactions in interactions_by_request.items():
-            # Fetch the Request object
-            request = self.get_request(request_id)
+            request = request_index.get(request_id)
             if request is None:
                 # Create a minimal Request if not found
                 # Use interaction's user_id since we may be aggregating across users
@@ -2832,7 +3197,7 @@ class LocalJsonStorage(BaseStorage):
         for user_data in all_memories.values():
             if isinstance(user_data, dict) and "profiles" in user_data:
                 for profile_json in user_data["profiles"]:
-                    profile = UserProfile.model_validate_json(profile_json)
+                    profile = self._parse(UserProfile, profile_json)
 
                     # Count by status
                     if profile.status is None:
@@ -2860,7 +3225,7 @@ class LocalJsonStorage(BaseStorage):
         """Get next available skill_id by finding the max existing ID."""
         max_id = 0
         for skill_json in all_memories.get("skills", []):
-            s = Skill.model_validate_json(skill_json)
+            s = self._parse(Skill, skill_json)
             if s.skill_id > max_id:
                 max_id = s.skill_id
         return max_id + 1
@@ -2875,8 +3240,8 @@ class LocalJsonStorage(BaseStorage):
                 # Update existing skill: replace in-place
                 all_memories["skills"] = [
                     (
-                        skill.model_dump_json()
-                        if Skill.model_validate_json(sj).skill_id == skill.skill_id
+                        skill.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+                        if self._parse(Skill, sj).skill_id == skill.skill_id
                         else sj
                     )
                     for sj in all_memories["skills"]
@@ -2884,9 +3249,13 @@ class LocalJsonStorage(BaseStorage):
             else:
                 # New skill: assign auto-incrementing ID
                 skill.skill_id = self._next_skill_id(all_memories)
-                all_memories["skills"].append(skill.model_dump_json())
+                all_memories["skills"].append(
+                    skill.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+                )
 
         self._save(all_memories)
+        # Skill embeddings are excluded from the JSON records, so the index is their only copy
+        self._index_embeddings("skills", skills)  # type: ignore[arg-type]
 
     def get_skills(
         self,
@@ -2901,7 +3270,7 @@ class LocalJsonStorage(BaseStorage):
 
         results = []
         for skill_json in all_memories["skills"]:
-            s = Skill.model_validate_json(skill_json)
+            s = self._parse(Skill, skill_json)
             if feedback_name and s.feedback_name != feedback_name:
                 continue
             if agent_version and s.agent_version != agent_version:
@@ -2919,9 +3288,9 @@ class LocalJsonStorage(BaseStorage):
         feedback_name: str | None = None,
         agent_version: str | None = None,
         skill_status: SkillStatus | None = None,
-        match_threshold: float = 0.5,  # noqa: ARG002
+        match_threshold: float = 0.5,
         match_count: int = 10,
-        query_embedding: list[float] | None = None,  # noqa: ARG002
+        query_embedding: list[float] | None = None,
     ) -> list[Skill]:
         all_memories = self._load()
         if "skills" not in all_memories:
@@ -2929,9 +3298,7 @@ class LocalJsonStorage(BaseStorage):
 
         results = []
         for skill_json in all_memories["skills"]:
-            s = Skill.model_validate_json(skill_json)
-            if query and query.lower() not in (s.instructions + s.description).lower():
-                continue
+            s = self._parse(Skill, skill_json)
             if feedback_name and s.feedback_name != feedback_name:
                 continue
             if agent_version and s.agent_version != agent_version:
@@ -2939,9 +3306,24 @@ class LocalJsonStorage(BaseStorage):
             if skill_status and s.skill_status != skill_status:
                 continue
             results.append(s)
-            if len(results) >= match_count:
+            if not (query or query_embedding) and len(results) >= match_count:
                 break
-        return results
+
+        if not (query or query_embedding):
+            return results
+        by_id = {str(s.skill_id): s for s in results}
+        ranked_ids = self._hybrid_rank(
+            "skills",
+            {
+                doc_id: f"{s.skill_name} {s.description} {s.instructions}"
+                for doc_id, s in by_id.items()
+            },
+            query,
+            query_embedding,
+            match_threshold,
+            match_count,
+        )
+        return [by_id[doc_id] for doc_id in ranked_ids]
 
     def update_skill_status(self, skill_id: int, skill_status: SkillStatus) -> None:
         all_memories = self._load()
@@ -2949,10 +3331,12 @@ class LocalJsonStorage(BaseStorage):
             return
         updated_skills = []
         for skill_json in all_memories["skills"]:
-            s = Skill.model_validate_json(skill_json)
+            s = self._parse(Skill, skill_json)
             if s.skill_id == skill_id:
                 s.skill_status = skill_status
-            updated_skills.append(s.model_dump_json())
+            updated_skills.append(
+                s.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT)
+            )
         all_memories["skills"] = updated_skills
         self._save(all_memories)
 
@@ -2963,7 +3347,7 @@ class LocalJsonStorage(BaseStorage):
         all_memories["skills"] = [
             skill_json
             for skill_json in all_memories["skills"]
-            if Skill.model_validate_json(skill_json).skill_id != skill_id
+            if self._parse(Skill, skill_json).skill_id != skill_id
         ]
         self._save(all_memories)
 
@@ -2972,6 +3356,7 @@ class LocalJsonStorage(BaseStorage):
         all_memories = self._load()
         all_memories["skills"] = []
         self._save(all_memories)
+        self._vector_index("skills").clear()
 
     def get_interactions_by_request_ids(
         self, request_ids: list[str]
@@ -2983,7 +3368,7 @@ class LocalJsonStorage(BaseStorage):
         for user_data in all_memories.values():
             if isinstance(user_data, dict) and "interactions" in user_data:
                 for interaction_json in user_data["interactions"]:
-                    interaction = Interaction.model_validate_json(interaction_json)
+                    interaction = self._parse(Interaction, interaction_json)
                     if interaction.request_id in request_ids:
                         results.append(interaction)
         return results
@@ -0,0 +1,543 @@
+"""
+Vector and keyword search primitives for local (self-host) storage.
+
+Mirrors the Supabase `hybrid_match_*` RPCs without a database: a NumPy vector index for
+semantic matches, BM25 for keyword matches, and reciprocal rank fusion (RRF) to merge them.
+"""
+
+import io
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Same constant the Supabase hybrid_match_* RPCs are called with (p_rrf_k)
+RRF_K = 60
+
+# Above this many vectors, searches probe a subset of k-means partitions instead of scanning all rows
+DEFAULT_ANN_THRESHOLD = 20_000
+
+# Writes are appended to a change log next to the `.npz` file, which is rewritten (compacted) once
+# the log holds this fraction of the index's rows, and at least _MIN_COMPACT_ROWS rows
+_COMPACT_RATIO = 0.25
+_MIN_COMPACT_ROWS = 1024
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def bm25_rank(
+    query: str,
+    documents: dict[str, str],
+    limit: int | None = None,
+    k1: float = 1.2,
+    b: float = 0.75,
+) -> list[tuple[str, float]]:
+    """
+    Rank documents against a query with Okapi BM25.
+
+    Args:
+        query (str): Free-text query
+        documents (dict[str, str]): Document text keyed by document id
+        limit (int, optional): Maximum number of results to return
+        k1 (float): Term frequency saturation
+        b (float): Document length normalization
+
+    Returns:
+        list[tuple[str, float]]: (document id, score) pairs with a positive score, best first
+    """
+    query_terms = set(tokenize(query))
+    if not query_terms or not documents:
+        return []
+
+    doc_terms = {doc_id: Counter(tokenize(text)) for doc_id, text in documents.items()}
+    doc_lengths = {doc_id: sum(terms.values()) for doc_id, terms in doc_terms.items()}
+    avg_length = (sum(doc_lengths.values()) / len(doc_lengths)) or 1.0
+    num_docs = len(documents)
+    doc_freq = {
+        term: sum(1 for terms in doc_terms.values() if term in terms)
+        for term in query_terms
+    }
+
+    scores: list[tuple[str, float]] = []
+    for doc_id, terms in doc_terms.items():
+        length_norm = k1 * (1 - b + b * doc_lengths[doc_id] / avg_length)
+        score = 0.0
+        for term in query_terms:
+            tf = terms.get(term, 0)
+            if not tf:
+                continue
+            idf = math.log(
+                1 + (num_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5)
+            )
+            score += idf * tf * (k1 + 1) / (tf + length_norm)
+        if score > 0:
+            scores.append((doc_id, score))
+
+    scores.sort(key=lambda item: item[1], reverse=True)
+    return scores[:limit] if limit is not None else scores
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[str]], k: int = RRF_K
+) -> list[tuple[str, float]]:
+    """
+    Merge ranked id lists with reciprocal rank fusion: score = sum(1 / (k + rank)).
+
+    Args:
+        rankings (list[list[str]]): Ranked id lists, best first
+        k (int): RRF damping constant
+
+    Returns:
+        list[tuple[str, float]]: (id, fused score) pairs, best first
+    """
+    fused: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+class LocalVectorIndex:
+    """
+    Cosine-similarity index over unit-normalized float32 vectors, persisted as a `.npz` file.
+
+    Upserts and removals append only the changed rows to a `<path>.log` change log, which is
+    replayed on load and folded into the `.npz` file once it grows past a fraction of the index
+    (or on flush()), so the cost of a write scales with its size rather than the index's.
+
+    Small indexes (and filtered searches over few candidates) are scanned exactly with a
+    single matrix-vector product. Once the index grows past `ann_threshold`, vectors are
+    partitioned with k-means and searches only scan the `nprobe` partitions whose centroids
+    are closest to the query (an IVF index), retraining when the index doubles in size.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ann_threshold: int = DEFAULT_ANN_THRESHOLD,
+        nprobe: int | None = None,
+    ) -> None:
+        """
+        Args:
+            path (str, optional): `.npz` file to load from and persist to. In-memory only when None.
+            ann_threshold (int): Number of vectors above which approximate search is used
+            nprobe (int, optional): Partitions scanned per approximate search. Defaults to ~10% of partitions.
+        """
+        self.path = path
+        self.ann_threshold = ann_threshold
+        self.nprobe = nprobe
+        self._lock = threading.RLock()
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._centroids: np.ndarray | None = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+        self._file_mtime_ns: int | None = None
+        # Bytes of the change log applied to this instance, and rows they hold
+        self._log_offset = 0
+        self._log_rows = 0
+        if path and Path(path).exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def exists_on_disk(self) -> bool:
+        """Whether the index has a persisted file."""
+        return bool(self.path) and Path(self.path).exists()  # type: ignore[arg-type]
+
+    @property
+    def dimensions(self) -> int:
+        """Dimensionality of the stored vectors (0 when empty)."""
+        return self._vectors.shape[1] if len(self._ids) else 0
+
+    # ==============================
+    # Mutation
+    # ==============================
+
+    def upsert(self, vectors: dict[str, list[float]]) -> None:
+        """
+        Insert or replace vectors. Empty vectors are ignored; vectors whose dimensionality
+        differs from the index are skipped with a warning.
+
+        Args:
+            vectors (dict[str, list[float]]): Embedding keyed by record id
+        """
+        items = [(doc_id, vec) for doc_id, vec in vectors.items() if vec]
+        if not items:
+            return
+        with self._lock:
+            self._refresh_if_stale()
+            dims = self.dimensions or len(items[0][1])
+            ids: list[str] = []
+            rows: list[np.ndarray] = []
+            for doc_id, vec in items:
+                if len(vec) != dims:
+                    logger.warning(
+                        "Skipping vector for %s: expected %d dimensions, got %d",
+                        doc_id,
+                        dims,
+                        len(vec),
+                    )
+                    continue
+                ids.append(doc_id)
+                rows.append(self._normalize(np.asarray(vec, dtype=np.float32)))
+            if not ids:
+                return
+            block = np.vstack(rows)
+            self._upsert_rows(ids, block)
+            self._persist_change(ids, block)
+
+    def remove(self, ids: list[str]) -> None:
+        """
+        Remove vectors by id (unknown ids are ignored).
+
+        Args:
+            ids (list[str]): Record ids to remove
+        """
+        with self._lock:
+            self._refresh_if_stale()
+            removed = [
+                doc_id for doc_id in dict.fromkeys(ids) if doc_id in self._positions
+            ]
+            if not removed:
+                return
+            self._remove_rows(removed)
+            self._persist_change(removed, np.zeros((len(removed), 0), dtype=np.float32))
+
+    def clear(self) -> None:
+        """Remove all vectors."""
+        with self._lock:
+            self._ids = []
+            self._positions = {}
+            self._vectors = np.zeros((0, 0), dtype=np.float32)
+            self._reset_partitions()
+            self._save()
+
+    def flush(self) -> None:
+        """Fold the change log into the `.npz` file."""
+        with self._lock:
+            self._refresh_if_stale()
+            if self._log_rows:
+                self._save()
+
+    def _upsert_rows(self, ids: list[str], block: np.ndarray) -> None:
+        """Insert or replace normalized rows in memory."""
+        new_ids: list[str] = []
+        new_rows: list[np.ndarray] = []
+        for doc_id, row in zip(ids, block, strict=True):
+            position = self._positions.get(doc_id)
+            if position is not None:
+                self._vectors[position] = row
+                if self._centroids is not None:
+                    self._assignments[position] = self._assign(row[None, :])[0]
+            else:
+                new_ids.append(doc_id)
+                new_rows.append(row)
+        if not new_rows:
+            return
+        new_block = np.vstack(new_rows)
+        start = len(self._ids)
+        self._vectors = (
+            np.vstack([self._vectors, new_block]) if start else new_block.copy()
+        )
+        for offset, doc_id in enumerate(new_ids):
+            self._positions[doc_id] = start + offset
+        self._ids.extend(new_ids)
+        if self._centroids is not None:
+            self._assignments = np.concatenate(
+                [self._assignments, self._assign(new_block)]
+            )
+
+    def _remove_rows(self, ids: list[str]) -> None:
+        """Remove rows from memory (unknown ids are ignored)."""
+        removed = set(ids)
+        keep = [i for i, doc_id in enumerate(self._ids) if doc_id not in removed]
+        if len(keep) == len(self._ids):
+            return
+        self._ids = [self._ids[i] for i in keep]
+        self._positions = {doc_id: i for i, doc_id in enumerate(self._ids)}
+        self._vectors = self._vectors[keep]
+        if self._centroids is not None:
+            self._assignments = self._assignments[keep]
+
+    # ==============================
+    # Search
+    # ==============================
+
+    def search(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        candidate_ids: list[str] | None = None,
+        min_similarity: float | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the vectors most similar to the query.
+
+        Args:
+            query_embedding (list[float]): Query vector
+            top_k (int): Maximum number of results
+            candidate_ids (list[str], optional): Restrict results to these ids
+            min_similarity (float, optional): Only return matches with cosine similarity above this value
+
+        Returns:
+            list[tuple[str, float]]: (id, cosine similarity) pairs, most similar first
+        """
+        with self._lock:
+            self._refresh_if_stale()
+            if not self._ids or top_k <= 0 or len(query_embedding) != self.dimensions:
+                return []
+            query = self._normalize(np.asarray(query_embedding, dtype=np.float32))
+
+            if candidate_ids is None:
+                rows = None
+                num_candidates = len(self._ids)
+            else:
+                rows = np.fromiter(
+                    (
+                        self._positions[doc_id]
+                        for doc_id in candidate_ids
+                        if doc_id in self._positions
+                    ),
+                    dtype=np.int64,
+                )
+                num_candidates = len(rows)
+                if not num_candidates:
+                    return []
+
+            results = None
+            if num_candidates > self.ann_threshold:
+                results = self._approximate_search(query, top_k, rows, min_similarity)
+            if results is None:
+                results = self._exact_search(query, top_k, rows, min_similarity)
+            return results
+
+    def _exact_search(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        rows: np.ndarray | None,
+        min_similarity: float | None,
+    ) -> list[tuple[str, float]]:
+        if rows is None:
+            rows = np.arange(len(self._ids))
+        return self._top_k(rows, self._vectors[rows] @ query, top_k, min_similarity)
+
+    def _approximate_search(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        rows: np.ndarray | None,
+        min_similarity: float | None,
+    ) -> list[tuple[str, float]] | None:
+        """Search the partitions nearest the query; None if they hold fewer than top_k candidates."""
+        self._ensure_partitions()
+        if self._centroids is None:
+            return None
+        nlist = len(self._centroids)
+        nprobe = min(nlist, self.nprobe or max(1, nlist // 10))
+        probed = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        in_probed = np.isin(self._assignments, probed)
+        if rows is not None:
+            mask = np.zeros(len(self._ids), dtype=bool)
+            mask[rows] = True
+            in_probed &= mask
+        probed_rows = np.flatnonzero(in_probed)
+        if len(probed_rows) < top_k:
+            # Too few candidates probed; results dropped by min_similarity do not count
+            return None
+        return self._top_k(
+            probed_rows, self._vectors[probed_rows] @ query, top_k, min_similarity
+        )
+
+    def _top_k(
+        self,
+        rows: np.ndarray,
+        scores: np.ndarray,
+        top_k: int,
+        min_similarity: float | None,
+    ) -> list[tuple[str, float]]:
+        if min_similarity is not None:
+            keep = scores > min_similarity
+            rows, scores = rows[keep], scores[keep]
+        if len(scores) > top_k:
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+            rows, scores = rows[best], scores[best]
+        order = np.argsort(-scores, kind="stable")
+        return [(self._ids[rows[i]], float(scores[i])) for i in order]
+
+    # ==============================
+    # Partitioning (k-means)
+    # ==============================
+
+    def _reset_partitions(self) -> None:
+        self._centroids = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+
+    def _ensure_partitions(
+        self, iterations: int = 8, max_train_rows: int = 50_000
+    ) -> None:
+        """Train k-means partitions, retraining once the index has doubled since the last training."""
+        num_vectors = len(self._ids)
+        if num_vectors <= self.ann_threshold:
+            self._reset_partitions()
+            return
+        if self._centroids is not None and num_vectors <= 2 * self._trained_size:
+            return
+
+        rng = np.random.default_rng(0)
+        nlist = max(1, int(math.sqrt(num_vectors)))
+        sample = (
+            self._vectors[rng.choice(num_vectors, max_train_rows, replace=False)]
+            if num_vectors > max_train_rows
+            else self._vectors
+        )
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = self._assign(sample, centroids)
+            order = np.argsort(assignments, kind="stable")
+            clusters, starts = np.unique(assignments[order], return_index=True)
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+            centroids[clusters] = self._normalize_rows(sums)
+        self._centroids = centroids
+        self._assignments = self._assign(self._vectors)
+        self._trained_size = num_vectors
+
+    def _assign(
+        self,
+        vectors: np.ndarray,
+        centroids: np.ndarray | None = None,
+        chunk_size: int = 8192,
+    ) -> np.ndarray:
+        """Assign each vector to its most similar centroid, in chunks to bound memory."""
+        centroids = self._centroids if centroids is None else centroids
+        if centroids is None:
+            return np.zeros(len(vectors), dtype=np.int32)
+        return np.concatenate(
+            [
+                np.argmax(vectors[start : start + chunk_size] @ centroids.T, axis=1)
+                for start in range(0, len(vectors), chunk_size)
+            ]
+        ).astype(np.int32)
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).astype(np.float32)
+
+    # ==============================
+    # Persistence
+    # ==============================
+
+    @property
+    def _log_path(self) -> Path:
+        return Path(f"{self.path}.log")
+
+    def _load(self) -> None:
+        assert self.path is not None  # noqa: S101
+        with np.load(self.path, allow_pickle=False) as data:
+            self._ids = [str(doc_id) for doc_id in data["ids"]]
+            self._vectors = data["vectors"].astype(np.float32, copy=False)
+        self._positions = {doc_id: i for i, doc_id in enumerate(self._ids)}
+        self._reset_partitions()
+        self._file_mtime_ns = Path(self.path).stat().st_mtime_ns
+        self._log_offset = 0
+        self._log_rows = 0
+        self._apply_log()
+
+    def _save(self) -> None:
+        """Write the whole index to the `.npz` file and drop the change log."""
+        if not self.path:
+            return
+        path = Path(self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as file:
+            np.savez(file, ids=np.array(self._ids, dtype=str), vectors=self._vectors)
+        tmp_path.replace(path)
+        # Replaying a log over the snapshot that already contains it is harmless, so a crash
+        # between these two steps loses nothing
+        self._log_path.unlink(missing_ok=True)
+        self._file_mtime_ns = path.stat().st_mtime_ns
+        self._log_offset = 0
+        self._log_rows = 0
+
+    def _persist_change(self, ids: list[str], block: np.ndarray) -> None:
+        """
+        Append a change to the log, compacting into the `.npz` file once the log is large.
+
+        Args:
+            ids (list[str]): Changed record ids
+            block (np.ndarray): Their normalized rows, or a zero-width array for removals
+        """
+        if not self.path:
+            return
+        if not Path(self.path).exists():
+            self._save()
+            return
+        buffer = io.BytesIO()
+        np.save(buffer, np.array(ids, dtype=str), allow_pickle=False)
+        np.save(buffer, block, allow_pickle=False)
+        record = buffer.getvalue()
+        # One write per record, so a concurrent reader sees whole records or a partial tail
+        with self._log_path.open("ab") as file:
+            file.write(record)
+        self._log_offset += len(record)
+        self._log_rows += len(ids)
+        if self._log_rows >= max(_MIN_COMPACT_ROWS, _COMPACT_RATIO * len(self._ids)):
+            self._save()
+
+    def _apply_log(self) -> None:
+        """Apply change-log records written after the ones already applied."""
+        if not self._log_path.exists():
+            return
+        with self._log_path.open("rb") as file:
+            file.seek(self._log_offset)
+            while True:
+                try:
+                    ids = np.load(file, allow_pickle=False)
+                    block = np.load(file, allow_pickle=False)
+                except (EOFError, ValueError):
+                    # End of the log, or a record still being written
+                    break
+                doc_ids = [str(doc_id) for doc_id in ids]
+                if block.shape[1]:
+                    self._upsert_rows(doc_ids, block.astype(np.float32, copy=False))
+                else:
+                    self._remove_rows(doc_ids)
+                self._log_offset = file.tell()
+                self._log_rows += len(doc_ids)
+
+    def _refresh_if_stale(self) -> None:
+        """Reload from disk if another writer replaced the index file, or apply its new log records."""
+        if not self.path or not Path(self.path).exists():
+            return
+        if Path(self.path).stat().st_mtime_ns != self._file_mtime_ns:
+            self._load()
+            return
+        log_size = self._log_path.stat().st_size if self._log_path.exists() else 0
+        if log_size < self._log_offset:
+            self._load()
+        elif log_size > self._log_offset:
+            self._apply_log()
@@ -0,0 +1,2808 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from reflexio_commons.api_schema.internal_schema import RequestInteractionDataModel
+from reflexio_commons.api_schema.retriever_schema import (
+    SearchInteractionRequest,
+    SearchUserProfileRequest,
+)
+from reflexio_commons.api_schema.service_schemas import (
+    AgentSuccessEvaluationResult,
+    DeleteUserInteractionRequest,
+    DeleteUserProfileRequest,
+    Feedback,
+    FeedbackAggregationChangeLog,
+    FeedbackStatus,
+    Interaction,
+    ProfileChangeLog,
+    RawFeedback,
+    Request,
+    Skill,
+    SkillStatus,
+    Status,
+    UserProfile,
+)
+from reflexio_commons.api_schema.validators import COMPACT_EMBEDDING_JSON_CONTEXT
+from reflexio_commons.config_schema import StorageConfigLocal
+
+from reflexio import data
+from reflexio.server import LOCAL_STORAGE_PATH
+from reflexio.server.services.storage.error import StorageError
+from reflexio.server.services.storage.storage_base import BaseStorage
+
+logger = logging.getLogger(__name__)
+
+# Each entity lives in its own table. Every table keeps the full pydantic JSON
+# payload in `data` plus the handful of columns needed for indexed filtering,
+# so writes are incremental row inserts/updates instead of whole-file rewrites.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS _meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS interactions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    interaction_id INTEGER NOT NULL,
+    user_id TEXT NOT NULL,
+    request_id TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_interactions_user_id
+    ON interactions(user_id, interaction_id);
+CREATE INDEX IF NOT EXISTS idx_interactions_request_id ON interactions(request_id);
+CREATE INDEX IF NOT EXISTS idx_interactions_created_at ON interactions(created_at);
+CREATE INDEX IF NOT EXISTS idx_interactions_interaction_id
+    ON interactions(interaction_id);
+
+CREATE TABLE IF NOT EXISTS requests (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    request_id TEXT NOT NULL UNIQUE,
+    user_id TEXT NOT NULL,
+    session_id TEXT,
+    source TEXT,
+    agent_version TEXT,
+    created_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_requests_user_id ON requests(user_id);
+CREATE INDEX IF NOT EXISTS idx_requests_session_id ON requests(session_id);
+CREATE INDEX IF NOT EXISTS idx_requests_created_at ON requests(created_at);
+
+CREATE TABLE IF NOT EXISTS profiles (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    profile_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    status TEXT,
+    last_modified_timestamp INTEGER NOT NULL,
+    expiration_timestamp INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_user_id ON profiles(user_id, profile_id);
+CREATE INDEX IF NOT EXISTS idx_profiles_status ON profiles(status);
+CREATE INDEX IF NOT EXISTS idx_profiles_last_modified
+    ON profiles(last_modified_timestamp);
+
+CREATE TABLE IF NOT EXISTS profile_change_logs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profile_change_logs_user_id
+    ON profile_change_logs(user_id);
+
+CREATE TABLE IF NOT EXISTS feedback_aggregation_change_logs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    feedback_name TEXT NOT NULL,
+    agent_version TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_feedback_aggregation_change_logs_name
+    ON feedback_aggregation_change_logs(feedback_name, agent_version, created_at);
+
+CREATE TABLE IF NOT EXISTS raw_feedbacks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    raw_feedback_id INTEGER NOT NULL,
+    user_id TEXT,
+    request_id TEXT NOT NULL,
+    feedback_name TEXT NOT NULL,
+    agent_version TEXT NOT NULL,
+    status TEXT,
+    created_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_raw_feedbacks_raw_feedback_id
+    ON raw_feedbacks(raw_feedback_id);
+CREATE INDEX IF NOT EXISTS idx_raw_feedbacks_user_id ON raw_feedbacks(user_id);
+CREATE INDEX IF NOT EXISTS idx_raw_feedbacks_request_id ON raw_feedbacks(request_id);
+CREATE INDEX IF NOT EXISTS idx_raw_feedbacks_name
+    ON raw_feedbacks(feedback_name, agent_version);
+CREATE INDEX IF NOT EXISTS idx_raw_feedbacks_created_at ON raw_feedbacks(created_at);
+
+CREATE TABLE IF NOT EXISTS feedbacks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    feedback_id INTEGER NOT NULL,
+    feedback_name TEXT NOT NULL,
+    agent_version TEXT NOT NULL,
+    status TEXT,
+    feedback_status TEXT,
+    created_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_feedbacks_feedback_id ON feedbacks(feedback_id);
+CREATE INDEX IF NOT EXISTS idx_feedbacks_name
+    ON feedbacks(feedback_name, agent_version);
+CREATE INDEX IF NOT EXISTS idx_feedbacks_created_at ON feedbacks(created_at);
+
+CREATE TABLE IF NOT EXISTS skills (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    skill_id INTEGER NOT NULL,
+    feedback_name TEXT NOT NULL,
+    agent_version TEXT NOT NULL,
+    skill_status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_skills_skill_id ON skills(skill_id);
+CREATE INDEX IF NOT EXISTS idx_skills_name ON skills(feedback_name, agent_version);
+
+CREATE TABLE IF NOT EXISTS agent_success_evaluation_results (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    agent_version TEXT NOT NULL,
+    session_id TEXT,
+    is_success INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_agent_success_evaluation_results_agent_version
+    ON agent_success_evaluation_results(agent_version);
+CREATE INDEX IF NOT EXISTS idx_agent_success_evaluation_results_created_at
+    ON agent_success_evaluation_results(created_at);
+
+CREATE TABLE IF NOT EXISTS operation_states (
+    service_name TEXT PRIMARY KEY,
+    operation_state TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+# Tables holding org data (everything except bookkeeping in `_meta`)
+_DATA_TABLES = (
+    "interactions",
+    "requests",
+    "profiles",
+    "profile_change_logs",
+    "feedback_aggregation_change_logs",
+    "raw_feedbacks",
+    "feedbacks",
+    "skills",
+    "agent_success_evaluation_results",
+    "operation_states",
+)
+
+_LEGACY_JSON_IMPORTED_KEY = "legacy_json_imported"
+
+
+def _status_value(status: Status | str | None) -> str | None:
+    """Normalize a Status enum (or legacy raw string) to the value stored in SQLite.
+
+    Args:
+        status (Status | str | None): Status enum, raw string, or None
+
+    Returns:
+        str | None: The stored column value, None for CURRENT
+    """
+    return getattr(status, "value", status)
+
+
+def _placeholders(values: list | tuple | set) -> str:
+    """Build a `?, ?, ...` placeholder list for an IN clause."""
+    return ", ".join("?" for _ in values)
+
+
+def _status_filter_clause(
+    column: str, status_filter: list[Status | None]
+) -> tuple[str, list]:
+    """Build a SQL predicate matching any of the given statuses.
+
+    Args:
+        column (str): Status column name
+        status_filter (list[Status | None]): Allowed statuses, None/CURRENT meaning NULL
+
+    Returns:
+        tuple[str, list]: SQL predicate and its bound parameters
+    """
+    values = [_status_value(s) for s in status_filter]
+    non_null = [v for v in values if v is not None]
+    parts = []
+    if len(non_null) != len(values):
+        parts.append(f"{column} IS NULL")
+    if non_null:
+        parts.append(f"{column} IN ({_placeholders(non_null)})")
+    if not parts:
+        return "0", []
+    return "(" + " OR ".join(parts) + ")", non_null
+
+
+def _where(clauses: list[str]) -> str:
+    """Join predicates into a WHERE clause (empty string when there are none)."""
+    return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
+class SqliteStorage(BaseStorage):
+    """
+    Storage class that uses an embedded SQLite database (WAL mode) to store data.
+
+    Each entity type is stored in its own table with secondary indexes on
+    user_id, request_id, session_id and created_at, so reads only touch
+    matching rows and writes are incremental.
+    """
+
+    def __init__(
+        self,
+        org_id: str,
+        base_dir: str | None = None,
+        config: StorageConfigLocal | None = None,
+    ) -> None:
+        self.config: StorageConfigLocal | None = config
+        if self.config:
+            base_dir = self.config.dir_path
+            if not Path(base_dir).is_absolute():
+                err_msg = f"SQLite Storage received a non absolute path {base_dir}"
+                logger.error(err_msg)
+                raise StorageError(err_msg)
+
+        if base_dir is None:
+            base_dir = LOCAL_STORAGE_PATH or str(Path(data.__file__).parent)
+        try:
+            Path(base_dir).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            err_msg = f"SQLite Storage cannot create directory at {base_dir}"
+            logger.error(err_msg)
+            raise StorageError(err_msg) from e
+        if not Path(base_dir).is_dir():
+            err_msg = f"SQLite Storage specified an invalid directory at {base_dir}"
+            logger.error(err_msg)
+            raise StorageError(err_msg)
+        logger.info("SQLite Storage for org %s uses directory %s", org_id, base_dir)
+        super().__init__(org_id, base_dir)
+        self.db_path = str(Path(base_dir) / f"reflexio_{org_id}.sqlite3")
+        # Legacy LocalJsonStorage file for the same org, imported by migrate()
+        self.legacy_json_path = str(Path(base_dir) / f"user_profiles_{org_id}.json")
+        # One connection per thread so WAL readers never block each other
+        self._local = threading.local()
+        try:
+            self._connect().executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            err_msg = f"SQLite Storage cannot initialize database at {self.db_path}"
+            logger.error(err_msg)
+            raise StorageError(err_msg) from e
+
+    # ==============================
+    # Connection helpers
+    # ==============================
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the SQLite connection for the current thread, creating it on first use.
+
+        Returns:
+            sqlite3.Connection: Autocommit connection with WAL enabled
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block inside a write transaction (BEGIN IMMEDIATE) so read-modify-write
+        sequences are atomic across threads and processes.
+
+        Yields:
+            sqlite3.Connection: Connection with an open transaction
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the connection held by the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _max_id(self, conn: sqlite3.Connection, table: str, column: str) -> int:
+        """Return the current maximum value of an id column (0 for an empty table)."""
+        row = conn.execute(
+            f"SELECT COALESCE(MAX({column}), 0) FROM {table}"  # noqa: S608
+        ).fetchone()
+        return int(row[0])
+
+    def _current_timestamp(self) -> str:
+        """Return a timezone-aware ISO timestamp for updated_at."""
+        return datetime.now(timezone.utc).isoformat()
+
+    # ==============================
+    # Row builders
+    # ==============================
+
+    @staticmethod
+    def _interaction_row(user_id: str, interaction: Interaction) -> tuple:
+        return (
+            interaction.interaction_id,
+            user_id,
+            interaction.request_id,
+            interaction.created_at,
+            interaction.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+        )
+
+    @staticmethod
+    def _profile_row(user_id: str, profile: UserProfile) -> tuple:
+        return (
+            profile.profile_id,
+            user_id,
+            _status_value(profile.status),
+            profile.last_modified_timestamp,
+            profile.expiration_timestamp,
+            profile.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+        )
+
+    @staticmethod
+    def _raw_feedback_row(feedback: RawFeedback) -> tuple:
+        return (
+            feedback.raw_feedback_id,
+            feedback.user_id,
+            feedback.request_id,
+            feedback.feedback_name,
+            feedback.agent_version,
+            _status_value(feedback.status),
+            feedback.created_at,
+            feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+        )
+
+    @staticmethod
+    def _feedback_row(feedback: Feedback) -> tuple:
+        return (
+            feedback.feedback_id,
+            feedback.feedback_name,
+            feedback.agent_version,
+            _status_value(feedback.status),
+            _status_value(feedback.feedback_status),
+            feedback.created_at,
+            feedback.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+        )
+
+    @staticmethod
+    def _skill_row(skill: Skill) -> tuple:
+        return (
+            skill.skill_id,
+            skill.feedback_name,
+            skill.agent_version,
+            _status_value(skill.skill_status),
+            skill.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+        )
+
+    @staticmethod
+    def _request_row(request: Request) -> tuple:
+        return (
+            request.request_id,
+            request.user_id,
+            request.session_id,
+            request.source,
+            request.agent_version,
+            request.created_at,
+            request.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+        )
+
+    def _insert_interactions(
+        self,
+        conn: sqlite3.Connection,
+        user_id: str,
+        interactions: list[Interaction],
+    ) -> None:
+        """Insert interactions, assigning auto-increment ids to placeholders (id 0)."""
+        max_id = self._max_id(conn, "interactions", "interaction_id")
+        rows = []
+        for interaction in interactions:
+            if interaction.interaction_id == 0:
+                max_id += 1
+                interaction.interaction_id = max_id
+            else:
+                max_id = max(max_id, interaction.interaction_id)
+            rows.append(self._interaction_row(user_id, interaction))
+        conn.executemany(
+            "INSERT INTO interactions (interaction_id, user_id, request_id, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def _insert_raw_feedbacks(
+        self, conn: sqlite3.Connection, raw_feedbacks: list[RawFeedback]
+    ) -> None:
+        conn.executemany(
+            "INSERT INTO raw_feedbacks (raw_feedback_id, user_id, request_id, feedback_name, "
+            "agent_version, status, created_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [self._raw_feedback_row(feedback) for feedback in raw_feedbacks],
+        )
+
+    def _insert_feedbacks(
+        self, conn: sqlite3.Connection, feedbacks: list[Feedback]
+    ) -> None:
+        conn.executemany(
+            "INSERT INTO feedbacks (feedback_id, feedback_name, agent_version, status, "
+            "feedback_status, created_at, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [self._feedback_row(feedback) for feedback in feedbacks],
+        )
+
+    def _insert_skills(self, conn: sqlite3.Connection, skills: list[Skill]) -> None:
+        conn.executemany(
+            "INSERT INTO skills (skill_id, feedback_name, agent_version, skill_status, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [self._skill_row(skill) for skill in skills],
+        )
+
+    def _upsert_request(self, conn: sqlite3.Connection, request: Request) -> None:
+        conn.execute(
+            "INSERT INTO requests (request_id, user_id, session_id, source, agent_version, "
+            "created_at, data) VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(request_id) DO UPDATE SET user_id = excluded.user_id, "
+            "session_id = excluded.session_id, source = excluded.source, "
+            "agent_version = excluded.agent_version, created_at = excluded.created_at, "
+            "data = excluded.data",
+            self._request_row(request),
+        )
+
+    def _insert_evaluation_results(
+        self,
+        conn: sqlite3.Connection,
+        results: list[AgentSuccessEvaluationResult],
+    ) -> None:
+        conn.executemany(
+            "INSERT INTO agent_success_evaluation_results (agent_version, session_id, "
+            "is_success, created_at, data) VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    result.agent_version,
+                    result.session_id,
+                    int(result.is_success),
+                    result.created_at,
+                    result.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+                )
+                for result in results
+            ],
+        )
+
+    def _update_feedback_rows(
+        self, conn: sqlite3.Connection, updates: list[tuple[int, Feedback]]
+    ) -> None:
+        """Persist modified feedbacks back to their rows, keyed by seq."""
+        conn.executemany(
+            "UPDATE feedbacks SET feedback_id = ?, feedback_name = ?, agent_version = ?, "
+            "status = ?, feedback_status = ?, created_at = ?, data = ? WHERE seq = ?",
+            [(*self._feedback_row(feedback), seq) for seq, feedback in updates],
+        )
+
+    # ==============================
+    # Migration
+    # ==============================
+
+    def _is_empty(self) -> bool:
+        """Check whether the database holds any org data."""
+        conn = self._connect()
+        return all(
+            conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is None  # noqa: S608
+            for table in _DATA_TABLES
+        )
+
+    def _get_meta(self, key: str) -> str | None:
+        row = (
+            self._connect()
+            .execute("SELECT value FROM _meta WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def check_migration_needed(self) -> bool:
+        """
+        Check whether a legacy LocalJsonStorage file for this org is waiting to be imported.
+
+        Returns:
+            bool: True if the legacy JSON file exists and has not been imported yet
+        """
+        return (
+            Path(self.legacy_json_path).exists()
+            and self._get_meta(_LEGACY_JSON_IMPORTED_KEY) is None
+            and self._is_empty()
+        )
+
+    def migrate(self) -> bool:
+        """
+        Import the legacy LocalJsonStorage file for this org, if one exists and the
+        database is still empty.
+
+        Returns:
+            bool: True if the storage is ready to use
+        """
+        if not self.check_migration_needed():
+            return True
+        try:
+            counts = self.import_local_json(self.legacy_json_path)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logger.error(
+                "Failed to import legacy JSON storage %s: %s", self.legacy_json_path, e
+            )
+            return False
+        logger.info(
+            "Imported legacy JSON storage %s for org %s: %s",
+            self.legacy_json_path,
+            self.org_id,
+            counts,
+        )
+        return True
+
+    def import_local_json(self, json_file_path: str) -> dict[str, int]:  # noqa: C901
+        """
+        Import a LocalJsonStorage file (`user_profiles_{org_id}.json`) into this database.
+
+        All records are inserted in a single transaction, preserving their ids.
+        The source file is left untouched.
+
+        Args:
+            json_file_path (str): Path to the legacy JSON storage file
+
+        Returns:
+            dict[str, int]: Number of imported records per table
+        """
+        with Path(json_file_path).open(encoding="utf-8") as file:
+            all_memories: dict = json.load(file)
+
+        counts = dict.fromkeys(_DATA_TABLES, 0)
+        with self._transaction() as conn:
+            for key, value in all_memories.items():
+                if key == "requests":
+                    for request_json in value:
+                        self._upsert_request(
+                            conn, Request.model_validate_json(request_json)
+                        )
+                    counts["requests"] += len(value)
+                elif key == "profile_change_logs":
+                    for log_json in value:
+                        self._insert_profile_change_log(
+                            conn, ProfileChangeLog.model_validate_json(log_json)
+                        )
+                    counts["profile_change_logs"] += len(value)
+                elif key == "feedback_aggregation_change_logs":
+                    for log_json in value:
+                        self._insert_feedback_aggregation_change_log(
+                            conn,
+                            FeedbackAggregationChangeLog.model_validate_json(log_json),
+                        )
+                    counts["feedback_aggregation_change_logs"] += len(value)
+                elif key == "raw_feedbacks":
+                    self._insert_raw_feedbacks(
+                        conn, [RawFeedback.model_validate_json(fb) for fb in value]
+                    )
+                    counts["raw_feedbacks"] += len(value)
+                elif key == "feedbacks":
+                    self._insert_feedbacks(
+                        conn, [Feedback.model_validate_json(fb) for fb in value]
+                    )
+                    counts["feedbacks"] += len(value)
+                elif key == "skills":
+                    self._insert_skills(
+                        conn, [Skill.model_validate_json(s) for s in value]
+                    )
+                    counts["skills"] += len(value)
+                elif key == "agent_success_evaluation_results":
+                    self._insert_evaluation_results(
+                        conn,
+                        [
+                            AgentSuccessEvaluationResult.model_validate_json(r)
+                            for r in value
+                        ],
+                    )
+                    counts["agent_success_evaluation_results"] += len(value)
+                elif key == "operation_states":
+                    for service_name, entry in value.items():
+                        conn.execute(
+                            "INSERT OR REPLACE INTO operation_states "
+                            "(service_name, operation_state, updated_at) VALUES (?, ?, ?)",
+                            (
+                                service_name,
+                                json.dumps(entry.get("operation_state", {})),
+                                entry.get("updated_at") or self._current_timestamp(),
+                            ),
+                        )
+                    counts["operation_states"] += len(value)
+                elif isinstance(value, dict):
+                    # User bucket: {"profiles": [...], "interactions": [...]}
+                    profiles = [
+                        UserProfile.model_validate_json(p)
+                        for p in value.get("profiles", [])
+                    ]
+                    conn.executemany(
+                        "INSERT INTO profiles (profile_id, user_id, status, "
+                        "last_modified_timestamp, expiration_timestamp, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [self._profile_row(key, p) for p in profiles],
+                    )
+                    counts["profiles"] += len(profiles)
+                    interactions = [
+                        Interaction.model_validate_json(i)
+                        for i in value.get("interactions", [])
+                    ]
+                    conn.executemany(
+                        "INSERT INTO interactions (interaction_id, user_id, request_id, "
+                        "created_at, data) VALUES (?, ?, ?, ?, ?)",
+                        [self._interaction_row(key, i) for i in interactions],
+                    )
+                    counts["interactions"] += len(interactions)
+            conn.execute(
+                "INSERT OR REPLACE INTO _meta (key, value) VALUES (?, ?)",
+                (_LEGACY_JSON_IMPORTED_KEY, self._current_timestamp()),
+            )
+        return counts
+
+    # ==============================
+    # CRUD methods
+    # ==============================
+
+    def get_all_profiles(
+        self,
+        limit: int = 100,
+        status_filter: list[Status | None] | None = None,
+    ) -> list[UserProfile]:
+        if status_filter is None:
+            status_filter = [None]  # Default to current profiles (status=None)
+        clause, params = _status_filter_clause("status", status_filter)
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT data FROM profiles WHERE {clause} "  # noqa: S608
+                "ORDER BY last_modified_timestamp DESC, seq ASC LIMIT ?",
+                (*params, limit),
+            )
+            .fetchall()
+        )
+        return [UserProfile.model_validate_json(row[0]) for row in rows]
+
+    def get_all_interactions(self, limit: int = 100) -> list[Interaction]:
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT data FROM interactions ORDER BY created_at DESC, seq ASC LIMIT ?",
+                (limit,),
+            )
+            .fetchall()
+        )
+        return [Interaction.model_validate_json(row[0]) for row in rows]
+
+    def get_user_profile(
+        self,
+        user_id: str,
+        status_filter: list[Status | None] | None = None,
+    ) -> list[UserProfile]:
+        if status_filter is None:
+            status_filter = [None]  # Default to current profiles (status=None)
+        clause, params = _status_filter_clause("status", status_filter)
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT data FROM profiles WHERE user_id = ? AND {clause} ORDER BY seq",  # noqa: S608
+                (user_id, *params),
+            )
+            .fetchall()
+        )
+        return [UserProfile.model_validate_json(row[0]) for row in rows]
+
+    def get_user_interaction(self, user_id: str) -> list[Interaction]:
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT data FROM interactions WHERE user_id = ? ORDER BY seq",
+                (user_id,),
+            )
+            .fetchall()
+        )
+        return [Interaction.model_validate_json(row[0]) for row in rows]
+
+    def add_user_profile(self, user_id: str, user_profiles: list[UserProfile]) -> None:
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO profiles (profile_id, user_id, status, last_modified_timestamp, "
+                "expiration_timestamp, data) VALUES (?, ?, ?, ?, ?, ?)",
+                [self._profile_row(user_id, profile) for profile in user_profiles],
+            )
+
+    def add_user_interaction(self, user_id: str, interaction: Interaction) -> None:
+        with self._transaction() as conn:
+            self._insert_interactions(conn, user_id, [interaction])
+
+    def add_user_interactions_bulk(
+        self, user_id: str, interactions: list[Interaction]
+    ) -> None:
+        """
+        Add multiple user interactions in a single transaction.
+
+        Args:
+            user_id: The user ID
+            interactions: List of interactions to add
+        """
+        if not interactions:
+            return
+        with self._transaction() as conn:
+            self._insert_interactions(conn, user_id, interactions)
+
+    def delete_user_interaction(self, request: DeleteUserInteractionRequest) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM interactions WHERE user_id = ? AND interaction_id = ?",
+                (request.user_id, request.interaction_id),
+            )
+
+    def delete_user_profile(self, request: DeleteUserProfileRequest) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM profiles WHERE user_id = ? AND profile_id = ?",
+                (request.user_id, request.profile_id),
+            )
+
+    def update_user_profile_by_id(
+        self, user_id: str, profile_id: str, new_profile: UserProfile
+    ) -> None:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT seq FROM profiles WHERE user_id = ? AND profile_id = ? "
+                "ORDER BY seq LIMIT 1",
+                (user_id, profile_id),
+            ).fetchone()
+            if row is None:
+                logger.warning(
+                    "update_user_profile_by_id::User profile not found for user id: %s",
+                    user_id,
+                )
+                return
+            conn.execute(
+                "UPDATE profiles SET profile_id = ?, user_id = ?, status = ?, "
+                "last_modified_timestamp = ?, expiration_timestamp = ?, data = ? "
+                "WHERE seq = ?",
+                (*self._profile_row(user_id, new_profile), row[0]),
+            )
+
+    def delete_all_interactions_for_user(self, user_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM interactions WHERE user_id = ?", (user_id,))
+
+    def delete_all_profiles_for_user(self, user_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM profiles WHERE user_id = ?", (user_id,))
+
+    def delete_all_profiles(self) -> None:
+        """Delete all profiles across all users."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM profiles")
+
+    def delete_all_interactions(self) -> None:
+        """Delete all interactions across all users."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM interactions")
+
+    def count_all_interactions(self) -> int:
+        """
+        Count total interactions across all users.
+
+        Returns:
+            int: Total number of interactions
+        """
+        row = self._connect().execute("SELECT COUNT(*) FROM interactions").fetchone()
+        return int(row[0])
+
+    def delete_oldest_interactions(self, count: int) -> int:
+        """
+        Delete the oldest N interactions based on created_at timestamp.
+
+        Args:
+            count (int): Number of oldest interactions to delete
+
+        Returns:
+            int: Number of interactions actually deleted
+        """
+        if count <= 0:
+            return 0
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM interactions WHERE seq IN ("
+                "SELECT seq FROM interactions ORDER BY created_at ASC, seq ASC LIMIT ?)",
+                (count,),
+            )
+            return cursor.rowcount
+
+    def update_all_profiles_status(
+        self,
+        old_status: Status | None,
+        new_status: Status | None,
+        user_ids: list[str] | None = None,
+    ) -> int:
+        """
+        Update all profiles with old_status to new_status atomically.
+
+        Args:
+            old_status: The current status to match (None for CURRENT)
+            new_status: The new status to set (None for CURRENT)
+            user_ids: Optional list of user_ids to filter updates. If None, updates all users.
+
+        Returns:
+            int: Number of profiles updated
+        """
+        clauses = []
+        params: list = []
+        old_value = _status_value(old_status)
+        if old_value is None:
+            clauses.append("status IS NULL")
+        else:
+            clauses.append("status = ?")
+            params.append(old_value)
+        if user_ids is not None:
+            clauses.append(f"user_id IN ({_placeholders(user_ids)})")
+            params.extend(user_ids)
+
+        now = int(datetime.now(timezone.utc).timestamp())
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT seq, user_id, data FROM profiles{_where(clauses)}",  # noqa: S608
+                params,
+            ).fetchall()
+            updates = []
+            for seq, user_id, profile_json in rows:
+                profile = UserProfile.model_validate_json(profile_json)
+                profile.status = new_status
+                profile.last_modified_timestamp = now
+                updates.append((*self._profile_row(user_id, profile), seq))
+            conn.executemany(
+                "UPDATE profiles SET profile_id = ?, user_id = ?, status = ?, "
+                "last_modified_timestamp = ?, expiration_timestamp = ?, data = ? "
+                "WHERE seq = ?",
+                updates,
+            )
+        logger.info(
+            "Updated %s profiles from %s to %s", len(updates), old_status, new_status
+        )
+        return len(updates)
+
+    def delete_all_profiles_by_status(self, status: Status) -> int:
+        """
+        Delete all profiles with the given status atomically.
+
+        Args:
+            status: The status of profiles to delete
+
+        Returns:
+            int: Number of profiles deleted
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM profiles WHERE status = ?", (_status_value(status),)
+            )
+            deleted_count = cursor.rowcount
+        logger.info("Deleted %s profiles with status %s", deleted_count, status)
+        return deleted_count
+
+    def get_user_ids_with_status(self, status: Status | None) -> list[str]:
+        """
+        Get list of unique user_ids that have profiles with the given status.
+
+        Args:
+            status: The status to filter by (None for CURRENT)
+
+        Returns:
+            list[str]: List of unique user_ids
+        """
+        clause, params = _status_filter_clause("status", [status])
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT user_id FROM profiles WHERE {clause} "  # noqa: S608
+                "GROUP BY user_id ORDER BY MIN(seq)",
+                params,
+            )
+            .fetchall()
+        )
+        return [row[0] for row in rows]
+
+    # ==============================
+    # Request methods
+    # ==============================
+
+    def add_request(self, request: Request) -> None:
+        """
+        Add a request to storage, replacing any existing request with the same ID.
+
+        Args:
+            request: Request object to store
+        """
+        with self._transaction() as conn:
+            self._upsert_request(conn, request)
+
+    def add_requests_bulk(
+        self, requests: list[Request], interactions: list[Interaction]
+    ) -> None:
+        """
+        Add many requests and their interactions, of any number of users, in a single transaction.
+
+        Args:
+            requests: Requests to store
+            interactions: Interactions of the requests
+        """
+        interactions_by_user: dict[str, list[Interaction]] = {}
+        for interaction in interactions:
+            interactions_by_user.setdefault(interaction.user_id, []).append(interaction)
+        with self._transaction() as conn:
+            for request in requests:
+                self._upsert_request(conn, request)
+            for user_id, user_interactions in interactions_by_user.items():
+                self._insert_interactions(conn, user_id, user_interactions)
+
+    def get_request(self, request_id: str) -> Request | None:
+        """
+        Get a request by its ID.
+
+        Args:
+            request_id: The request ID to retrieve
+
+        Returns:
+            Request object if found, None otherwise
+        """
+        row = (
+            self._connect()
+            .execute("SELECT data FROM requests WHERE request_id = ?", (request_id,))
+            .fetchone()
+        )
+        return Request.model_validate_json(row[0]) if row else None
+
+    def _get_requests_by_ids(
+        self, conn: sqlite3.Connection, request_ids: list[str]
+    ) -> dict[str, Request]:
+        """Fetch requests for the given IDs in one indexed query."""
+        if not request_ids:
+            return {}
+        rows = conn.execute(
+            f"SELECT data FROM requests WHERE request_id IN ({_placeholders(request_ids)})",  # noqa: S608
+            request_ids,
+        ).fetchall()
+        requests = [Request.model_validate_json(row[0]) for row in rows]
+        return {request.request_id: request for request in requests}
+
+    def delete_request(self, request_id: str) -> None:
+        """
+        Delete a request by its ID and all associated interactions.
+
+        Args:
+            request_id: The request ID to delete
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM interactions WHERE request_id = ?", (request_id,))
+            conn.execute("DELETE FROM requests WHERE request_id = ?", (request_id,))
+
+    def delete_session(self, session_id: str) -> int:
+        """
+        Delete all requests and interactions in a session.
+
+        Args:
+            session_id: The session ID to delete
+
+        Returns:
+            int: Number of requests deleted
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM interactions WHERE request_id IN ("
+                "SELECT request_id FROM requests WHERE session_id = ?)",
+                (session_id,),
+            )
+            cursor = conn.execute(
+                "DELETE FROM requests WHERE session_id = ?", (session_id,)
+            )
+            return cursor.rowcount
+
+    def delete_all_requests(self) -> None:
+        """Delete all requests and their associated interactions."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM interactions")
+            conn.execute("DELETE FROM requests")
+
+    def get_requests_by_session(self, user_id: str, session_id: str) -> list[Request]:
+        """
+        Get all requests for a specific session.
+
+        Args:
+            user_id (str): User ID to filter requests
+            session_id (str): Session ID to filter by
+
+        Returns:
+            list[Request]: List of Request objects in the session
+        """
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT data FROM requests WHERE user_id = ? AND session_id = ? ORDER BY seq",
+                (user_id, session_id),
+            )
+            .fetchall()
+        )
+        return [Request.model_validate_json(row[0]) for row in rows]
+
+    def get_sessions(
+        self,
+        user_id: str | None = None,
+        request_id: str | None = None,
+        session_id: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        top_k: int | None = 30,
+        offset: int = 0,
+    ) -> dict[str, list[RequestInteractionDataModel]]:
+        """
+        Get requests with their associated interactions, grouped by session_id.
+
+        Args:
+            user_id (str, optional): User ID to filter requests.
+            request_id (str, optional): Specific request ID to retrieve
+            session_id (str, optional): Specific session ID to retrieve
+            start_time (int, optional): Start timestamp for filtering
+            end_time (int, optional): End timestamp for filtering
+            top_k (int, optional): Maximum number of requests to return
+            offset (int): Number of requests to skip for pagination
+
+        Returns:
+            dict[str, list[RequestInteractionDataModel]]: Dictionary mapping session_id to list of RequestInteractionDataModel objects
+        """
+        clauses = []
+        params: list = []
+        if user_id:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if request_id:
+            clauses.append("request_id = ?")
+            params.append(request_id)
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if start_time:
+            clauses.append("created_at >= ?")
+            params.append(start_time)
+        if end_time:
+            clauses.append("created_at <= ?")
+            params.append(end_time)
+
+        conn = self._connect()
+        rows = conn.execute(
+            f"SELECT data FROM requests{_where(clauses)} "  # noqa: S608
+            "ORDER BY created_at DESC, seq ASC LIMIT ? OFFSET ?",
+            (*params, top_k or 100, offset),
+        ).fetchall()
+        requests = [Request.model_validate_json(row[0]) for row in rows]
+        if not requests:
+            return {}
+
+        # Fetch only the interactions belonging to the returned requests
+        request_ids = [req.request_id for req in requests]
+        interaction_clauses = [f"request_id IN ({_placeholders(request_ids)})"]
+        interaction_params: list = list(request_ids)
+        if user_id:
+            interaction_clauses.append("user_id = ?")
+            interaction_params.append(user_id)
+        interaction_rows = conn.execute(
+            f"SELECT data FROM interactions{_where(interaction_clauses)} "  # noqa: S608
+            "ORDER BY created_at ASC, seq ASC",
+            interaction_params,
+        ).fetchall()
+        interactions_by_request_id: dict[str, list[Interaction]] = {}
+        for row in interaction_rows:
+            interaction = Interaction.model_validate_json(row[0])
+            interactions_by_request_id.setdefault(interaction.request_id, []).append(
+                interaction
+            )
+
+        grouped_results: dict[str, list[RequestInteractionDataModel]] = {}
+        for req in requests:
+            group_name = req.session_id or ""
+            grouped_results.setdefault(group_name, []).append(
+                RequestInteractionDataModel(
+                    session_id=group_name,
+                    request=req,
+                    interactions=interactions_by_request_id.get(req.request_id, []),
+                )
+            )
+        return grouped_results
+
+    def get_rerun_user_ids(
+        self,
+        user_id: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        source: str | None = None,
+        agent_version: str | None = None,
+    ) -> list[str]:
+        """
+        Get distinct user IDs that have matching requests for rerun workflows.
+
+        Args:
+            user_id (str, optional): Restrict to a specific user ID.
+            start_time (int, optional): Start timestamp for request filtering.
+            end_time (int, optional): End timestamp for request filtering.
+            source (str, optional): Restrict to requests from a source.
+            agent_version (str, optional): Restrict to requests with an agent version.
+
+        Returns:
+            list[str]: Distinct user IDs matching the filters.
+        """
+        clauses = []
+        params: list = []
+        if user_id:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if start_time:
+            clauses.append("created_at >= ?")
+            params.append(start_time)
+        if end_time:
+            clauses.append("created_at <= ?")
+            params.append(end_time)
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if agent_version:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT DISTINCT user_id FROM requests{_where(clauses)} ORDER BY user_id",  # noqa: S608
+                params,
+            )
+            .fetchall()
+        )
+        return [row[0] for row in rows]
+
+    # ==============================
+    # Profile Change Log methods
+    # ==============================
+
+    def _insert_profile_change_log(
+        self, conn: sqlite3.Connection, profile_change_log: ProfileChangeLog
+    ) -> None:
+        conn.execute(
+            "INSERT INTO profile_change_logs (user_id, created_at, data) VALUES (?, ?, ?)",
+            (
+                profile_change_log.user_id,
+                profile_change_log.created_at,
+                profile_change_log.model_dump_json(
+                    context=COMPACT_EMBEDDING_JSON_CONTEXT
+                ),
+            ),
+        )
+
+    def add_profile_change_log(self, profile_change_log: ProfileChangeLog) -> None:
+        with self._transaction() as conn:
+            self._insert_profile_change_log(conn, profile_change_log)
+
+    def get_profile_change_logs(self, limit: int = 100) -> list[ProfileChangeLog]:
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT data FROM profile_change_logs ORDER BY seq LIMIT ?", (limit,)
+            )
+            .fetchall()
+        )
+        return [ProfileChangeLog.model_validate_json(row[0]) for row in rows]
+
+    def delete_profile_change_log_for_user(self, user_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM profile_change_logs WHERE user_id = ?", (user_id,)
+            )
+
+    def delete_all_profile_change_logs(self) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM profile_change_logs")
+
+    # ==============================
+    # Feedback Aggregation Change Log methods
+    # ==============================
+
+    def _insert_feedback_aggregation_change_log(
+        self, conn: sqlite3.Connection, change_log: FeedbackAggregationChangeLog
+    ) -> None:
+        conn.execute(
+            "INSERT INTO feedback_aggregation_change_logs "
+            "(feedback_name, agent_version, created_at, data) VALUES (?, ?, ?, ?)",
+            (
+                change_log.feedback_name,
+                change_log.agent_version,
+                change_log.created_at,
+                change_log.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+            ),
+        )
+
+    def add_feedback_aggregation_change_log(
+        self, change_log: FeedbackAggregationChangeLog
+    ) -> None:
+        with self._transaction() as conn:
+            self._insert_feedback_aggregation_change_log(conn, change_log)
+
+    def get_feedback_aggregation_change_logs(
+        self,
+        feedback_name: str,
+        agent_version: str,
+        limit: int = 100,
+    ) -> list[FeedbackAggregationChangeLog]:
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT data FROM feedback_aggregation_change_logs "
+                "WHERE feedback_name = ? AND agent_version = ? "
+                "ORDER BY created_at DESC, seq ASC LIMIT ?",
+                (feedback_name, agent_version, limit),
+            )
+            .fetchall()
+        )
+        return [
+            FeedbackAggregationChangeLog.model_validate_json(row[0]) for row in rows
+        ]
+
+    def delete_all_feedback_aggregation_change_logs(self) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM feedback_aggregation_change_logs")
+
+    # ==============================
+    # Search methods
+    # ==============================
+
+    def search_interaction(
+        self, search_interaction_request: SearchInteractionRequest
+    ) -> list[Interaction]:
+        """Search user interactions from storage using substring matching.
+
+        Args:
+            search_interaction_request (SearchInteractionRequest): Search filters
+
+        Returns:
+            list[Interaction]: Matching interactions in insertion order
+        """
+        clauses = ["user_id = ?"]
+        params: list = [search_interaction_request.user_id]
+        if search_interaction_request.request_id:
+            clauses.append("request_id = ?")
+            params.append(search_interaction_request.request_id)
+        if search_interaction_request.start_time:
+            clauses.append("created_at >= ?")
+            params.append(search_interaction_request.start_time.timestamp())
+        if search_interaction_request.end_time:
+            clauses.append("created_at <= ?")
+            params.append(search_interaction_request.end_time.timestamp())
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT data FROM interactions{_where(clauses)} ORDER BY seq",  # noqa: S608
+                params,
+            )
+            .fetchall()
+        )
+        interactions = [Interaction.model_validate_json(row[0]) for row in rows]
+        if search_interaction_request.query:
+            interactions = [
+                interaction
+                for interaction in interactions
+                if search_interaction_request.query in interaction.content
+            ]
+        return interactions
+
+    def search_user_profile(
+        self,
+        search_user_profile_request: SearchUserProfileRequest,
+        status_filter: list[Status | None] | None = None,
+        query_embedding: list[float] | None = None,  # noqa: ARG002
+    ) -> list[UserProfile]:
+        """Search user profiles from storage using substring matching.
+
+        Args:
+            search_user_profile_request (SearchUserProfileRequest): Search filters
+            status_filter (Optional[list[Optional[Status]]]): Filter profiles by status
+            query_embedding (list[float], optional): Not used in SQLite storage
+
+        Returns:
+            list[UserProfile]: Matching profiles
+        """
+        if status_filter is None:
+            status_filter = [None]  # Default to current profiles (status=None)
+        status_clause, status_params = _status_filter_clause("status", status_filter)
+        clauses = ["user_id = ?", status_clause]
+        params: list = [search_user_profile_request.user_id, *status_params]
+        if search_user_profile_request.start_time:
+            clauses.append("last_modified_timestamp >= ?")
+            params.append(search_user_profile_request.start_time.timestamp())
+        if search_user_profile_request.end_time:
+            clauses.append("last_modified_timestamp <= ?")
+            params.append(search_user_profile_request.end_time.timestamp())
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT data FROM profiles{_where(clauses)} ORDER BY seq",  # noqa: S608
+                params,
+            )
+            .fetchall()
+        )
+        user_profiles = [UserProfile.model_validate_json(row[0]) for row in rows]
+        if search_user_profile_request.generated_from_request_id:
+            user_profiles = [
+                profile
+                for profile in user_profiles
+                if profile.generated_from_request_id
+                == search_user_profile_request.generated_from_request_id
+            ]
+        if search_user_profile_request.query:
+            user_profiles = [
+                profile
+                for profile in user_profiles
+                if search_user_profile_request.query in profile.profile_content
+            ]
+        if search_user_profile_request.top_k:
+            user_profiles = user_profiles[: search_user_profile_request.top_k]
+        return user_profiles
+
+    # ==============================
+    # Raw feedback methods
+    # ==============================
+
+    def save_raw_feedbacks(self, raw_feedbacks: list[RawFeedback]) -> None:
+        with self._transaction() as conn:
+            # Assign auto-incrementing IDs to new feedbacks (matching Supabase behavior)
+            max_id = self._max_id(conn, "raw_feedbacks", "raw_feedback_id")
+            for i, feedback in enumerate(raw_feedbacks):
+                if feedback.raw_feedback_id == 0:
+                    feedback.raw_feedback_id = max_id + i + 1
+            self._insert_raw_feedbacks(conn, raw_feedbacks)
+
+    @staticmethod
+    def _raw_feedback_filters(
+        user_id: str | None = None,
+        feedback_name: str | None = None,
+        agent_version: str | None = None,
+        status_filter: list[Status | None] | None = None,
+    ) -> tuple[list[str], list]:
+        """Build the shared raw feedback predicates used by get/count methods."""
+        clauses = []
+        params: list = []
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if feedback_name:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        if agent_version is not None:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        if status_filter is not None:
+            status_clause, status_params = _status_filter_clause(
+                "status", status_filter
+            )
+            clauses.append(status_clause)
+            params.extend(status_params)
+        return clauses, params
+
+    def get_raw_feedbacks(
+        self,
+        limit: int = 100,
+        user_id: str | None = None,
+        feedback_name: str | None = None,
+        agent_version: str | None = None,
+        status_filter: list[Status | None] | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        include_embedding: bool = False,  # noqa: ARG002
+    ) -> list[RawFeedback]:
+        """
+        Get raw feedbacks from storage.
+
+        Args:
+            limit (int): Maximum number of feedbacks to return
+            user_id (str, optional): The user ID to filter by. If None, returns feedbacks for all users.
+            feedback_name (str, optional): The feedback name to filter by. If None, returns all raw feedbacks.
+            agent_version (str, optional): The agent version to filter by. If None, returns all agent versions.
+            status_filter (list[Optional[Status]], optional): List of status values to filter by.
+                If None, returns feedbacks with all statuses.
+            start_time (int, optional): Unix timestamp. Only return feedbacks created at or after this time.
+            end_time (int, optional): Unix timestamp. Only return feedbacks created at or before this time.
+            include_embedding (bool): Embeddings are always stored with the record in SQLite storage.
+
+        Returns:
+            list[RawFeedback]: List of raw feedback objects
+        """
+        clauses, params = self._raw_feedback_filters(
+            user_id, feedback_name, agent_version, status_filter
+        )
+        if start_time is not None:
+            clauses.append("created_at >= ?")
+            params.append(start_time)
+        if end_time is not None:
+            clauses.append("created_at <= ?")
+            params.append(end_time)
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT data FROM raw_feedbacks{_where(clauses)} ORDER BY seq LIMIT ?",  # noqa: S608
+                (*params, limit),
+            )
+            .fetchall()
+        )
+        return [RawFeedback.model_validate_json(row[0]) for row in rows]
+
+    def count_raw_feedbacks(
+        self,
+        user_id: str | None = None,
+        feedback_name: str | None = None,
+        min_raw_feedback_id: int | None = None,
+        agent_version: str | None = None,
+        status_filter: list[Status | None] | None = None,
+    ) -> int:
+        """
+        Count raw feedbacks in storage without decoding any records.
+
+        Args:
+            user_id (str, optional): The user ID to filter by. If None, counts feedbacks for all users.
+            feedback_name (str, optional): The feedback name to filter by. If None, counts all raw feedbacks.
+            min_raw_feedback_id (int, optional): Only count feedbacks with raw_feedback_id greater than this value.
+            agent_version (str, optional): The agent version to filter by. If None, counts all agent versions.
+            status_filter (list[Optional[Status]], optional): List of status values to filter by.
+                If None, counts feedbacks with all statuses.
+
+        Returns:
+            int: Count of raw feedbacks matching the filters
+        """
+        clauses, params = self._raw_feedback_filters(
+            user_id, feedback_name, agent_version, status_filter
+        )
+        if min_raw_feedback_id is not None:
+            clauses.append("raw_feedback_id > ?")
+            params.append(min_raw_feedback_id)
+        row = (
+            self._connect()
+            .execute(
+                f"SELECT COUNT(*) FROM raw_feedbacks{_where(clauses)}",  # noqa: S608
+                params,
+            )
+            .fetchone()
+        )
+        return int(row[0])
+
+    def count_raw_feedbacks_by_session(self, session_id: str) -> int:
+        """
+        Count raw feedbacks linked to a session via request_id -> requests.session_id.
+
+        Args:
+            session_id (str): The session ID to count raw feedbacks for
+
+        Returns:
+            int: Count of raw feedbacks linked to the session
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT COUNT(*) FROM raw_feedbacks WHERE request_id IN ("
+                "SELECT request_id FROM requests WHERE session_id = ?)",
+                (session_id,),
+            )
+            .fetchone()
+        )
+        return int(row[0])
+
+    def delete_all_raw_feedbacks(self) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM raw_feedbacks")
+
+    @staticmethod
+    def _feedback_name_filters(
+        feedback_name: str, agent_version: str | None
+    ) -> tuple[list[str], list]:
+        """Build predicates matching a feedback name and optional agent version."""
+        clauses = ["feedback_name = ?"]
+        params: list = [feedback_name]
+        if agent_version is not None:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        return clauses, params
+
+    def delete_all_raw_feedbacks_by_feedback_name(
+        self, feedback_name: str, agent_version: str | None = None
+    ) -> None:
+        """
+        Delete all raw feedbacks by feedback name from storage.
+
+        Args:
+            feedback_name (str): The feedback name to delete
+            agent_version (str, optional): The agent version to filter by. If None, deletes all agent versions.
+        """
+        clauses, params = self._feedback_name_filters(feedback_name, agent_version)
+        with self._transaction() as conn:
+            conn.execute(
+                f"DELETE FROM raw_feedbacks{_where(clauses)}",  # noqa: S608
+                params,
+            )
+
+    def delete_all_feedbacks(self) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM feedbacks")
+
+    def delete_feedback(self, feedback_id: int) -> None:
+        """Delete a feedback by ID.
+
+        Args:
+            feedback_id (int): The ID of the feedback to delete
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM feedbacks WHERE feedback_id = ?", (feedback_id,))
+
+    def delete_raw_feedback(self, raw_feedback_id: int) -> None:
+        """Delete a raw feedback by ID.
+
+        Args:
+            raw_feedback_id (int): The ID of the raw feedback to delete
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM raw_feedbacks WHERE raw_feedback_id = ?",
+                (raw_feedback_id,),
+            )
+
+    def delete_all_feedbacks_by_feedback_name(
+        self, feedback_name: str, agent_version: str | None = None
+    ) -> None:
+        """
+        Delete all regular feedbacks by feedback name from storage.
+
+        Args:
+            feedback_name (str): The feedback name to delete
+            agent_version (str, optional): The agent version to filter by. If None, deletes all agent versions.
+        """
+        clauses, params = self._feedback_name_filters(feedback_name, agent_version)
+        with self._transaction() as conn:
+            conn.execute(
+                f"DELETE FROM feedbacks{_where(clauses)}",  # noqa: S608
+                params,
+            )
+
+    def save_feedbacks(self, feedbacks: list[Feedback]) -> list[Feedback]:
+        """
+        Save feedbacks to storage.
+
+        Args:
+            feedbacks (list[Feedback]): List of feedbacks to save
+
+        Returns:
+            list[Feedback]: Saved feedbacks with feedback_id populated
+        """
+        with self._transaction() as conn:
+            existing_max_id = self._max_id(conn, "feedbacks", "feedback_id")
+            for i, feedback in enumerate(feedbacks):
+                if not feedback.feedback_id:
+                    feedback.feedback_id = existing_max_id + i + 1
+            self._insert_feedbacks(conn, feedbacks)
+        return feedbacks
+
+    def get_feedbacks(
+        self,
+        limit: int = 100,
+        feedback_name: str | None = None,
+        status_filter: list[Status | None] | None = None,
+        feedback_status_filter: list[FeedbackStatus] | None = None,
+    ) -> list[Feedback]:
+        """
+        Get feedbacks from storage.
+
+        Args:
+            limit (int): Maximum number of feedbacks to return
+            feedback_name (str, optional): The feedback name to filter by. If None, returns all feedbacks.
+            status_filter (list[Optional[Status]], optional): List of Status values to filter by. None in the list means CURRENT status.
+            feedback_status_filter (Optional[list[FeedbackStatus]]): List of FeedbackStatus values to filter by.
+                If None, returns all feedback statuses.
+
+        Returns:
+            list[Feedback]: List of feedback objects
+        """
+        clauses = []
+        params: list = []
+        if status_filter is not None:
+            status_clause, status_params = _status_filter_clause(
+                "status", status_filter
+            )
+            clauses.append(status_clause)
+            params.extend(status_params)
+        else:
+            # Default behavior: exclude archived (keep current feedbacks)
+            clauses.append("(status IS NULL OR status != ?)")
+            params.append(Status.ARCHIVED.value)
+        if feedback_status_filter:
+            values = [_status_value(s) for s in feedback_status_filter]
+            clauses.append(f"feedback_status IN ({_placeholders(values)})")
+            params.extend(values)
+        if feedback_name:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT data FROM feedbacks{_where(clauses)} ORDER BY seq LIMIT ?",  # noqa: S608
+                (*params, limit),
+            )
+            .fetchall()
+        )
+        return [Feedback.model_validate_json(row[0]) for row in rows]
+
+    def update_feedback_status(
+        self, feedback_id: int, feedback_status: FeedbackStatus
+    ) -> None:
+        """
+        Update the status of a specific feedback.
+
+        Args:
+            feedback_id (int): The ID of the feedback to update
+            feedback_status (FeedbackStatus): The new status to set
+
+        Raises:
+            ValueError: If feedback with the given ID is not found
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT seq, data FROM feedbacks WHERE feedback_id = ?", (feedback_id,)
+            ).fetchall()
+            if not rows:
+                raise ValueError(f"Feedback with ID {feedback_id} not found")
+            updates = []
+            for seq, feedback_json in rows:
+                feedback = Feedback.model_validate_json(feedback_json)
+                feedback.feedback_status = feedback_status
+                updates.append((seq, feedback))
+            self._update_feedback_rows(conn, updates)
+
+    def _set_feedback_status(
+        self,
+        clauses: list[str],
+        params: list,
+        new_status: Status | None,
+    ) -> None:
+        """Set the `status` field of every feedback matching the predicates."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT seq, data FROM feedbacks{_where(clauses)}",  # noqa: S608
+                params,
+            ).fetchall()
+            updates = []
+            for seq, feedback_json in rows:
+                feedback = Feedback.model_validate_json(feedback_json)
+                feedback.status = new_status
+                updates.append((seq, feedback))
+            self._update_feedback_rows(conn, updates)
+
+    def archive_feedbacks_by_feedback_name(
+        self, feedback_name: str, agent_version: str | None = None
+    ) -> None:
+        """
+        Archive non-APPROVED feedbacks by setting their status field to 'archived'.
+        APPROVED feedbacks are left untouched to preserve user-approved feedback.
+
+        Args:
+            feedback_name (str): The feedback name to archive
+            agent_version (str, optional): The agent version to filter by. If None, archives all agent versions.
+        """
+        clauses, params = self._feedback_name_filters(feedback_name, agent_version)
+        clauses.append("feedback_status != ?")
+        params.append(FeedbackStatus.APPROVED.value)
+        self._set_feedback_status(clauses, params, Status.ARCHIVED)
+
+    def restore_archived_feedbacks_by_feedback_name(
+        self, feedback_name: str, agent_version: str | None = None
+    ) -> None:
+        """
+        Restore archived feedbacks by setting their status field to null.
+
+        Args:
+            feedback_name (str): The feedback name to restore
+            agent_version (str, optional): The agent version to filter by. If None, restores all agent versions.
+        """
+        clauses, params = self._feedback_name_filters(feedback_name, agent_version)
+        clauses.append("status = ?")
+        params.append(Status.ARCHIVED.value)
+        self._set_feedback_status(clauses, params, None)
+
+    def delete_archived_feedbacks_by_feedback_name(
+        self, feedback_name: str, agent_version: str | None = None
+    ) -> None:
+        """
+        Permanently delete feedbacks that have status='archived'.
+
+        Args:
+            feedback_name (str): The feedback name to delete
+            agent_version (str, optional): The agent version to filter by. If None, deletes all agent versions.
+        """
+        clauses, params = self._feedback_name_filters(feedback_name, agent_version)
+        clauses.append("status = ?")
+        params.append(Status.ARCHIVED.value)
+        with self._transaction() as conn:
+            conn.execute(
+                f"DELETE FROM feedbacks{_where(clauses)}",  # noqa: S608
+                params,
+            )
+
+    def archive_feedbacks_by_ids(self, feedback_ids: list[int]) -> None:
+        """
+        Archive non-APPROVED feedbacks by IDs, setting their status field to 'archived'.
+        APPROVED feedbacks are left untouched. No-op if feedback_ids is empty.
+
+        Args:
+            feedback_ids (list[int]): List of feedback IDs to archive
+        """
+        if not feedback_ids:
+            return
+        self._set_feedback_status(
+            [
+                f"feedback_id IN ({_placeholders(feedback_ids)})",
+                "feedback_status != ?",
+            ],
+            [*feedback_ids, FeedbackStatus.APPROVED.value],
+            Status.ARCHIVED,
+        )
+
+    def restore_archived_feedbacks_by_ids(self, feedback_ids: list[int]) -> None:
+        """
+        Restore archived feedbacks by IDs, setting their status field to null.
+        No-op if feedback_ids is empty.
+
+        Args:
+            feedback_ids (list[int]): List of feedback IDs to restore
+        """
+        if not feedback_ids:
+            return
+        self._set_feedback_status(
+            [f"feedback_id IN ({_placeholders(feedback_ids)})", "status = ?"],
+            [*feedback_ids, Status.ARCHIVED.value],
+            None,
+        )
+
+    def delete_feedbacks_by_ids(self, feedback_ids: list[int]) -> None:
+        """
+        Permanently delete feedbacks by their IDs.
+        No-op if feedback_ids is empty.
+
+        Args:
+            feedback_ids (list[int]): List of feedback IDs to delete
+        """
+        if not feedback_ids:
+            return
+        with self._transaction() as conn:
+            conn.execute(
+                f"DELETE FROM feedbacks WHERE feedback_id IN ({_placeholders(feedback_ids)})",  # noqa: S608
+                feedback_ids,
+            )
+
+    def update_all_raw_feedbacks_status(
+        self,
+        old_status: Status | None,
+        new_status: Status | None,
+        agent_version: str | None = None,
+        feedback_name: str | None = None,
+    ) -> int:
+        """
+        Update all raw feedbacks with old_status to new_status atomically.
+
+        Args:
+            old_status: The current status to match (None for CURRENT)
+            new_status: The new status to set (None for CURRENT)
+            agent_version: Optional filter by agent version
+            feedback_name: Optional filter by feedback name
+
+        Returns:
+            int: Number of raw feedbacks updated
+        """
+        status_clause, params = _status_filter_clause("status", [old_status])
+        clauses = [status_clause]
+        if agent_version is not None:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        if feedback_name is not None:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT seq, data FROM raw_feedbacks{_where(clauses)}",  # noqa: S608
+                params,
+            ).fetchall()
+            updates = []
+            for seq, feedback_json in rows:
+                feedback = RawFeedback.model_validate_json(feedback_json)
+                feedback.status = new_status
+                updates.append(
+                    (
+                        _status_value(new_status),
+                        feedback.model_dump_json(
+                            context=COMPACT_EMBEDDING_JSON_CONTEXT
+                        ),
+                        seq,
+                    )
+                )
+            conn.executemany(
+                "UPDATE raw_feedbacks SET status = ?, data = ? WHERE seq = ?", updates
+            )
+        logger.info(
+            "Updated %s raw feedbacks from %s to %s",
+            len(updates),
+            old_status,
+            new_status,
+        )
+        return len(updates)
+
+    def delete_all_raw_feedbacks_by_status(
+        self,
+        status: Status,
+        agent_version: str | None = None,
+        feedback_name: str | None = None,
+    ) -> int:
+        """
+        Delete all raw feedbacks with the given status atomically.
+
+        Args:
+            status: The status of raw feedbacks to delete
+            agent_version: Optional filter by agent version
+            feedback_name: Optional filter by feedback name
+
+        Returns:
+            int: Number of raw feedbacks deleted
+        """
+        clauses = ["status = ?"]
+        params: list = [_status_value(status)]
+        if agent_version is not None:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        if feedback_name is not None:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM raw_feedbacks{_where(clauses)}",  # noqa: S608
+                params,
+            )
+            deleted_count = cursor.rowcount
+        logger.info("Deleted %s raw feedbacks with status %s", deleted_count, status)
+        return deleted_count
+
+    def delete_raw_feedbacks_by_ids(self, raw_feedback_ids: list[int]) -> int:
+        """
+        Delete raw feedbacks by their IDs.
+
+        Args:
+            raw_feedback_ids (list[int]): List of raw feedback IDs to delete
+
+        Returns:
+            int: Number of raw feedbacks deleted
+        """
+        if not raw_feedback_ids:
+            return 0
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM raw_feedbacks WHERE raw_feedback_id IN "  # noqa: S608
+                f"({_placeholders(raw_feedback_ids)})",
+                raw_feedback_ids,
+            )
+            return cursor.rowcount
+
+    def has_raw_feedbacks_with_status(
+        self,
+        status: Status | None,
+        agent_version: str | None = None,
+        feedback_name: str | None = None,
+    ) -> bool:
+        """
+        Check if any raw feedbacks exist with given status and filters.
+
+        Args:
+            status: The status to check for (None for CURRENT)
+            agent_version: Optional filter by agent version
+            feedback_name: Optional filter by feedback name
+
+        Returns:
+            bool: True if any matching raw feedbacks exist
+        """
+        status_clause, params = _status_filter_clause("status", [status])
+        clauses = [status_clause]
+        if agent_version is not None:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        if feedback_name is not None:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        row = (
+            self._connect()
+            .execute(
+                f"SELECT 1 FROM raw_feedbacks{_where(clauses)} LIMIT 1",  # noqa: S608
+                params,
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def search_raw_feedbacks(
+        self,
+        query: str | None = None,
+        user_id: str | None = None,
+        agent_version: str | None = None,
+        feedback_name: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        status_filter: list[Status | None] | None = None,
+        match_threshold: float = 0.5,  # noqa: ARG002
+        match_count: int = 10,
+        query_embedding: list[float] | None = None,  # noqa: ARG002
+    ) -> list[RawFeedback]:
+        """
+        Search raw feedbacks with advanced filtering (SQLite storage uses text matching, not vector search).
+
+        Args:
+            query (str, optional): Text query for text search
+            user_id (str, optional): Filter by user (resolved via request_id -> requests linkage)
+            agent_version (str, optional): Filter by agent version
+            feedback_name (str, optional): Filter by feedback name
+            start_time (int, optional): Start timestamp (Unix) for created_at filter
+            end_time (int, optional): End timestamp (Unix) for created_at filter
+            status_filter (list[Optional[Status]], optional): List of status values to filter by
+            match_threshold (float): Not used in SQLite storage
+            match_count (int): Maximum number of results to return
+            query_embedding (list[float], optional): Not used in SQLite storage
+
+        Returns:
+            list[RawFeedback]: List of matching raw feedback objects
+        """
+        clauses = []
+        params: list = []
+        if user_id:
+            clauses.append(
+                "request_id IN (SELECT request_id FROM requests WHERE user_id = ?)"
+            )
+            params.append(user_id)
+        if agent_version:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        if feedback_name:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        if start_time:
+            clauses.append("created_at >= ?")
+            params.append(start_time)
+        if end_time:
+            clauses.append("created_at <= ?")
+            params.append(end_time)
+        if status_filter is not None:
+            status_clause, status_params = _status_filter_clause(
+                "status", status_filter
+            )
+            clauses.append(status_clause)
+            params.extend(status_params)
+
+        cursor = self._connect().execute(
+            f"SELECT data FROM raw_feedbacks{_where(clauses)} ORDER BY seq",  # noqa: S608
+            params,
+        )
+        results = []
+        for row in cursor:
+            rf = RawFeedback.model_validate_json(row[0])
+            if query and query.lower() not in rf.feedback_content.lower():
+                continue
+            results.append(rf)
+            if len(results) >= match_count:
+                break
+        return results
+
+    def search_feedbacks(
+        self,
+        query: str | None = None,
+        agent_version: str | None = None,
+        feedback_name: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        status_filter: list[Status | None] | None = None,
+        feedback_status_filter: FeedbackStatus | None = None,
+        match_threshold: float = 0.5,  # noqa: ARG002
+        match_count: int = 10,
+        query_embedding: list[float] | None = None,  # noqa: ARG002
+    ) -> list[Feedback]:
+        """
+        Search feedbacks with advanced filtering (SQLite storage uses text matching, not vector search).
+
+        Args:
+            query (str, optional): Text query for text search
+            agent_version (str, optional): Filter by agent version
+            feedback_name (str, optional): Filter by feedback name
+            start_time (int, optional): Start timestamp (Unix) for created_at filter
+            end_time (int, optional): End timestamp (Unix) for created_at filter
+            status_filter (list[Optional[Status]], optional): List of Status values to filter by
+            feedback_status_filter (FeedbackStatus, optional): Filter by FeedbackStatus
+            match_threshold (float): Not used in SQLite storage
+            match_count (int): Maximum number of results to return
+            query_embedding (list[float], optional): Not used in SQLite storage
+
+        Returns:
+            list[Feedback]: List of matching feedback objects
+        """
+        clauses = []
+        params: list = []
+        if agent_version:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        if feedback_name:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        if start_time:
+            clauses.append("created_at >= ?")
+            params.append(start_time)
+        if end_time:
+            clauses.append("created_at <= ?")
+            params.append(end_time)
+        if feedback_status_filter:
+            clauses.append("feedback_status = ?")
+            params.append(_status_value(feedback_status_filter))
+        if status_filter is not None:
+            status_clause, status_params = _status_filter_clause(
+                "status", status_filter
+            )
+            clauses.append(status_clause)
+            params.extend(status_params)
+
+        cursor = self._connect().execute(
+            f"SELECT data FROM feedbacks{_where(clauses)} ORDER BY seq",  # noqa: S608
+            params,
+        )
+        results = []
+        for row in cursor:
+            f = Feedback.model_validate_json(row[0])
+            if query and query.lower() not in f.feedback_content.lower():
+                continue
+            results.append(f)
+            if len(results) >= match_count:
+                break
+        return results
+
+    # ==============================
+    # Agent Success Evaluation methods
+    # ==============================
+
+    def save_agent_success_evaluation_results(
+        self, results: list[AgentSuccessEvaluationResult]
+    ) -> None:
+        """
+        Save agent success evaluation results to storage.
+
+        Args:
+            results (list[AgentSuccessEvaluationResult]): List of agent success evaluation result objects to save
+        """
+        with self._transaction() as conn:
+            self._insert_evaluation_results(conn, results)
+
+    def get_agent_success_evaluation_results(
+        self, limit: int = 100, agent_version: str | None = None
+    ) -> list[AgentSuccessEvaluationResult]:
+        """
+        Get agent success evaluation results from storage.
+
+        Args:
+            limit (int): Maximum number of results to return
+            agent_version (str, optional): The agent version to filter by. If None, returns all results.
+
+        Returns:
+            list[AgentSuccessEvaluationResult]: List of agent success evaluation result objects
+        """
+        clauses = []
+        params: list = []
+        if agent_version is not None:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT data FROM agent_success_evaluation_results"  # noqa: S608
+                f"{_where(clauses)} ORDER BY seq LIMIT ?",
+                (*params, limit),
+            )
+            .fetchall()
+        )
+        return [
+            AgentSuccessEvaluationResult.model_validate_json(row[0]) for row in rows
+        ]
+
+    def delete_all_agent_success_evaluation_results(self) -> None:
+        """Delete all agent success evaluation results from storage."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM agent_success_evaluation_results")
+
+    # ==============================
+    # Dashboard methods
+    # ==============================
+
+    def _period_counts(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        timestamp_column: str,
+        current_period_start: int,
+        previous_period_start: int,
+    ) -> tuple[int, int]:
+        """Count rows in the current and previous dashboard periods."""
+        row = conn.execute(
+            f"SELECT COALESCE(SUM({timestamp_column} >= ?), 0), "  # noqa: S608
+            f"COALESCE(SUM({timestamp_column} >= ? AND {timestamp_column} < ?), 0) "
+            f"FROM {table} WHERE {timestamp_column} >= ?",
+            (
+                current_period_start,
+                previous_period_start,
+                current_period_start,
+                previous_period_start,
+            ),
+        ).fetchone()
+        return int(row[0]), int(row[1])
+
+    def _time_series(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        timestamp_column: str,
+        period_start: int,
+    ) -> list[dict]:
+        """Return raw (timestamp, 1) data points for rows in the current period."""
+        rows = conn.execute(
+            f"SELECT {timestamp_column} FROM {table} "  # noqa: S608
+            f"WHERE {timestamp_column} >= ? ORDER BY {timestamp_column}",
+            (period_start,),
+        ).fetchall()
+        return [{"timestamp": row[0], "value": 1} for row in rows]
+
+    def get_dashboard_stats(self, days_back: int = 30) -> dict:
+        """
+        Get comprehensive dashboard statistics including counts and time-series data.
+        Counts are computed with indexed SQL aggregates, so no records are decoded.
+
+        Args:
+            days_back (int): Number of days to include in time series data
+
+        Returns:
+            dict: Dictionary containing current_period, previous_period, and raw time_series data
+        """
+        conn = self._connect()
+        current_time = int(datetime.now(timezone.utc).timestamp())
+        seconds_in_period = days_back * 24 * 60 * 60
+        current_period_start = current_time - seconds_in_period
+        previous_period_start = current_period_start - seconds_in_period
+        periods = (current_period_start, previous_period_start)
+
+        interactions_current, interactions_previous = self._period_counts(
+            conn, "interactions", "created_at", *periods
+        )
+        profiles_current, profiles_previous = self._period_counts(
+            conn, "profiles", "last_modified_timestamp", *periods
+        )
+        raw_feedbacks_current, raw_feedbacks_previous = self._period_counts(
+            conn, "raw_feedbacks", "created_at", *periods
+        )
+        feedbacks_current, feedbacks_previous = self._period_counts(
+            conn, "feedbacks", "created_at", *periods
+        )
+
+        eval_row = conn.execute(
+            "SELECT COALESCE(SUM(created_at >= ?), 0), "
+            "COALESCE(SUM(created_at >= ? AND is_success), 0), "
+            "COALESCE(SUM(created_at < ?), 0), "
+            "COALESCE(SUM(created_at < ? AND is_success), 0) "
+            "FROM agent_success_evaluation_results WHERE created_at >= ?",
+            (
+                current_period_start,
+                current_period_start,
+                current_period_start,
+                current_period_start,
+                previous_period_start,
+            ),
+        ).fetchone()
+        total_eval_current, success_count_current = int(eval_row[0]), int(eval_row[1])
+        total_eval_previous, success_count_previous = int(eval_row[2]), int(eval_row[3])
+
+        evaluation_rows = conn.execute(
+            "SELECT created_at, is_success FROM agent_success_evaluation_results "
+            "WHERE created_at >= ? ORDER BY created_at",
+            (current_period_start,),
+        ).fetchall()
+
+        return {
+            "current_period": {
+                "total_profiles": profiles_current,
+                "total_interactions": interactions_current,
+                "total_feedbacks": raw_feedbacks_current + feedbacks_current,
+                "success_rate": (
+                    (success_count_current / total_eval_current * 100)
+                    if total_eval_current > 0
+                    else 0.0
+                ),
+            },
+            "previous_period": {
+                "total_profiles": profiles_previous,
+                "total_interactions": interactions_previous,
+                "total_feedbacks": raw_feedbacks_previous + feedbacks_previous,
+                "success_rate": (
+                    (success_count_previous / total_eval_previous * 100)
+                    if total_eval_previous > 0
+                    else 0.0
+                ),
+            },
+            "interactions_time_series": self._time_series(
+                conn, "interactions", "created_at", current_period_start
+            ),
+            "profiles_time_series": self._time_series(
+                conn, "profiles", "last_modified_timestamp", current_period_start
+            ),
+            "feedbacks_time_series": self._time_series(
+                conn, "raw_feedbacks", "created_at", current_period_start
+            ),
+            "evaluations_time_series": [
+                {"timestamp": created_at, "value": 100 if is_success else 0}
+                for created_at, is_success in evaluation_rows
+            ],
+        }
+
+    # ==============================
+    # Operation State methods
+    # ==============================
+
+    @staticmethod
+    def _operation_state_entry(row: tuple) -> dict:
+        return {
+            "service_name": row[0],
+            "operation_state": json.loads(row[1]),
+            "updated_at": row[2],
+        }
+
+    def _write_operation_state(
+        self, conn: sqlite3.Connection, service_name: str, operation_state: dict
+    ) -> None:
+        conn.execute(
+            "INSERT INTO operation_states (service_name, operation_state, updated_at) "
+            "VALUES (?, ?, ?) ON CONFLICT(service_name) DO UPDATE SET "
+            "operation_state = excluded.operation_state, updated_at = excluded.updated_at",
+            (service_name, json.dumps(operation_state), self._current_timestamp()),
+        )
+
+    def create_operation_state(self, service_name: str, operation_state: dict) -> None:
+        """
+        Create operation state for a service.
+
+        Args:
+            service_name (str): Name of the service
+            operation_state (dict): Operation state data as a dictionary
+        """
+        with self._transaction() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM operation_states WHERE service_name = ?",
+                (service_name,),
+            ).fetchone()
+            if exists:
+                raise StorageError(
+                    f"Operation state already exists for service '{service_name}'"
+                )
+            self._write_operation_state(conn, service_name, operation_state)
+
+    def upsert_operation_state(self, service_name: str, operation_state: dict) -> None:
+        """
+        Create or update operation state for a service.
+
+        Args:
+            service_name (str): Name of the service
+            operation_state (dict): Operation state data as a dictionary
+        """
+        with self._transaction() as conn:
+            self._write_operation_state(conn, service_name, operation_state)
+
+    def get_operation_state(self, service_name: str) -> dict | None:
+        """
+        Get operation state for a specific service.
+
+        Args:
+            service_name (str): Name of the service
+
+        Returns:
+            Optional[dict]: Operation state record or None if not found
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT service_name, operation_state, updated_at FROM operation_states "
+                "WHERE service_name = ?",
+                (service_name,),
+            )
+            .fetchone()
+        )
+        return self._operation_state_entry(row) if row else None
+
+    @staticmethod
+    def _group_interactions_by_request(
+        interactions: list[Interaction],
+        requests_by_id: dict[str, Request],
+        user_id: str | None,
+    ) -> list[RequestInteractionDataModel]:
+        """
+        Group interactions by request_id into RequestInteractionDataModel objects,
+        synthesizing a minimal Request when the request row is missing.
+        """
+        interactions_by_request: dict[str, list[Interaction]] = {}
+        for interaction in interactions:
+            interactions_by_request.setdefault(interaction.request_id, []).append(
+                interaction
+            )
+
+        sessions: list[RequestInteractionDataModel] = []
+        for request_id, request_interactions in interactions_by_request.items():
+            request = requests_by_id.get(request_id)
+            if request is None:
+                request = Request(
+                    request_id=request_id,
+                    user_id=request_interactions[0].user_id or (user_id or ""),
+                    created_at=request_interactions[0].created_at,
+                )
+            sessions.append(
+                RequestInteractionDataModel(
+                    session_id=request.session_id or request_id,
+                    request=request,
+                    interactions=request_interactions,
+                )
+            )
+        return sessions
+
+    def get_operation_state_with_new_request_interaction(
+        self,
+        service_name: str,
+        user_id: str | None,
+        sources: list[str] | None = None,
+    ) -> tuple[dict, list[RequestInteractionDataModel]]:
+        """
+        Retrieve operation state payload and interactions since last processing,
+        grouped by request.
+
+        Args:
+            service_name (str): Name of the service
+            user_id (Optional[str]): User identifier to filter interactions.
+                If None, returns interactions across all users.
+            sources (Optional[list[str]]): Optional list of sources to filter interactions by
+
+        Returns:
+            tuple[dict, list[RequestInteractionDataModel]]: Operation state payload and list of
+                RequestInteractionDataModel objects containing new interactions grouped by request
+        """
+        conn = self._connect()
+        state_record = self.get_operation_state(service_name)
+        operation_state: dict = {}
+        if state_record and isinstance(state_record.get("operation_state"), dict):
+            operation_state = state_record["operation_state"]
+
+        last_processed_ids = operation_state.get("last_processed_interaction_ids") or []
+        if not isinstance(last_processed_ids, list):
+            last_processed_ids = []
+        processed_set = {int(item) for item in last_processed_ids}
+
+        last_processed_timestamp = operation_state.get("last_processed_timestamp")
+        if not isinstance(last_processed_timestamp, int):
+            last_processed_timestamp = None
+
+        clauses = []
+        params: list = []
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if last_processed_timestamp is not None:
+            clauses.append("created_at >= ?")
+            params.append(last_processed_timestamp)
+        rows = conn.execute(
+            f"SELECT data FROM interactions{_where(clauses)} ORDER BY created_at, seq",  # noqa: S608
+            params,
+        ).fetchall()
+
+        new_interactions: list[Interaction] = []
+        for row in rows:
+            interaction = Interaction.model_validate_json(row[0])
+            if (
+                last_processed_timestamp is not None
+                and interaction.created_at > last_processed_timestamp
+            ) or interaction.interaction_id not in processed_set:
+                new_interactions.append(interaction)
+
+        requests_by_id = self._get_requests_by_ids(
+            conn, list({i.request_id for i in new_interactions})
+        )
+        sessions = [
+            session
+            for session in self._group_interactions_by_request(
+                new_interactions, requests_by_id, user_id
+            )
+            if sources is None or session.request.source in sources
+        ]
+        # Sort by the earliest interaction timestamp in each group
+        sessions.sort(
+            key=lambda g: (
+                min(i.created_at or 0 for i in g.interactions) if g.interactions else 0
+            )
+        )
+        return operation_state, sessions
+
+    def get_last_k_interactions_grouped(
+        self,
+        user_id: str | None,
+        k: int,
+        sources: list[str] | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        agent_version: str | None = None,
+    ) -> tuple[list[RequestInteractionDataModel], list[Interaction]]:
+        """
+        Get the last K interactions ordered by interaction_id (most recent first), grouped by request.
+
+        Source and agent_version filters are applied with a single JOIN against the
+        requests table instead of one request lookup per interaction.
+
+        Args:
+            user_id (Optional[str]): User identifier to filter interactions.
+                If None, returns interactions across all users.
+            k (int): Maximum number of interactions to retrieve
+            sources (Optional[list[str]]): Optional list of sources to filter interactions by.
+            start_time (Optional[int]): Unix timestamp. Only return interactions created at or after this time.
+            end_time (Optional[int]): Unix timestamp. Only return interactions created at or before this time.
+            agent_version (Optional[str]): Filter by agent_version on the request.
+
+        Returns:
+            tuple[list[RequestInteractionDataModel], list[Interaction]]:
+                - List of RequestInteractionDataModel objects (grouped by request/session)
+                - Flat list of all interactions sorted by interaction_id DESC
+        """
+        clauses = []
+        params: list = []
+        if user_id is not None:
+            clauses.append("i.user_id = ?")
+            params.append(user_id)
+        if start_time is not None:
+            clauses.append("i.created_at >= ?")
+            params.append(start_time)
+        if end_time is not None:
+            clauses.append("i.created_at <= ?")
+            params.append(end_time)
+        if sources is not None:
+            clauses.append(f"r.source IN ({_placeholders(sources)})")
+            params.extend(sources)
+        if agent_version is not None:
+            clauses.append("r.agent_version = ?")
+            params.append(agent_version)
+
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT i.data, r.data FROM interactions i "  # noqa: S608
+            "LEFT JOIN requests r ON r.request_id = i.request_id"
+            f"{_where(clauses)} ORDER BY i.interaction_id DESC, i.seq ASC LIMIT ?",
+            (*params, k),
+        ).fetchall()
+
+        flat_interactions: list[Interaction] = []
+        requests_by_id: dict[str, Request] = {}
+        for interaction_json, request_json in rows:
+            interaction = Interaction.model_validate_json(interaction_json)
+            flat_interactions.append(interaction)
+            if request_json and interaction.request_id not in requests_by_id:
+                requests_by_id[interaction.request_id] = Request.model_validate_json(
+                    request_json
+                )
+
+        sessions = self._group_interactions_by_request(
+            flat_interactions, requests_by_id, user_id
+        )
+        for session in sessions:
+            # Sort interactions by interaction_id ASC within the group (preserves insertion order)
+            session.interactions.sort(key=lambda x: x.interaction_id or 0)
+        # Sort groups by earliest interaction_id (preserves insertion order)
+        sessions.sort(
+            key=lambda g: (
+                min(i.interaction_id or 0 for i in g.interactions)
+                if g.interactions
+                else 0
+            )
+        )
+        return sessions, flat_interactions
+
+    def update_operation_state(self, service_name: str, operation_state: dict) -> None:
+        """
+        Update operation state for a specific service.
+
+        Args:
+            service_name (str): Name of the service
+            operation_state (dict): Operation state data as a dictionary
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE operation_states SET operation_state = ?, updated_at = ? "
+                "WHERE service_name = ?",
+                (json.dumps(operation_state), self._current_timestamp(), service_name),
+            )
+            if cursor.rowcount == 0:
+                raise StorageError(
+                    f"Operation state does not exist for service '{service_name}'"
+                )
+
+    def get_all_operation_states(self) -> list[dict]:
+        """
+        Get all operation states.
+
+        Returns:
+            list[dict]: List of all operation state records
+        """
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT service_name, operation_state, updated_at FROM operation_states"
+            )
+            .fetchall()
+        )
+        return [self._operation_state_entry(row) for row in rows]
+
+    def delete_operation_state(self, service_name: str) -> None:
+        """
+        Delete operation state for a specific service.
+
+        Args:
+            service_name (str): Name of the service
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM operation_states WHERE service_name = ?", (service_name,)
+            )
+
+    def delete_all_operation_states(self) -> None:
+        """Delete all operation states."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM operation_states")
+
+    def try_acquire_in_progress_lock(
+        self, state_key: str, request_id: str, stale_lock_seconds: int = 300
+    ) -> dict:
+        """
+        Atomically try to acquire an in-progress lock inside a write transaction.
+
+        Because the read and write happen under BEGIN IMMEDIATE, the lock is atomic
+        across threads and across processes sharing the database file. It either:
+        1. Acquires the lock if no active lock exists (or lock is stale)
+        2. Updates pending_request_id if an active lock is held by another request
+
+        Args:
+            state_key (str): The operation state key (e.g., "profile_generation_in_progress::3::user_id")
+            request_id (str): The current request's unique identifier
+            stale_lock_seconds (int): Seconds after which a lock is considered stale (default 300)
+
+        Returns:
+            dict: Result with keys:
+                - 'acquired' (bool): True if lock was acquired, False if blocked
+                - 'state' (dict): The current operation state after the operation
+        """
+        current_time = int(time.time())
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT operation_state FROM operation_states WHERE service_name = ?",
+                (state_key,),
+            ).fetchone()
+            current_state = json.loads(row[0]) if row else {}
+            if not isinstance(current_state, dict):
+                current_state = {}
+
+            in_progress = current_state.get("in_progress", False)
+            started_at = current_state.get("started_at", 0)
+
+            # Case 1: No lock or lock is not in_progress - acquire it
+            # Case 2: Lock is stale (started > stale_lock_seconds ago) - acquire it
+            if not in_progress or (current_time - started_at >= stale_lock_seconds):
+                new_state = {
+                    "in_progress": True,
+                    "started_at": current_time,
+                    "current_request_id": request_id,
+                    "pending_request_id": None,
+                }
+                self._write_operation_state(conn, state_key, new_state)
+                return {"acquired": True, "state": new_state}
+
+            # Case 3: Active lock exists - update pending_request_id
+            current_state["pending_request_id"] = request_id
+            self._write_operation_state(conn, state_key, current_state)
+            return {"acquired": False, "state": current_state}
+
+    # ==============================
+    # Statistics methods
+    # ==============================
+
+    def get_profile_statistics(self) -> dict:
+        """Get profile count statistics by status.
+
+        Returns:
+            dict with keys: current_count, pending_count, archived_count, expiring_soon_count
+        """
+        current_timestamp = int(datetime.now(timezone.utc).timestamp())
+        expiring_soon_timestamp = current_timestamp + (7 * 24 * 60 * 60)  # 7 days
+        row = (
+            self._connect()
+            .execute(
+                "SELECT COALESCE(SUM(status IS NULL), 0), "
+                "COALESCE(SUM(status = ?), 0), "
+                "COALESCE(SUM(status = ?), 0), "
+                "COALESCE(SUM(status IS NULL AND expiration_timestamp > ? "
+                "AND expiration_timestamp <= ?), 0) FROM profiles",
+                (
+                    Status.PENDING.value,
+                    Status.ARCHIVED.value,
+                    current_timestamp,
+                    expiring_soon_timestamp,
+                ),
+            )
+            .fetchone()
+        )
+        return {
+            "current_count": int(row[0]),
+            "pending_count": int(row[1]),
+            "archived_count": int(row[2]),
+            "expiring_soon_count": int(row[3]),
+        }
+
+    # ==============================
+    # Skill methods
+    # ==============================
+
+    def save_skills(self, skills: list[Skill]) -> None:
+        with self._transaction() as conn:
+            max_id = self._max_id(conn, "skills", "skill_id")
+            for skill in skills:
+                if skill.skill_id:
+                    # Update existing skill in place
+                    conn.execute(
+                        "UPDATE skills SET skill_id = ?, feedback_name = ?, "
+                        "agent_version = ?, skill_status = ?, data = ? WHERE skill_id = ?",
+                        (*self._skill_row(skill), skill.skill_id),
+                    )
+                else:
+                    # New skill: assign auto-incrementing ID
+                    max_id += 1
+                    skill.skill_id = max_id
+                    self._insert_skills(conn, [skill])
+
+    def get_skills(
+        self,
+        limit: int = 100,
+        feedback_name: str | None = None,
+        agent_version: str | None = None,
+        skill_status: SkillStatus | None = None,
+    ) -> list[Skill]:
+        clauses = []
+        params: list = []
+        if feedback_name:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        if agent_version:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        if skill_status:
+            clauses.append("skill_status = ?")
+            params.append(_status_value(skill_status))
+        rows = (
+            self._connect()
+            .execute(
+                f"SELECT data FROM skills{_where(clauses)} ORDER BY seq LIMIT ?",  # noqa: S608
+                (*params, limit),
+            )
+            .fetchall()
+        )
+        return [Skill.model_validate_json(row[0]) for row in rows]
+
+    def search_skills(
+        self,
+        query: str | None = None,
+        feedback_name: str | None = None,
+        agent_version: str | None = None,
+        skill_status: SkillStatus | None = None,
+        match_threshold: float = 0.5,  # noqa: ARG002
+        match_count: int = 10,
+        query_embedding: list[float] | None = None,  # noqa: ARG002
+    ) -> list[Skill]:
+        clauses = []
+        params: list = []
+        if feedback_name:
+            clauses.append("feedback_name = ?")
+            params.append(feedback_name)
+        if agent_version:
+            clauses.append("agent_version = ?")
+            params.append(agent_version)
+        if skill_status:
+            clauses.append("skill_status = ?")
+            params.append(_status_value(skill_status))
+        cursor = self._connect().execute(
+            f"SELECT data FROM skills{_where(clauses)} ORDER BY seq",  # noqa: S608
+            params,
+        )
+        results = []
+        for row in cursor:
+            s = Skill.model_validate_json(row[0])
+            if query and query.lower() not in (s.instructions + s.description).lower():
+                continue
+            results.append(s)
+            if len(results) >= match_count:
+                break
+        return results
+
+    def update_skill_status(self, skill_id: int, skill_status: SkillStatus) -> None:
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT seq, data FROM skills WHERE skill_id = ?", (skill_id,)
+            ).fetchall()
+            updates = []
+            for seq, skill_json in rows:
+                skill = Skill.model_validate_json(skill_json)
+                skill.skill_status = skill_status
+                updates.append(
+                    (
+                        _status_value(skill_status),
+                        skill.model_dump_json(context=COMPACT_EMBEDDING_JSON_CONTEXT),
+                        seq,
+                    )
+                )
+            conn.executemany(
+                "UPDATE skills SET skill_status = ?, data = ? WHERE seq = ?", updates
+            )
+
+    def delete_skill(self, skill_id: int) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM skills WHERE skill_id = ?", (skill_id,))
+
+    def delete_all_skills(self) -> None:
+        """Delete all skills for this organization."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM skills")
+
+    def get_interactions_by_request_ids(
+        self, request_ids: list[str]
+    ) -> list[Interaction]:
+        if not request_ids:
+            return []
+        rows = (
+            self._connect()
+            .execute(
+                "SELECT data FROM interactions WHERE request_id IN "  # noqa: S608
+                f"({_placeholders(request_ids)}) ORDER BY seq",
+                list(request_ids),
+            )
+            .fetchall()
+        )
+        return [Interaction.model_validate_json(row[0]) for row in rows]
@@ -1,6 +1,11 @@
+import functools
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 from reflexio_commons.api_schema.internal_schema import RequestInteractionDataModel
 from reflexio_commons.api_schema.retriever_schema import (
     SearchInteractionRequest,
@@ -24,6 +29,96 @@ from reflexio_commons.api_schema.service_schemas import (
 )
 
 from reflexio import data
+from reflexio.server import RAW_FEEDBACK_PAGE_SIZE
+from reflexio.server.services.executor_registry import run_in_executor_async
+from reflexio.server.services.search_result_cache import get_search_result_cache
+
+# Writes that can change unified search results. Writes of one user's profiles (user_id as first
+# argument or on the request) only invalidate that user's cached searches; the rest invalidate the org.
+_USER_SCOPED_SEARCH_WRITES = frozenset(
+    {
+        "add_user_profile",
+        "update_user_profile_by_id",
+        "delete_user_profile",
+        "delete_all_profiles_for_user",
+    }
+)
+_ORG_SCOPED_SEARCH_WRITES = frozenset(
+    {
+        "delete_all_profiles",
+        "update_all_profiles_status",
+        "delete_all_profiles_by_status",
+        "save_raw_feedbacks",
+        "save_feedbacks",
+        "delete_all_raw_feedbacks",
+        "delete_all_raw_feedbacks_by_feedback_name",
+        "delete_all_feedbacks",
+        "delete_feedback",
+        "delete_raw_feedback",
+        "delete_all_feedbacks_by_feedback_name",
+        "update_feedback_status",
+        "archive_feedbacks_by_feedback_name",
+        "archive_feedbacks_by_ids",
+        "restore_archived_feedbacks_by_feedback_name",
+        "restore_archived_feedbacks_by_ids",
+        "delete_archived_feedbacks_by_feedback_name",
+        "delete_feedbacks_by_ids",
+        "update_all_raw_feedbacks_status",
+        "delete_all_raw_feedbacks_by_status",
+        "delete_raw_feedbacks_by_ids",
+        "save_skills",
+        "update_skill_status",
+        "delete_skill",
+        "delete_all_skills",
+    }
+)
+
+
+def _invalidating_search_cache(
+    method: Callable[..., Any], user_scoped: bool
+) -> Callable[..., Any]:
+    """Wrap a storage write so it invalidates the cached unified searches it can affect."""
+
+    @functools.wraps(method)
+    def wrapper(self: "BaseStorage", *args: Any, **kwargs: Any) -> Any:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            user_id = None
+            if user_scoped:
+                target = (
+                    args[0] if args else kwargs.get("user_id", kwargs.get("request"))
+                )
+                user_id = (
+                    target
+                    if isinstance(target, str)
+                    else getattr(target, "user_id", None)
+                )
+            get_search_result_cache().invalidate(self.org_id, user_id)
+
+    wrapper._invalidates_search_cache = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _split_embeddings(
+    raw_feedbacks: list[RawFeedback],
+) -> tuple[list[RawFeedback], np.ndarray]:
+    """
+    Move the embeddings of raw feedbacks into one float32 matrix.
+
+    Args:
+        raw_feedbacks: Raw feedbacks, possibly with embeddings
+
+    Returns:
+        tuple[list[RawFeedback], np.ndarray]: Copies of the raw feedbacks without embeddings, and an
+            (n, dim) float32 matrix of their embeddings (zero rows for feedbacks without one)
+    """
+    dim = next((len(fb.embedding) for fb in raw_feedbacks if fb.embedding), 0)
+    matrix = np.zeros((len(raw_feedbacks), dim), dtype=np.float32)
+    for row, fb in enumerate(raw_feedbacks):
+        if fb.embedding:
+            matrix[row] = fb.embedding
+    return [fb.model_copy(update={"embedding": []}) for fb in raw_feedbacks], matrix
 
 
 class BaseStorage(ABC):
@@ -31,6 +126,22 @@ class BaseStorage(ABC):
     Base class for storage
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Backends implement the writes; wrap each implementation to keep the search cache fresh
+        for name in _USER_SCOPED_SEARCH_WRITES | _ORG_SCOPED_SEARCH_WRITES:
+            method = cls.__dict__.get(name)
+            if callable(method) and not getattr(
+                method, "_invalidates_search_cache", False
+            ):
+                setattr(
+                    cls,
+                    name,
+                    _invalidating_search_cache(
+                        method, name in _USER_SCOPED_SEARCH_WRITES
+                    ),
+                )
+
     def __init__(self, org_id: str, base_dir: str | None = None) -> None:
         self.org_id = org_id
         if base_dir is None:
@@ -226,6 +337,28 @@ class BaseStorage(ABC):
         """
         raise NotImplementedError
 
+    def add_requests_bulk(
+        self, requests: list[Request], interactions: list[Interaction]
+    ) -> None:
+        """
+        Add many requests and their interactions, of any number of users.
+
+        The default implementation adds the requests one by one, then each user's interactions with
+        add_user_interactions_bulk; storages override it to write everything with batched embedding
+        calls and bulk inserts.
+
+        Args:
+            requests: Requests to store (before their interactions)
+            interactions: Interactions of the requests
+        """
+        for request in requests:
+            self.add_request(request)
+        interactions_by_user: dict[str, list[Interaction]] = {}
+        for interaction in interactions:
+            interactions_by_user.setdefault(interaction.user_id, []).append(interaction)
+        for user_id, user_interactions in interactions_by_user.items():
+            self.add_user_interactions_bulk(user_id, user_interactions)
+
     @abstractmethod
     def get_request(self, request_id: str) -> Request | None:
         """
@@ -415,6 +548,51 @@ class BaseStorage(ABC):
     ) -> list[UserProfile]:
         raise NotImplementedError
 
+    # ==============================
+    # Async read methods
+    # ==============================
+    # Used by the async API endpoints. The defaults run the sync method on the shared "storage"
+    # executor so the event loop never blocks; backends with an async client override them.
+
+    async def aget_user_profile(
+        self,
+        user_id: str,
+        status_filter: list[Status | None] | None = None,
+    ) -> list[UserProfile]:
+        """Async twin of get_user_profile."""
+        return await run_in_executor_async(
+            "storage", self.get_user_profile, user_id, status_filter=status_filter
+        )
+
+    async def asearch_user_profile(
+        self,
+        search_user_profile_request: SearchUserProfileRequest,
+        status_filter: list[Status | None] | None = None,
+        query_embedding: list[float] | None = None,
+    ) -> list[UserProfile]:
+        """Async twin of search_user_profile."""
+        return await run_in_executor_async(
+            "storage",
+            self.search_user_profile,
+            search_user_profile_request,
+            status_filter=status_filter,
+            query_embedding=query_embedding,
+        )
+
+    async def asearch_raw_feedbacks(self, **kwargs: Any) -> list[RawFeedback]:
+        """Async twin of search_raw_feedbacks (same keyword arguments)."""
+        return await run_in_executor_async(
+            "storage", self.search_raw_feedbacks, **kwargs
+        )
+
+    async def asearch_feedbacks(self, **kwargs: Any) -> list[Feedback]:
+        """Async twin of search_feedbacks (same keyword arguments)."""
+        return await run_in_executor_async("storage", self.search_feedbacks, **kwargs)
+
+    async def asearch_skills(self, **kwargs: Any) -> list[Skill]:
+        """Async twin of search_skills (same keyword arguments)."""
+        return await run_in_executor_async("storage", self.search_skills, **kwargs)
+
     # ==============================
     # Feedback methods
     # ==============================
@@ -455,6 +633,90 @@ class BaseStorage(ABC):
         """
         raise NotImplementedError
 
+    def iter_raw_feedback_pages(
+        self,
+        user_id: str | None = None,
+        feedback_name: str | None = None,
+        agent_version: str | None = None,
+        status_filter: list[Status | None] | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        page_size: int = RAW_FEEDBACK_PAGE_SIZE,
+    ) -> Iterator[tuple[list[RawFeedback], np.ndarray]]:
+        """
+        Stream all matching raw feedbacks with their embeddings, one page at a time.
+
+        Unlike get_raw_feedbacks this is not capped by a limit. The default implementation loads all
+        matching rows through get_raw_feedbacks and splits them into pages; storages backed by a remote
+        database override it to fetch pages with keyset pagination.
+
+        Args:
+            user_id (str, optional): The user ID to filter by
+            feedback_name (str, optional): The feedback name to filter by
+            agent_version (str, optional): The agent version to filter by
+            status_filter (list[Optional[Status]], optional): List of status values to filter by
+            start_time (int, optional): Unix timestamp. Only return feedbacks created at or after this time.
+            end_time (int, optional): Unix timestamp. Only return feedbacks created at or before this time.
+            page_size (int): Max raw feedbacks per page
+
+        Yields:
+            tuple[list[RawFeedback], np.ndarray]: Raw feedbacks of the page without embeddings, and their
+                embeddings as a float32 matrix with one row per feedback (zeros for feedbacks without one)
+        """
+        raw_feedbacks = self.get_raw_feedbacks(
+            limit=sys.maxsize,
+            user_id=user_id,
+            feedback_name=feedback_name,
+            agent_version=agent_version,
+            status_filter=status_filter,
+            start_time=start_time,
+            end_time=end_time,
+            include_embedding=True,
+        )
+        for start in range(0, len(raw_feedbacks), max(page_size, 1)):
+            yield _split_embeddings(raw_feedbacks[start : start + page_size])
+
+    def get_raw_feedbacks_with_embeddings(
+        self,
+        user_id: str | None = None,
+        feedback_name: str | None = None,
+        agent_version: str | None = None,
+        status_filter: list[Status | None] | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        page_size: int = RAW_FEEDBACK_PAGE_SIZE,
+    ) -> tuple[list[RawFeedback], np.ndarray]:
+        """
+        Get all matching raw feedbacks and their embeddings as one float32 matrix.
+
+        Collects the pages of iter_raw_feedback_pages (same arguments).
+
+        Returns:
+            tuple[list[RawFeedback], np.ndarray]: Raw feedbacks without embeddings, and an
+                (n, dim) float32 matrix whose row i is the embedding of raw feedback i
+        """
+        raw_feedbacks: list[RawFeedback] = []
+        matrices: list[np.ndarray] = []
+        for page, matrix in self.iter_raw_feedback_pages(
+            user_id=user_id,
+            feedback_name=feedback_name,
+            agent_version=agent_version,
+            status_filter=status_filter,
+            start_time=start_time,
+            end_time=end_time,
+            page_size=page_size,
+        ):
+            raw_feedbacks.extend(page)
+            matrices.append(matrix)
+        # Pages without any embedding have zero columns; pad them to the common dimension
+        dim = max((matrix.shape[1] for matrix in matrices), default=0)
+        embeddings = np.zeros((len(raw_feedbacks), dim), dtype=np.float32)
+        row = 0
+        for matrix in matrices:
+            embeddings[row : row + len(matrix), : matrix.shape[1]] = matrix
+            row += len(matrix)
+        return raw_feedbacks, embeddings
+
     @abstractmethod
     def count_raw_feedbacks(
         self,
@@ -0,0 +1,179 @@
+"""
+Process-wide pool of Supabase clients shared by every SupabaseStorage.
+
+create_client() builds a supabase Client whose PostgREST, auth and storage sub-clients each open
+their own httpx connection pool, so every Reflexio construction (and every rebuild after a cache
+eviction) paid for fresh TLS handshakes. The pool keeps one Client per (url, key), and all of
+them send requests through a single HTTP/2 keep-alive httpx client, so orgs on the same Supabase
+host also share connections. Async clients are pooled the same way, per event loop.
+"""
+
+import asyncio
+import threading
+import weakref
+
+import httpx
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
+from supabase.lib.client_options import AsyncClientOptions, SyncClientOptions
+
+from reflexio.server import (
+    SUPABASE_HTTP_KEEPALIVE_SECONDS,
+    SUPABASE_HTTP_MAX_CONNECTIONS,
+)
+from supabase import AsyncClient, Client, acreate_client, create_client
+
+# Pool key: (supabase url, supabase key)
+PoolKey = tuple[str, str]
+
+
+def _http_limits() -> httpx.Limits:
+    """Connection limits of the shared httpx clients."""
+    return httpx.Limits(
+        max_connections=SUPABASE_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=SUPABASE_HTTP_MAX_CONNECTIONS,
+        keepalive_expiry=SUPABASE_HTTP_KEEPALIVE_SECONDS,
+    )
+
+
+class SupabaseClientPool:
+    """Supabase clients keyed by (url, key) over one shared HTTP/2 connection pool.
+
+    Sync clients are shared by all threads (httpx.Client is thread-safe). httpx async
+    connections are bound to the loop that opened them, so async clients and their httpx
+    client are kept per event loop and dropped with the loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._http_client: httpx.Client | None = None
+        self._clients: dict[PoolKey, Client] = {}
+        self._async_http_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[PoolKey, AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._hits = 0
+        self._misses = 0
+        self._async_hits = 0
+        self._async_misses = 0
+
+    def get(self, url: str, key: str) -> Client:
+        """
+        Get the shared sync client of a Supabase project, creating it on first use.
+
+        Args:
+            url (str): Supabase project URL
+            key (str): Supabase API key
+
+        Returns:
+            Client: Client sending requests through the shared httpx client
+        """
+        pool_key: PoolKey = (url, key)
+        with self._lock:
+            client = self._clients.get(pool_key)
+            if client is not None:
+                self._hits += 1
+                return client
+            self._misses += 1
+            if self._http_client is None:
+                self._http_client = httpx.Client(
+                    http2=True,
+                    limits=_http_limits(),
+                    timeout=DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+                    follow_redirects=True,
+                )
+            # create_client only builds objects (sub-clients are created on first use)
+            client = create_client(
+                url, key, options=SyncClientOptions(httpx_client=self._http_client)
+            )
+            self._clients[pool_key] = client
+            return client
+
+    async def aget(self, url: str, key: str) -> AsyncClient:
+        """
+        Get the shared async client of a Supabase project for the running event loop.
+
+        Args:
+            url (str): Supabase project URL
+            key (str): Supabase API key
+
+        Returns:
+            AsyncClient: Client sending requests through this loop's shared httpx client
+        """
+        pool_key: PoolKey = (url, key)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(pool_key)
+            if client is not None:
+                self._async_hits += 1
+                return client
+            self._async_misses += 1
+            http_client = self._async_http_clients.get(loop)
+            if http_client is None:
+                http_client = httpx.AsyncClient(
+                    http2=True,
+                    limits=_http_limits(),
+                    timeout=DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+                    follow_redirects=True,
+                )
+                self._async_http_clients[loop] = http_client
+        client = await acreate_client(
+            url, key, options=AsyncClientOptions(httpx_client=http_client)
+        )
+        with self._lock:
+            # Keep the first client if another task on this loop raced us
+            return clients.setdefault(pool_key, client)
+
+    def stats(self) -> dict[str, int]:
+        """Get pool sizes and hit/miss counters."""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "hits": self._hits,
+                "misses": self._misses,
+                "async_clients": sum(len(c) for c in self._async_clients.values()),
+                "async_hits": self._async_hits,
+                "async_misses": self._async_misses,
+                "event_loops": len(self._async_http_clients),
+            }
+
+    def clear(self) -> None:
+        """Drop all pooled clients and close the shared sync connection pool.
+
+        Async httpx clients are left to be garbage-collected with their loop, since they can
+        only be closed from it.
+        """
+        with self._lock:
+            http_client = self._http_client
+            self._http_client = None
+            self._clients.clear()
+            self._async_clients.clear()
+            self._async_http_clients.clear()
+            self._hits = self._misses = self._async_hits = self._async_misses = 0
+        if http_client is not None:
+            http_client.close()
+
+
+_pool = SupabaseClientPool()
+
+
+def get_supabase_client(url: str, key: str) -> Client:
+    """Get the process-wide sync Supabase client for (url, key)."""
+    return _pool.get(url, key)
+
+
+async def aget_supabase_client(url: str, key: str) -> AsyncClient:
+    """Get the process-wide async Supabase client for (url, key) on the running loop."""
+    return await _pool.aget(url, key)
+
+
+def get_supabase_client_pool_stats() -> dict[str, int]:
+    """Get pool sizes and hit/miss counters of the Supabase client pool for monitoring."""
+    return _pool.stats()
+
+
+def clear_supabase_client_pool() -> None:
+    """Drop all pooled Supabase clients (for testing/admin)."""
+    _pool.clear()
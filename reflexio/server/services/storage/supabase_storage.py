@@ -2,13 +2,17 @@
 Storage class that uses Supabase as vector db for storing data
 """
 
+import base64
 import functools
+import inspect
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
 from reflexio_commons.api_schema.internal_schema import RequestInteractionDataModel
 from reflexio_commons.api_schema.retriever_schema import (
     SearchInteractionRequest,
@@ -43,9 +47,14 @@ from reflexio_commons.config_schema import (
 )
 
 from reflexio import data
+from reflexio.server import RAW_FEEDBACK_PAGE_SIZE
 from reflexio.server.llm.litellm_client import LiteLLMClient, LiteLLMConfig
 from reflexio.server.services.storage.error import StorageError
 from reflexio.server.services.storage.storage_base import BaseStorage
+from reflexio.server.services.storage.supabase_client_pool import (
+    aget_supabase_client,
+    get_supabase_client,
+)
 from reflexio.server.services.storage.supabase_storage_utils import (
     agent_success_evaluation_result_to_data,
     execute_migration,
@@ -53,6 +62,7 @@ from reflexio.server.services.storage.supabase_storage_utils import (
     feedback_to_data,
     interaction_to_data,
     profile_change_log_to_data,
+    raw_feedback_embedding_text,
     raw_feedback_to_data,
     request_to_data,
     response_list_to_feedback_aggregation_change_logs,
@@ -63,10 +73,11 @@ from reflexio.server.services.storage.supabase_storage_utils import (
     response_to_request,
     response_to_skill,
     skill_to_data,
+    user_profile_embedding_text,
     user_profile_to_data,
 )
-from reflexio.server.site_var.site_var_manager import SiteVarManager
-from supabase import Client, create_client
+from reflexio.server.site_var.site_var_manager import get_site_var_manager
+from supabase import AsyncClient, Client
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +94,11 @@ _EVAL_RESULT_COLUMNS = "result_id, session_id, agent_version, evaluation_name, i
 _SKILL_COLUMNS = "skill_id, skill_name, description, version, agent_version, feedback_name, instructions, allowed_tools, blocking_issues, raw_feedback_ids, skill_status, created_at, updated_at"
 _OPERATION_STATE_COLUMNS = "service_name, operation_state, updated_at"
 
+# Multi-item save paths embed texts in chunks of _EMBEDDING_BATCH_SIZE per API call and
+# write rows in chunks of _BULK_WRITE_BATCH_SIZE per PostgREST request.
+_EMBEDDING_BATCH_SIZE = 100
+_BULK_WRITE_BATCH_SIZE = 500
+
 
 def _parse_blocking_issue(data: dict) -> BlockingIssue | None:
     """Safely parse a blocking_issue JSONB value from the database.
@@ -103,6 +119,95 @@ def _parse_blocking_issue(data: dict) -> BlockingIssue | None:
         return None
 
 
+def _decode_embedding_texts(
+    values: list[str | None], dtype: type = np.float32
+) -> np.ndarray:
+    """Parse pgvector text values ("[0.1,0.2,...]") into a matrix in one vectorized pass.
+
+    Args:
+        values: Embedding column values of a page of rows (None for rows without an embedding)
+        dtype: Element type of the matrix
+
+    Returns:
+        np.ndarray: (rows, dim) matrix with zero rows for missing embeddings
+    """
+    present = [row for row, value in enumerate(values) if value]
+    if not present:
+        return np.zeros((len(values), 0), dtype=dtype)
+    flat = np.fromstring(
+        ",".join(values[row].strip("[]") for row in present),  # type: ignore[reportOptionalMemberAccess]
+        dtype=dtype,
+        sep=",",
+    )
+    parsed = flat.reshape(len(present), -1)
+    if len(present) == len(values):
+        return parsed
+    matrix = np.zeros((len(values), parsed.shape[1]), dtype=dtype)
+    matrix[present] = parsed
+    return matrix
+
+
+def _decode_embedding_b64(values: list[str | None]) -> np.ndarray:
+    """Decode base64 pgvector binary values (embedding_b64 column) into a float32 matrix.
+
+    The pgvector binary format is an int16 dimension, an int16 unused field and the vector as
+    big-endian float4, so a page of equal-dimension vectors is one (rows, 1 + dim) big-endian
+    array whose first column is the header.
+
+    Args:
+        values: embedding_b64 column values of a page of rows (None for rows without an embedding)
+
+    Returns:
+        np.ndarray: (rows, dim) float32 matrix with zero rows for missing embeddings
+    """
+    buffers = [base64.b64decode(value) if value else None for value in values]
+    dim = next((len(buffer) // 4 - 1 for buffer in buffers if buffer), 0)
+    missing = bytes(4 * (dim + 1))
+    flat = np.frombuffer(b"".join(buffer or missing for buffer in buffers), dtype=">f4")
+    return flat.reshape(len(values), dim + 1)[:, 1:].astype(np.float32)
+
+
+def _filter_raw_feedbacks_query(
+    query: Any,
+    user_id: str | None,
+    feedback_name: str | None,
+    agent_version: str | None,
+    status_filter: list[Status | None] | None,
+    start_time: int | None,
+    end_time: int | None,
+) -> Any:
+    """Apply the get_raw_feedbacks filters to a Supabase query builder.
+
+    Returns:
+        Modified query builder with the filters applied
+    """
+    # Add user_id filter if specified
+    if user_id is not None:
+        query = query.eq("user_id", user_id)
+
+    # Add feedback_name filter if specified (skip if None or empty string)
+    if feedback_name:
+        query = query.eq("feedback_name", feedback_name)
+
+    # Add agent_version filter if specified
+    if agent_version is not None:
+        query = query.eq("agent_version", agent_version)
+
+    # Add time range filters if specified
+    if start_time is not None:
+        start_time_iso = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
+        query = query.gte("created_at", start_time_iso)
+    if end_time is not None:
+        end_time_iso = datetime.fromtimestamp(end_time, tz=timezone.utc).isoformat()
+        query = query.lte("created_at", end_time_iso)
+
+    # Add status filter if specified
+    if status_filter is not None:
+        query = _apply_status_filter_to_query(query, status_filter)
+
+    return query
+
+
 def _timestamp_to_iso(ts: int) -> str:
     """Convert a Unix timestamp to ISO format string for Supabase queries.
 
@@ -278,22 +383,47 @@ class SupabaseStorage(BaseStorage):
 
     @staticmethod
     def handle_exceptions(func: Callable[..., Any]) -> Callable[..., Any]:
+        def to_storage_error(e: Exception) -> StorageError:
+            import traceback
+
+            stack_trace = traceback.format_exc()
+            logger.error(
+                "Error in %s: %s\nStack trace:\n%s",
+                func.__name__,
+                str(e),
+                stack_trace,
+            )
+            error_msg = f"{str(e)}\nStack trace:\n{stack_trace}"
+            return StorageError(message=error_msg)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    raise to_storage_error(e) from e
+
+            return async_wrapper
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    yield from func(*args, **kwargs)
+                except Exception as e:
+                    raise to_storage_error(e) from e
+
+            return generator_wrapper
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                import traceback
-
-                stack_trace = traceback.format_exc()
-                logger.error(
-                    "Error in %s: %s\nStack trace:\n%s",
-                    func.__name__,
-                    str(e),
-                    stack_trace,
-                )
-                error_msg = f"{str(e)}\nStack trace:\n{stack_trace}"
-                raise StorageError(message=error_msg) from e
+                raise to_storage_error(e) from e
 
         return wrapper
 
@@ -323,14 +453,21 @@ class SupabaseStorage(BaseStorage):
             "Supabase Storage for org %s uses URL %s", org_id, self.supabase_url
         )
         try:
-            self.client: Client = create_client(self.supabase_url, self.supabase_key)
+            # Shared with every other instance using this project (see supabase_client_pool)
+            self.client: Client = get_supabase_client(
+                self.supabase_url, self.supabase_key
+            )
+            # Cleared when the embedding_b64 computed column is missing (migration not applied)
+            self._binary_embeddings = True
         except Exception as e:
             err_msg = f"Supabase Storage failed to connect: {str(e)}"
             logger.exception(err_msg)
             raise StorageError(err_msg) from e
 
         # Get site var for supabase settings (including search_mode)
-        self.supabase_settings = SiteVarManager().get_site_var("supabase_settings")
+        self.supabase_settings = get_site_var_manager().get_site_var(
+            "supabase_settings"
+        )
         if isinstance(self.supabase_settings, dict):
             search_mode_str = self.supabase_settings.get("search_mode", "hybrid")
             self.search_mode = SearchMode(search_mode_str)
@@ -338,7 +475,7 @@ class SupabaseStorage(BaseStorage):
             self.search_mode = SearchMode.HYBRID
 
         # Get site var as fallback for model settings
-        self.model_setting = SiteVarManager().get_site_var("llm_model_setting")
+        self.model_setting = get_site_var_manager().get_site_var("llm_model_setting")
         if not isinstance(self.model_setting, dict):
             raise ValueError("llm_model_setting must be a dict")
 
@@ -351,6 +488,8 @@ class SupabaseStorage(BaseStorage):
             )
         )
         self.embedding_dimensions = EMBEDDING_DIMENSIONS
+        # Cumulative per-table save latency, see get_save_metrics()
+        self._save_metrics: dict[str, dict[str, float]] = {}
 
         try:
             # Use LiteLLMClient with embedding model configuration
@@ -365,6 +504,18 @@ class SupabaseStorage(BaseStorage):
             logger.exception(err_msg)
             raise StorageError(err_msg) from e
 
+    async def _get_async_client(self) -> AsyncClient:
+        """
+        Get the async Supabase client of the running event loop from the shared client pool.
+
+        httpx async connections are bound to the loop that opened them, so each loop gets its own
+        client (normally just the server's loop and the shared LLM event loop).
+
+        Returns:
+            AsyncClient: Async client for this org's Supabase project
+        """
+        return await aget_supabase_client(self.supabase_url, self.supabase_key)
+
     def _current_timestamp(self) -> str:
         """Return a timezone-aware ISO timestamp for updated_at."""
         return datetime.now(timezone.utc).isoformat()
@@ -472,12 +623,36 @@ class SupabaseStorage(BaseStorage):
         user_id: str,
         status_filter: list[Status | None] | None = None,
     ) -> list[UserProfile]:
+        response = self._user_profile_query(
+            self.client, user_id, status_filter
+        ).execute()
+        return response_list_to_user_profiles(response.data)
+
+    @handle_exceptions
+    async def aget_user_profile(
+        self,
+        user_id: str,
+        status_filter: list[Status | None] | None = None,
+    ) -> list[UserProfile]:
+        client = await self._get_async_client()
+        response = await self._user_profile_query(
+            client, user_id, status_filter
+        ).execute()
+        return response_list_to_user_profiles(response.data)
+
+    @staticmethod
+    def _user_profile_query(
+        client: Client | AsyncClient,
+        user_id: str,
+        status_filter: list[Status | None] | None,
+    ) -> Any:
+        """Build the profiles query of get_user_profile on a sync or async client."""
         if status_filter is None:
             status_filter = [None]  # Default to current profiles (status=None)
 
         current_timestamp = int(datetime.now(timezone.utc).timestamp())
         query = (
-            self.client.table("profiles")
+            client.table("profiles")
             .select(_PROFILE_COLUMNS)
             .eq("user_id", user_id)
             .gte("expiration_timestamp", current_timestamp)
@@ -504,9 +679,7 @@ class SupabaseStorage(BaseStorage):
         else:
             # Only non-None statuses: status IN (...)
             query = query.in_("status", status_strings)
-
-        response = query.execute()
-        return response_list_to_user_profiles(response.data)
+        return query
 
     @handle_exceptions
     def get_user_interaction(self, user_id: str) -> list[Interaction]:
@@ -520,14 +693,38 @@ class SupabaseStorage(BaseStorage):
 
     @handle_exceptions
     def add_user_profile(self, user_id: str, user_profiles: list[UserProfile]) -> None:  # noqa: ARG002
-        for profile in user_profiles:
-            embedding = self._get_embedding(
-                "\n".join([profile.profile_content, str(profile.custom_features)])
-            )
+        """
+        Save profiles with embeddings.
+
+        Profiles that already carry an embedding (e.g. computed by ProfileDeduplicator from
+        `user_profile_embedding_text`) are saved without re-embedding.
+
+        Args:
+            user_id (str): User ID of the profiles
+            user_profiles (list[UserProfile]): Profiles to save
+        """
+        if not user_profiles:
+            return
+        embed_start = time.perf_counter()
+        precomputed = [profile.embedding for profile in user_profiles]
+        embeddings, embedding_calls = self._get_embeddings(
+            [user_profile_embedding_text(profile) for profile in user_profiles],
+            precomputed=precomputed,
+        )
+        for profile, embedding in zip(user_profiles, embeddings, strict=True):
             profile.embedding = embedding
-            self.client.table("profiles").upsert(
-                user_profile_to_data(profile)
-            ).execute()
+        write_start = time.perf_counter()
+        self._bulk_upsert(
+            "profiles", [user_profile_to_data(profile) for profile in user_profiles]
+        )
+        self._record_save_metrics(
+            "profiles",
+            rows=len(user_profiles),
+            embedding_calls=embedding_calls,
+            reused_embeddings=self._count_reusable(precomputed),
+            embed_seconds=write_start - embed_start,
+            write_seconds=time.perf_counter() - write_start,
+        )
 
     @handle_exceptions
     def add_user_interaction(self, user_id: str, interaction: Interaction) -> None:  # noqa: ARG002
@@ -568,6 +765,7 @@ class SupabaseStorage(BaseStorage):
         ]
 
         # Get all embeddings in a single API call
+        embed_start = time.perf_counter()
         embeddings = self.llm_client.get_embeddings(
             texts, self.embedding_model_name, self.embedding_dimensions
         )
@@ -577,8 +775,16 @@ class SupabaseStorage(BaseStorage):
             interaction.embedding = embedding
 
         # Bulk upsert all interactions
+        write_start = time.perf_counter()
         data_list = [interaction_to_data(interaction) for interaction in interactions]
         self.client.table("interactions").upsert(data_list).execute()
+        self._record_save_metrics(
+            "interactions",
+            rows=len(interactions),
+            embedding_calls=1,
+            embed_seconds=write_start - embed_start,
+            write_seconds=time.perf_counter() - write_start,
+        )
 
     @handle_exceptions
     def delete_user_interaction(self, request: DeleteUserInteractionRequest) -> None:
@@ -611,9 +817,7 @@ class SupabaseStorage(BaseStorage):
             return
 
         # Get embedding for the updated profile
-        embedding = self._get_embedding(
-            "\n".join([new_profile.profile_content, str(new_profile.custom_features)])
-        )
+        embedding = self._get_embedding(user_profile_embedding_text(new_profile))
         new_profile.embedding = embedding
         self.client.table("profiles").update(user_profile_to_data(new_profile)).eq(
             "profile_id", profile_id
@@ -799,6 +1003,68 @@ class SupabaseStorage(BaseStorage):
         """
         self.client.table("requests").upsert(request_to_data(request)).execute()
 
+    @handle_exceptions
+    def add_requests_bulk(
+        self, requests: list[Request], interactions: list[Interaction]
+    ) -> None:
+        """
+        Add many requests and their interactions, of any number of users.
+
+        Interactions are embedded `_EMBEDDING_BATCH_SIZE` texts per API call, and requests and
+        interactions are written `_BULK_WRITE_BATCH_SIZE` rows per upsert.
+
+        Args:
+            requests: Requests to store (written before their interactions)
+            interactions: Interactions of the requests
+        """
+        write_start = time.perf_counter()
+        self._bulk_upsert("requests", [request_to_data(r) for r in requests])
+        self._record_save_metrics(
+            "requests",
+            rows=len(requests),
+            embedding_calls=0,
+            embed_seconds=0.0,
+            write_seconds=time.perf_counter() - write_start,
+        )
+        if not interactions:
+            return
+
+        # Same texts as add_user_interactions_bulk; blank ones are embedded too, as the column
+        # requires a vector
+        texts = [
+            "\n".join(
+                [interaction.content or "", interaction.user_action_description or ""]
+            )
+            for interaction in interactions
+        ]
+        embed_start = time.perf_counter()
+        embedding_calls = 0
+        for start in range(0, len(texts), _EMBEDDING_BATCH_SIZE):
+            embeddings = self.llm_client.get_embeddings(
+                texts[start : start + _EMBEDDING_BATCH_SIZE],
+                self.embedding_model_name,
+                self.embedding_dimensions,
+            )
+            embedding_calls += 1
+            for interaction, embedding in zip(
+                interactions[start : start + _EMBEDDING_BATCH_SIZE],
+                embeddings,
+                strict=True,
+            ):
+                interaction.embedding = embedding
+
+        write_start = time.perf_counter()
+        self._bulk_upsert(
+            "interactions", [interaction_to_data(i) for i in interactions]
+        )
+        self._record_save_metrics(
+            "interactions",
+            rows=len(interactions),
+            embedding_calls=embedding_calls,
+            embed_seconds=write_start - embed_start,
+            write_seconds=time.perf_counter() - write_start,
+        )
+
     @handle_exceptions
     def get_request(self, request_id: str) -> Request | None:
         """
@@ -1195,31 +1461,74 @@ class SupabaseStorage(BaseStorage):
         status_filter: list[Status | None] | None = None,
         query_embedding: list[float] | None = None,
     ) -> list[UserProfile]:
-        if status_filter is None:
-            status_filter = [None]  # Default to current profiles (status=None)
-
-        current_timestamp = int(datetime.now(timezone.utc).timestamp())
         # Perform hybrid search (vector + FTS)
         if not search_user_profile_request.query:
             return []
 
-        query_text = search_user_profile_request.query
         response = self.client.rpc(
             "hybrid_match_profiles",
-            {
-                "p_query_embedding": query_embedding or self._get_embedding(query_text),
-                "p_query_text": query_text,
-                "p_match_threshold": search_user_profile_request.threshold or 0.7,
-                "p_match_count": search_user_profile_request.top_k or 10,
-                "p_current_epoch": current_timestamp,
-                "p_filter_user_id": search_user_profile_request.user_id,
-                "p_search_mode": self.search_mode.value,
-                "p_rrf_k": 60,
-                "p_filter_extractor_name": search_user_profile_request.extractor_name,
-            },
+            self._hybrid_match_profiles_params(
+                search_user_profile_request,
+                query_embedding
+                or self._get_embedding(search_user_profile_request.query),
+            ),
         ).execute()
+        return self._filter_searched_profiles(
+            response.data, search_user_profile_request, status_filter
+        )
 
-        data = cast(list[dict[str, Any]], response.data)
+    @handle_exceptions
+    async def asearch_user_profile(
+        self,
+        search_user_profile_request: SearchUserProfileRequest,
+        status_filter: list[Status | None] | None = None,
+        query_embedding: list[float] | None = None,
+    ) -> list[UserProfile]:
+        if not search_user_profile_request.query:
+            return []
+
+        client = await self._get_async_client()
+        response = await client.rpc(
+            "hybrid_match_profiles",
+            self._hybrid_match_profiles_params(
+                search_user_profile_request,
+                query_embedding
+                or await self._aget_embedding(search_user_profile_request.query),
+            ),
+        ).execute()
+        return self._filter_searched_profiles(
+            response.data, search_user_profile_request, status_filter
+        )
+
+    def _hybrid_match_profiles_params(
+        self,
+        search_user_profile_request: SearchUserProfileRequest,
+        query_embedding: list[float],
+    ) -> dict[str, Any]:
+        """Build the hybrid_match_profiles RPC arguments of search_user_profile."""
+        return {
+            "p_query_embedding": query_embedding,
+            "p_query_text": search_user_profile_request.query,
+            "p_match_threshold": search_user_profile_request.threshold or 0.7,
+            "p_match_count": search_user_profile_request.top_k or 10,
+            "p_current_epoch": int(datetime.now(timezone.utc).timestamp()),
+            "p_filter_user_id": search_user_profile_request.user_id,
+            "p_search_mode": self.search_mode.value,
+            "p_rrf_k": 60,
+            "p_filter_extractor_name": search_user_profile_request.extractor_name,
+        }
+
+    @staticmethod
+    def _filter_searched_profiles(
+        rows: Any,
+        search_user_profile_request: SearchUserProfileRequest,
+        status_filter: list[Status | None] | None,
+    ) -> list[UserProfile]:
+        """Apply the status, source and custom_feature filters of search_user_profile to RPC rows."""
+        if status_filter is None:
+            status_filter = [None]  # Default to current profiles (status=None)
+
+        data = cast(list[dict[str, Any]], rows)
         profiles = response_list_to_user_profiles(data)
         filtered_profiles = []
         for profile in profiles:
@@ -1277,6 +1586,136 @@ class SupabaseStorage(BaseStorage):
             text, self.embedding_model_name, self.embedding_dimensions
         )
 
+    async def _aget_embedding(self, text: str) -> list[float]:
+        """
+        Async twin of _get_embedding.
+
+        Args:
+            text: Text to get embedding for
+
+        Returns:
+            list[float]: Embedding vector
+        """
+        return await self.llm_client.aget_embedding(
+            text, self.embedding_model_name, self.embedding_dimensions
+        )
+
+    def _get_embeddings(
+        self,
+        texts: list[str],
+        precomputed: list[list[float]] | None = None,
+    ) -> tuple[list[list[float]], int]:
+        """
+        Get embeddings for many texts, batching up to `_EMBEDDING_BATCH_SIZE` texts per API call.
+
+        Blank texts are not sent and get an empty embedding.
+
+        Args:
+            texts: Texts to get embeddings for
+            precomputed: Optional embeddings already computed for the same texts (aligned with `texts`);
+                entries with the configured dimensions are reused instead of being re-embedded
+
+        Returns:
+            tuple[list[list[float]], int]: Embeddings in input order, and the number of API calls made
+        """
+        embeddings: list[list[float]] = [
+            list(vector) if vector and len(vector) == self.embedding_dimensions else []
+            for vector in (precomputed or [[] for _ in texts])
+        ]
+        pending = [
+            i
+            for i, text in enumerate(texts)
+            if not embeddings[i] and text and text.strip()
+        ]
+        calls = 0
+        for start in range(0, len(pending), _EMBEDDING_BATCH_SIZE):
+            chunk = pending[start : start + _EMBEDDING_BATCH_SIZE]
+            vectors = self.llm_client.get_embeddings(
+                [texts[i] for i in chunk],
+                self.embedding_model_name,
+                self.embedding_dimensions,
+            )
+            calls += 1
+            for i, vector in zip(chunk, vectors, strict=True):
+                embeddings[i] = vector
+        return embeddings, calls
+
+    def _bulk_upsert(self, table: str, rows: list[dict[str, Any]]) -> list[Any]:
+        """
+        Upsert rows with one PostgREST request per `_BULK_WRITE_BATCH_SIZE` rows.
+
+        Args:
+            table: Table name
+            rows: Row payloads (all with the same keys)
+
+        Returns:
+            list[Any]: Returned rows, in input order
+        """
+        returned: list[Any] = []
+        for start in range(0, len(rows), _BULK_WRITE_BATCH_SIZE):
+            response = (
+                self.client.table(table)
+                .upsert(rows[start : start + _BULK_WRITE_BATCH_SIZE])
+                .execute()
+            )
+            if response.data and isinstance(response.data, list):
+                returned.extend(response.data)
+        return returned
+
+    def _count_reusable(self, precomputed: list[list[float]]) -> int:
+        """Count precomputed embeddings that `_get_embeddings` can reuse."""
+        return sum(
+            1
+            for vector in precomputed
+            if vector and len(vector) == self.embedding_dimensions
+        )
+
+    def _record_save_metrics(
+        self,
+        table: str,
+        rows: int,
+        embedding_calls: int,
+        embed_seconds: float,
+        write_seconds: float,
+        reused_embeddings: int = 0,
+    ) -> None:
+        """Log a save's embedding/write latency and add it to the per-table totals."""
+        logger.info(
+            "event=storage_save table=%s rows=%d embedding_calls=%d reused_embeddings=%d embed_seconds=%.3f write_seconds=%.3f",
+            table,
+            rows,
+            embedding_calls,
+            reused_embeddings,
+            embed_seconds,
+            write_seconds,
+        )
+        metrics = self._save_metrics.setdefault(
+            table,
+            {
+                "saves": 0,
+                "rows": 0,
+                "embedding_calls": 0,
+                "reused_embeddings": 0,
+                "embed_seconds": 0.0,
+                "write_seconds": 0.0,
+            },
+        )
+        metrics["saves"] += 1
+        metrics["rows"] += rows
+        metrics["embedding_calls"] += embedding_calls
+        metrics["reused_embeddings"] += reused_embeddings
+        metrics["embed_seconds"] += embed_seconds
+        metrics["write_seconds"] += write_seconds
+
+    def get_save_metrics(self) -> dict[str, dict[str, float]]:
+        """
+        Get cumulative save latency for this storage instance.
+
+        Returns:
+            dict[str, dict[str, float]]: Per table: saves, rows, embedding_calls, reused_embeddings, embed_seconds and write_seconds
+        """
+        return {table: dict(metrics) for table, metrics in self._save_metrics.items()}
+
     @handle_exceptions
     def search_raw_feedbacks(  # noqa: C901
         self,
@@ -1563,28 +2002,42 @@ class SupabaseStorage(BaseStorage):
 
     @handle_exceptions
     def save_raw_feedbacks(self, raw_feedbacks: list[RawFeedback]) -> None:
-        for raw_feedback in raw_feedbacks:
-            # Use indexed_content if available, otherwise when_condition,
-            # otherwise build from structured fields
-            embedding_text = (
-                raw_feedback.indexed_content
-                or raw_feedback.when_condition
-                or raw_feedback.feedback_content
-                or " ".join(
-                    filter(
-                        None,
-                        [
-                            raw_feedback.do_action,
-                            raw_feedback.do_not_action,
-                        ],
-                    )
-                )
-            )
-            if embedding_text:
-                raw_feedback.embedding = self._get_embedding(embedding_text)
-            self.client.table("raw_feedbacks").upsert(
-                raw_feedback_to_data(raw_feedback)
-            ).execute()
+        """
+        Save raw feedbacks with embeddings.
+
+        Raw feedbacks that already carry an embedding (e.g. computed by FeedbackDeduplicator
+        from `raw_feedback_embedding_text`) are saved without re-embedding.
+
+        Args:
+            raw_feedbacks (list[RawFeedback]): Raw feedbacks to save
+        """
+        if not raw_feedbacks:
+            return
+        embed_start = time.perf_counter()
+        precomputed = [raw_feedback.embedding for raw_feedback in raw_feedbacks]
+        embeddings, embedding_calls = self._get_embeddings(
+            [
+                raw_feedback_embedding_text(raw_feedback)
+                for raw_feedback in raw_feedbacks
+            ],
+            precomputed=precomputed,
+        )
+        for raw_feedback, embedding in zip(raw_feedbacks, embeddings, strict=True):
+            if embedding:
+                raw_feedback.embedding = embedding
+        write_start = time.perf_counter()
+        self._bulk_upsert(
+            "raw_feedbacks",
+            [raw_feedback_to_data(raw_feedback) for raw_feedback in raw_feedbacks],
+        )
+        self._record_save_metrics(
+            "raw_feedbacks",
+            rows=len(raw_feedbacks),
+            embedding_calls=embedding_calls,
+            reused_embeddings=self._count_reusable(precomputed),
+            embed_seconds=write_start - embed_start,
+            write_seconds=time.perf_counter() - write_start,
+        )
 
     @handle_exceptions
     def save_feedbacks(self, feedbacks: list[Feedback]) -> list[Feedback]:
@@ -1597,21 +2050,33 @@ class SupabaseStorage(BaseStorage):
         Returns:
             list[Feedback]: Saved feedbacks with feedback_id populated from storage
         """
-        saved_feedbacks = []
-        for feedback in feedbacks:
-            embedding_text = feedback.when_condition or feedback.feedback_content
-            embedding = self._get_embedding(embedding_text)
+        if not feedbacks:
+            return []
+        embed_start = time.perf_counter()
+        embeddings, embedding_calls = self._get_embeddings(
+            [
+                feedback.when_condition or feedback.feedback_content
+                for feedback in feedbacks
+            ]
+        )
+        for feedback, embedding in zip(feedbacks, embeddings, strict=True):
             feedback.embedding = embedding
-            response = (
-                self.client.table("feedbacks")
-                .upsert(feedback_to_data(feedback))
-                .execute()
-            )
-            if response.data and isinstance(response.data, list):
-                row = cast(dict[str, Any], response.data[0])
-                feedback.feedback_id = row.get("feedback_id", feedback.feedback_id)
-            saved_feedbacks.append(feedback)
-        return saved_feedbacks
+        write_start = time.perf_counter()
+        rows = self._bulk_upsert(
+            "feedbacks", [feedback_to_data(feedback) for feedback in feedbacks]
+        )
+        # PostgREST returns inserted rows in request order
+        for feedback, row in zip(feedbacks, rows, strict=False):
+            row = cast(dict[str, Any], row)
+            feedback.feedback_id = row.get("feedback_id", feedback.feedback_id)
+        self._record_save_metrics(
+            "feedbacks",
+            rows=len(feedbacks),
+            embedding_calls=embedding_calls,
+            embed_seconds=write_start - embed_start,
+            write_seconds=time.perf_counter() - write_start,
+        )
+        return list(feedbacks)
 
     @handle_exceptions
     def get_raw_feedbacks(
@@ -1654,59 +2119,139 @@ class SupabaseStorage(BaseStorage):
             .order("created_at", desc=True)
             .limit(limit)
         )
+        query = _filter_raw_feedbacks_query(
+            query,
+            user_id,
+            feedback_name,
+            agent_version,
+            status_filter,
+            start_time,
+            end_time,
+        )
 
-        # Add user_id filter if specified
-        if user_id is not None:
-            query = query.eq("user_id", user_id)
-
-        # Add feedback_name filter if specified (skip if None or empty string)
-        if feedback_name:
-            query = query.eq("feedback_name", feedback_name)
-
-        # Add agent_version filter if specified
-        if agent_version is not None:
-            query = query.eq("agent_version", agent_version)
-
-        # Add time range filters if specified
-        if start_time is not None:
-            start_time_iso = datetime.fromtimestamp(
-                start_time, tz=timezone.utc
-            ).isoformat()
-            query = query.gte("created_at", start_time_iso)
-        if end_time is not None:
-            end_time_iso = datetime.fromtimestamp(end_time, tz=timezone.utc).isoformat()
-            query = query.lte("created_at", end_time_iso)
-
-        # Add status filter if specified
-        if status_filter is not None:
-            query = _apply_status_filter_to_query(query, status_filter)
-
-        response = query.execute()
+        rows = query.execute().data
+        embeddings = (
+            _decode_embedding_texts(
+                [item.get("embedding") for item in rows], dtype=np.float64
+            )
+            if include_embedding
+            else None
+        )
         return [
-            RawFeedback(
-                raw_feedback_id=int(item["raw_feedback_id"]),
-                user_id=item.get("user_id"),
-                feedback_name=item["feedback_name"],
-                created_at=self._parse_datetime_to_timestamp(item["created_at"]),
-                request_id=item["request_id"],
-                agent_version=item["agent_version"],
-                feedback_content=item["feedback_content"],
-                do_action=item.get("do_action"),
-                do_not_action=item.get("do_not_action"),
-                when_condition=item.get("when_condition"),
-                blocking_issue=_parse_blocking_issue(item),
-                status=Status(item["status"]) if item.get("status") else None,
-                source=item.get("source"),
-                source_interaction_ids=item.get("source_interaction_ids") or [],
+            self._row_to_raw_feedback(
+                item,
                 embedding=(
-                    [float(x) for x in item["embedding"].strip("[]").split(",")]
-                    if include_embedding and item.get("embedding")
+                    embeddings[row]
+                    if embeddings is not None and item.get("embedding")
                     else []
                 ),
             )
-            for item in response.data
+            for row, item in enumerate(rows)
         ]
 
+    @handle_exceptions
+    def iter_raw_feedback_pages(
+        self,
+        user_id: str | None = None,
+        feedback_name: str | None = None,
+        agent_version: str | None = None,
+        status_filter: list[Status | None] | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        page_size: int = RAW_FEEDBACK_PAGE_SIZE,
+    ) -> Iterator[tuple[list[RawFeedback], np.ndarray]]:
+        """
+        Stream all matching raw feedbacks with their embeddings, one page at a time.
+
+        Pages are fetched newest first with keyset pagination on raw_feedback_id, so every page is an
+        index range scan however deep it is. Embeddings are selected through the embedding_b64
+        computed column (pgvector binary format) and decoded per page straight into a float32 matrix;
+        on a database without that migration the pgvector text is parsed per page in one vectorized pass.
+
+        Args:
+            user_id (str, optional): The user ID to filter by
+            feedback_name (str, optional): The feedback name to filter by
+            agent_version (str, optional): The agent version to filter by
+            status_filter (list[Optional[Status]], optional): List of status values to filter by
+            start_time (int, optional): Unix timestamp. Only return feedbacks created at or after this time.
+            end_time (int, optional): Unix timestamp. Only return feedbacks created at or before this time.
+            page_size (int): Max raw feedbacks per page
+
+        Yields:
+            tuple[list[RawFeedback], np.ndarray]: Raw feedbacks of the page without embeddings, and their
+                embeddings as a float32 matrix with one row per feedback (zeros for feedbacks without one)
+        """
+        last_id: int | None = None
+        while True:
+            embedding_column = (
+                "embedding_b64" if self._binary_embeddings else "embedding"
+            )
+            query = (
+                self.client.table("raw_feedbacks")
+                .select(f"{_RAW_FEEDBACK_COLUMNS}, {embedding_column}")
+                .order("raw_feedback_id", desc=True)
+                .limit(page_size)
+            )
+            query = _filter_raw_feedbacks_query(
+                query,
+                user_id,
+                feedback_name,
+                agent_version,
+                status_filter,
+                start_time,
+                end_time,
+            )
+            if last_id is not None:
+                query = query.lt("raw_feedback_id", last_id)
+            try:
+                rows = query.execute().data
+            except Exception as e:
+                if not self._binary_embeddings or "embedding_b64" not in str(e):
+                    raise
+                logger.warning(
+                    "embedding_b64 column missing for org %s (migration not applied), "
+                    "falling back to pgvector text: %s",
+                    self.org_id,
+                    e,
+                )
+                self._binary_embeddings = False
+                continue
+
+            if not rows:
+                return
+            values = [item.get(embedding_column) for item in rows]
+            embeddings = (
+                _decode_embedding_b64(values)
+                if embedding_column == "embedding_b64"
+                else _decode_embedding_texts(values)
+            )
+            yield [self._row_to_raw_feedback(item) for item in rows], embeddings
+            if len(rows) < page_size:
+                return
+            last_id = int(rows[-1]["raw_feedback_id"])
+
+    def _row_to_raw_feedback(
+        self, item: dict, embedding: list[float] | np.ndarray | None = None
+    ) -> RawFeedback:
+        """Build a RawFeedback from a raw_feedbacks row and its already decoded embedding."""
+        return RawFeedback(
+            raw_feedback_id=int(item["raw_feedback_id"]),
+            user_id=item.get("user_id"),
+            feedback_name=item["feedback_name"],
+            created_at=self._parse_datetime_to_timestamp(item["created_at"]),
+            request_id=item["request_id"],
+            agent_version=item["agent_version"],
+            feedback_content=item["feedback_content"],
+            do_action=item.get("do_action"),
+            do_not_action=item.get("do_not_action"),
+            when_condition=item.get("when_condition"),
+            blocking_issue=_parse_blocking_issue(item),
+            status=Status(item["status"]) if item.get("status") else None,
+            source=item.get("source"),
+            source_interaction_ids=item.get("source_interaction_ids") or [],
+            embedding=embedding if embedding is not None else [],
+        )
+
     @handle_exceptions
     def count_raw_feedbacks(
         self,
@@ -2313,18 +2858,27 @@ class SupabaseStorage(BaseStorage):
         Args:
             results (list[AgentSuccessEvaluationResult]): List of agent success evaluation result objects to save
         """
-        for result in results:
-            # Generate embedding from combined content
-            embedding_text = f"{result.failure_type} {result.failure_reason}"
-            if embedding_text.strip():
-                embedding = self._get_embedding(embedding_text)
-                result.embedding = embedding
-            else:
-                result.embedding = []
-
-            self.client.table("agent_success_evaluation_result").upsert(
-                agent_success_evaluation_result_to_data(result)
-            ).execute()
+        if not results:
+            return
+        # Generate embedding from combined content (blank content gets no embedding)
+        embed_start = time.perf_counter()
+        embeddings, embedding_calls = self._get_embeddings(
+            [f"{result.failure_type} {result.failure_reason}" for result in results]
+        )
+        for result, embedding in zip(results, embeddings, strict=True):
+            result.embedding = embedding
+        write_start = time.perf_counter()
+        self._bulk_upsert(
+            "agent_success_evaluation_result",
+            [agent_success_evaluation_result_to_data(result) for result in results],
+        )
+        self._record_save_metrics(
+            "agent_success_evaluation_result",
+            rows=len(results),
+            embedding_calls=embedding_calls,
+            embed_seconds=write_start - embed_start,
+            write_seconds=time.perf_counter() - write_start,
+        )
 
     @handle_exceptions
     def get_agent_success_evaluation_results(
@@ -3096,9 +3650,15 @@ class SupabaseStorage(BaseStorage):
         Args:
             skills (list[Skill]): List of skill objects to save
         """
-        for skill in skills:
-            embedding_text = skill.instructions or skill.description
-            embedding = self._get_embedding(embedding_text)
+        if not skills:
+            return
+        embed_start = time.perf_counter()
+        embeddings, embedding_calls = self._get_embeddings(
+            [skill.instructions or skill.description for skill in skills]
+        )
+        write_start = time.perf_counter()
+        new_rows = []
+        for skill, embedding in zip(skills, embeddings, strict=True):
             skill.embedding = embedding
             data = skill_to_data(skill)
             data["org_id"] = self.org_id
@@ -3110,8 +3670,19 @@ class SupabaseStorage(BaseStorage):
                     "skill_id", skill_id
                 ).execute()
             else:
-                # Insert new skill, let DB auto-generate skill_id
-                self.client.table("skills").insert(data).execute()
+                new_rows.append(data)
+        # Insert new skills in bulk, let DB auto-generate skill_id
+        for start in range(0, len(new_rows), _BULK_WRITE_BATCH_SIZE):
+            self.client.table("skills").insert(
+                new_rows[start : start + _BULK_WRITE_BATCH_SIZE]
+            ).execute()
+        self._record_save_metrics(
+            "skills",
+            rows=len(skills),
+            embedding_calls=embedding_calls,
+            embed_seconds=write_start - embed_start,
+            write_seconds=time.perf_counter() - write_start,
+        )
 
     @handle_exceptions
     def get_skills(
@@ -39,6 +39,19 @@ from reflexio_commons.api_schema.service_schemas import (
 logger = logging.getLogger(__name__)
 
 
+def _embedding_to_data(embedding: list[float]) -> list[float]:
+    """
+    Convert an embedding to a JSON-serializable list (CompactEmbedding values are float32 buffers).
+
+    Args:
+        embedding: list[float] or CompactEmbedding
+
+    Returns:
+        list[float]: The embedding as a list
+    """
+    return embedding if isinstance(embedding, list) else embedding.tolist()
+
+
 def _parse_iso_timestamp(ts: str) -> int:
     """
     Parse an ISO 8601 timestamp string to a Unix timestamp int.
@@ -124,6 +137,19 @@ def response_to_interaction(item: dict[str, Any]) -> Interaction:
     )
 
 
+def user_profile_embedding_text(profile: UserProfile) -> str:
+    """
+    Build the text that a profile's stored embedding is computed from.
+
+    Args:
+        profile: UserProfile to embed
+
+    Returns:
+        Profile content followed by its custom features
+    """
+    return "\n".join([profile.profile_content, str(profile.custom_features)])
+
+
 def user_profile_to_data(profile: UserProfile) -> dict[str, Any]:
     """
     Convert a UserProfile object to data for upserting into Supabase.
@@ -144,7 +170,7 @@ def user_profile_to_data(profile: UserProfile) -> dict[str, Any]:
         "profile_time_to_live": profile.profile_time_to_live.value,
         "expiration_timestamp": profile.expiration_timestamp,
         "custom_features": profile.custom_features,
-        "embedding": profile.embedding,
+        "embedding": _embedding_to_data(profile.embedding),
         "source": profile.source,
         "status": profile.status.value if profile.status else None,
         "extractor_names": profile.extractor_names,
@@ -175,7 +201,7 @@ def interaction_to_data(interaction: Interaction) -> dict[str, Any]:
         "interacted_image_url": interaction.interacted_image_url,
         "shadow_content": interaction.shadow_content,
         "tools_used": [t.model_dump() for t in interaction.tools_used],
-        "embedding": interaction.embedding,
+        "embedding": _embedding_to_data(interaction.embedding),
     }
     # Only include interaction_id if it's set (non-zero), otherwise let DB auto-generate
     if interaction.interaction_id:
@@ -412,6 +438,27 @@ def response_list_to_feedback_aggregation_change_logs(
     return [response_to_feedback_aggregation_change_log(item) for item in response_data]
 
 
+def raw_feedback_embedding_text(raw_feedback: RawFeedback) -> str:
+    """
+    Build the text that a raw feedback's stored embedding is computed from.
+
+    Uses indexed_content if available, otherwise when_condition, otherwise the
+    structured fields.
+
+    Args:
+        raw_feedback: RawFeedback to embed
+
+    Returns:
+        Text to embed (empty if the feedback has no content)
+    """
+    return (
+        raw_feedback.indexed_content
+        or raw_feedback.when_condition
+        or raw_feedback.feedback_content
+        or " ".join(filter(None, [raw_feedback.do_action, raw_feedback.do_not_action]))
+    )
+
+
 def raw_feedback_to_data(raw_feedback: RawFeedback) -> dict[str, Any]:
     """
     Convert a RawFeedback object to data for upserting into Supabase.
@@ -445,7 +492,7 @@ def raw_feedback_to_data(raw_feedback: RawFeedback) -> dict[str, Any]:
         "source_interaction_ids": raw_feedback.source_interaction_ids or None,
         "status": raw_feedback.status,
         "source": raw_feedback.source,
-        "embedding": raw_feedback.embedding,
+        "embedding": _embedding_to_data(raw_feedback.embedding),
     }
 
 
@@ -472,7 +519,7 @@ def feedback_to_data(feedback: Feedback) -> dict[str, Any]:
         "feedback_status": feedback.feedback_status,
         "agent_version": feedback.agent_version,
         "feedback_metadata": feedback.feedback_metadata,
-        "embedding": feedback.embedding,
+        "embedding": _embedding_to_data(feedback.embedding),
         "status": feedback.status,
     }
 
@@ -503,7 +550,7 @@ def agent_success_evaluation_result_to_data(
         "number_of_correction_per_session": result.number_of_correction_per_session,
         "user_turns_to_resolution": result.user_turns_to_resolution,
         "is_escalated": result.is_escalated,
-        "embedding": result.embedding or None,
+        "embedding": _embedding_to_data(result.embedding) or None,
     }
 
 
@@ -528,7 +575,7 @@ def skill_to_data(skill: Skill) -> dict[str, Any]:
         "blocking_issues": [bi.model_dump() for bi in skill.blocking_issues],
         "raw_feedback_ids": skill.raw_feedback_ids,
         "skill_status": skill.skill_status.value if skill.skill_status else "draft",
-        "embedding": skill.embedding or None,
+        "embedding": _embedding_to_data(skill.embedding) or None,
         "updated_at": datetime.fromtimestamp(
             skill.updated_at, tz=timezone.utc
         ).isoformat(),
@@ -2,12 +2,14 @@
 Unified search service that searches across all entity types in parallel.
 
 Executes in two phases:
-  Phase A: Query rewriting + embedding generation (parallel)
+  Phase A: Query rewriting + embedding generation (concurrent async LLM calls)
   Phase B: Entity searches across profiles, feedbacks, raw_feedbacks, skills (parallel)
 """
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import Future
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 from reflexio_commons.api_schema.retriever_schema import (
@@ -25,13 +27,28 @@ from reflexio_commons.api_schema.service_schemas import (
 )
 from reflexio_commons.config_schema import APIKeyConfig
 
+from reflexio.server.llm.llm_event_loop import run_on_llm_event_loop
 from reflexio.server.prompt.prompt_manager import PromptManager
+from reflexio.server.services.executor_registry import (
+    ExecutorSaturatedError,
+    get_executor,
+)
 from reflexio.server.services.query_rewriter import QueryRewriter
+from reflexio.server.services.search_result_cache import (
+    CacheKey,
+    SearchResultCache,
+    get_search_result_cache,
+)
 from reflexio.server.services.storage.storage_base import BaseStorage
 from reflexio.server.site_var.feature_flags import is_skill_generation_enabled
 
 logger = logging.getLogger(__name__)
 
+# Seconds Phase A waits for the query rewrite and the query embedding before degrading
+_PHASE_A_TIMEOUT_SECONDS = 10
+# Seconds Phase B waits for each entity search before failing the request
+_PHASE_B_TIMEOUT_SECONDS = 30
+
 
 def run_unified_search(
     request: UnifiedSearchRequest,
@@ -45,7 +62,8 @@ def run_unified_search(
 
     Phase A runs query rewriting and embedding generation in parallel.
     Phase B runs all entity searches in parallel using the results from Phase A.
-    Skills search is gated behind the skill_generation feature flag.
+    Skills search is gated behind the skill_generation feature flag. Responses are served from
+    the search result cache when the same (or, if enabled, a near-duplicate) search ran recently.
 
     Args:
         request (UnifiedSearchRequest): The unified search request
@@ -63,8 +81,16 @@ def run_unified_search(
     top_k = request.top_k if request.top_k is not None else 5
     threshold = request.threshold if request.threshold is not None else 0.3
 
+    cache = get_search_result_cache()
+    cache_key = cache.key(org_id, request)
+    epoch = cache.epoch(org_id, request.user_id)
+    start = time.perf_counter()
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # --- Phase A: parallel query rewrite + embedding generation ---
-    supports_embedding = hasattr(storage, "_get_embedding")
+    supports_embedding = hasattr(storage, "_aget_embedding")
     rewritten_query, embedding = _run_phase_a(
         query=request.query,
         org_id=org_id,
@@ -77,9 +103,80 @@ def run_unified_search(
     )
 
     rewritten_query_text = rewritten_query.fts_query
+    cached = _get_similar_cached(
+        cache, cache_key, request, rewritten_query_text, embedding, start
+    )
+    if cached is not None:
+        return cached
 
     # --- Phase B: parallel searches across all entity types ---
-    profiles, feedbacks, raw_feedbacks, skills = _run_phase_b(
+    results = _run_phase_b(
+        request=request,
+        org_id=org_id,
+        storage=storage,
+        embedding=embedding,
+        query=rewritten_query_text,
+        top_k=top_k,
+        threshold=threshold,
+    )
+    response = _build_response(request, rewritten_query_text, results)
+    cache.put(cache_key, response, epoch, time.perf_counter() - start, embedding)
+    return response
+
+
+async def arun_unified_search(
+    request: UnifiedSearchRequest,
+    org_id: str,
+    storage: BaseStorage,
+    api_key_config: APIKeyConfig | None,
+    prompt_manager: PromptManager,
+) -> UnifiedSearchResponse:
+    """
+    Async twin of run_unified_search for async API endpoints.
+
+    Both phases are awaited on the calling event loop: LLM calls through the async LLM client and
+    entity searches through the storage's async read methods, so no thread waits on the network.
+
+    Args:
+        request (UnifiedSearchRequest): The unified search request
+        org_id (str): Organization ID (used for feature flag checks)
+        storage: Storage instance (SupabaseStorage or compatible)
+        api_key_config (APIKeyConfig): API key configuration for LLM calls
+        prompt_manager (PromptManager): Prompt manager for query rewriter
+
+    Returns:
+        UnifiedSearchResponse: Combined results from all entity types
+    """
+    if not request.query:
+        return UnifiedSearchResponse(success=True, msg="No query provided")
+
+    top_k = request.top_k if request.top_k is not None else 5
+    threshold = request.threshold if request.threshold is not None else 0.3
+
+    cache = get_search_result_cache()
+    cache_key = cache.key(org_id, request)
+    epoch = cache.epoch(org_id, request.user_id)
+    start = time.perf_counter()
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    rewritten_query, embedding = await _arun_phase_a(
+        request.query,
+        QueryRewriter(api_key_config=api_key_config, prompt_manager=prompt_manager),
+        storage,
+        hasattr(storage, "_aget_embedding"),
+        request.conversation_history,
+        bool(request.query_rewrite),
+    )
+    rewritten_query_text = rewritten_query.fts_query
+    cached = _get_similar_cached(
+        cache, cache_key, request, rewritten_query_text, embedding, start
+    )
+    if cached is not None:
+        return cached
+
+    results = await _arun_phase_b(
         request=request,
         org_id=org_id,
         storage=storage,
@@ -88,7 +185,41 @@ def run_unified_search(
         top_k=top_k,
         threshold=threshold,
     )
+    response = _build_response(request, rewritten_query_text, results)
+    cache.put(cache_key, response, epoch, time.perf_counter() - start, embedding)
+    return response
+
 
+def _get_similar_cached(
+    cache: SearchResultCache,
+    cache_key: CacheKey,
+    request: UnifiedSearchRequest,
+    rewritten_query_text: str,
+    embedding: list[float] | None,
+    start: float,
+) -> UnifiedSearchResponse | None:
+    """Reuse the cached response of a near-duplicate query, reporting this query's rewrite."""
+    if embedding is None:
+        return None
+    cached = cache.get_similar(cache_key, embedding, time.perf_counter() - start)
+    if cached is not None:
+        cached.rewritten_query = (
+            rewritten_query_text if rewritten_query_text != request.query else None
+        )
+    return cached
+
+
+def _build_response(
+    request: UnifiedSearchRequest,
+    rewritten_query_text: str,
+    results: tuple[
+        list[UserProfile] | None,
+        list[Feedback] | None,
+        list[RawFeedback] | None,
+        list[Skill] | None,
+    ],
+) -> UnifiedSearchResponse:
+    profiles, feedbacks, raw_feedbacks, skills = results
     if profiles is None:
         return UnifiedSearchResponse(success=False, msg="Search failed")
 
@@ -114,7 +245,7 @@ def _run_phase_a(
     conversation_history: list[ConversationTurn] | None = None,
     query_rewrite: bool = False,
 ) -> tuple[RewrittenQuery, list[float] | None]:
-    """Run query rewriting and embedding generation in parallel.
+    """Run query rewriting and embedding generation concurrently on the shared LLM event loop.
 
     Args:
         query (str): The original search query
@@ -134,37 +265,50 @@ def _run_phase_a(
         api_key_config=api_key_config,
         prompt_manager=prompt_manager,
     )
-
-    rewritten_query = None
-    embedding = None
-
-    executor = ThreadPoolExecutor(max_workers=2)
-    try:
-        rewrite_future = executor.submit(
-            query_rewriter.rewrite,
+    return run_on_llm_event_loop(
+        _arun_phase_a(
             query,
-            query_rewrite,
+            query_rewriter,
+            storage,
+            supports_embedding,
             conversation_history,
+            query_rewrite,
         )
+    )
 
-        embedding_future = None
-        if supports_embedding:
-            embedding_future = executor.submit(storage._get_embedding, query)  # type: ignore[reportAttributeAccessIssue]
 
+async def _arun_phase_a(
+    query: str,
+    query_rewriter: QueryRewriter,
+    storage: BaseStorage,
+    supports_embedding: bool,
+    conversation_history: list[ConversationTurn] | None,
+    query_rewrite: bool,
+) -> tuple[RewrittenQuery, list[float] | None]:
+    # Both are optional: a failed or slow call degrades to the original query / text-only search
+    async def rewrite() -> RewrittenQuery:
         try:
-            rewritten_query = rewrite_future.result(timeout=10)
+            return await asyncio.wait_for(
+                query_rewriter.arewrite(query, query_rewrite, conversation_history),
+                timeout=_PHASE_A_TIMEOUT_SECONDS,
+            )
         except Exception as e:
             logger.warning("Query rewrite failed: %s", e)
-            rewritten_query = RewrittenQuery(fts_query=query)
+            return RewrittenQuery(fts_query=query)
 
-        if embedding_future is not None:
-            try:
-                embedding = embedding_future.result(timeout=10)
-            except Exception as e:
-                logger.error("Embedding generation failed: %s", e)
-    finally:
-        executor.shutdown(wait=False, cancel_futures=True)
+    async def embed() -> list[float] | None:
+        if not supports_embedding:
+            return None
+        try:
+            return await asyncio.wait_for(
+                storage._aget_embedding(query),  # type: ignore[reportAttributeAccessIssue]
+                timeout=_PHASE_A_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            logger.error("Embedding generation failed: %s", e)
+            return None
 
+    rewritten_query, embedding = await asyncio.gather(rewrite(), embed())
     return rewritten_query, embedding
 
 
@@ -198,7 +342,8 @@ def _run_phase_b(
     """
     skills_enabled = is_skill_generation_enabled(org_id)
 
-    executor = ThreadPoolExecutor(max_workers=4)
+    executor = get_executor("search")
+    futures: list[Future] = []
     try:
         profiles_future = executor.submit(
             _search_profiles_via_storage,
@@ -209,6 +354,7 @@ def _run_phase_b(
             request.user_id,
             embedding,
         )
+        futures.append(profiles_future)
         feedbacks_future = executor.submit(
             storage.search_feedbacks,
             query=query,
@@ -219,6 +365,7 @@ def _run_phase_b(
             match_count=top_k,
             query_embedding=embedding,
         )
+        futures.append(feedbacks_future)
         raw_feedbacks_future = executor.submit(
             storage.search_raw_feedbacks,
             query=query,
@@ -230,6 +377,7 @@ def _run_phase_b(
             match_count=top_k,
             query_embedding=embedding,
         )
+        futures.append(raw_feedbacks_future)
         skills_future = (
             executor.submit(
                 storage.search_skills,
@@ -243,19 +391,133 @@ def _run_phase_b(
             if skills_enabled
             else None
         )
-
-        profiles = profiles_future.result(timeout=30)
-        feedbacks = feedbacks_future.result(timeout=30)
-        raw_feedbacks = raw_feedbacks_future.result(timeout=30)
-        skills = skills_future.result(timeout=30) if skills_future else []
+        if skills_future is not None:
+            futures.append(skills_future)
+
+        profiles = profiles_future.result(timeout=_PHASE_B_TIMEOUT_SECONDS)
+        feedbacks = feedbacks_future.result(timeout=_PHASE_B_TIMEOUT_SECONDS)
+        raw_feedbacks = raw_feedbacks_future.result(timeout=_PHASE_B_TIMEOUT_SECONDS)
+        skills = (
+            skills_future.result(timeout=_PHASE_B_TIMEOUT_SECONDS)
+            if skills_future
+            else []
+        )
+    except ExecutorSaturatedError:
+        # Shed load: let the API answer 503 instead of queueing more searches
+        for future in futures:
+            executor.cancel(future)
+        raise
     except FuturesTimeoutError:
+        logger.error("Unified search timed out")
+        for future in futures:
+            executor.cancel(future)
+        return None, None, None, None
+    except Exception as e:
+        logger.error("Unified search failed: %s", e)
+        for future in futures:
+            executor.cancel(future)
+        return None, None, None, None
+
+    return profiles, feedbacks, raw_feedbacks, skills
+
+
+async def _arun_phase_b(
+    request: UnifiedSearchRequest,
+    org_id: str,
+    storage: BaseStorage,
+    embedding: list[float] | None,
+    query: str,
+    top_k: int,
+    threshold: float,
+) -> tuple[
+    list[UserProfile] | None,
+    list[Feedback] | None,
+    list[RawFeedback] | None,
+    list[Skill] | None,
+]:
+    """Async twin of _run_phase_b using the storage's async read methods.
+
+    Args:
+        request (UnifiedSearchRequest): The search request (for filters)
+        org_id (str): Organization ID
+        storage (BaseStorage): Storage instance
+        embedding (Optional[list[float]]): Pre-computed query embedding, or None for text-only search
+        query (str): Query string (possibly rewritten) for FTS
+        top_k (int): Maximum results per entity type
+        threshold (float): Minimum match threshold
+
+    Returns:
+        tuple: (profiles, feedbacks, raw_feedbacks, skills) — all None on timeout/failure
+    """
+
+    async def search_profiles() -> list[UserProfile]:
+        if not request.user_id:
+            return []
+        try:
+            return await storage.asearch_user_profile(
+                SearchUserProfileRequest(
+                    user_id=request.user_id,
+                    query=query,
+                    top_k=top_k,
+                    threshold=threshold,
+                ),
+                status_filter=[None],
+                query_embedding=embedding,
+            )
+        except ExecutorSaturatedError:
+            raise
+        except Exception as e:
+            logger.error("Profile search failed: %s", e)
+            return []
+
+    async def search_skills() -> list[Skill]:
+        if not is_skill_generation_enabled(org_id):
+            return []
+        return await storage.asearch_skills(
+            query=query,
+            feedback_name=request.feedback_name,
+            agent_version=request.agent_version,
+            match_threshold=threshold,
+            match_count=top_k,
+            query_embedding=embedding,
+        )
+
+    try:
+        profiles, feedbacks, raw_feedbacks, skills = await asyncio.wait_for(
+            asyncio.gather(
+                search_profiles(),
+                storage.asearch_feedbacks(
+                    query=query,
+                    agent_version=request.agent_version,
+                    feedback_name=request.feedback_name,
+                    status_filter=[None],
+                    match_threshold=threshold,
+                    match_count=top_k,
+                    query_embedding=embedding,
+                ),
+                storage.asearch_raw_feedbacks(
+                    query=query,
+                    user_id=request.user_id,
+                    agent_version=request.agent_version,
+                    feedback_name=request.feedback_name,
+                    status_filter=[None],
+                    match_threshold=threshold,
+                    match_count=top_k,
+                    query_embedding=embedding,
+                ),
+                search_skills(),
+            ),
+            timeout=_PHASE_B_TIMEOUT_SECONDS,
+        )
+    except ExecutorSaturatedError:
+        # Shed load: let the API answer 503 instead of queueing more searches
+        raise
+    except asyncio.TimeoutError:
         logger.error("Unified search timed out")
         return None, None, None, None
     except Exception as e:
         logger.error("Unified search failed: %s", e)
         return None, None, None, None
-    finally:
-        executor.shutdown(wait=False, cancel_futures=True)
 
     return profiles, feedbacks, raw_feedbacks, skills
 
@@ -7,7 +7,7 @@ to check whether a given feature is enabled for an organization.
 
 import logging
 
-from reflexio.server.site_var.site_var_manager import SiteVarManager
+from reflexio.server.site_var.site_var_manager import get_site_var_manager
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ def _get_feature_flags_config() -> dict:
     Returns:
         dict: The full feature flags config, or empty dict if not found.
     """
-    config = SiteVarManager().get_site_var("feature_flags")
+    config = get_site_var_manager().get_site_var("feature_flags")
     if config is None or not isinstance(config, dict):
         logger.warning(
             "feature_flags site var not found or invalid, defaulting to empty config"
@@ -1,11 +1,20 @@
 import json
 import logging
+import threading
+import time
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import redis
 
+from reflexio.server import SITE_VAR_REDIS_URL, SITE_VAR_RELOAD_INTERVAL_SECONDS
+
 logger = logging.getLogger(__name__)
 
+# Redis pub/sub channel that makes every process reload its shared site vars
+SITE_VAR_RELOAD_CHANNEL = "site_var_reload"
+
 
 class SiteVarManager:
     """
@@ -261,3 +270,252 @@ class SiteVarManager:
         if filename.endswith(".txt"):
             return filename[:-4]
         return filename
+
+
+class SiteVarRegistry:
+    """
+    Process-wide, read-only snapshot of every site var in a source directory.
+
+    All files are loaded once into an immutable mapping that reads use without locking. A reload
+    builds a new mapping and swaps it in, so readers see either the old or the new snapshot.
+    Reloads happen when a source file changes (checked at most every `reload_interval_seconds`
+    by the reading thread), on `reload()`, or on a message on the Redis reload channel.
+    Returned values are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        source_dir: str | None = None,
+        reload_interval_seconds: float = SITE_VAR_RELOAD_INTERVAL_SECONDS,
+        redis_url: str = "",
+    ):
+        """
+        Args:
+            source_dir (Optional[str]): Directory containing JSON or text files for site variables
+            reload_interval_seconds (float): Min seconds between source file change checks (0 disables them)
+            redis_url (str): Redis URL to listen on for reload messages (disabled when empty)
+        """
+        self._loader = SiteVarManager(source_dir=source_dir)
+        self.source_dir = self._loader.source_dir
+        self.reload_interval_seconds = reload_interval_seconds
+        self._snapshot: Mapping[str, str | dict] = MappingProxyType({})
+        self._fingerprint: dict[str, tuple[int, int]] = {}
+        self._next_check = 0.0
+        self._reload_lock = threading.Lock()
+        # Counters are updated without locking, so they are approximate under heavy concurrency
+        self._counters = {"hits": 0, "misses": 0, "reloads": 0, "reload_failures": 0}
+        self._last_reload_at = 0.0
+        self._listener: threading.Thread | None = None
+        self._stop_listening = threading.Event()
+        self.reload()
+        if redis_url:
+            self._start_redis_listener(redis_url)
+
+    def get_site_var(self, name: str) -> str | dict | None:
+        """
+        Get a site variable by name from the current snapshot.
+
+        Args:
+            name (str): Name of the site variable to retrieve
+
+        Returns:
+            Optional[str | dict]: The site variable value as JSON dict (for JSON files) or plain text (for text files), or None if not found
+        """
+        self._maybe_reload()
+        value = self._snapshot.get(name)
+        if value is None:
+            self._counters["misses"] += 1
+            logger.warning("Site var %s not found in %s", name, self.source_dir)
+        else:
+            self._counters["hits"] += 1
+        return value
+
+    def load_all_site_vars(self) -> dict[str, str | dict]:
+        """
+        Get every site variable of the current snapshot.
+
+        Returns:
+            dict[str, str | dict]: Dictionary mapping site var names to their values
+        """
+        self._maybe_reload()
+        return dict(self._snapshot)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reload every source file and swap in the new snapshot if anything changed.
+
+        A file that fails to load keeps its previous value until it is fixed.
+
+        Args:
+            force (bool): Reload even if no file's mtime or size changed (an edit within the
+                filesystem's timestamp resolution that keeps the size is otherwise missed)
+
+        Returns:
+            bool: True if a new snapshot was installed
+        """
+        with self._reload_lock:
+            return self._reload_locked(force=force)
+
+    def _reload_locked(self, force: bool = False) -> bool:
+        fingerprint = self._scan_fingerprint()
+        if not force and fingerprint == self._fingerprint and self._last_reload_at:
+            return False
+        site_vars: dict[str, str | dict] = {}
+        for filename in fingerprint:
+            name = self._loader._get_name_from_filename(filename)
+            if name in site_vars:
+                continue  # name.json and name.txt are the same var
+            value = self._loader._load_from_file(name)
+            if value is None and name in self._snapshot:
+                self._counters["reload_failures"] += 1
+                logger.warning("Keeping previous value of site var %s", name)
+                value = self._snapshot[name]
+            if value is not None:
+                site_vars[name] = value
+        self._snapshot = MappingProxyType(site_vars)
+        self._fingerprint = fingerprint
+        self._last_reload_at = time.time()
+        self._counters["reloads"] += 1
+        logger.info(
+            "event=site_vars_reloaded count=%d source_dir=%s",
+            len(site_vars),
+            self.source_dir,
+        )
+        return True
+
+    def _maybe_reload(self) -> None:
+        if self.reload_interval_seconds <= 0 or time.monotonic() < self._next_check:
+            return
+        # Only one reader checks for changes; the others keep serving the current snapshot
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = time.monotonic() + self.reload_interval_seconds
+            self._reload_locked()
+        except Exception as e:
+            logger.error("Error reloading site vars: %s", str(e))
+        finally:
+            self._reload_lock.release()
+
+    def _scan_fingerprint(self) -> dict[str, tuple[int, int]]:
+        """
+        Get (mtime_ns, size) of every site var file.
+
+        Returns:
+            dict[str, tuple[int, int]]: Fingerprint keyed by filename
+        """
+        source_dir = Path(self.source_dir)
+        if not source_dir.exists():
+            return {}
+        fingerprint = {}
+        for entry in sorted(source_dir.iterdir()):
+            if entry.name.endswith((".json", ".txt")):
+                stat = entry.stat()
+                fingerprint[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return fingerprint
+
+    def _start_redis_listener(self, redis_url: str) -> None:
+        def listen() -> None:
+            while not self._stop_listening.is_set():
+                self._listen_for_reloads(redis_url)
+
+        self._listener = threading.Thread(
+            target=listen, name="site-var-reload-listener", daemon=True
+        )
+        self._listener.start()
+
+    def _listen_for_reloads(self, redis_url: str) -> None:
+        """Reload on every message of the reload channel until stopped; back off on Redis errors."""
+        try:
+            pubsub = redis.Redis.from_url(redis_url).pubsub(
+                ignore_subscribe_messages=True
+            )
+            pubsub.subscribe(SITE_VAR_RELOAD_CHANNEL)
+            while not self._stop_listening.is_set():
+                if pubsub.get_message(timeout=1.0) is not None:
+                    self.reload(force=True)
+            pubsub.close()
+        except redis.RedisError as e:
+            logger.error("Site var reload listener error: %s", str(e))
+            self._stop_listening.wait(5)
+
+    def stats(self) -> dict:
+        """
+        Get snapshot size and hit/miss/reload counters.
+
+        Returns:
+            dict: site_vars count, hits, misses, reloads, reload_failures and last_reload_at (epoch seconds)
+        """
+        return {
+            "site_vars": len(self._snapshot),
+            **self._counters,
+            "last_reload_at": self._last_reload_at,
+        }
+
+    def close(self) -> None:
+        """Stop the Redis reload listener, if any."""
+        self._stop_listening.set()
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
+
+
+_registry_lock = threading.Lock()
+_registry: SiteVarRegistry | None = None
+
+
+def get_site_var_manager() -> SiteVarRegistry:
+    """
+    Get the process-wide site var registry for the default source directory, creating it on first use.
+
+    Returns:
+        SiteVarRegistry: The shared registry
+    """
+    global _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SiteVarRegistry(redis_url=SITE_VAR_REDIS_URL)
+            registry = _registry
+    return registry
+
+
+def get_site_var_stats() -> dict:
+    """
+    Get counters of the shared site var registry.
+
+    Returns:
+        dict: Registry stats, or an empty dict if the registry was never used
+    """
+    registry = _registry
+    return registry.stats() if registry is not None else {}
+
+
+def reload_site_vars() -> bool:
+    """
+    Reload the shared registry now and ask other processes to reload when SITE_VAR_REDIS_URL is set.
+
+    Explicit reloads always re-read every file, even if their mtimes and sizes are unchanged.
+
+    Returns:
+        bool: True if this process installed a new snapshot
+    """
+    reloaded = get_site_var_manager().reload(force=True)
+    if SITE_VAR_REDIS_URL:
+        try:
+            redis.Redis.from_url(SITE_VAR_REDIS_URL).publish(
+                SITE_VAR_RELOAD_CHANNEL, "reload"
+            )
+        except redis.RedisError as e:
+            logger.error("Failed to publish site var reload: %s", str(e))
+    return reloaded
+
+
+def reset_site_var_manager() -> None:
+    """Close and forget the shared registry (for testing/admin)."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.close()
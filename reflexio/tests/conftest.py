@@ -75,6 +75,11 @@ def _mock_completion(*args, **kwargs):
     return _create_mock_completion(prompt_content, parse_structured)
 
 
+async def _mock_acompletion(*args, **kwargs):
+    """Mock implementation for litellm.acompletion."""
+    return _mock_completion(*args, **kwargs)
+
+
 def _is_e2e_test_run(config) -> bool:
     """
     Check if this pytest run includes e2e tests.
@@ -97,8 +102,9 @@ def _is_e2e_test_run(config) -> bool:
     return False
 
 
-# Global patcher reference to keep it alive
+# Global patcher references to keep them alive
 _litellm_patcher = None
+_litellm_async_patcher = None
 
 
 def pytest_configure(config):
@@ -108,24 +114,34 @@ def pytest_configure(config):
 
     Skips mocking for e2e tests to allow real API calls.
     """
-    global _litellm_patcher
+    global _litellm_patcher, _litellm_async_patcher
 
     # Skip mocking for e2e tests - they need real API calls
     if _is_e2e_test_run(config):
         return
 
-    # Set mock env var and start the litellm.completion patch for unit tests
+    # Set mock env var and start the litellm.completion/acompletion patches for unit tests
     os.environ["MOCK_LLM_RESPONSE"] = "true"
+    # Mocked embeddings must not leak between tests through the process-wide embedding cache
+    os.environ.setdefault("EMBEDDING_CACHE_SIZE", "0")
+    # Likewise for mocked search responses and query rewrites in the process-wide caches
+    os.environ.setdefault("UNIFIED_SEARCH_CACHE_SIZE", "0")
+    os.environ.setdefault("QUERY_REWRITE_CACHE_SIZE", "0")
     _litellm_patcher = patch("litellm.completion", side_effect=_mock_completion)
     _litellm_patcher.start()
+    _litellm_async_patcher = patch("litellm.acompletion", side_effect=_mock_acompletion)
+    _litellm_async_patcher.start()
 
 
 def pytest_unconfigure(config):
     """
     Pytest hook that runs during cleanup.
     """
-    global _litellm_patcher
+    global _litellm_patcher, _litellm_async_patcher
 
     if _litellm_patcher:
         _litellm_patcher.stop()
         _litellm_patcher = None
+    if _litellm_async_patcher:
+        _litellm_async_patcher.stop()
+        _litellm_async_patcher = None
@@ -0,0 +1,247 @@
+"""Unit tests for the memory-bounded LRU Reflexio instance cache, single-flight and warm-up."""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from reflexio_commons.api_schema.service_schemas import RawFeedback
+
+from reflexio.reflexio_lib.reflexio_lib import Reflexio
+from reflexio.server.cache import reflexio_cache
+from reflexio.server.cache.recent_orgs import RecentOrgs
+from reflexio.server.cache.reflexio_cache import (
+    _ReflexioCache,
+    aget_reflexio,
+    estimate_size,
+    get_cache_stats,
+    get_reflexio,
+    invalidate_reflexio_cache,
+    warm_up_reflexio_cache,
+)
+
+_SIZES = {"small-a": 400, "small-b": 400, "small-c": 400, "huge": 5000}
+
+
+def _instance(org_id, **_kwargs):
+    """Stand-in for a Reflexio instance whose storage and LLM client already exist."""
+    return SimpleNamespace(
+        org_id=org_id,
+        is_warmed_up=True,
+        request_context=SimpleNamespace(storage_created=True),
+    )
+
+
+class _LazyInstance:
+    """Stand-in for a Reflexio instance that creates storage on warm_up()."""
+
+    def __init__(self, org_id, **_kwargs):
+        self.org_id = org_id
+        self.request_context = SimpleNamespace(storage_created=False)
+        self.storage_bytes = 0
+        self.warm_up_threads = []
+
+    @property
+    def is_warmed_up(self):
+        return self.request_context.storage_created
+
+    def warm_up(self):
+        self.warm_up_threads.append(threading.get_ident())
+        self.request_context.storage_created = True
+        self.storage_bytes = 500
+
+
+@pytest.fixture
+def cache():
+    cache = _ReflexioCache(max_bytes=1000, ttl=3600)
+    with (
+        patch.object(reflexio_cache, "_reflexio_cache", cache),
+        patch.object(reflexio_cache, "REFLEXIO_CACHE_MAX_BYTES", 1000),
+        patch.object(
+            reflexio_cache,
+            "Reflexio",
+            side_effect=_instance,
+        ) as reflexio_cls,
+        patch.object(
+            reflexio_cache,
+            "estimate_size",
+            side_effect=lambda reflexio: (
+                _SIZES[reflexio.org_id] + getattr(reflexio, "storage_bytes", 0)
+            ),
+        ),
+    ):
+        yield reflexio_cls
+
+
+def test_evicts_least_recently_used_when_over_memory_budget(cache):
+    first = get_reflexio("small-a")
+    get_reflexio("small-b")
+    assert get_reflexio("small-a") is first  # small-b is now least recently used
+
+    get_reflexio("small-c")
+
+    stats = get_cache_stats()
+    assert stats["current_size"] == 2
+    assert stats["current_bytes"] == 800
+    assert stats["evictions"] == 1
+    assert get_reflexio("small-a") is first
+    assert cache.call_count == 3  # small-a was never rebuilt
+
+
+def test_instance_larger_than_budget_is_cached_alone(cache):
+    get_reflexio("small-a")
+    huge = get_reflexio("huge")
+
+    assert get_reflexio("huge") is huge
+    stats = get_cache_stats()
+    assert stats["current_size"] == 1
+    assert stats["current_bytes"] == 1000
+
+
+def test_counts_hits_misses_and_invalidations(cache):
+    get_reflexio("small-a")
+    get_reflexio("small-a")
+    assert invalidate_reflexio_cache("small-a") is True
+    assert invalidate_reflexio_cache("small-a") is False
+
+    stats = get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 1, 1)
+    assert stats["evictions"] == 0
+
+
+def test_entry_is_resized_once_storage_exists(cache):
+    cache.side_effect = _LazyInstance
+    reflexio = get_reflexio("small-a")
+    assert get_cache_stats()["current_bytes"] == 400
+
+    # First use creates storage; the next hit sizes the instance with it
+    reflexio.warm_up()
+    assert get_reflexio("small-a") is reflexio
+    assert get_cache_stats()["current_bytes"] == 900
+
+
+def test_async_get_warms_up_off_the_event_loop(cache):
+    cache.side_effect = _LazyInstance
+
+    async def get_twice():
+        loop_thread = threading.get_ident()
+        first = await aget_reflexio("small-a")
+        second = await aget_reflexio("small-a")
+        return loop_thread, first, second
+
+    loop_thread, first, second = asyncio.run(get_twice())
+
+    assert second is first
+    assert len(first.warm_up_threads) == 1
+    assert first.warm_up_threads[0] != loop_thread
+    assert get_cache_stats()["current_bytes"] == 900
+
+    # A cold instance cached by a sync caller is also warmed up off the loop
+    cold = get_reflexio("small-b")
+    assert asyncio.run(aget_reflexio("small-b")) is cold
+    assert len(cold.warm_up_threads) == 1
+
+
+def test_estimate_size_descends_into_owned_objects_and_embeddings():
+    feedback = RawFeedback(agent_version="v1", request_id="r1", embedding=[0.5] * 512)
+
+    assert estimate_size(feedback) > 512 * sys.getsizeof(0.5)
+    # Shared objects are counted once
+    assert estimate_size([feedback, feedback]) < 2 * estimate_size(feedback)
+
+
+@pytest.fixture
+def blocking_build(cache):
+    """Make Reflexio construction wait until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def build(org_id, **_kwargs):
+        started.set()
+        release.wait(5)
+        return _instance(org_id)
+
+    cache.side_effect = build
+    return started, release
+
+
+def test_concurrent_misses_build_once(cache, blocking_build):
+    started, release = blocking_build
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(get_reflexio, "small-a") for _ in range(4)]
+        started.wait(5)
+        while get_cache_stats()["coalesced"] < 3:
+            time.sleep(0.01)
+        release.set()
+        instances = {id(future.result()) for future in futures}
+
+    assert len(instances) == 1
+    assert cache.call_count == 1
+    stats = get_cache_stats()
+    assert (stats["misses"], stats["coalesced"], stats["building"]) == (1, 3, 0)
+
+
+def test_instance_invalidated_while_building_is_not_cached(cache, blocking_build):
+    started, release = blocking_build
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(get_reflexio, "small-a")
+        started.wait(5)
+        invalidate_reflexio_cache("small-a")
+        release.set()
+        future.result()
+
+    assert get_cache_stats()["current_size"] == 0
+
+
+def test_build_failure_is_raised_to_waiters_and_not_cached(cache):
+    cache.side_effect = ValueError("Failed to load configuration")
+
+    with pytest.raises(ValueError):
+        get_reflexio("small-a")
+
+    cache.side_effect = _instance
+    assert get_reflexio("small-a").org_id == "small-a"
+    assert get_cache_stats()["building"] == 0
+
+
+def test_storage_and_llm_client_are_created_on_first_use(tmp_path):
+    with patch(
+        "reflexio.server.api_endpoints.request_context.SimpleConfigurator.create_storage"
+    ) as create_storage:
+        reflexio = Reflexio(org_id="lazy-org", storage_base_dir=str(tmp_path))
+        create_storage.assert_not_called()
+        assert reflexio._llm_client is None
+
+        reflexio.warm_up()
+        reflexio.warm_up()
+
+    create_storage.assert_called_once()
+    assert reflexio.request_context.storage is create_storage.return_value
+    assert reflexio._llm_client is not None
+
+
+def test_warm_up_builds_and_initializes_recent_orgs(cache, tmp_path):
+    recent_orgs = RecentOrgs(str(tmp_path / "recent_orgs.sqlite3"))
+    recent_orgs.record([("small-a", None)], now=1.0)
+    recent_orgs.record([("small-b", "/data"), ("huge", None)], now=2.0)
+    keys = recent_orgs.most_recent(2)
+    recent_orgs.close()
+    assert set(keys) == {("small-b", "/data"), ("huge", None)}
+
+    instances = {}
+
+    def build(org_id, **_kwargs):
+        if org_id == "huge":
+            raise ValueError("Failed to load configuration")
+        instances[org_id] = MagicMock(org_id=org_id, storage_bytes=0)
+        return instances[org_id]
+
+    cache.side_effect = build
+    assert warm_up_reflexio_cache(keys) == 1
+
+    instances["small-b"].warm_up.assert_called_once()
+    assert get_cache_stats()["warmed_up"] == 1
@@ -0,0 +1,191 @@
+"""Unit tests for the async LiteLLMClient twins and the shared LLM event loop."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from reflexio.server.llm import litellm_client
+from reflexio.server.llm.embedding_cache import EmbeddingCache
+from reflexio.server.llm.litellm_client import (
+    LiteLLMClient,
+    LiteLLMClientError,
+    LiteLLMConfig,
+)
+from reflexio.server.llm.llm_event_loop import (
+    get_llm_event_loop,
+    run_on_llm_event_loop,
+)
+from reflexio.server.services.executor_registry import (
+    BoundedExecutor,
+    TaskCancelledError,
+)
+
+
+def _completion_response(content: str) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.usage = None
+    return response
+
+
+def test_agenerate_chat_response_retries_with_async_backoff():
+    calls = []
+
+    async def acompletion(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise RuntimeError("connection reset")
+        return _completion_response("hello")
+
+    client = LiteLLMClient(
+        LiteLLMConfig(model="gpt-4o-mini", max_retries=2, retry_delay=0.0)
+    )
+    with (
+        patch.object(litellm_client.litellm, "acompletion", side_effect=acompletion),
+        patch.object(litellm_client.time, "sleep") as blocking_sleep,
+    ):
+        result = asyncio.run(
+            client.agenerate_chat_response(
+                [{"role": "user", "content": "hi"}], system_message="be brief"
+            )
+        )
+
+    assert result == "hello"
+    assert len(calls) == 2
+    assert calls[0]["messages"][0] == {"role": "system", "content": "be brief"}
+    blocking_sleep.assert_not_called()
+
+
+def test_agenerate_response_raises_non_retryable_errors():
+    async def acompletion(**kwargs):
+        raise RuntimeError("invalid_api_key")
+
+    client = LiteLLMClient(LiteLLMConfig(model="gpt-4o-mini", max_retries=3))
+    with (
+        patch.object(litellm_client.litellm, "acompletion", side_effect=acompletion),
+        pytest.raises(LiteLLMClientError),
+    ):
+        asyncio.run(client.agenerate_response("hi"))
+
+
+def test_provider_semaphore_bounds_in_flight_requests():
+    active = [0]
+    peak = [0]
+
+    async def acompletion(**kwargs):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        return _completion_response("ok")
+
+    client = LiteLLMClient(LiteLLMConfig(model="gpt-4o-mini"))
+
+    async def run_many():
+        return await asyncio.gather(
+            *(client.agenerate_response(f"q{i}") for i in range(10))
+        )
+
+    with (
+        patch.object(litellm_client, "LLM_ASYNC_CONCURRENCY_PER_PROVIDER", 3),
+        patch.object(litellm_client.litellm, "acompletion", side_effect=acompletion),
+    ):
+        results = asyncio.run(run_many())
+
+    assert results == ["ok"] * 10
+    assert peak[0] == 3
+
+
+def test_aget_embeddings_share_the_embedding_cache():
+    cache = EmbeddingCache(max_size=100)
+
+    async def aembedding(**kwargs):
+        response = MagicMock()
+        response.data = [
+            {"index": i, "embedding": [float(len(text))]}
+            for i, text in enumerate(kwargs["input"])
+        ]
+        return response
+
+    client = LiteLLMClient(LiteLLMConfig(model="gpt-4o-mini"))
+    with (
+        patch.object(litellm_client, "get_embedding_cache", return_value=cache),
+        patch.object(
+            litellm_client.litellm, "aembedding", side_effect=aembedding
+        ) as mock_aembedding,
+    ):
+        first = asyncio.run(client.aget_embedding("hello"))
+        batch = asyncio.run(client.aget_embeddings(["hello", "hi", "hi"]))
+
+    assert batch == [first, [2.0], [2.0]]
+    assert mock_aembedding.call_count == 2
+    assert mock_aembedding.call_args.kwargs["input"] == ["hi"]
+
+
+def test_run_on_llm_event_loop_returns_results_from_many_threads():
+    async def double(value):
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    results = [None] * 20
+
+    def worker(index):
+        results[index] = run_on_llm_event_loop(double(index))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [i * 2 for i in range(20)]
+
+
+def test_run_on_llm_event_loop_times_out_and_cancels():
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        run_on_llm_event_loop(hang(), timeout=0.05)
+    assert cancelled.wait(timeout=5)
+
+
+def test_cancelling_the_executor_task_cancels_the_coroutine():
+    executor = BoundedExecutor("test-async", max_workers=1, max_queue=0)
+    started = threading.Event()
+
+    async def hang():
+        started.set()
+        await asyncio.sleep(10)
+
+    future = executor.submit(run_on_llm_event_loop, hang())
+    assert started.wait(timeout=5)
+    executor.cancel(future)
+
+    start = time.perf_counter()
+    with pytest.raises(TaskCancelledError):
+        future.result(timeout=5)
+    assert time.perf_counter() - start < 5
+    executor.shutdown()
+
+
+def test_run_on_llm_event_loop_rejects_calls_from_the_loop_thread():
+    async def noop():
+        return None
+
+    async def nested():
+        return run_on_llm_event_loop(noop())
+
+    loop = get_llm_event_loop()
+    with pytest.raises(RuntimeError):
+        asyncio.run_coroutine_threadsafe(nested(), loop).result(timeout=5)
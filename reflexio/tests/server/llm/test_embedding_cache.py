@@ -0,0 +1,126 @@
+"""Unit tests for the content-addressed embedding cache and its LiteLLMClient wiring."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from reflexio.server.llm.embedding_cache import EmbeddingCache, embedding_cache_key
+from reflexio.server.llm.litellm_client import LiteLLMClient, LiteLLMConfig
+
+
+def _embedding_response(texts: list[str]) -> MagicMock:
+    response = MagicMock()
+    response.data = [
+        {"index": i, "embedding": [float(len(text)), float(i)]}
+        for i, text in enumerate(texts)
+    ]
+    return response
+
+
+@pytest.fixture
+def cache():
+    cache = EmbeddingCache(max_size=100)
+    with patch(
+        "reflexio.server.llm.litellm_client.get_embedding_cache", return_value=cache
+    ):
+        yield cache
+
+
+@pytest.fixture
+def mock_embedding():
+    with patch(
+        "reflexio.server.llm.litellm_client.litellm.embedding",
+        side_effect=lambda **kwargs: _embedding_response(kwargs["input"]),
+    ) as mock:
+        yield mock
+
+
+def test_get_embeddings_only_sends_cache_misses(cache, mock_embedding):
+    client = LiteLLMClient(LiteLLMConfig(model="gpt-4o-mini"))
+
+    first = client.get_embedding("hello", dimensions=2)
+    batch = client.get_embeddings(["hello", "world", "world"], dimensions=2)
+
+    assert batch[0] == first
+    assert batch[1] == batch[2]
+    assert mock_embedding.call_count == 2
+    assert mock_embedding.call_args.kwargs["input"] == ["world"]
+
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["stores"] == 2
+
+
+def test_cache_key_includes_model_and_dimensions(cache, mock_embedding):
+    client = LiteLLMClient(LiteLLMConfig(model="gpt-4o-mini"))
+
+    client.get_embedding("hello", dimensions=2)
+    client.get_embedding("hello", dimensions=3)
+    client.get_embedding("hello", model="other-model", dimensions=2)
+
+    assert mock_embedding.call_count == 3
+    assert embedding_cache_key("hello", "m", None) != embedding_cache_key(
+        "hello", "m", 2
+    )
+
+
+def test_disk_tier_survives_a_new_cache():
+    key = embedding_cache_key("hello", "text-embedding-3-small", 4)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        EmbeddingCache(max_size=10, disk_dir=temp_dir).put(key, [0.5, 1.0, 1.5, 2.0])
+
+        fresh = EmbeddingCache(max_size=10, disk_dir=temp_dir)
+        assert fresh.get(key) == [0.5, 1.0, 1.5, 2.0]
+        assert fresh.get(key) == [0.5, 1.0, 1.5, 2.0]
+        assert fresh.stats()["disk_hits"] == 1
+        assert fresh.stats()["memory_hits"] == 1
+
+
+def test_orphaned_or_truncated_disk_rows_read_as_misses():
+    first = embedding_cache_key("first", "text-embedding-3-small", 4)
+    second = embedding_cache_key("second", "text-embedding-3-small", 4)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        EmbeddingCache(max_size=10, disk_dir=temp_dir).put(first, [1.0, 1.0, 1.0, 1.0])
+        vectors_path = next(Path(temp_dir).glob("*.f32"))
+        # A vector whose key line was never written (the process died in between)
+        with vectors_path.open("ab") as file:
+            file.write(np.full(4, 9.0, dtype=np.float32).tobytes())
+        EmbeddingCache(max_size=10, disk_dir=temp_dir).put(second, [2.0, 2.0, 2.0, 2.0])
+
+        fresh = EmbeddingCache(max_size=10, disk_dir=temp_dir)
+        assert fresh.get(first) == [1.0, 1.0, 1.0, 1.0]
+        assert fresh.get(second) == [2.0, 2.0, 2.0, 2.0]
+
+        # Truncating the vector file turns the lost rows into misses
+        with vectors_path.open("r+b") as file:
+            file.truncate(4 * 4 + 2)
+        truncated = EmbeddingCache(max_size=10, disk_dir=temp_dir)
+        assert truncated.get(first) == [1.0, 1.0, 1.0, 1.0]
+        assert truncated.get(second) is None
+
+
+def test_memory_tier_stores_float32_and_returns_lists():
+    cache = EmbeddingCache(max_size=10)
+    key = embedding_cache_key("hello", "text-embedding-3-small", 3)
+    cache.put(key, [0.1, 0.2, 0.3])
+
+    stored = cache._memory[key]
+    assert stored.dtype == np.float32
+    hit = cache.get(key)
+    assert isinstance(hit, list)
+    assert hit == pytest.approx([0.1, 0.2, 0.3], rel=1e-6)
+    # Hits are copies, so callers cannot mutate the cached entry
+    hit[0] = 5.0
+    assert cache.get(key)[0] == pytest.approx(0.1, rel=1e-6)
+
+
+def test_disabled_cache_never_hits():
+    cache = EmbeddingCache(max_size=0)
+    key = embedding_cache_key("hello", "m", 2)
+    cache.put(key, [1.0, 2.0])
+    assert cache.get(key) is None
+    assert not cache.enabled
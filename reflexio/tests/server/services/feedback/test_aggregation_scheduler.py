@@ -0,0 +1,204 @@
+"""Unit tests for the debounced aggregation scheduler."""
+
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from reflexio_commons.config_schema import (
+    AgentFeedbackConfig,
+    FeedbackAggregatorConfig,
+)
+
+from reflexio.server.api_endpoints.request_context import RequestContext
+from reflexio.server.services.feedback.aggregation_scheduler import (
+    AggregationScheduler,
+)
+from reflexio.server.services.feedback.feedback_generation_service import (
+    FeedbackGenerationService,
+)
+
+
+def wait_until_idle(scheduler: AggregationScheduler, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while scheduler.stats()["running"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert scheduler.stats()["running"] == 0
+
+
+@pytest.fixture
+def db_path():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield str(Path(temp_dir) / "aggregation_triggers.sqlite3")
+
+
+def test_triggers_coalesce_into_one_run_per_window(db_path):
+    handler = MagicMock()
+    scheduler = AggregationScheduler(handler, debounce_seconds=60, db_path=db_path)
+    for _ in range(3):
+        scheduler.trigger("org_a", "fb", "1.0")
+    scheduler.trigger("org_b", "fb", "1.0")
+
+    stats = scheduler.stats()
+    assert stats["pending"] == 2
+    assert stats["triggered"] == 4
+    assert stats["coalesced"] == 2
+    # Nothing is due before the window expires
+    assert scheduler.run_due() == 0
+
+    assert scheduler.run_due(now=time.time() + 61) == 2
+    wait_until_idle(scheduler)
+    assert sorted(call.args for call in handler.call_args_list) == [
+        ("org_a", "fb", "1.0"),
+        ("org_b", "fb", "1.0"),
+    ]
+    stats = scheduler.stats()
+    assert stats["pending"] == 0
+    assert stats["runs"] == 2
+    assert stats["failed_runs"] == 0
+
+
+def test_trigger_during_run_schedules_one_follow_up(db_path):
+    started = threading.Event()
+    release = threading.Event()
+
+    def handler(org_id, feedback_name, agent_version):
+        started.set()
+        release.wait(timeout=5)
+
+    scheduler = AggregationScheduler(handler, debounce_seconds=60, db_path=db_path)
+    scheduler.trigger("org_a", "fb", "1.0")
+    scheduler.run_due(now=time.time() + 61)
+    assert started.wait(timeout=5)
+
+    # A running key is never submitted again
+    scheduler.trigger("org_a", "fb", "1.0")
+    scheduler.trigger("org_a", "fb", "1.0")
+    assert scheduler.run_due(now=time.time() + 61) == 0
+    release.set()
+    wait_until_idle(scheduler)
+
+    org_stats = scheduler.stats("org_a")["org"]
+    assert org_stats["running"] == []
+    assert [entry["trigger_count"] for entry in org_stats["pending"]] == [2]
+    assert org_stats["pending"][0]["due_in_seconds"] > 0
+
+
+def test_pending_triggers_survive_restart(db_path):
+    handler = MagicMock()
+    scheduler = AggregationScheduler(handler, debounce_seconds=60, db_path=db_path)
+    scheduler.trigger("org_a", "fb", "1.0")
+    scheduler.trigger("org_a", "other", "2.0")
+
+    restored = AggregationScheduler(handler, debounce_seconds=60, db_path=db_path)
+    assert restored.stats()["pending"] == 2
+
+    restored.run_due(now=time.time() + 61)
+    wait_until_idle(restored)
+    assert handler.call_count == 2
+    assert (
+        AggregationScheduler(handler, debounce_seconds=60, db_path=db_path).stats()[
+            "pending"
+        ]
+        == 0
+    )
+
+
+def test_failed_run_is_retried_with_backoff_then_dropped(db_path):
+    handler = MagicMock(side_effect=RuntimeError("boom"))
+    scheduler = AggregationScheduler(
+        handler,
+        debounce_seconds=0,
+        db_path=db_path,
+        max_attempts=2,
+        retry_base_seconds=30,
+    )
+    scheduler.trigger("org_a", "fb", "1.0")
+    scheduler.run_due()
+    wait_until_idle(scheduler)
+
+    stats = scheduler.stats("org_a")
+    assert stats["failed_runs"] == 1
+    assert stats["last_run_seconds"] >= 0
+    (pending,) = stats["org"]["pending"]
+    assert pending["failed_attempts"] == 1
+    assert 0 < pending["due_in_seconds"] <= 30
+    # Backoff is persisted with the trigger
+    restored = AggregationScheduler(handler, debounce_seconds=0, db_path=db_path)
+    assert restored.stats("org_a")["org"]["pending"][0]["failed_attempts"] == 1
+    assert scheduler.run_due() == 0
+
+    assert scheduler.run_due(now=time.time() + 31) == 1
+    wait_until_idle(scheduler)
+    stats = scheduler.stats()
+    assert stats["failed_runs"] == 2
+    assert stats["pending"] == 0
+    assert stats["dropped_triggers"] == 1
+
+
+def test_legacy_trigger_table_is_migrated(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE pending_aggregations (org_id TEXT NOT NULL, feedback_name TEXT NOT NULL, "
+        "agent_version TEXT NOT NULL, first_triggered_at REAL NOT NULL, due_at REAL NOT NULL, "
+        "trigger_count INTEGER NOT NULL, PRIMARY KEY (org_id, feedback_name, agent_version))"
+    )
+    conn.execute(
+        "INSERT INTO pending_aggregations VALUES ('org_a', 'fb', '1.0', 0, 0, 3)"
+    )
+    conn.commit()
+    conn.close()
+
+    scheduler = AggregationScheduler(MagicMock(), debounce_seconds=60, db_path=db_path)
+    (pending,) = scheduler.stats("org_a")["org"]["pending"]
+    assert pending["trigger_count"] == 3
+    assert pending["failed_attempts"] == 0
+
+
+def test_dispatcher_runs_due_keys():
+    done = threading.Event()
+    scheduler = AggregationScheduler(
+        lambda *_: done.set(), debounce_seconds=0.05, db_path=None
+    )
+    scheduler.start()
+    try:
+        scheduler.trigger("org_a", "fb", "1.0")
+        assert done.wait(timeout=5)
+    finally:
+        scheduler.stop()
+
+
+def test_feedback_service_schedules_instead_of_running_inline():
+    feedback_config = AgentFeedbackConfig(
+        feedback_name="test_feedback",
+        feedback_definition_prompt="test",
+        feedback_aggregator_config=FeedbackAggregatorConfig(min_feedback_threshold=2),
+    )
+    scheduler = MagicMock()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        service = FeedbackGenerationService(
+            llm_client=MagicMock(),
+            request_context=RequestContext(org_id="0", storage_base_dir=temp_dir),
+        )
+        service.configurator.set_config_by_name(
+            "agent_feedback_configs", [feedback_config]
+        )
+        service.service_config = MagicMock(agent_version="1.0")
+        module = "reflexio.server.services.feedback.feedback_generation_service"
+        with (
+            patch(f"{module}.run_feedback_aggregation_for_config") as run_inline,
+            patch(f"{module}.get_aggregation_scheduler", return_value=scheduler),
+        ):
+            service._trigger_feedback_aggregation()
+            scheduler.trigger.assert_called_once_with("0", "test_feedback", "1.0")
+            run_inline.assert_not_called()
+
+        with (
+            patch(f"{module}.run_feedback_aggregation_for_config") as run_inline,
+            patch(f"{module}.get_aggregation_scheduler", return_value=None),
+        ):
+            service._trigger_feedback_aggregation()
+            run_inline.assert_called_once()
@@ -5,8 +5,9 @@ Tests fingerprint computation, change detection logic, selective LLM invocation,
 and clustering stability.
 """
 
+import asyncio
 import contextlib
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import numpy as np
 import pytest
@@ -412,9 +413,13 @@ class TestAggregatorRunWithChangeDetection:
         mock_configurator.get_config.return_value.agent_feedback_configs = [
             mock_agent_feedback_config
         ]
+        mock_configurator.get_config.return_value.cluster_generation_concurrency = 4
 
         # Setup storage methods
-        mock_storage.get_raw_feedbacks.return_value = raw_feedbacks
+        mock_storage.get_raw_feedbacks_with_embeddings.return_value = (
+            raw_feedbacks,
+            np.array([fb.embedding for fb in raw_feedbacks], dtype=np.float32),
+        )
         mock_storage.get_feedbacks.return_value = existing_feedbacks
         mock_storage.count_raw_feedbacks.return_value = len(raw_feedbacks)
         mock_storage.save_feedbacks.return_value = []
@@ -437,7 +442,7 @@ class TestAggregatorRunWithChangeDetection:
             when_condition="When something happens",
         )
         mock_response = FeedbackAggregationOutput(feedback=structured)
-        mock_llm_client.generate_chat_response.return_value = mock_response
+        mock_llm_client.agenerate_chat_response = AsyncMock(return_value=mock_response)
         mock_llm_client.config = MagicMock()
         mock_llm_client.config.model = "test-model"
 
@@ -476,7 +481,7 @@ class TestAggregatorRunWithChangeDetection:
         aggregator.run(request)
 
         # LLM should be called for each cluster (at least 1, up to 2)
-        assert mock_llm_client.generate_chat_response.call_count >= 1
+        assert mock_llm_client.agenerate_chat_response.call_count >= 1
         # Save feedbacks should be called
         mock_storage.save_feedbacks.assert_called_once()
         # Fingerprints should be stored
@@ -535,7 +540,7 @@ class TestAggregatorRunWithChangeDetection:
         aggregator.run(request)
 
         # LLM should NOT be called
-        mock_llm_client.generate_chat_response.assert_not_called()
+        mock_llm_client.agenerate_chat_response.assert_not_called()
         # archive_feedbacks_by_ids should NOT be called (nothing to archive)
         mock_storage.archive_feedbacks_by_ids.assert_not_called()
 
@@ -590,7 +595,7 @@ class TestAggregatorRunWithChangeDetection:
         aggregator.run(request)
 
         # LLM should be called fewer times than total clusters
-        total_llm_calls = mock_llm_client.generate_chat_response.call_count
+        total_llm_calls = mock_llm_client.agenerate_chat_response.call_count
         assert total_llm_calls >= 1
         # save_feedbacks should be called
         mock_storage.save_feedbacks.assert_called_once()
@@ -642,7 +647,7 @@ class TestAggregatorRunWithChangeDetection:
         aggregator.run(request)
 
         # LLM should be called for ALL clusters
-        assert mock_llm_client.generate_chat_response.call_count == len(clusters)
+        assert mock_llm_client.agenerate_chat_response.call_count == len(clusters)
         # archive_feedbacks_by_feedback_name should be called (full archive)
         mock_storage.archive_feedbacks_by_feedback_name.assert_called_once()
 
@@ -753,6 +758,99 @@ class TestAggregatorRunWithChangeDetection:
 
         mock_storage.restore_archived_feedbacks_by_feedback_name.assert_called_once()
 
+    def test_incremental_clustering_stores_centroids(self):
+        """With incremental_clustering, run() persists cluster centroids next to fingerprints."""
+        group_a = create_similar_embeddings(3, base_seed=42)
+        group_b = create_similar_embeddings(3, base_seed=100)
+        raw_feedbacks = create_raw_feedbacks_with_embeddings(group_a + group_b)
+
+        aggregator, mock_storage, mock_llm_client = self._setup_aggregator_for_run(
+            raw_feedbacks=raw_feedbacks,
+            operation_state=None,
+            config=FeedbackAggregatorConfig(
+                min_feedback_threshold=2, refresh_count=1, incremental_clustering=True
+            ),
+        )
+        mock_storage.save_feedbacks.side_effect = lambda feedbacks: feedbacks
+
+        request = FeedbackAggregatorRequest(
+            agent_version="1.0",
+            feedback_name="test_feedback",
+        )
+
+        aggregator.run(request)
+
+        centroid_states = [
+            state
+            for key, state in (
+                call[0] for call in mock_storage.upsert_operation_state.call_args_list
+            )
+            if key.endswith("::centroids")
+        ]
+        assert len(centroid_states) == 1
+        assert sorted(
+            raw_id
+            for entry in centroid_states[0]["clusters"]
+            for raw_id in entry["raw_feedback_ids"]
+        ) == list(range(6))
+
+    def test_fingerprints_map_to_the_feedback_of_their_own_cluster(self):
+        """Concurrent generation keeps feedback_ids on the cluster that produced them,
+        even when an earlier cluster yields no feedback."""
+        group_a = create_similar_embeddings(3, base_seed=42)
+        group_b = create_similar_embeddings(3, base_seed=100)
+        raw_feedbacks = create_raw_feedbacks_with_embeddings(group_a + group_b)
+
+        aggregator, mock_storage, _ = self._setup_aggregator_for_run(
+            raw_feedbacks=raw_feedbacks,
+            operation_state=None,
+        )
+        clusters = aggregator.get_clusters(
+            raw_feedbacks, FeedbackAggregatorConfig(min_feedback_threshold=2)
+        )
+        assert len(clusters) == 2
+        first_ids = {fb.raw_feedback_id for fb in next(iter(clusters.values()))}
+
+        async def generate(cluster_feedbacks, _approved):
+            if {fb.raw_feedback_id for fb in cluster_feedbacks} == first_ids:
+                return None
+            return Feedback(
+                feedback_name="test_feedback",
+                agent_version="1.0",
+                feedback_content="generated",
+                feedback_status=FeedbackStatus.PENDING,
+            )
+
+        aggregator._generate_feedback_from_cluster = generate
+
+        def save_feedbacks_side_effect(feedbacks):
+            for fb in feedbacks:
+                fb.feedback_id = 7
+            return feedbacks
+
+        mock_storage.save_feedbacks.side_effect = save_feedbacks_side_effect
+
+        aggregator.run(
+            FeedbackAggregatorRequest(
+                agent_version="1.0", feedback_name="test_feedback"
+            )
+        )
+
+        fingerprint_states = [
+            state["cluster_fingerprints"]
+            for key, state in (
+                call[0] for call in mock_storage.upsert_operation_state.call_args_list
+            )
+            if key.endswith("::clusters")
+        ]
+        assert len(fingerprint_states) == 1
+        feedback_ids = {
+            tuple(entry["raw_feedback_ids"]): entry["feedback_id"]
+            for entry in fingerprint_states[0].values()
+        }
+        assert feedback_ids[tuple(sorted(first_ids))] is None
+        assert sorted(feedback_ids.values(), key=str) == [7, None]
+
 
 class TestLLMResponseTypeSafety:
     """Regression tests for LLM response isinstance guard."""
@@ -765,7 +863,9 @@ class TestLLMResponseTypeSafety:
         mock_request_context.configurator = MagicMock()
 
         # LLM returns a raw string instead of FeedbackAggregationOutput
-        mock_llm_client.generate_chat_response.return_value = "unparsed text"
+        mock_llm_client.agenerate_chat_response = AsyncMock(
+            return_value="unparsed text"
+        )
         mock_llm_client.config = MagicMock()
         mock_llm_client.config.model = "test-model"
 
@@ -788,7 +888,9 @@ class TestLLMResponseTypeSafety:
             ),
         ]
 
-        result = aggregator._generate_feedback_from_cluster(cluster_feedbacks, "None")
+        result = asyncio.run(
+            aggregator._generate_feedback_from_cluster(cluster_feedbacks, "None")
+        )
         assert result is None
 
     def test_valid_aggregation_output_is_processed(self):
@@ -802,8 +904,8 @@ class TestLLMResponseTypeSafety:
             do_action="Be concise",
             when_condition="When answering questions",
         )
-        mock_llm_client.generate_chat_response.return_value = FeedbackAggregationOutput(
-            feedback=structured
+        mock_llm_client.agenerate_chat_response = AsyncMock(
+            return_value=FeedbackAggregationOutput(feedback=structured)
         )
         mock_llm_client.config = MagicMock()
         mock_llm_client.config.model = "test-model"
@@ -827,7 +929,9 @@ class TestLLMResponseTypeSafety:
             ),
         ]
 
-        result = aggregator._generate_feedback_from_cluster(cluster_feedbacks, "None")
+        result = asyncio.run(
+            aggregator._generate_feedback_from_cluster(cluster_feedbacks, "None")
+        )
         assert result is not None
         assert result.do_action == "Be concise"
         assert result.when_condition == "When answering questions"
@@ -21,6 +21,7 @@ def disable_mock_llm_response(monkeypatch):
 from reflexio_commons.api_schema.service_schemas import RawFeedback
 from reflexio_commons.config_schema import FeedbackAggregatorConfig
 
+from reflexio.server.services.feedback import feedback_aggregator
 from reflexio.server.services.feedback.feedback_aggregator import (
     CLUSTERING_ALGORITHM_THRESHOLD,
     FeedbackAggregator,
@@ -347,5 +348,180 @@ class TestEdgeCases:
         assert len(list(clusters.values())[0]) == 5
 
 
+class TestSparseClustering:
+    """Tests for the sparse k-nearest-neighbour graph path (large datasets)."""
+
+    def test_knn_graph_is_symmetric_without_self_loops(self, monkeypatch):
+        """The graph keeps k neighbours per point across blocks, symmetric, no diagonal."""
+        # Force several similarity blocks
+        monkeypatch.setattr(feedback_aggregator, "KNN_BLOCK_ELEMENTS", 40)
+        embeddings = np.asarray(
+            create_dissimilar_embeddings(20, base_seed=7), dtype=np.float32
+        )
+
+        graph = FeedbackAggregator._build_knn_distance_graph(embeddings, 3)
+
+        assert graph.shape == (20, 20)
+        assert graph.diagonal().sum() == 0
+        assert (graph != graph.T).nnz == 0
+        assert all(graph.getrow(i).nnz >= 3 for i in range(20))
+        expected = 1.0 - embeddings[0] @ embeddings[graph.getrow(0).indices[0]]
+        assert graph.getrow(0).data[0] == pytest.approx(expected, abs=1e-5)
+
+    def test_identical_embeddings_keep_edges(self):
+        """Zero distances are kept as edges instead of being dropped by the sparse matrix."""
+        embeddings = np.asarray(create_similar_embeddings(1) * 4, dtype=np.float32)
+
+        graph = FeedbackAggregator._build_knn_distance_graph(embeddings, 3)
+
+        assert graph.nnz == 12
+
+    def test_sparse_path_clusters_each_component(
+        self, mock_feedback_aggregator, monkeypatch
+    ):
+        """Above the sparse threshold, each connected group is clustered separately."""
+        monkeypatch.setattr(feedback_aggregator, "SPARSE_CLUSTERING_THRESHOLD", 30)
+        monkeypatch.setattr(feedback_aggregator, "KNN_GRAPH_NEIGHBORS", 5)
+        embeddings = (
+            create_similar_embeddings(12, base_seed=1)
+            + create_similar_embeddings(12, base_seed=2)
+            + create_similar_embeddings(12, base_seed=3)
+            + create_dissimilar_embeddings(1, base_seed=4)
+        )
+        raw_feedbacks = create_raw_feedbacks_with_embeddings(embeddings)
+        config = FeedbackAggregatorConfig(min_feedback_threshold=2)
+
+        with patch.object(
+            mock_feedback_aggregator,
+            "_cluster_with_knn_graph",
+            wraps=mock_feedback_aggregator._cluster_with_knn_graph,
+        ) as mock_knn:
+            clusters = mock_feedback_aggregator.get_clusters(raw_feedbacks, config)
+
+        mock_knn.assert_called_once()
+        assert sorted(
+            sorted(fb.raw_feedback_id for fb in cluster_feedbacks)
+            for cluster_feedbacks in clusters.values()
+        ) == [list(range(0, 12)), list(range(12, 24)), list(range(24, 36))]
+
+
+class TestIncrementalClustering:
+    """Tests for incremental clustering against stored cluster centroids."""
+
+    def _two_cluster_feedbacks(self) -> list[RawFeedback]:
+        embeddings = create_similar_embeddings(5, base_seed=1) + (
+            create_similar_embeddings(5, base_seed=2)
+        )
+        return create_raw_feedbacks_with_embeddings(embeddings)
+
+    def test_no_state_falls_back_to_full_clustering(self, mock_feedback_aggregator):
+        """Without stored centroids, all feedbacks are clustered and state is built."""
+        raw_feedbacks = self._two_cluster_feedbacks()
+        config = FeedbackAggregatorConfig(min_feedback_threshold=2)
+
+        clusters, state = mock_feedback_aggregator._get_clusters_incremental(
+            raw_feedbacks, config, {}
+        )
+
+        assert len(clusters) == 2
+        assert len(state["clusters"]) == 2
+        assert sorted(
+            raw_id
+            for entry in state["clusters"]
+            for raw_id in entry["raw_feedback_ids"]
+        ) == list(range(10))
+        assert len(state["clusters"][0]["centroid"]) == 512
+        assert state["noise_raw_feedback_ids"] == []
+
+    def test_new_feedback_assigned_to_nearest_cluster(self, mock_feedback_aggregator):
+        """New feedbacks join the nearest cluster; other clusters are not re-clustered."""
+        raw_feedbacks = self._two_cluster_feedbacks()
+        config = FeedbackAggregatorConfig(min_feedback_threshold=2)
+        _, state = mock_feedback_aggregator._get_clusters_incremental(
+            raw_feedbacks, config, {}
+        )
+
+        new_feedback = RawFeedback(
+            raw_feedback_id=10,
+            agent_version="1.0",
+            request_id="10",
+            feedback_content="Feedback content 10",
+            feedback_name="test_feedback",
+            embedding=create_similar_embeddings(1, base_seed=1)[0],
+        )
+        with patch.object(
+            mock_feedback_aggregator,
+            "_cluster_raw_feedbacks",
+            wraps=mock_feedback_aggregator._cluster_raw_feedbacks,
+        ) as mock_cluster:
+            clusters, new_state = mock_feedback_aggregator._get_clusters_incremental(
+                [*raw_feedbacks, new_feedback], config, state
+            )
+
+        # Only the cluster that gained a member is re-clustered
+        pooled_ids = {fb.raw_feedback_id for fb in mock_cluster.call_args[0][0]}
+        assert pooled_ids == {0, 1, 2, 3, 4, 10}
+
+        cluster_ids = sorted(
+            sorted(fb.raw_feedback_id for fb in cluster_feedbacks)
+            for cluster_feedbacks in clusters.values()
+        )
+        assert cluster_ids == [[0, 1, 2, 3, 4, 10], [5, 6, 7, 8, 9]]
+        assert len(new_state["clusters"]) == 2
+
+    def test_unchanged_clusters_keep_fingerprints(self, mock_feedback_aggregator):
+        """With no new feedbacks, clusters and fingerprints are carried over unchanged."""
+        raw_feedbacks = self._two_cluster_feedbacks()
+        config = FeedbackAggregatorConfig(min_feedback_threshold=2)
+        first_clusters, state = mock_feedback_aggregator._get_clusters_incremental(
+            raw_feedbacks, config, {}
+        )
+
+        with patch.object(
+            mock_feedback_aggregator, "_cluster_raw_feedbacks"
+        ) as mock_cluster:
+            clusters, new_state = mock_feedback_aggregator._get_clusters_incremental(
+                raw_feedbacks, config, state
+            )
+
+        mock_cluster.assert_not_called()
+        fingerprint = FeedbackAggregator._compute_cluster_fingerprint
+        assert {fingerprint(c) for c in clusters.values()} == {
+            fingerprint(c) for c in first_clusters.values()
+        }
+        assert new_state == state
+
+    def test_new_feedback_forms_cluster_with_noise(self, mock_feedback_aggregator):
+        """An unassigned new feedback is re-clustered with nearby previous noise."""
+        raw_feedbacks = self._two_cluster_feedbacks()
+        outliers = create_similar_embeddings(2, base_seed=3)
+        noise = RawFeedback(
+            raw_feedback_id=10,
+            agent_version="1.0",
+            request_id="10",
+            feedback_content="Feedback content 10",
+            feedback_name="test_feedback",
+            embedding=outliers[0],
+        )
+        config = FeedbackAggregatorConfig(min_feedback_threshold=2)
+        _, state = mock_feedback_aggregator._get_clusters_incremental(
+            [*raw_feedbacks, noise], config, {}
+        )
+        assert state["noise_raw_feedback_ids"] == [10]
+
+        new_feedback = noise.model_copy(
+            update={"raw_feedback_id": 11, "embedding": outliers[1]}
+        )
+        clusters, new_state = mock_feedback_aggregator._get_clusters_incremental(
+            [*raw_feedbacks, noise, new_feedback], config, state
+        )
+
+        assert len(clusters) == 3
+        assert [10, 11] in [
+            sorted(fb.raw_feedback_id for fb in c) for c in clusters.values()
+        ]
+        assert new_state["noise_raw_feedback_ids"] == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
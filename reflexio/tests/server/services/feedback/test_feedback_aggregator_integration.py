@@ -2,7 +2,7 @@ import contextlib
 import csv
 import os
 import tempfile
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from reflexio_commons.api_schema.service_schemas import (
@@ -167,12 +167,12 @@ def test_feedback_aggregator_get_clusters(
 
 @pytest.fixture
 def mock_chat_completion():
-    # Mock for feedback generation call - patch generate_chat_response which returns string directly
+    # Mock for feedback generation call - patch agenerate_chat_response which returns string directly
     mock_content = "The agent was helpful and provided accurate information"
 
     with patch(
-        "reflexio.server.llm.litellm_client.LiteLLMClient.generate_chat_response",
-        return_value=mock_content,
+        "reflexio.server.llm.litellm_client.LiteLLMClient.agenerate_chat_response",
+        new=AsyncMock(return_value=mock_content),
     ):
         yield
 
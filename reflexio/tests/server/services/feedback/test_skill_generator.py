@@ -1,8 +1,10 @@
 """Unit tests for the SkillGenerator service."""
 
+import asyncio
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from reflexio_commons.api_schema.service_schemas import (
     BlockingIssue,
@@ -30,6 +32,12 @@ from reflexio.server.services.feedback.skill_generator import (
 )
 from reflexio.tests.server.test_utils import skip_low_priority
 
+
+def _with_embeddings(raw_feedbacks: list[RawFeedback]) -> tuple:
+    """Return value of storage.get_raw_feedbacks_with_embeddings for raw_feedbacks."""
+    return raw_feedbacks, np.zeros((len(raw_feedbacks), 4), dtype=np.float32)
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -39,6 +47,7 @@ from reflexio.tests.server.test_utils import skip_low_priority
 def mock_llm_client():
     """Create a mock LLM client."""
     client = MagicMock()
+    client.agenerate_chat_response = AsyncMock()
     client.config = MagicMock()
     client.config.model = "test-model"
     return client
@@ -435,15 +444,17 @@ class TestGenerateNewSkill:
         self, skill_generator, sample_raw_feedbacks, mock_skill_generation_output
     ):
         """Test that a skill is generated from LLM output."""
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
 
-        skill = skill_generator._generate_new_skill(
-            sample_raw_feedbacks,
-            "interaction context",
-            "tools",
-            "existing skills",
+        skill = asyncio.run(
+            skill_generator._generate_new_skill(
+                sample_raw_feedbacks,
+                "interaction context",
+                "tools",
+                "existing skills",
+            )
         )
 
         assert skill is not None
@@ -461,13 +472,15 @@ class TestGenerateNewSkill:
         self, skill_generator, sample_raw_feedbacks
     ):
         """Test that None is returned when LLM returns None."""
-        skill_generator.client.generate_chat_response.return_value = None
-
-        skill = skill_generator._generate_new_skill(
-            sample_raw_feedbacks,
-            "interaction context",
-            "tools",
-            "existing skills",
+        skill_generator.client.agenerate_chat_response.return_value = None
+
+        skill = asyncio.run(
+            skill_generator._generate_new_skill(
+                sample_raw_feedbacks,
+                "interaction context",
+                "tools",
+                "existing skills",
+            )
         )
 
         assert skill is None
@@ -475,15 +488,17 @@ class TestGenerateNewSkill:
     @skip_low_priority
     def test_returns_none_on_exception(self, skill_generator, sample_raw_feedbacks):
         """Test that None is returned on LLM exception."""
-        skill_generator.client.generate_chat_response.side_effect = Exception(
+        skill_generator.client.agenerate_chat_response.side_effect = Exception(
             "LLM error"
         )
 
-        skill = skill_generator._generate_new_skill(
-            sample_raw_feedbacks,
-            "interaction context",
-            "tools",
-            "existing skills",
+        skill = asyncio.run(
+            skill_generator._generate_new_skill(
+                sample_raw_feedbacks,
+                "interaction context",
+                "tools",
+                "existing skills",
+            )
         )
 
         assert skill is None
@@ -493,15 +508,17 @@ class TestGenerateNewSkill:
         self, skill_generator, sample_raw_feedbacks, mock_skill_generation_output
     ):
         """Test that the correct prompt is rendered."""
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
 
-        skill_generator._generate_new_skill(
-            sample_raw_feedbacks,
-            "interaction ctx",
-            "available tools str",
-            "existing skills str",
+        asyncio.run(
+            skill_generator._generate_new_skill(
+                sample_raw_feedbacks,
+                "interaction ctx",
+                "available tools str",
+                "existing skills str",
+            )
         )
 
         render_call = skill_generator.request_context.prompt_manager.render_prompt
@@ -523,15 +540,17 @@ class TestUpdateExistingSkill:
         mock_skill_generation_output,
     ):
         """Test skill update with version bump."""
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
 
-        updated = skill_generator._update_existing_skill(
-            sample_skill,
-            sample_raw_feedbacks,
-            "interaction context",
-            "tools",
+        updated = asyncio.run(
+            skill_generator._update_existing_skill(
+                sample_skill,
+                sample_raw_feedbacks,
+                "interaction context",
+                "tools",
+            )
         )
 
         assert updated is not None
@@ -549,15 +568,17 @@ class TestUpdateExistingSkill:
         mock_skill_generation_output,
     ):
         """Test that raw_feedback_ids are merged."""
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
 
-        updated = skill_generator._update_existing_skill(
-            sample_skill,
-            sample_raw_feedbacks,
-            "interaction context",
-            "tools",
+        updated = asyncio.run(
+            skill_generator._update_existing_skill(
+                sample_skill,
+                sample_raw_feedbacks,
+                "interaction context",
+                "tools",
+            )
         )
 
         assert updated is not None
@@ -574,16 +595,18 @@ class TestUpdateExistingSkill:
         mock_skill_generation_output,
     ):
         """Test version bump from 1.5.0 to 1.6.0."""
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
         sample_skill.version = "1.5.0"
 
-        updated = skill_generator._update_existing_skill(
-            sample_skill,
-            sample_raw_feedbacks,
-            "ctx",
-            "tools",
+        updated = asyncio.run(
+            skill_generator._update_existing_skill(
+                sample_skill,
+                sample_raw_feedbacks,
+                "ctx",
+                "tools",
+            )
         )
 
         assert updated.version == "1.6.0"
@@ -593,13 +616,15 @@ class TestUpdateExistingSkill:
         self, skill_generator, sample_skill, sample_raw_feedbacks
     ):
         """Test that None is returned on LLM exception."""
-        skill_generator.client.generate_chat_response.side_effect = Exception("fail")
-
-        updated = skill_generator._update_existing_skill(
-            sample_skill,
-            sample_raw_feedbacks,
-            "ctx",
-            "tools",
+        skill_generator.client.agenerate_chat_response.side_effect = Exception("fail")
+
+        updated = asyncio.run(
+            skill_generator._update_existing_skill(
+                sample_skill,
+                sample_raw_feedbacks,
+                "ctx",
+                "tools",
+            )
         )
 
         assert updated is None
@@ -615,7 +640,9 @@ class TestSkillGeneratorRun:
 
     def test_returns_zero_when_no_raw_feedbacks(self, skill_generator):
         """Test that run returns zeros when no raw feedbacks exist."""
-        skill_generator.storage.get_raw_feedbacks.return_value = []
+        skill_generator.storage.get_raw_feedbacks_with_embeddings.return_value = (
+            _with_embeddings([])
+        )
 
         request = SkillGeneratorRequest(
             agent_version="1.0.0",
@@ -660,7 +687,9 @@ class TestSkillGeneratorRun:
                 when_condition="solo condition",
             ),
         ]
-        skill_generator.storage.get_raw_feedbacks.return_value = feedbacks
+        skill_generator.storage.get_raw_feedbacks_with_embeddings.return_value = (
+            _with_embeddings(feedbacks)
+        )
         skill_generator.storage.get_skills.return_value = []
 
         # Mock clustering to return a single cluster with 1 feedback (below min of 2)
@@ -686,10 +715,12 @@ class TestSkillGeneratorRun:
         self, skill_generator, sample_raw_feedbacks, mock_skill_generation_output
     ):
         """Test that new skills are generated for valid clusters."""
-        skill_generator.storage.get_raw_feedbacks.return_value = sample_raw_feedbacks
+        skill_generator.storage.get_raw_feedbacks_with_embeddings.return_value = (
+            _with_embeddings(sample_raw_feedbacks)
+        )
         skill_generator.storage.get_skills.return_value = []
         skill_generator.storage.get_interactions_by_request_ids.return_value = []
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
 
@@ -720,11 +751,13 @@ class TestSkillGeneratorRun:
         mock_skill_generation_output,
     ):
         """Test that existing skills are updated when a match is found."""
-        skill_generator.storage.get_raw_feedbacks.return_value = sample_raw_feedbacks
+        skill_generator.storage.get_raw_feedbacks_with_embeddings.return_value = (
+            _with_embeddings(sample_raw_feedbacks)
+        )
         skill_generator.storage.get_skills.return_value = [sample_skill]
         skill_generator.storage.search_skills.return_value = [sample_skill]
         skill_generator.storage.get_interactions_by_request_ids.return_value = []
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
 
@@ -751,10 +784,12 @@ class TestSkillGeneratorRun:
         self, skill_generator, sample_raw_feedbacks, mock_skill_generation_output
     ):
         """Test that operation state is updated after a successful run."""
-        skill_generator.storage.get_raw_feedbacks.return_value = sample_raw_feedbacks
+        skill_generator.storage.get_raw_feedbacks_with_embeddings.return_value = (
+            _with_embeddings(sample_raw_feedbacks)
+        )
         skill_generator.storage.get_skills.return_value = []
         skill_generator.storage.get_interactions_by_request_ids.return_value = []
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
 
@@ -786,11 +821,13 @@ class TestSkillGeneratorRun:
         mock_skill_generation_output,
     ):
         """Test that search failure falls back to generating a new skill."""
-        skill_generator.storage.get_raw_feedbacks.return_value = sample_raw_feedbacks
+        skill_generator.storage.get_raw_feedbacks_with_embeddings.return_value = (
+            _with_embeddings(sample_raw_feedbacks)
+        )
         skill_generator.storage.get_skills.return_value = [sample_skill]
         skill_generator.storage.search_skills.side_effect = Exception("Search failed")
         skill_generator.storage.get_interactions_by_request_ids.return_value = []
-        skill_generator.client.generate_chat_response.return_value = (
+        skill_generator.client.agenerate_chat_response.return_value = (
             mock_skill_generation_output
         )
 
@@ -63,8 +63,10 @@ def mock_request_context():
 
 @pytest.fixture
 def mock_site_var_manager():
-    """Mock the SiteVarManager to return model settings."""
-    with patch("reflexio.server.services.deduplication_utils.SiteVarManager") as mock:
+    """Mock the shared site var registry to return model settings."""
+    with patch(
+        "reflexio.server.services.deduplication_utils.get_site_var_manager"
+    ) as mock:
         instance = mock.return_value
         instance.get_site_var.return_value = {"default_generation_model_name": "gpt-4"}
         yield mock
@@ -213,7 +215,7 @@ class TestProfileDeduplicatorInit:
     ):
         """Test that init falls back to default model if not in site var."""
         with patch(
-            "reflexio.server.services.deduplication_utils.SiteVarManager"
+            "reflexio.server.services.deduplication_utils.get_site_var_manager"
         ) as mock:
             instance = mock.return_value
             instance.get_site_var.return_value = {}
@@ -697,6 +699,56 @@ class TestDeduplicate:
         assert delete_ids == []
         assert superseded == []
 
+    def test_deduplicate_attaches_storage_embeddings_to_new_profiles(
+        self,
+        mock_request_context,
+        mock_llm_client,
+        mock_site_var_manager,
+        sample_profiles,
+    ):
+        """Test that each profile is embedded once, for both its search and its save."""
+        vectors = {}
+
+        def embed(texts, **_kwargs):
+            return [
+                vectors.setdefault(text, [float(len(vectors))] * 512) for text in texts
+            ]
+
+        mock_llm_client.get_embeddings.side_effect = embed
+        mock_request_context.storage.embedding_model_name = "storage-embedding-model"
+        mock_llm_client.generate_chat_response.return_value = (
+            ProfileDeduplicationOutput(
+                duplicate_groups=[], unique_ids=["NEW-0", "NEW-1", "NEW-2"]
+            )
+        )
+
+        deduplicator = ProfileDeduplicator(
+            request_context=mock_request_context,
+            llm_client=mock_llm_client,
+        )
+        profiles, _, _ = deduplicator.deduplicate(
+            new_profiles=sample_profiles,
+            user_id="test_user",
+            request_id="test_request",
+        )
+
+        # One embedding call, with the storage's model
+        assert mock_llm_client.get_embeddings.call_count == 1
+        assert (
+            mock_llm_client.get_embeddings.call_args[1]["model"]
+            == "storage-embedding-model"
+        )
+        # Searches and saved profiles use the embedding of the text storage embeds
+        stored_vectors = [
+            vectors[f"{p.profile_content}\nNone"] for p in sample_profiles
+        ]
+        search_calls = mock_request_context.storage.search_user_profile.call_args_list
+        assert [call.kwargs["query_embedding"] for call in search_calls] == (
+            stored_vectors
+        )
+        assert [p.embedding for p in profiles] == stored_vectors
+        assert len(vectors) == len(sample_profiles)
+
     def test_deduplicate_returns_original_when_llm_fails(
         self,
         mock_request_context,
@@ -265,6 +265,41 @@ class TestGetInteractions:
         call_kwargs = request_context.storage.get_last_k_interactions_grouped.call_args
         assert call_kwargs[1]["k"] == 50
 
+    def test_min_window_size_widens_configured_window(
+        self,
+        request_context,
+        mock_llm_client,
+        sample_request_interaction_models,
+    ):
+        """Test that a coalesced run's minimum window covers more than the configured window."""
+        config = ProfileExtractorConfig(
+            extractor_name="test_extractor",
+            profile_content_definition_prompt="Extract user preferences",
+            extraction_window_size_override=10,
+        )
+        service_config = ProfileGenerationServiceConfig(
+            user_id="test_user",
+            request_id="test_request",
+            min_extraction_window_size=25,
+        )
+        request_context.storage.get_last_k_interactions_grouped.return_value = (
+            sample_request_interaction_models,
+            [],
+        )
+
+        extractor = ProfileExtractor(
+            request_context=request_context,
+            llm_client=mock_llm_client,
+            extractor_config=config,
+            service_config=service_config,
+            agent_context="Test agent",
+        )
+
+        extractor._get_interactions()
+
+        call_kwargs = request_context.storage.get_last_k_interactions_grouped.call_args
+        assert call_kwargs[1]["k"] == 25
+
     def test_returns_none_when_source_filter_skips(
         self,
         request_context,
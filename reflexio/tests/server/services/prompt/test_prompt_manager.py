@@ -9,7 +9,12 @@ from pathlib import Path
 import pytest
 
 import reflexio.server.prompt as prompt
-from reflexio.server.prompt.prompt_manager import PromptManager
+from reflexio.server.prompt.prompt_manager import (
+    CompiledPrompt,
+    PromptManager,
+    PromptRegistry,
+    get_prompt_registry,
+)
 from reflexio.server.prompt.prompt_schema import Prompt, PromptBank
 
 
@@ -291,6 +296,52 @@ class TestPromptManager:
         assert result1 == result2
         assert result1 == "This is a test prompt with test_value and another_value"
 
+    def test_managers_share_one_registry(self, temp_prompt_bank):
+        """Test that prompt banks are loaded once per path and shared across managers"""
+        pm1 = PromptManager(temp_prompt_bank)
+        pm2 = PromptManager(temp_prompt_bank, version_override={"test_prompt": "0.9.0"})
+
+        assert pm1.registry is pm2.registry
+        assert pm1.registry is get_prompt_registry(temp_prompt_bank)
+        assert pm2.render_prompt("test_prompt", {"variable1": "v"}) == (
+            "Old test prompt with v"
+        )
+        assert pm1.registry.reloads == 1
+
+    def test_compiled_prompt_matches_str_format(self):
+        """Test that pre-split rendering matches str.format for escapes, specs and conversions"""
+        content = "{{literal}} {name!r} {count:>4} {ratio:.2f} {name}{name}"
+        compiled = CompiledPrompt(
+            Prompt(created_at=0, content=content, variables=["name", "count", "ratio"])
+        )
+        variables = {"name": "ab", "count": 7, "ratio": 0.5}
+
+        assert compiled.segments is not None
+        assert compiled.fields == {"name", "count", "ratio"}
+        assert compiled.render(variables) == content.format(**variables)
+
+    def test_compiled_prompt_falls_back_for_attribute_fields(self):
+        """Test that templates with attribute fields are rendered with str.format"""
+        compiled = CompiledPrompt(
+            Prompt(created_at=0, content="{value.real}", variables=["value"])
+        )
+
+        assert compiled.segments is None
+        assert compiled.render({"value": 3}) == "3"
+
+    def test_hot_reload_picks_up_changed_prompt(self, temp_prompt_bank):
+        """Test that a hot-reloading registry swaps in edited prompt files"""
+        registry = PromptRegistry(Path(temp_prompt_bank), hot_reload=True)
+        prompt_path = Path(temp_prompt_bank) / "test_prompt" / "0.9.0.prompt"
+        prompt_path.write_text("Edited prompt with {variable1}!")
+
+        registry._next_check = 0.0
+        compiled = registry.get_compiled_prompt("test_prompt", "0.9.0")
+
+        assert compiled is not None
+        assert compiled.render({"variable1": "v"}) == "Edited prompt with v!"
+        assert registry.reloads == 2
+
     def test_all_metadata_files_schema_validation(self):
         """Test that all metadata.json files in prompt_bank conform to simplified schema"""
         # Get the path to the actual prompt_bank directory
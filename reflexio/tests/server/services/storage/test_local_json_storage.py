@@ -1,6 +1,10 @@
+import json
 import tempfile
 from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 from reflexio_commons.api_schema.retriever_schema import (
     SearchInteractionRequest,
     SearchUserProfileRequest,
@@ -9,20 +13,33 @@ from reflexio_commons.api_schema.service_schemas import (
     NEVER_EXPIRES_TIMESTAMP,
     DeleteUserInteractionRequest,
     DeleteUserProfileRequest,
+    Feedback,
     Interaction,
     ProfileChangeLog,
     ProfileTimeToLive,
+    RawFeedback,
     Request,
+    Skill,
     UserActionType,
     UserProfile,
 )
 
-from reflexio.server.services.storage.local_json_storage import LocalJsonStorage
+from reflexio.server.services.storage.local_json_storage import (
+    LocalJsonStorage,
+    clear_local_storage_cache,
+    get_local_storage_cache_stats,
+)
+from reflexio.server.services.storage.sqlite_storage import SqliteStorage
+from reflexio.server.services.storage.storage_base import BaseStorage
+
+# Storage contract tests run against every local engine
+STORAGE_ENGINES = [LocalJsonStorage, SqliteStorage]
 
 
-def test_get_user_profile():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_get_user_profile(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
         storage.add_user_profile(
             "test_user_id",
             [
@@ -46,9 +63,10 @@ def test_get_user_profile():
         assert profiles[0].source == "test_source"
 
 
-def test_get_all_profiles():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_get_all_profiles(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
 
         # Add profiles for two different users
         storage.add_user_profile(
@@ -91,9 +109,10 @@ def test_get_all_profiles():
         assert profiles[1].source == "test_source"
 
 
-def test_get_all_interactions():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_get_all_interactions(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
 
         # Add interactions for a user
         interaction1 = Interaction(
@@ -129,9 +148,10 @@ def test_get_all_interactions():
         assert interactions[1].content == "I like pizza"
 
 
-def test_get_rerun_user_ids_with_filters():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_get_rerun_user_ids_with_filters(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
         now = int(datetime.now(timezone.utc).timestamp())
 
         storage.add_request(
@@ -175,9 +195,10 @@ def test_get_rerun_user_ids_with_filters():
         assert result == ["user1"]
 
 
-def test_search_user_profile():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_search_user_profile(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
         timestamp = int(datetime.now(timezone.utc).timestamp())
 
         storage.add_user_profile(
@@ -215,9 +236,10 @@ def test_search_user_profile():
         assert profiles[0].generated_from_request_id == "request_id_1"
 
 
-def test_search_interaction():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_search_interaction(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
         timestamp = int(datetime.now(timezone.utc).timestamp())
 
         interaction = Interaction(
@@ -252,9 +274,10 @@ def test_search_interaction():
         assert interactions[0].request_id == "request1"
 
 
-def test_delete_user_profile():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_delete_user_profile(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
 
         profile = UserProfile(
             user_id="user1",
@@ -284,9 +307,10 @@ def test_delete_user_profile():
         assert len(profiles) == 0
 
 
-def test_delete_user_interaction():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_delete_user_interaction(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
 
         interaction = Interaction(
             interaction_id=1,
@@ -317,9 +341,10 @@ def test_delete_user_interaction():
         assert len(interactions) == 0
 
 
-def test_update_user_profile_by_id():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_update_user_profile_by_id(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
 
         original_profile = UserProfile(
             user_id="user1",
@@ -358,9 +383,10 @@ def test_update_user_profile_by_id():
         assert profiles[0].source == "test_source"
 
 
-def test_profile_change_log_operations():
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_profile_change_log_operations(storage_cls: type[BaseStorage]):
     with tempfile.TemporaryDirectory() as temp_dir:
-        storage = LocalJsonStorage(org_id="test_org", base_dir=temp_dir)
+        storage = storage_cls(org_id="test_org", base_dir=temp_dir)
         current_time = int(datetime.now(timezone.utc).timestamp())
 
         # Create a profile change log
@@ -409,6 +435,249 @@ def test_profile_change_log_operations():
         assert len(logs) == 0
 
 
+def test_model_cache_serves_repeated_reads():
+    clear_local_storage_cache()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = LocalJsonStorage(
+            org_id="0", base_dir=temp_dir, enable_model_cache=True
+        )
+        storage.add_user_profile(
+            "user1",
+            [
+                UserProfile(
+                    user_id="user1",
+                    profile_id="1",
+                    profile_content="I like sushi",
+                    last_modified_timestamp=int(datetime.now(timezone.utc).timestamp()),
+                    generated_from_request_id="request_id_1",
+                    custom_features={"cuisine": "japanese"},
+                )
+            ],
+        )
+
+        first = storage.get_user_profile("user1")
+        stats_after_first = get_local_storage_cache_stats()
+        second = storage.get_user_profile("user1")
+        stats_after_second = get_local_storage_cache_stats()
+
+        assert first == second
+        assert first[0] is not second[0]
+        assert (
+            stats_after_second["document_hits"]
+            == stats_after_first["document_hits"] + 1
+        )
+        assert stats_after_second["model_hits"] == stats_after_first["model_hits"] + 1
+        assert stats_after_second["model_misses"] == stats_after_first["model_misses"]
+
+        # Mutating a returned model must not leak into the cache
+        second[0].profile_content = "changed"
+        second[0].custom_features["cuisine"] = "changed"
+        third = storage.get_user_profile("user1")[0]
+        assert third.profile_content == "I like sushi"
+        assert third.custom_features == {"cuisine": "japanese"}
+
+
+def test_model_cache_invalidated_by_external_write():
+    clear_local_storage_cache()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = LocalJsonStorage(
+            org_id="0", base_dir=temp_dir, enable_model_cache=True
+        )
+        storage.add_user_interaction(
+            "user1",
+            Interaction(
+                interaction_id=0,
+                user_id="user1",
+                request_id="request_1",
+                content="hello",
+                created_at=int(datetime.now(timezone.utc).timestamp()),
+            ),
+        )
+        assert len(storage.get_user_interaction("user1")) == 1
+        generation = storage.cache_generation
+
+        # Another writer (e.g. a second process) rewrites the file
+        with Path(storage.file_path).open("w", encoding="utf-8") as file:
+            json.dump(
+                {"user1": {"profiles": [], "interactions": []}, "padding": 1}, file
+            )
+
+        assert storage.get_user_interaction("user1") == []
+        assert storage.cache_generation == generation + 1
+        assert get_local_storage_cache_stats()["invalidations"] == 1
+
+
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_last_k_interactions_grouped_uses_request_index(storage_cls: type[BaseStorage]):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
+        storage.add_request(Request(request_id="r1", user_id="user1", source="chat"))
+        storage.add_request(Request(request_id="r2", user_id="user1", source="api"))
+        for request_id in ["r1", "r2", "r1"]:
+            storage.add_user_interaction(
+                "user1",
+                Interaction(
+                    interaction_id=0,
+                    user_id="user1",
+                    request_id=request_id,
+                    content=f"from {request_id}",
+                    created_at=int(datetime.now(timezone.utc).timestamp()),
+                ),
+            )
+
+        with patch.object(storage, "get_request") as mock_get_request:
+            sessions, flat = storage.get_last_k_interactions_grouped(
+                "user1", k=10, sources=["chat"]
+            )
+        mock_get_request.assert_not_called()
+        assert [i.interaction_id for i in flat] == [3, 1]
+        assert len(sessions) == 1
+        assert sessions[0].request.source == "chat"
+        assert [i.interaction_id for i in sessions[0].interactions] == [1, 3]
+
+
+@pytest.mark.parametrize("storage_cls", STORAGE_ENGINES)
+def test_operation_state_with_new_request_interaction_skips_processed(
+    storage_cls: type[BaseStorage],
+):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = storage_cls(org_id="0", base_dir=temp_dir)
+        storage.add_request(Request(request_id="r1", user_id="user1", source="chat"))
+        for content in ["hello", "again"]:
+            storage.add_user_interaction(
+                "user1",
+                Interaction(
+                    interaction_id=0,
+                    user_id="user1",
+                    request_id="r1",
+                    content=content,
+                    created_at=int(datetime.now(timezone.utc).timestamp()),
+                ),
+            )
+        storage.upsert_operation_state("svc", {"last_processed_interaction_ids": [1]})
+
+        state, sessions = storage.get_operation_state_with_new_request_interaction(
+            "svc", "user1", sources=["chat"]
+        )
+        assert state == {"last_processed_interaction_ids": [1]}
+        assert [i.interaction_id for s in sessions for i in s.interactions] == [2]
+        assert sessions[0].request.source == "chat"
+
+
+def _unit_embedding(axis: int) -> list[float]:
+    vector = [0.0] * 512
+    vector[axis] = 1.0
+    return vector
+
+
+def test_search_feedbacks_fuses_keyword_and_vector_matches():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        storage.save_feedbacks(
+            [
+                Feedback(
+                    agent_version="v1",
+                    feedback_name="fb",
+                    feedback_content="Keep answers concise",
+                    embedding=_unit_embedding(0),
+                ),
+                Feedback(
+                    agent_version="v1",
+                    feedback_name="fb",
+                    feedback_content="Be brief and to the point",
+                    embedding=_unit_embedding(1),
+                ),
+                Feedback(
+                    agent_version="v1",
+                    feedback_name="fb",
+                    feedback_content="Use a friendly tone",
+                    embedding=_unit_embedding(2),
+                ),
+            ]
+        )
+
+        # Keyword-only search keeps substring semantics
+        results = storage.search_feedbacks(query="concise")
+        assert [f.feedback_id for f in results] == [1]
+
+        # Vector match on #2 plus keyword match on #1; #3 matches neither
+        results = storage.search_feedbacks(
+            query="concise", query_embedding=_unit_embedding(1)
+        )
+        assert sorted(f.feedback_id for f in results) == [1, 2]
+
+        # Index is persisted next to the JSON file and reloaded by a fresh process
+        clear_local_storage_cache()
+        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        results = storage.search_feedbacks(query_embedding=_unit_embedding(2))
+        assert [f.feedback_id for f in results] == [3]
+        assert (Path(temp_dir) / "vector_index_0" / "feedbacks.npz").exists()
+
+
+def test_vector_index_tracks_profile_and_skill_writes():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        profile = UserProfile(
+            user_id="user1",
+            profile_id="p1",
+            profile_content="I like sushi",
+            last_modified_timestamp=int(datetime.now(timezone.utc).timestamp()),
+            generated_from_request_id="request_id_1",
+            embedding=_unit_embedding(0),
+        )
+        storage.add_user_profile("user1", [profile])
+        request = SearchUserProfileRequest(user_id="user1")
+        assert storage.search_user_profile(request, query_embedding=_unit_embedding(0))
+        storage.update_user_profile_by_id(
+            "user1",
+            "p1",
+            profile.model_copy(update={"embedding": _unit_embedding(1)}),
+        )
+        assert not storage.search_user_profile(
+            request, query_embedding=_unit_embedding(0)
+        )
+
+        # Skill embeddings are not written to JSON, so only the index can find them
+        storage.save_skills(
+            [
+                Skill(
+                    skill_name="brevity",
+                    instructions="Answer in one sentence",
+                    embedding=_unit_embedding(3),
+                )
+            ]
+        )
+        assert [
+            s.skill_id
+            for s in storage.search_skills(query_embedding=_unit_embedding(3))
+        ] == [1]
+
+        # Raw feedback ids are reused after deletes; stale vectors must not match
+        storage.save_raw_feedbacks(
+            [
+                RawFeedback(
+                    agent_version="v1",
+                    request_id="r1",
+                    feedback_name="fb",
+                    feedback_content="old",
+                    embedding=_unit_embedding(4),
+                )
+            ]
+        )
+        storage.delete_raw_feedback(1)
+        storage.save_raw_feedbacks(
+            [
+                RawFeedback(
+                    agent_version="v1",
+                    request_id="r1",
+                    feedback_name="fb",
+                    feedback_content="new",
+                )
+            ]
+        )
+        assert storage.search_raw_feedbacks(query_embedding=_unit_embedding(4)) == []
+
+
 if __name__ == "__main__":
     test_get_user_profile()
     test_profile_change_log_operations()
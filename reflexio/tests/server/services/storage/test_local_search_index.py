@@ -0,0 +1,109 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from reflexio.server.services.storage.local_search_index import (
+    LocalVectorIndex,
+    bm25_rank,
+    reciprocal_rank_fusion,
+)
+
+
+def test_bm25_rank_prefers_rarer_and_denser_terms():
+    documents = {
+        "a": "be concise and keep answers short",
+        "b": "keep the tone friendly",
+        "c": "concise concise concise",
+    }
+    ranked = [doc_id for doc_id, _ in bm25_rank("concise answers", documents)]
+    assert ranked[:2] == ["a", "c"]
+    assert "b" not in ranked
+    assert bm25_rank("", documents) == []
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d"]], k=60)
+    assert [doc_id for doc_id, _ in fused][:1] == ["b"]
+    assert dict(fused)["a"] == 1 / 61
+
+
+def test_vector_index_search_and_persistence():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(200, 16)).astype(np.float32)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = str(Path(temp_dir) / "index.npz")
+        index = LocalVectorIndex(path)
+        index.upsert({str(i): vector.tolist() for i, vector in enumerate(vectors)})
+
+        results = index.search(vectors[7].tolist(), top_k=3)
+        assert results[0][0] == "7"
+        assert abs(results[0][1] - 1.0) < 1e-5
+        assert index.search(vectors[7].tolist(), 3, candidate_ids=["8", "9"])[0][0] in {
+            "8",
+            "9",
+        }
+
+        index.remove(["7"])
+        reloaded = LocalVectorIndex(path)
+        assert len(reloaded) == 199
+        assert reloaded.search(vectors[7].tolist(), top_k=1)[0][0] != "7"
+        # Mismatched dimensions are ignored rather than raising
+        assert reloaded.search([1.0, 0.0], top_k=1) == []
+
+
+def test_vector_index_appends_small_writes_to_change_log():
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(100, 8)).astype(np.float32)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "index.npz"
+        log_path = Path(f"{path}.log")
+        writer = LocalVectorIndex(str(path))
+        writer.upsert({str(i): vector.tolist() for i, vector in enumerate(vectors)})
+        reader = LocalVectorIndex(str(path))
+        snapshot_mtime = path.stat().st_mtime_ns
+
+        # Small writes leave the snapshot alone and go to the change log
+        writer.upsert({"new": vectors[0].tolist()})
+        writer.remove(["5"])
+        assert path.stat().st_mtime_ns == snapshot_mtime
+        assert log_path.exists()
+
+        # Other instances apply the log on their next access, and a fresh load replays it
+        assert len(reader) == 100
+        assert reader.search(vectors[5].tolist(), top_k=1)[0][0] != "5"
+        assert len(reader) == 100
+        assert "new" in {doc_id for doc_id, _ in reader.search(vectors[0].tolist(), 2)}
+        assert len(LocalVectorIndex(str(path))) == 100
+
+        writer.flush()
+        assert not log_path.exists()
+        assert path.stat().st_mtime_ns != snapshot_mtime
+        reloaded = LocalVectorIndex(str(path))
+        assert len(reloaded) == 100
+        assert reloaded.search(vectors[5].tolist(), top_k=1)[0][0] != "5"
+
+
+def test_vector_index_approximate_search_finds_exact_neighbours():
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(3000, 32)).astype(np.float32)
+    index = LocalVectorIndex(ann_threshold=1000)
+    index.upsert({str(i): vector.tolist() for i, vector in enumerate(vectors)})
+
+    hits = sum(
+        index.search(vectors[i].tolist(), top_k=1)[0][0] == str(i)
+        for i in range(0, 3000, 100)
+    )
+    assert hits == 30
+
+
+def test_vector_index_threshold_filtering_does_not_trigger_exact_scan():
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(3000, 32)).astype(np.float32)
+    index = LocalVectorIndex(ann_threshold=1000)
+    index.upsert({str(i): vector.tolist() for i, vector in enumerate(vectors)})
+
+    with patch.object(index, "_exact_search", side_effect=AssertionError("exact scan")):
+        results = index.search(vectors[7].tolist(), top_k=10, min_similarity=0.9)
+    assert [doc_id for doc_id, _ in results] == ["7"]
@@ -0,0 +1,310 @@
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from reflexio_commons.api_schema.retriever_schema import (
+    SearchInteractionRequest,
+    SearchUserProfileRequest,
+)
+from reflexio_commons.api_schema.service_schemas import (
+    DeleteUserInteractionRequest,
+    Feedback,
+    FeedbackStatus,
+    Interaction,
+    ProfileChangeLog,
+    ProfileTimeToLive,
+    RawFeedback,
+    Request,
+    Status,
+    UserActionType,
+    UserProfile,
+)
+from reflexio_commons.config_schema import (
+    EMBEDDING_DIMENSIONS,
+    LocalStorageEngine,
+    StorageConfigLocal,
+)
+
+from reflexio.server.services.storage.local_json_storage import LocalJsonStorage
+from reflexio.server.services.storage.sqlite_storage import SqliteStorage
+
+
+def _profile(user_id: str, profile_id: str, content: str) -> UserProfile:
+    return UserProfile(
+        user_id=user_id,
+        profile_id=profile_id,
+        profile_content=content,
+        last_modified_timestamp=int(datetime.now(timezone.utc).timestamp()),
+        generated_from_request_id=f"request_{profile_id}",
+        profile_time_to_live=ProfileTimeToLive.INFINITY,
+        source="test_source",
+    )
+
+
+def _interaction(user_id: str, request_id: str, content: str) -> Interaction:
+    return Interaction(
+        interaction_id=0,
+        user_id=user_id,
+        request_id=request_id,
+        content=content,
+        user_action=UserActionType.NONE,
+        user_action_description="",
+        interacted_image_url="",
+        created_at=int(datetime.now(timezone.utc).timestamp()),
+    )
+
+
+def test_profile_crud():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SqliteStorage(org_id="0", base_dir=temp_dir)
+        storage.add_user_profile("user1", [_profile("user1", "1", "I like sushi")])
+        storage.add_user_profile("user2", [_profile("user2", "2", "I like pizza")])
+
+        profiles = storage.get_user_profile("user1")
+        assert len(profiles) == 1
+        assert profiles[0].profile_content == "I like sushi"
+        assert profiles[0].profile_time_to_live == ProfileTimeToLive.INFINITY
+        assert len(storage.get_all_profiles()) == 2
+
+        updated = _profile("user1", "1", "I like ramen")
+        storage.update_user_profile_by_id("user1", "1", updated)
+        assert storage.get_user_profile("user1")[0].profile_content == "I like ramen"
+
+        assert storage.update_all_profiles_status(None, Status.ARCHIVED, ["user1"]) == 1
+        assert storage.get_user_profile("user1") == []
+        assert storage.get_user_ids_with_status(Status.ARCHIVED) == ["user1"]
+        stats = storage.get_profile_statistics()
+        assert stats["current_count"] == 1
+        assert stats["archived_count"] == 1
+
+        assert storage.delete_all_profiles_by_status(Status.ARCHIVED) == 1
+        assert storage.get_user_profile("user1", status_filter=[Status.ARCHIVED]) == []
+
+
+def test_interactions_and_requests():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SqliteStorage(org_id="0", base_dir=temp_dir)
+        storage.add_request(
+            Request(request_id="r1", user_id="user1", source="chat", session_id="s1")
+        )
+        storage.add_request(
+            Request(request_id="r2", user_id="user1", source="email", session_id="s1")
+        )
+        storage.add_user_interactions_bulk(
+            "user1",
+            [
+                _interaction("user1", "r1", "I like sushi"),
+                _interaction("user1", "r1", "and ramen"),
+                _interaction("user1", "r2", "I like pizza"),
+            ],
+        )
+
+        interactions = storage.get_user_interaction("user1")
+        assert [i.interaction_id for i in interactions] == [1, 2, 3]
+        assert storage.count_all_interactions() == 3
+
+        results = storage.search_interaction(
+            SearchInteractionRequest(user_id="user1", query="sushi")
+        )
+        assert [i.content for i in results] == ["I like sushi"]
+
+        sessions, flat = storage.get_last_k_interactions_grouped(
+            "user1", k=10, sources=["chat"]
+        )
+        assert [i.interaction_id for i in flat] == [2, 1]
+        assert len(sessions) == 1
+        assert sessions[0].request.request_id == "r1"
+
+        grouped = storage.get_sessions(user_id="user1")
+        assert len(grouped["s1"]) == 2
+        assert sum(len(g.interactions) for g in grouped["s1"]) == 3
+
+        storage.delete_user_interaction(
+            DeleteUserInteractionRequest(user_id="user1", interaction_id=3)
+        )
+        assert storage.count_all_interactions() == 2
+        assert storage.delete_session("s1") == 2
+        assert storage.count_all_interactions() == 0
+
+
+def test_add_requests_bulk_multiple_users():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SqliteStorage(org_id="0", base_dir=temp_dir)
+        storage.add_requests_bulk(
+            [
+                Request(request_id="r1", user_id="user1", source="chat"),
+                Request(request_id="r2", user_id="user2", source="chat"),
+            ],
+            [
+                _interaction("user1", "r1", "I like sushi"),
+                _interaction("user2", "r2", "I like pizza"),
+                _interaction("user1", "r1", "and ramen"),
+            ],
+        )
+
+        assert storage.get_request("r2").user_id == "user2"
+        assert [i.content for i in storage.get_user_interaction("user1")] == [
+            "I like sushi",
+            "and ramen",
+        ]
+        assert [i.interaction_id for i in storage.get_user_interaction("user2")] == [3]
+        assert storage.count_all_interactions() == 3
+
+
+def test_feedback_operations():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SqliteStorage(org_id="0", base_dir=temp_dir)
+        storage.add_request(Request(request_id="r1", user_id="user1"))
+        storage.save_raw_feedbacks(
+            [
+                RawFeedback(
+                    agent_version="v1",
+                    request_id="r1",
+                    feedback_name="fb",
+                    feedback_content="Be more concise",
+                )
+                for _ in range(3)
+            ]
+        )
+        assert storage.count_raw_feedbacks(feedback_name="fb") == 3
+        assert storage.count_raw_feedbacks(min_raw_feedback_id=1) == 2
+        assert len(storage.search_raw_feedbacks(query="concise", user_id="user1")) == 3
+        assert storage.delete_raw_feedbacks_by_ids([1, 2]) == 2
+        assert storage.count_raw_feedbacks() == 1
+
+        saved = storage.save_feedbacks(
+            [
+                Feedback(
+                    agent_version="v1",
+                    feedback_name="fb",
+                    feedback_content="Be concise",
+                    feedback_status=FeedbackStatus.PENDING,
+                ),
+                Feedback(
+                    agent_version="v1",
+                    feedback_name="fb",
+                    feedback_content="Be polite",
+                    feedback_status=FeedbackStatus.APPROVED,
+                ),
+            ]
+        )
+        assert [f.feedback_id for f in saved] == [1, 2]
+
+        storage.archive_feedbacks_by_feedback_name("fb")
+        assert [f.feedback_id for f in storage.get_feedbacks()] == [2]
+        storage.restore_archived_feedbacks_by_ids([1])
+        assert len(storage.get_feedbacks()) == 2
+
+
+def test_get_raw_feedbacks_with_embeddings_streams_all_pages():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SqliteStorage(org_id="0", base_dir=temp_dir)
+        storage.save_raw_feedbacks(
+            [
+                RawFeedback(
+                    agent_version="v1",
+                    request_id=f"r{i}",
+                    feedback_name="fb",
+                    feedback_content=f"feedback {i}",
+                    embedding=[float(i)] * EMBEDDING_DIMENSIONS if i else [],
+                )
+                for i in range(5)
+            ]
+        )
+
+        pages = list(storage.iter_raw_feedback_pages(feedback_name="fb", page_size=2))
+        raw_feedbacks, embeddings = storage.get_raw_feedbacks_with_embeddings(
+            feedback_name="fb", page_size=2
+        )
+
+        assert [len(page) for page, _ in pages] == [2, 2, 1]
+        assert len(raw_feedbacks) == 5
+        assert all(fb.embedding == [] for fb in raw_feedbacks)
+        assert embeddings.shape == (5, EMBEDDING_DIMENSIONS)
+        for fb, vector in zip(raw_feedbacks, embeddings, strict=True):
+            assert (vector == int(fb.request_id[1:])).all()
+
+
+def test_operation_state_and_lock():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SqliteStorage(org_id="0", base_dir=temp_dir)
+        storage.add_user_interaction("user1", _interaction("user1", "r1", "hello"))
+        storage.add_user_interaction("user1", _interaction("user1", "r1", "again"))
+        storage.upsert_operation_state("svc", {"last_processed_interaction_ids": [1]})
+
+        state, sessions = storage.get_operation_state_with_new_request_interaction(
+            "svc", "user1"
+        )
+        assert state == {"last_processed_interaction_ids": [1]}
+        assert [i.interaction_id for s in sessions for i in s.interactions] == [2]
+
+        first = storage.try_acquire_in_progress_lock("lock", "req1")
+        second = storage.try_acquire_in_progress_lock("lock", "req2")
+        assert first["acquired"] is True
+        assert second["acquired"] is False
+        assert second["state"]["pending_request_id"] == "req2"
+
+
+def test_profile_change_log_and_search():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = SqliteStorage(org_id="0", base_dir=temp_dir)
+        profile = _profile("user1", "1", "I like sushi")
+        storage.add_user_profile("user1", [profile])
+        storage.add_profile_change_log(
+            ProfileChangeLog(
+                id=1,
+                user_id="user1",
+                request_id="request_1",
+                created_at=int(datetime.now(timezone.utc).timestamp()),
+                added_profiles=[profile],
+                removed_profiles=[],
+                mentioned_profiles=[],
+            )
+        )
+        assert len(storage.get_profile_change_logs()) == 1
+        storage.delete_profile_change_log_for_user("user1")
+        assert storage.get_profile_change_logs() == []
+
+        results = storage.search_user_profile(
+            SearchUserProfileRequest(user_id="user1", query="sushi")
+        )
+        assert len(results) == 1
+
+
+def test_data_persists_across_instances():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        SqliteStorage(org_id="0", base_dir=temp_dir).add_user_profile(
+            "user1", [_profile("user1", "1", "I like sushi")]
+        )
+        storage = SqliteStorage(org_id="0", base_dir=temp_dir)
+        assert len(storage.get_user_profile("user1")) == 1
+
+
+def test_migrate_imports_legacy_json():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        legacy = LocalJsonStorage(org_id="0", base_dir=temp_dir)
+        legacy.add_request(Request(request_id="r1", user_id="user1", source="chat"))
+        legacy.add_user_profile("user1", [_profile("user1", "1", "I like sushi")])
+        legacy.add_user_interaction("user1", _interaction("user1", "r1", "hello"))
+        legacy.save_feedbacks(
+            [Feedback(agent_version="v1", feedback_name="fb", feedback_content="x")]
+        )
+        legacy.upsert_operation_state("svc", {"cursor": 5})
+
+        storage = SqliteStorage(
+            org_id="0",
+            config=StorageConfigLocal(
+                dir_path=temp_dir, engine=LocalStorageEngine.SQLITE
+            ),
+        )
+        assert storage.check_migration_needed() is True
+        assert storage.migrate() is True
+        assert storage.check_migration_needed() is False
+
+        assert storage.get_user_profile("user1")[0].profile_content == "I like sushi"
+        assert storage.get_user_interaction("user1")[0].interaction_id == 1
+        assert storage.get_request("r1").source == "chat"
+        assert storage.get_feedbacks()[0].feedback_id == 1
+        assert storage.get_operation_state("svc")["operation_state"] == {"cursor": 5}
+        # Legacy file is left untouched
+        assert Path(legacy.file_path).exists()
@@ -0,0 +1,63 @@
+"""Unit tests for the process-wide Supabase client pool."""
+
+import asyncio
+
+import pytest
+
+from reflexio.server.services.storage.supabase_client_pool import SupabaseClientPool
+
+_URL = "https://project-a.supabase.co"
+_KEY = "service-role-key-a"
+
+
+@pytest.fixture
+def pool():
+    pool = SupabaseClientPool()
+    yield pool
+    pool.clear()
+
+
+def test_reuses_client_per_url_and_key(pool):
+    client = pool.get(_URL, _KEY)
+
+    assert pool.get(_URL, _KEY) is client
+    assert pool.get(_URL, "service-role-key-b") is not client
+    assert pool.stats()["clients"] == 2
+    assert (pool.stats()["hits"], pool.stats()["misses"]) == (1, 2)
+
+
+def test_clients_share_one_http2_connection_pool(pool):
+    first = pool.get(_URL, _KEY)
+    second = pool.get("https://project-b.supabase.co", _KEY)
+
+    session = first.postgrest.session
+    assert second.postgrest.session is session
+    assert session._transport._pool._http2
+
+
+def test_async_clients_are_pooled_per_event_loop(pool):
+    async def get_twice():
+        first = await pool.aget(_URL, _KEY)
+        assert await pool.aget(_URL, _KEY) is first
+        return first
+
+    loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        client_a = loop_a.run_until_complete(get_twice())
+        client_b = loop_b.run_until_complete(get_twice())
+    finally:
+        loop_a.close()
+        loop_b.close()
+
+    assert client_a is not client_b
+    assert client_a.postgrest.session is not client_b.postgrest.session
+    stats = pool.stats()
+    assert (stats["async_hits"], stats["async_misses"]) == (2, 2)
+
+
+def test_clear_drops_clients(pool):
+    client = pool.get(_URL, _KEY)
+    pool.clear()
+
+    assert pool.get(_URL, _KEY) is not client
+    assert pool.stats()["clients"] == 1
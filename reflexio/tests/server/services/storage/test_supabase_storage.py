@@ -1,8 +1,11 @@
 """Tests for SupabaseStorage implementation."""
 
+import base64
+import struct
 from datetime import datetime, timezone
 from unittest.mock import Mock, call, patch
 
+import numpy as np
 import pytest
 from reflexio_commons.api_schema.retriever_schema import (
     Interaction,
@@ -13,6 +16,7 @@ from reflexio_commons.api_schema.service_schemas import (
     NEVER_EXPIRES_TIMESTAMP,
     DeleteUserInteractionRequest,
     DeleteUserProfileRequest,
+    Feedback,
     FeedbackStatus,
     ProfileChangeLog,
     ProfileTimeToLive,
@@ -27,10 +31,10 @@ from reflexio_commons.config_schema import StorageConfigSupabase
 @pytest.fixture
 def mock_supabase_client():
     with patch(
-        "reflexio.server.services.storage.supabase_storage.create_client"
-    ) as mock_create_client:
+        "reflexio.server.services.storage.supabase_storage.get_supabase_client"
+    ) as mock_get_client:
         mock_client = Mock()
-        mock_create_client.return_value = mock_client
+        mock_get_client.return_value = mock_client
         yield mock_client
 
 
@@ -1238,3 +1242,168 @@ def test_get_rerun_user_ids_paginates(supabase_storage, mock_supabase_client):
 
     assert result == ["user1", "user2"]
     assert query.offset.call_args_list == [call(0), call(1000)]
+
+
+def test_save_raw_feedbacks_batches_embeddings_and_writes(
+    supabase_storage, mock_supabase_client, mock_openai
+):
+    """Test save_raw_feedbacks embeds in chunked calls and upserts in one request."""
+    mock_openai.get_embeddings.side_effect = lambda texts, *_: [
+        [0.1] * 512 for _ in texts
+    ]
+    raw_feedbacks = [
+        RawFeedback(
+            feedback_name="fb",
+            request_id="request_id_1",
+            agent_version="v1",
+            feedback_content=f"feedback {i}",
+        )
+        for i in range(150)
+    ]
+
+    supabase_storage.save_raw_feedbacks(raw_feedbacks)
+
+    assert mock_openai.get_embeddings.call_count == 2  # 100 + 50
+    mock_openai.get_embedding.assert_not_called()
+    upsert = mock_supabase_client.table.return_value.upsert
+    upsert.assert_called_once()
+    assert len(upsert.call_args[0][0]) == 150
+    assert all(rf.embedding for rf in raw_feedbacks)
+
+    metrics = supabase_storage.get_save_metrics()["raw_feedbacks"]
+    assert metrics["saves"] == 1
+    assert metrics["rows"] == 150
+    assert metrics["embedding_calls"] == 2
+
+
+def test_save_feedbacks_assigns_ids_from_bulk_upsert(
+    supabase_storage, mock_supabase_client, mock_openai
+):
+    """Test save_feedbacks maps returned rows back onto the saved feedbacks in order."""
+    mock_openai.get_embeddings.side_effect = lambda texts, *_: [
+        [0.1] * 512 for _ in texts
+    ]
+    response = Mock()
+    response.data = [{"feedback_id": 7}, {"feedback_id": 8}]
+    mock_supabase_client.table.return_value.upsert.return_value.execute.return_value = (
+        response
+    )
+    feedbacks = [
+        Feedback(feedback_name="fb", agent_version="v1", feedback_content="first"),
+        Feedback(feedback_name="fb", agent_version="v1", feedback_content="second"),
+    ]
+
+    saved = supabase_storage.save_feedbacks(feedbacks)
+
+    assert [f.feedback_id for f in saved] == [7, 8]
+    mock_openai.get_embeddings.assert_called_once()
+    mock_supabase_client.table.return_value.upsert.assert_called_once()
+
+
+def test_add_user_profile_reuses_precomputed_embeddings(
+    supabase_storage, user_profile_data, mock_supabase_client, mock_openai
+):
+    """Test add_user_profile only embeds profiles that do not already carry an embedding."""
+    mock_openai.get_embeddings.side_effect = lambda texts, *_: [
+        [0.2] * 512 for _ in texts
+    ]
+    precomputed = user_profile_data["profile"].model_copy(
+        update={"embedding": [0.5] * 512}
+    )
+    fresh = user_profile_data["expired_profile"]
+
+    supabase_storage.add_user_profile("1@123", [precomputed, fresh])
+
+    mock_openai.get_embeddings.assert_called_once()
+    assert mock_openai.get_embeddings.call_args[0][0] == [
+        f"{fresh.profile_content}\n{fresh.custom_features}"
+    ]
+    assert precomputed.embedding == [0.5] * 512
+    assert fresh.embedding == [0.2] * 512
+    metrics = supabase_storage.get_save_metrics()["profiles"]
+    assert metrics["reused_embeddings"] == 1
+    assert metrics["embedding_calls"] == 1
+
+
+def _raw_feedback_rows(ids, embedding_column, encode):
+    return [
+        {
+            "raw_feedback_id": raw_feedback_id,
+            "feedback_name": "test_raw_feedback",
+            "request_id": f"request_{raw_feedback_id}",
+            "agent_version": "v1",
+            "feedback_content": f"feedback {raw_feedback_id}",
+            "created_at": "2026-03-01T00:00:00+00:00",
+            embedding_column: encode([float(raw_feedback_id)] * 512),
+        }
+        for raw_feedback_id in ids
+    ]
+
+
+def _pgvector_b64(vector):
+    payload = struct.pack(">HH", len(vector), 0) + struct.pack(
+        f">{len(vector)}f", *vector
+    )
+    return base64.encodebytes(payload).decode("ascii")
+
+
+def _keyset_query(mock_supabase_client, pages):
+    query = Mock()
+    for method in ("select", "order", "limit", "eq", "lt"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = pages
+    mock_supabase_client.table.return_value = query
+    return query
+
+
+def test_iter_raw_feedback_pages_keyset_paginates_binary_embeddings(
+    supabase_storage, mock_supabase_client
+):
+    """Test raw feedback pages are fetched by raw_feedback_id keyset and decoded to float32."""
+    query = _keyset_query(
+        mock_supabase_client,
+        [
+            Mock(data=_raw_feedback_rows([5, 4], "embedding_b64", _pgvector_b64)),
+            Mock(data=_raw_feedback_rows([2], "embedding_b64", _pgvector_b64)),
+        ],
+    )
+
+    pages = list(
+        supabase_storage.iter_raw_feedback_pages(
+            feedback_name="test_raw_feedback", page_size=2
+        )
+    )
+
+    assert [[fb.raw_feedback_id for fb in page] for page, _ in pages] == [[5, 4], [2]]
+    assert all(fb.embedding == [] for page, _ in pages for fb in page)
+    matrix = pages[0][1]
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (2, 512)
+    assert (matrix[1] == 4.0).all()
+    assert query.select.call_args[0][0].endswith("embedding_b64")
+    assert query.order.call_args == call("raw_feedback_id", desc=True)
+    assert query.lt.call_args_list == [call("raw_feedback_id", 4)]
+
+
+def test_get_raw_feedbacks_with_embeddings_falls_back_to_text(
+    supabase_storage, mock_supabase_client
+):
+    """Test pgvector text is parsed when the embedding_b64 column is not migrated yet."""
+    rows = _raw_feedback_rows([3, 1], "embedding", str)
+    rows.append({**rows[-1], "raw_feedback_id": 0, "embedding": None})
+    query = _keyset_query(
+        mock_supabase_client,
+        [
+            Exception("column raw_feedbacks.embedding_b64 does not exist"),
+            Mock(data=rows),
+        ],
+    )
+
+    raw_feedbacks, embeddings = supabase_storage.get_raw_feedbacks_with_embeddings()
+
+    assert [fb.raw_feedback_id for fb in raw_feedbacks] == [3, 1, 0]
+    assert embeddings.shape == (3, 512)
+    assert (embeddings[0] == 3.0).all()
+    assert not embeddings[2].any()
+    assert query.select.call_args[0][0].endswith(", embedding")
+    assert supabase_storage._binary_embeddings is False
@@ -5,6 +5,7 @@ Tests the abstract base class by creating a concrete implementation for testing.
 """
 
 import tempfile
+import threading
 import time
 from dataclasses import dataclass, field
 from unittest.mock import MagicMock
@@ -22,6 +23,7 @@ from reflexio.server.services.base_generation_service import (
     ExtractorExecutionError,
     StatusChangeOperation,
 )
+from reflexio.server.services.executor_registry import ExecutorSaturatedError
 
 # ===============================
 # Test Data Classes
@@ -37,6 +39,7 @@ class MockExtractorConfig:
     manual_trigger: bool = False
     extraction_window_size_override: int | None = None
     extraction_window_stride_override: int | None = None
+    depends_on_previous_extractors: bool = False
 
 
 @dataclass
@@ -1917,5 +1920,121 @@ class TestSequentialExecution:
         assert service._last_extractor_run_stats["timed_out"] == 1
 
 
+class TestParallelExecution:
+    """Tests for the opt-in parallel extractor execution in _run_generation."""
+
+    @pytest.fixture(autouse=True)
+    def parallel_mode(self, monkeypatch):
+        monkeypatch.setattr(
+            "reflexio.server.services.base_generation_service.PARALLEL_EXTRACTION",
+            True,
+        )
+
+    def test_independent_extractors_run_concurrently(self, llm_client, request_context):
+        """Both extractors must be running at once to pass the barrier."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BarrierExtractor:
+            def __init__(self, name):
+                self.name = name
+
+            def run(self):
+                barrier.wait()
+                return {"name": self.name}
+
+        class ParallelService(ConcreteGenerationService):
+            def _create_extractor(self, extractor_config, service_config):
+                return BarrierExtractor(extractor_config.extractor_name)
+
+        service = ParallelService(
+            llm_client,
+            request_context,
+            extractor_configs=[
+                MockExtractorConfig(extractor_name="ext1"),
+                MockExtractorConfig(extractor_name="ext2"),
+            ],
+        )
+        service.run(MockServiceConfig())
+
+        assert service._processed_results == [{"name": "ext1"}, {"name": "ext2"}]
+        stats = service._last_extractor_run_stats
+        assert stats["parallel"] is True
+        assert stats["failed"] == 0
+        assert [entry["name"] for entry in stats["extractors"]] == ["ext1", "ext2"]
+        assert all(entry["status"] == "ok" for entry in stats["extractors"])
+        assert all(entry["seconds"] >= 0 for entry in stats["extractors"])
+
+    def test_dependent_extractor_is_chained_after_independent_ones(
+        self, llm_client, request_context
+    ):
+        """Only the extractor declaring a dependency sees previous results."""
+        observed_previously = {}
+
+        class RecordingExtractor:
+            def __init__(self, name, service_config):
+                self.name = name
+                self.previously = list(service_config.previously_extracted)
+
+            def run(self):
+                observed_previously[self.name] = self.previously
+                return {"name": self.name}
+
+        class ParallelService(ConcreteGenerationService):
+            def _create_extractor(self, extractor_config, service_config):
+                return RecordingExtractor(
+                    extractor_config.extractor_name, service_config
+                )
+
+        service = ParallelService(
+            llm_client,
+            request_context,
+            extractor_configs=[
+                MockExtractorConfig(
+                    extractor_name="summary", depends_on_previous_extractors=True
+                ),
+                MockExtractorConfig(extractor_name="ext1"),
+                MockExtractorConfig(extractor_name="ext2"),
+            ],
+        )
+        service.run(MockServiceConfig())
+
+        assert observed_previously["ext1"] == []
+        assert observed_previously["ext2"] == []
+        assert observed_previously["summary"] == [{"name": "ext1"}, {"name": "ext2"}]
+        assert [
+            entry["name"] for entry in service._last_extractor_run_stats["extractors"]
+        ] == [
+            "ext1",
+            "ext2",
+            "summary",
+        ]
+
+    def test_saturated_executor_runs_extractors_inline(
+        self, llm_client, request_context, monkeypatch
+    ):
+        """A full "llm" executor must not drop extractions."""
+
+        class SaturatedExecutor:
+            def submit(self, fn, *args, **kwargs):
+                raise ExecutorSaturatedError("executor 'llm' is saturated")
+
+        monkeypatch.setattr(
+            "reflexio.server.services.base_generation_service.get_executor",
+            lambda _name: SaturatedExecutor(),
+        )
+        service = ConcreteGenerationService(
+            llm_client,
+            request_context,
+            extractor_configs=[
+                MockExtractorConfig(extractor_name="ext1"),
+                MockExtractorConfig(extractor_name="ext2"),
+            ],
+        )
+        service.run(MockServiceConfig())
+
+        assert len(service._processed_results) == 2
+        assert service._last_extractor_run_stats["failed"] == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""Unit tests for the shared bounded executors."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from reflexio.server.services.executor_registry import (
+    BoundedExecutor,
+    ExecutorSaturatedError,
+    get_executor,
+    get_executor_stats,
+    is_cancelled,
+    run_in_executor_async,
+    shutdown_executors,
+)
+
+
+@pytest.fixture
+def executor():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    yield executor
+    executor.shutdown()
+
+
+def test_submit_sheds_load_past_the_cap(executor):
+    release = threading.Event()
+    running = executor.submit(release.wait, 5)
+    queued = executor.submit(lambda: "queued")
+
+    with pytest.raises(ExecutorSaturatedError):
+        executor.submit(lambda: "rejected")
+
+    stats = executor.stats()
+    assert stats["rejected"] == 1
+    assert stats["queued"] + stats["active"] == 2
+
+    release.set()
+    assert running.result(timeout=5) is True
+    assert queued.result(timeout=5) == "queued"
+    assert executor.stats()["completed"] == 2
+
+
+def test_cancel_drops_queued_and_flags_running_tasks(executor):
+    started = threading.Event()
+    observed = threading.Event()
+
+    def cooperative():
+        started.set()
+        while not is_cancelled():
+            time.sleep(0.01)
+        observed.set()
+
+    running = executor.submit(cooperative)
+    queued = executor.submit(lambda: "never")
+    assert started.wait(5)
+
+    assert executor.cancel(queued)
+    assert queued.cancelled()
+    assert executor.cancel(running)
+    assert observed.wait(5)
+    running.result(timeout=5)
+
+    stats = executor.stats()
+    assert stats["cancelled"] == 2
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+
+
+def test_registry_reuses_named_pools():
+    try:
+        assert get_executor("search") is get_executor("search")
+        assert get_executor("search").max_workers == 16
+        assert "search" in get_executor_stats()
+    finally:
+        shutdown_executors()
+    assert get_executor_stats() == {}
+
+
+def test_run_in_executor_async_awaits_pool_tasks():
+    async def run():
+        return await asyncio.gather(
+            run_in_executor_async("storage", threading.current_thread),
+            run_in_executor_async("storage", lambda x, y=0: x + y, 1, y=2),
+        )
+
+    try:
+        thread, total = asyncio.run(run())
+        assert thread.name.startswith("storage")
+        assert total == 3
+    finally:
+        shutdown_executors()
@@ -134,6 +134,17 @@ class TestGetExtractorWindowParams:
         assert window == 0
         assert stride == 0
 
+    def test_min_window_size_only_widens_window(self):
+        """Test that min_window_size raises a smaller window but never shrinks a larger one."""
+        config = MockExtractorConfig(extractor_name="test")
+
+        assert get_extractor_window_params(
+            config, global_window_size=10, global_stride=5, min_window_size=25
+        ) == (25, 5)
+        assert get_extractor_window_params(
+            config, global_window_size=10, global_stride=5, min_window_size=3
+        ) == (10, 5)
+
 
 # ===============================
 # Test: get_effective_source_filter
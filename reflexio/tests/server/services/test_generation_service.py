@@ -122,3 +122,152 @@ def test_empty_session_id_allows_multiple_requests(mock_llm_responses):
 # from GenerationService. Each extractor now handles its own window/stride
 # calculation using the get_extractor_window_params() utility function.
 # See: reflexio/server/services/extractor_interaction_utils.py
+
+
+def test_run_bulk_stores_all_and_coalesces_generation_per_user():
+    """
+    Test that run_bulk stores every request and runs generation once per (user, agent_version, source).
+    """
+    org_id = "test_org"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        llm_config = LiteLLMConfig(model="gpt-4o-mini")
+        llm_client = LiteLLMClient(llm_config)
+        request_context = RequestContext(org_id=org_id, storage_base_dir=temp_dir)
+        generation_service = GenerationService(
+            llm_client=llm_client, request_context=request_context
+        )
+
+        requests = [
+            PublishUserInteractionRequest(
+                user_id=user_id,
+                interaction_data_list=[
+                    InteractionData(content=f"{user_id} message {i}")
+                ],
+                agent_version="v1",
+            )
+            for i in range(3)
+            for user_id in ("user_a", "user_b")
+        ]
+
+        with (
+            patch(
+                "reflexio.server.services.generation_service.ProfileGenerationService.run"
+            ) as profile_run,
+            patch(
+                "reflexio.server.services.generation_service.FeedbackGenerationService.run"
+            ) as feedback_run,
+        ):
+            request_ids = generation_service.run_bulk(requests)
+
+        assert len(request_ids) == 6
+        storage = request_context.storage
+        assert len(storage.get_user_interaction("user_a")) == 3
+        assert len(storage.get_user_interaction("user_b")) == 3
+
+        # One run per user, for the user's last request
+        profile_requests = {
+            call.args[0].user_id: call.args[0].request_id
+            for call in profile_run.call_args_list
+        }
+        assert profile_requests == {
+            "user_a": request_ids[4],
+            "user_b": request_ids[5],
+        }
+        assert feedback_run.call_count == 2
+
+
+def test_run_bulk_retry_replaces_requests_of_earlier_attempt():
+    """
+    Test that re-running a bulk publish with the same request IDs replaces the stored requests
+    instead of duplicating their interactions.
+    """
+    org_id = "test_org"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        llm_config = LiteLLMConfig(model="gpt-4o-mini")
+        llm_client = LiteLLMClient(llm_config)
+        request_context = RequestContext(org_id=org_id, storage_base_dir=temp_dir)
+        generation_service = GenerationService(
+            llm_client=llm_client, request_context=request_context
+        )
+
+        requests = [
+            PublishUserInteractionRequest(
+                user_id="user_a",
+                interaction_data_list=[InteractionData(content=f"message {i}")],
+            )
+            for i in range(3)
+        ]
+        request_ids = [f"job-1-{i}" for i in range(3)]
+
+        with (
+            patch(
+                "reflexio.server.services.generation_service.ProfileGenerationService.run"
+            ),
+            patch(
+                "reflexio.server.services.generation_service.FeedbackGenerationService.run"
+            ),
+        ):
+            assert (
+                generation_service.run_bulk(requests, request_ids=request_ids)
+                == request_ids
+            )
+            # A retry of the same job
+            generation_service.run_bulk(
+                requests, request_ids=request_ids, replace_existing=True
+            )
+
+        storage = request_context.storage
+        interactions = storage.get_user_interaction("user_a")
+        assert len(interactions) == 3
+        assert sorted(i.request_id for i in interactions) == request_ids
+
+
+def test_run_bulk_window_covers_all_new_interactions_of_user():
+    """
+    Test that a coalesced run covers more new interactions than the extraction window holds.
+    """
+    org_id = "test_org"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        llm_config = LiteLLMConfig(model="gpt-4o-mini")
+        llm_client = LiteLLMClient(llm_config)
+        request_context = RequestContext(org_id=org_id, storage_base_dir=temp_dir)
+        generation_service = GenerationService(
+            llm_client=llm_client, request_context=request_context
+        )
+
+        # 25 requests of two interactions each, far more than the default window of 10
+        requests = [
+            PublishUserInteractionRequest(
+                user_id="user_a",
+                interaction_data_list=[
+                    InteractionData(content=f"question {i}"),
+                    InteractionData(content=f"answer {i}"),
+                ],
+            )
+            for i in range(25)
+        ] + [
+            PublishUserInteractionRequest(
+                user_id="user_b",
+                interaction_data_list=[InteractionData(content="hello")],
+            )
+        ]
+
+        with (
+            patch(
+                "reflexio.server.services.generation_service.ProfileGenerationService.run"
+            ) as profile_run,
+            patch(
+                "reflexio.server.services.generation_service.FeedbackGenerationService.run"
+            ) as feedback_run,
+        ):
+            generation_service.run_bulk(requests)
+
+        for service_run in (profile_run, feedback_run):
+            windows = {
+                call.args[0].user_id: call.args[0].min_extraction_window_size
+                for call in service_run.call_args_list
+            }
+            assert windows == {"user_a": 50, "user_b": 1}
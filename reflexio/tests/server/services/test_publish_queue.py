@@ -0,0 +1,211 @@
+"""Unit tests for the SQLite publish queue and its worker pool."""
+
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from reflexio_commons.api_schema.service_schemas import (
+    InteractionData,
+    PublishUserInteractionRequest,
+    PublishUserInteractionsBulkRequest,
+    PublishUserInteractionsBulkResponse,
+)
+
+from reflexio.server.api_endpoints.publisher_api import process_publish_job
+from reflexio.server.services.publish_queue.publish_queue_base import (
+    PublishQueueFullError,
+)
+from reflexio.server.services.publish_queue.publish_queue_worker import (
+    PublishQueueWorkerPool,
+)
+from reflexio.server.services.publish_queue.sqlite_publish_queue import (
+    SqlitePublishQueue,
+)
+
+
+@pytest.fixture
+def queue():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        queue = SqlitePublishQueue(
+            str(Path(temp_dir) / "queue.sqlite3"),
+            max_attempts=2,
+            max_depth=3,
+            retry_base_seconds=0.0,
+        )
+        yield queue
+        queue.close()
+
+
+def test_claim_respects_per_org_concurrency(queue):
+    for payload in ["a1", "a2", "a3"]:
+        queue.enqueue("org_a", payload)
+    queue.enqueue("org_b", "b1")
+
+    jobs = queue.claim(limit=10, per_org_limit=2)
+    assert [job.payload for job in jobs] == ["a1", "a2", "b1"]
+    assert all(job.attempts == 1 for job in jobs)
+    # org_a is still at its limit until one of its jobs finishes
+    assert queue.claim(limit=10, per_org_limit=2) == []
+
+    queue.complete(jobs[0])
+    assert [job.payload for job in queue.claim(limit=10, per_org_limit=2)] == ["a3"]
+
+    stats = queue.stats()
+    assert stats["running"] == 3
+    assert stats["pending"] == 0
+    assert queue.stats("org_b")["running"] == 1
+
+
+def test_org_at_its_limit_does_not_block_other_orgs(queue):
+    queue.max_depth = 0
+    for i in range(50):
+        queue.enqueue("org_flood", f"flood{i}")
+    queue.enqueue("org_b", "b1")
+
+    # Workers claim one job at a time; the flooding org fills its two slots first
+    claimed = [queue.claim(limit=1, per_org_limit=2)[0] for _ in range(2)]
+    assert [job.org_id for job in claimed] == ["org_flood", "org_flood"]
+    (job,) = queue.claim(limit=1, per_org_limit=2)
+    assert job.payload == "b1"
+    assert queue.claim(limit=1, per_org_limit=2) == []
+
+
+def test_stale_lease_cannot_complete_or_fail_reclaimed_job(queue):
+    queue.enqueue("org_a", "payload")
+    queue.lease_seconds = -1
+    (stale,) = queue.claim(limit=1, per_org_limit=0)
+    queue.lease_seconds = 900
+    (current,) = queue.claim(limit=1, per_org_limit=0)
+    assert current.attempts == stale.attempts + 1
+
+    assert not queue.extend_lease(stale)
+    assert not queue.complete(stale)
+    assert not queue.fail(stale, "late failure")
+    assert queue.stats()["running"] == 1
+    assert queue.complete(current)
+    assert queue.stats()["running"] == 0
+
+
+def test_failed_jobs_retry_then_dead_letter(queue):
+    queue.enqueue("org_a", "payload")
+
+    (job,) = queue.claim(limit=1, per_org_limit=0)
+    assert not queue.fail(job, "boom")
+    (job,) = queue.claim(limit=1, per_org_limit=0)
+    assert job.attempts == 2
+    assert queue.fail(job, "boom again")
+
+    assert queue.claim(limit=1, per_org_limit=0) == []
+    assert queue.stats()["dead"] == 1
+
+
+def test_expired_lease_is_reclaimed(queue):
+    queue.lease_seconds = -1
+    queue.enqueue("org_a", "payload")
+    queue.claim(limit=1, per_org_limit=0)
+
+    (job,) = queue.claim(limit=1, per_org_limit=0)
+    assert job.attempts == 2
+
+
+def test_enqueue_rejects_full_org_queue(queue):
+    for i in range(3):
+        queue.enqueue("org_a", str(i))
+    with pytest.raises(PublishQueueFullError):
+        queue.enqueue("org_a", "overflow")
+    queue.enqueue("org_b", "other org is unaffected")
+
+    stats = queue.stats("org_a")
+    assert stats["pending"] == 3
+    assert stats["ready"] == 3
+    assert stats["oldest_pending_age_seconds"] >= 0
+
+
+def test_worker_pool_drains_queue_and_counts_failures(queue):
+    processed = []
+
+    def handler(job):
+        if job.payload == "bad":
+            raise RuntimeError("bad payload")
+        processed.append(job.payload)
+
+    pool = PublishQueueWorkerPool(queue, handler, num_workers=2, per_org_limit=1)
+    queue.enqueue("org_a", "good")
+    queue.enqueue("org_b", "bad")
+    pool.start()
+    try:
+        deadline = time.monotonic() + 5
+        while pool.stats()["dead_lettered"] < 1 and time.monotonic() < deadline:
+            pool.notify()
+            time.sleep(0.05)
+    finally:
+        pool.stop()
+
+    assert processed == ["good"]
+    stats = pool.stats()
+    assert stats["processed"] == 1
+    assert stats["failed_attempts"] == 2
+    assert stats["dead_lettered"] == 1
+    assert queue.stats()["dead"] == 1
+
+
+def test_worker_pool_extends_lease_of_long_running_job(queue):
+    queue.lease_seconds = 0.3
+    reclaimed = []
+
+    def handler(job):
+        # Runs for several lease periods; without lease extensions another claim would take the job
+        time.sleep(1.0)
+        reclaimed.extend(queue.claim(limit=1, per_org_limit=0))
+
+    pool = PublishQueueWorkerPool(queue, handler, num_workers=1, per_org_limit=0)
+    queue.enqueue("org_a", "slow")
+    pool.start()
+    try:
+        deadline = time.monotonic() + 5
+        while pool.stats()["processed"] < 1 and time.monotonic() < deadline:
+            pool.notify()
+            time.sleep(0.05)
+    finally:
+        pool.stop()
+
+    assert reclaimed == []
+    assert pool.stats()["processed"] == 1
+    assert queue.stats()["running"] == 0
+
+
+def test_publish_job_attempts_reuse_request_ids(queue):
+    payload = PublishUserInteractionsBulkRequest(
+        requests=[
+            PublishUserInteractionRequest(
+                user_id=f"user_{i}",
+                interaction_data_list=[InteractionData(content="hello")],
+            )
+            for i in range(2)
+        ]
+    ).model_dump_json()
+    queue.enqueue("org_a", payload)
+    queue.enqueue("org_a", payload)
+
+    with patch(
+        "reflexio.server.api_endpoints.publisher_api.add_user_interactions_bulk",
+        return_value=PublishUserInteractionsBulkResponse(success=True),
+    ) as add_bulk:
+        (job,) = queue.claim(limit=1, per_org_limit=0)
+        process_publish_job(job)
+        queue.fail(job, "interrupted")
+        (retry,) = queue.claim(limit=1, per_org_limit=0)
+        process_publish_job(retry)
+        queue.complete(retry)
+        (other_job,) = queue.claim(limit=1, per_org_limit=0)
+        process_publish_job(other_job)
+
+    first, second, other = (call.kwargs for call in add_bulk.call_args_list)
+    assert retry.job_id == job.job_id
+    assert len(set(first["request_ids"])) == 2
+    assert second["request_ids"] == first["request_ids"]
+    assert not first["replace_existing"]
+    assert second["replace_existing"]
+    assert set(other["request_ids"]).isdisjoint(first["request_ids"])
@@ -12,7 +12,7 @@ from reflexio_commons.api_schema.retriever_schema import (
     RewrittenQuery,
 )
 
-from reflexio.server.services.query_rewriter import QueryRewriter
+from reflexio.server.services.query_rewriter import QueryRewriter, RewriteCache
 
 
 def _make_rewriter(**overrides):
@@ -23,7 +23,9 @@ def _make_rewriter(**overrides):
 
     with (
         patch("reflexio.server.services.query_rewriter.LiteLLMClient"),
-        patch("reflexio.server.services.query_rewriter.SiteVarManager") as mock_svm,
+        patch(
+            "reflexio.server.services.query_rewriter.get_site_var_manager"
+        ) as mock_svm,
     ):
         mock_svm.return_value.get_site_var.return_value = {
             "query_rewrite_model_name": "gpt-5-nano"
@@ -195,6 +197,89 @@ class TestQueryRewriter(unittest.TestCase):
         self.assertEqual(variables["conversation_context_block"], "")
 
 
+class TestRewriteFastPathAndCache(unittest.TestCase):
+    """Unit tests for the keyword fast path and the process-wide rewrite cache."""
+
+    def setUp(self):
+        self.cache = RewriteCache(max_size=100, ttl_seconds=60)
+        patcher = patch(
+            "reflexio.server.services.query_rewriter._rewrite_cache", self.cache
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_keyword_like_queries_skip_the_llm(self):
+        rewriter = _make_rewriter()
+
+        for query in ("refund OR return", '"late delivery"', "ORD-1234 user_id"):
+            self.assertEqual(rewriter.rewrite(query).fts_query, query)
+
+        rewriter.llm_client.generate_response.assert_not_called()
+        self.assertEqual(self.cache.stats()["fast_path"], 3)
+
+    def test_natural_language_and_history_queries_use_the_llm(self):
+        self.assertFalse(QueryRewriter._is_keyword_query("agent failed to refund"))
+        self.assertFalse(
+            QueryRewriter._is_keyword_query(
+                "ORD-1234",
+                conversation_history=[ConversationTurn(role="user", content="hi")],
+            )
+        )
+
+    def test_repeated_query_is_served_from_cache(self):
+        rewriter = _make_rewriter()
+        rewriter.llm_client.config.model = "gpt-5-nano"
+        rewriter.llm_client.generate_response.return_value = "refund OR return"
+
+        other = _make_rewriter()
+        other.llm_client.config.model = "gpt-5-nano"
+
+        first = rewriter.rewrite("refund")
+        second = other.rewrite("refund")
+
+        self.assertEqual(first.fts_query, "refund OR return")
+        self.assertEqual(second.fts_query, "refund OR return")
+        rewriter.llm_client.generate_response.assert_called_once()
+        other.llm_client.generate_response.assert_not_called()
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_conversation_history_is_part_of_the_cache_key(self):
+        rewriter = _make_rewriter()
+        rewriter.llm_client.config.model = "gpt-5-nano"
+        rewriter.llm_client.generate_response.return_value = "refund OR return"
+
+        rewriter.rewrite("refund")
+        rewriter.rewrite(
+            "refund",
+            conversation_history=[ConversationTurn(role="user", content="shoes")],
+        )
+
+        self.assertEqual(rewriter.llm_client.generate_response.call_count, 2)
+
+    def test_failed_rewrites_are_not_cached(self):
+        rewriter = _make_rewriter()
+        rewriter.llm_client.config.model = "gpt-5-nano"
+        rewriter.llm_client.generate_response.side_effect = [
+            RuntimeError("API timeout"),
+            "refund OR return",
+        ]
+
+        self.assertEqual(rewriter.rewrite("refund").fts_query, "refund")
+        self.assertEqual(rewriter.rewrite("refund").fts_query, "refund OR return")
+
+    def test_unparseable_rewrites_are_not_cached(self):
+        rewriter = _make_rewriter()
+        rewriter.llm_client.config.model = "gpt-5-nano"
+        rewriter.llm_client.generate_response.side_effect = [
+            "",
+            "refund OR return",
+        ]
+
+        self.assertEqual(rewriter.rewrite("refund").fts_query, "refund")
+        self.assertEqual(rewriter.rewrite("refund").fts_query, "refund OR return")
+        self.assertEqual(self.cache.stats()["hits"], 0)
+
+
 class TestFormatConversationContext(unittest.TestCase):
     """Unit tests for QueryRewriter._format_conversation_context."""
 
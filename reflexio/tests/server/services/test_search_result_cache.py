@@ -0,0 +1,190 @@
+"""Unit tests for the unified search result cache and its storage-write invalidation."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from reflexio_commons.api_schema.retriever_schema import (
+    RewrittenQuery,
+    UnifiedSearchRequest,
+)
+from reflexio_commons.api_schema.service_schemas import Feedback
+from reflexio_commons.config_schema import EMBEDDING_DIMENSIONS
+
+from reflexio.server.services.search_result_cache import SearchResultCache
+from reflexio.server.services.storage.storage_base import BaseStorage
+from reflexio.server.services.unified_search_service import run_unified_search
+
+
+class _WriteOnlyStorage(BaseStorage):
+    """BaseStorage subclass implementing just the writes the tests call."""
+
+    def add_user_profile(self, user_id, user_profiles):
+        pass
+
+    def save_feedbacks(self, feedbacks):
+        return feedbacks
+
+    def archive_feedbacks_by_feedback_name(self, feedback_name, agent_version=None):
+        pass
+
+    def archive_feedbacks_by_ids(self, feedback_ids):
+        pass
+
+
+_WriteOnlyStorage.__abstractmethods__ = frozenset()
+
+
+@pytest.fixture
+def cache():
+    cache = SearchResultCache(max_size=100, ttl_seconds=60, similarity_threshold=0.95)
+    with (
+        patch(
+            "reflexio.server.services.unified_search_service.get_search_result_cache",
+            return_value=cache,
+        ),
+        patch(
+            "reflexio.server.services.storage.storage_base.get_search_result_cache",
+            return_value=cache,
+        ),
+        patch(
+            "reflexio.server.services.unified_search_service.is_skill_generation_enabled",
+            return_value=False,
+        ),
+        patch(
+            "reflexio.server.services.unified_search_service.QueryRewriter"
+        ) as rewriter_cls,
+    ):
+        rewriter_cls.return_value.arewrite = AsyncMock(
+            side_effect=lambda query, *_args, **_kwargs: RewrittenQuery(fts_query=query)
+        )
+        yield cache
+
+
+def _storage(embedding=None):
+    storage = MagicMock()
+    storage._aget_embedding = AsyncMock(return_value=embedding or [1.0, 0.0])
+    storage.search_user_profile.return_value = []
+    storage.search_feedbacks.return_value = [
+        Feedback(
+            feedback_id=1,
+            feedback_name="f",
+            agent_version="v1",
+            feedback_content="be concise",
+            embedding=[0.5] * EMBEDDING_DIMENSIONS,
+        )
+    ]
+    storage.search_raw_feedbacks.return_value = []
+    return storage
+
+
+def _search(storage, query, user_id="u1"):
+    return run_unified_search(
+        UnifiedSearchRequest(query=query, user_id=user_id),
+        "org",
+        storage,
+        None,
+        MagicMock(),
+    )
+
+
+def test_repeated_query_is_served_from_cache(cache):
+    storage = _storage()
+
+    first = _search(storage, "refund policy")
+    second = _search(storage, "  Refund   POLICY ")
+
+    assert storage.search_feedbacks.call_count == 1
+    assert first.feedbacks[0].embedding == [0.5] * EMBEDDING_DIMENSIONS
+    assert second.feedbacks[0].feedback_content == "be concise"
+    assert second.feedbacks[0].embedding == []
+    stats = cache.stats()
+    assert stats["exact_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["latency_saved_seconds"] > 0
+
+
+def test_cached_responses_are_copies(cache):
+    storage = _storage()
+    _search(storage, "refund policy")
+
+    _search(storage, "refund policy").feedbacks.clear()
+
+    assert len(_search(storage, "refund policy").feedbacks) == 1
+
+
+def test_org_write_invalidates_cached_searches(cache):
+    storage = _storage()
+    _search(storage, "refund policy")
+
+    _WriteOnlyStorage("org").save_feedbacks([])
+    _search(storage, "refund policy")
+
+    assert storage.search_feedbacks.call_count == 2
+    assert cache.stats()["stale_drops"] == 1
+
+
+@pytest.mark.parametrize(
+    ("method", "arg"),
+    [("archive_feedbacks_by_feedback_name", "f"), ("archive_feedbacks_by_ids", [1])],
+)
+def test_archiving_feedbacks_invalidates_cached_searches(cache, method, arg):
+    storage = _storage()
+    _search(storage, "refund policy")
+
+    getattr(_WriteOnlyStorage("org"), method)(arg)
+    _search(storage, "refund policy")
+
+    assert storage.search_feedbacks.call_count == 2
+    assert cache.stats()["exact_hits"] == 0
+
+
+def test_profile_write_only_invalidates_that_user(cache):
+    storage = _storage()
+    _search(storage, "refund policy", user_id="u1")
+    _search(storage, "refund policy", user_id="u2")
+
+    _WriteOnlyStorage("org").add_user_profile("u1", [])
+    _search(storage, "refund policy", user_id="u1")
+    _search(storage, "refund policy", user_id="u2")
+
+    assert storage.search_feedbacks.call_count == 3
+
+
+def test_write_during_search_is_not_cached(cache):
+    storage = _storage()
+
+    def search_then_write(**kwargs):
+        _WriteOnlyStorage("org").save_feedbacks([])
+        return []
+
+    storage.search_raw_feedbacks.side_effect = search_then_write
+    _search(storage, "refund policy")
+    storage.search_raw_feedbacks.side_effect = None
+    _search(storage, "refund policy")
+
+    assert storage.search_feedbacks.call_count == 2
+
+
+def test_near_duplicate_query_reuses_results(cache):
+    storage = _storage(embedding=[1.0, 0.0])
+    _search(storage, "refund policy")
+
+    storage._aget_embedding.return_value = [0.99, 0.05]
+    similar = _search(storage, "the refund policy")
+    storage._aget_embedding.return_value = [0.0, 1.0]
+    _search(storage, "shipping times")
+
+    assert similar.success
+    assert storage.search_feedbacks.call_count == 2
+    assert cache.stats()["similar_hits"] == 1
+
+
+def test_disabled_cache_never_hits():
+    cache = SearchResultCache(max_size=0, ttl_seconds=60)
+    request = UnifiedSearchRequest(query="refund policy")
+    key = cache.key("org", request)
+
+    cache.put(key, MagicMock(success=True), cache.epoch("org", None), 1.0)
+
+    assert cache.get(key) is None
+    assert cache.stats()["lookups"] == 0
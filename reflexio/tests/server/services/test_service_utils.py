@@ -1,5 +1,6 @@
 """Tests for service_utils module."""
 
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
@@ -10,9 +11,12 @@ from reflexio_commons.api_schema.service_schemas import (
     UserActionType,
 )
 
+from reflexio.server.llm.litellm_client import LiteLLMClientError
+from reflexio.server.services import service_utils
 from reflexio.server.services.service_utils import (
     format_interactions_to_history_string,
     format_sessions_to_history_string,
+    run_llm_tasks_concurrently,
 )
 
 
@@ -385,3 +389,67 @@ def test_format_sessions_to_history_string_preserves_order_within_group():
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestRunLlmTasksConcurrently:
+    """Tests for run_llm_tasks_concurrently."""
+
+    def test_results_keep_input_order_and_respect_concurrency(self):
+        """Results line up with items and no more than max_concurrency tasks overlap."""
+        active = [0]
+        peak = [0]
+
+        async def task(item):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.02)
+            active[0] -= 1
+            return item * 2
+
+        results = run_llm_tasks_concurrently(task, list(range(8)), max_concurrency=3)
+
+        assert results == [i * 2 for i in range(8)]
+        assert 1 < peak[0] <= 3
+
+    def test_failed_tasks_yield_none(self):
+        """A task that raises a non rate limit error yields None without retries."""
+        calls = []
+
+        async def task(item):
+            calls.append(item)
+            if item == 1:
+                raise ValueError("bad output")
+            return item
+
+        assert run_llm_tasks_concurrently(task, [0, 1, 2], max_concurrency=2) == [
+            0,
+            None,
+            2,
+        ]
+        assert calls.count(1) == 1
+
+    def test_rate_limited_tasks_are_retried(self, monkeypatch):
+        """Rate-limited tasks back off and are retried until they succeed."""
+        monkeypatch.setattr(service_utils, "RATE_LIMIT_BACKOFF_SECONDS", 0.0)
+        attempts = {}
+
+        async def task(item):
+            attempts[item] = attempts.get(item, 0) + 1
+            if item == 0 and attempts[item] < 3:
+                raise LiteLLMClientError("API call failed: rate_limit_exceeded")
+            return item
+
+        assert run_llm_tasks_concurrently(task, [0, 1], max_concurrency=2) == [0, 1]
+        assert attempts == {0: 3, 1: 1}
+
+    def test_rate_limit_retries_are_bounded(self, monkeypatch):
+        """An item still rate-limited after RATE_LIMIT_RETRIES yields None."""
+        monkeypatch.setattr(service_utils, "RATE_LIMIT_BACKOFF_SECONDS", 0.0)
+        attempts = []
+
+        async def task(item):
+            attempts.append(item)
+            raise LiteLLMClientError("API call failed: rate_limit_exceeded")
+
+        assert run_llm_tasks_concurrently(task, ["a"], max_concurrency=4) == [None]
+        assert len(attempts) == service_utils.RATE_LIMIT_RETRIES + 1
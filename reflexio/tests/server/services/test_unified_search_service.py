@@ -4,16 +4,19 @@ Tests the critical orchestration logic: empty query, embedding failure,
 rewritten_query propagation, and skills feature-flag gating.
 """
 
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from reflexio_commons.api_schema.retriever_schema import (
     RewrittenQuery,
     UnifiedSearchRequest,
 )
 
+from reflexio.server.services.executor_registry import ExecutorSaturatedError
 from reflexio.server.services.unified_search_service import (
     _run_phase_b,
+    arun_unified_search,
     run_unified_search,
 )
 
@@ -21,12 +24,16 @@ from reflexio.server.services.unified_search_service import (
 def _mock_storage(embedding=None):
     """Create a mock storage with configurable embedding."""
     storage = MagicMock()
-    storage._get_embedding.return_value = embedding or [0.1] * 1536
+    storage._aget_embedding = AsyncMock(return_value=embedding or [0.1] * 1536)
     # Storage search methods return empty lists by default
     storage.search_user_profile.return_value = []
     storage.search_feedbacks.return_value = []
     storage.search_raw_feedbacks.return_value = []
     storage.search_skills.return_value = []
+    storage.asearch_user_profile = AsyncMock(return_value=[])
+    storage.asearch_feedbacks = AsyncMock(return_value=[])
+    storage.asearch_raw_feedbacks = AsyncMock(return_value=[])
+    storage.asearch_skills = AsyncMock(return_value=[])
     return storage
 
 
@@ -55,10 +62,10 @@ class TestRunUnifiedSearch(unittest.TestCase):
     def test_embedding_failure_degrades_to_text_search(self, _flag1, _rewriter_cls):
         """When embedding generation fails, should degrade to text-only search (not crash)."""
         storage = _mock_storage()
-        storage._get_embedding.side_effect = RuntimeError("Embedding API down")
+        storage._aget_embedding.side_effect = RuntimeError("Embedding API down")
 
-        _rewriter_cls.return_value.rewrite.return_value = RewrittenQuery(
-            fts_query="test query"
+        _rewriter_cls.return_value.arewrite = AsyncMock(
+            return_value=RewrittenQuery(fts_query="test query")
         )
 
         request = UnifiedSearchRequest(query="test query")
@@ -79,12 +86,12 @@ class TestRunUnifiedSearch(unittest.TestCase):
         return_value=False,
     )
     def test_local_storage_without_get_embedding(self, _flag1, _rewriter_cls):
-        """LocalJsonStorage (no _get_embedding) should not crash and should use text-only search."""
+        """LocalJsonStorage (no _aget_embedding) should not crash and should use text-only search."""
         storage = _mock_storage()
-        del storage._get_embedding  # Simulate LocalJsonStorage which lacks this method
+        del storage._aget_embedding  # Simulate LocalJsonStorage which lacks this method
 
-        _rewriter_cls.return_value.rewrite.return_value = RewrittenQuery(
-            fts_query="test query"
+        _rewriter_cls.return_value.arewrite = AsyncMock(
+            return_value=RewrittenQuery(fts_query="test query")
         )
 
         request = UnifiedSearchRequest(query="test query")
@@ -107,7 +114,7 @@ class TestRunUnifiedSearch(unittest.TestCase):
     def test_rewritten_query_populated_when_changed(self, _flag1, _rewriter_cls):
         """rewritten_query field should only be set when query was actually rewritten."""
         expanded = RewrittenQuery(fts_query="agent failed OR error to refund OR return")
-        _rewriter_cls.return_value.rewrite.return_value = expanded
+        _rewriter_cls.return_value.arewrite = AsyncMock(return_value=expanded)
 
         storage = _mock_storage()
         request = UnifiedSearchRequest(
@@ -134,8 +141,8 @@ class TestRunUnifiedSearch(unittest.TestCase):
     )
     def test_rewritten_query_none_when_unchanged(self, _flag1, _rewriter_cls):
         """rewritten_query should be None when query was not rewritten."""
-        _rewriter_cls.return_value.rewrite.return_value = RewrittenQuery(
-            fts_query="same query"
+        _rewriter_cls.return_value.arewrite = AsyncMock(
+            return_value=RewrittenQuery(fts_query="same query")
         )
 
         storage = _mock_storage()
@@ -197,5 +204,91 @@ class TestPhaseB(unittest.TestCase):
         storage.search_skills.assert_called_once()
 
 
+class TestArunUnifiedSearch(unittest.TestCase):
+    """Tests for the async arun_unified_search path."""
+
+    @patch("reflexio.server.services.unified_search_service.QueryRewriter")
+    @patch(
+        "reflexio.server.services.unified_search_service.is_skill_generation_enabled",
+        return_value=False,
+    )
+    def test_uses_async_storage_reads(self, _flag, _rewriter_cls):
+        """All entity searches should go through the async read methods."""
+        _rewriter_cls.return_value.arewrite = AsyncMock(
+            return_value=RewrittenQuery(fts_query="test query")
+        )
+        storage = _mock_storage()
+
+        result = asyncio.run(
+            arun_unified_search(
+                request=UnifiedSearchRequest(query="test query", user_id="u1"),
+                org_id="test-org",
+                storage=storage,
+                api_key_config=MagicMock(),
+                prompt_manager=MagicMock(),
+            )
+        )
+
+        self.assertTrue(result.success)
+        storage.asearch_user_profile.assert_awaited_once()
+        storage.asearch_feedbacks.assert_awaited_once()
+        storage.asearch_raw_feedbacks.assert_awaited_once()
+        storage.asearch_skills.assert_not_awaited()
+        storage.search_feedbacks.assert_not_called()
+        self.assertEqual(
+            storage.asearch_feedbacks.call_args.kwargs["query_embedding"],
+            [0.1] * 1536,
+        )
+
+    @patch("reflexio.server.services.unified_search_service.QueryRewriter")
+    @patch(
+        "reflexio.server.services.unified_search_service.is_skill_generation_enabled",
+        return_value=False,
+    )
+    def test_search_failure_returns_unsuccessful_response(self, _flag, _rewriter_cls):
+        """A failing entity search should fail the request rather than raise."""
+        _rewriter_cls.return_value.arewrite = AsyncMock(
+            return_value=RewrittenQuery(fts_query="test query")
+        )
+        storage = _mock_storage()
+        storage.asearch_feedbacks.side_effect = RuntimeError("db down")
+
+        result = asyncio.run(
+            arun_unified_search(
+                request=UnifiedSearchRequest(query="test query"),
+                org_id="test-org",
+                storage=storage,
+                api_key_config=MagicMock(),
+                prompt_manager=MagicMock(),
+            )
+        )
+
+        self.assertFalse(result.success)
+
+    @patch("reflexio.server.services.unified_search_service.QueryRewriter")
+    @patch(
+        "reflexio.server.services.unified_search_service.is_skill_generation_enabled",
+        return_value=False,
+    )
+    def test_saturated_storage_pool_propagates(self, _flag, _rewriter_cls):
+        """ExecutorSaturatedError should reach the API so it can answer 503."""
+        _rewriter_cls.return_value.arewrite = AsyncMock(
+            return_value=RewrittenQuery(fts_query="test query")
+        )
+        storage = _mock_storage()
+        storage.asearch_raw_feedbacks.side_effect = ExecutorSaturatedError("full")
+
+        with self.assertRaises(ExecutorSaturatedError):
+            asyncio.run(
+                arun_unified_search(
+                    request=UnifiedSearchRequest(query="test query"),
+                    org_id="test-org",
+                    storage=storage,
+                    api_key_config=MagicMock(),
+                    prompt_manager=MagicMock(),
+                )
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
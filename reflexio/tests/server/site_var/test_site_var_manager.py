@@ -7,7 +7,13 @@ from unittest.mock import Mock, patch
 
 import redis
 
-from reflexio.server.site_var.site_var_manager import SiteVarManager
+from reflexio.server.site_var.site_var_manager import (
+    SiteVarManager,
+    SiteVarRegistry,
+    get_site_var_manager,
+    get_site_var_stats,
+    reset_site_var_manager,
+)
 
 
 class TestSiteVarManager(unittest.TestCase):
@@ -344,5 +350,85 @@ class TestSiteVarManager(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestSiteVarRegistry(unittest.TestCase):
+    """Unit tests for the shared site var snapshot and its reloading."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self._write("config.json", '{"model": "a"}')
+        self._write("prompt.txt", "hello")
+        self.registry = SiteVarRegistry(
+            source_dir=self.temp_dir, reload_interval_seconds=60
+        )
+
+    def tearDown(self):
+        self.registry.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, filename, content):
+        with open(os.path.join(self.temp_dir, filename), "w") as f:
+            f.write(content)
+
+    def _touch_and_expire(self, filename, content):
+        self._write(filename, content)
+        path = os.path.join(self.temp_dir, filename)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.registry._next_check = 0.0
+
+    def test_reads_are_served_from_snapshot(self):
+        with patch.object(
+            self.registry._loader, "_load_from_file", side_effect=AssertionError
+        ):
+            self.assertEqual(self.registry.get_site_var("config"), {"model": "a"})
+            self.assertEqual(self.registry.get_site_var("prompt"), "hello")
+            self.assertIsNone(self.registry.get_site_var("missing"))
+
+        stats = self.registry.stats()
+        self.assertEqual(stats["site_vars"], 2)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["reloads"], 1)
+
+    def test_reloads_when_a_file_changes(self):
+        self._touch_and_expire("config.json", '{"model": "b"}')
+
+        self.assertEqual(self.registry.get_site_var("config"), {"model": "b"})
+        self.assertEqual(self.registry.stats()["reloads"], 2)
+        # Unchanged files do not trigger another reload
+        self.registry._next_check = 0.0
+        self.registry.get_site_var("config")
+        self.assertEqual(self.registry.stats()["reloads"], 2)
+
+    def test_forced_reload_ignores_unchanged_fingerprint(self):
+        path = os.path.join(self.temp_dir, "config.json")
+        stat = os.stat(path)
+        self._write("config.json", '{"model": "b"}')
+        # Same size and mtime: only a forced reload picks up the edit
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertFalse(self.registry.reload())
+        self.assertEqual(self.registry.get_site_var("config"), {"model": "a"})
+        self.assertTrue(self.registry.reload(force=True))
+        self.assertEqual(self.registry.get_site_var("config"), {"model": "b"})
+
+    def test_invalid_file_keeps_previous_value(self):
+        self._touch_and_expire("config.json", '{"model": ')
+
+        self.assertEqual(self.registry.get_site_var("config"), {"model": "a"})
+        self.assertEqual(self.registry.stats()["reload_failures"], 1)
+
+    def test_shared_registry_is_reused(self):
+        reset_site_var_manager()
+        try:
+            self.assertEqual(get_site_var_stats(), {})
+            registry = get_site_var_manager()
+            self.assertIs(registry, get_site_var_manager())
+            self.assertIsNotNone(registry.get_site_var("llm_model_setting"))
+            self.assertGreaterEqual(get_site_var_stats()["hits"], 1)
+        finally:
+            reset_site_var_manager()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,13 @@
+-- Binary transfer of raw feedback embeddings.
+-- Selecting `embedding` returns pgvector text ("[0.1,0.2,...]", ~10 bytes per dimension) that the
+-- client has to parse float by float. This computed column exposes the pgvector binary send format
+-- (int16 dim, int16 unused, dim big-endian float4) base64-encoded, so clustering jobs can decode whole
+-- pages straight into float32 arrays. PostgREST exposes it as a selectable column: select=...,embedding_b64
+
+CREATE OR REPLACE FUNCTION public.embedding_b64(public.raw_feedbacks)
+RETURNS text
+LANGUAGE sql
+STABLE
+AS $function$
+    SELECT encode(vector_send($1.embedding), 'base64')
+$function$;